@@ -29,6 +29,7 @@ from app.api.middleware.error_handler import validate_user_exists
 from app.api.middleware.exception_handler import InvalidTokenError
 from app.api.middleware.logging_middleware import sanitize_error_message
 from app.api.models import User
+from app.api.services.user_activity_buffer import get_user_activity_buffer
 
 logger = structlog.get_logger()
 password_hasher = PasswordHasher(type=Type.ID)
@@ -184,11 +185,10 @@ async def authenticate_user(
                 user.user_password_hash
             ):
                 user.user_password_hash = hash_password(password)
+                await db.commit()
 
-            # Update last_active_date on successful login
-            user.last_active_date = datetime.now(UTC)
-            await db.commit()
-            await db.refresh(user)
+            # last_active_date is written behind, off the login path
+            get_user_activity_buffer().record(user.user_id)
 
             logger.info("User authenticated successfully", user_id=str(user.user_id))
             return user
@@ -250,4 +250,5 @@ async def get_current_user(
         )
 
     user = await validate_user_exists(db_session=db, user_model=User, user_id=user_id)
+    get_user_activity_buffer().record(user.user_id)
     return cast(User, user)
@@ -0,0 +1,178 @@
+"""
+Circuit Breaker
+- Stops calling an external API (Resend) once it is failing, so requests and
+  workers fail fast instead of spending seconds in retry backoff.
+- Closed: calls pass and outcomes are kept in a sliding time window; the
+  breaker opens when the failure rate over enough calls reaches a threshold.
+- Open: calls are rejected with CircuitOpenError until a cool-down elapses.
+- Half-open: a single probe call is let through; success closes the breaker,
+  failure opens it for another cool-down.
+- State changes are logged and counted for /metrics; state is per process.
+"""
+
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Deque, Dict, Optional, Tuple
+
+import structlog
+
+from app.api.core.metrics import record_circuit_breaker_transition
+
+logger = structlog.get_logger()
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of making a call while the breaker is open."""
+
+    def __init__(self, name: str, retry_after: float) -> None:
+        super().__init__(f"Circuit '{name}' is open; retry in {retry_after:.1f}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Failure-rate circuit breaker over a sliding window of recent calls."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        minimum_calls: int = 5,
+        window_seconds: float = 30.0,
+        open_seconds: float = 30.0,
+    ) -> None:
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = max(1, minimum_calls)
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self._state = CircuitState.CLOSED
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started_at: Optional[float] = None
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self._state is CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.open_seconds
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    @property
+    def failure_rate(self) -> float:
+        self._prune(time.monotonic())
+        return self._failures / len(self._outcomes) if self._outcomes else 0.0
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until an open breaker lets a probe through; 0 otherwise."""
+        if self.state is not CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self.open_seconds - (time.monotonic() - self._opened_at))
+
+    def allows_calls(self) -> bool:
+        """True unless the breaker is open (a half-open probe may be running)."""
+        return self.state is not CircuitState.OPEN
+
+    def raise_if_open(self) -> None:
+        """Raise CircuitOpenError if open, without taking the half-open probe."""
+        if not self.allows_calls():
+            raise CircuitOpenError(self.name, self.retry_after)
+
+    def before_call(self) -> None:
+        """Admit a call or raise CircuitOpenError; pair with a record_* call."""
+        state = self.state
+        now = time.monotonic()
+        if state is CircuitState.CLOSED:
+            return
+        if state is CircuitState.HALF_OPEN and (
+            self._probe_started_at is None
+            or now - self._probe_started_at >= self.open_seconds
+        ):
+            # A probe that never reported back is treated as lost after a cool-down.
+            self._probe_started_at = now
+            return
+        retry_after = (
+            self.retry_after
+            if state is CircuitState.OPEN
+            else self.open_seconds - (now - (self._probe_started_at or now))
+        )
+        raise CircuitOpenError(self.name, max(0.0, retry_after))
+
+    def record_success(self) -> None:
+        if self._state is CircuitState.HALF_OPEN:
+            self._transition(CircuitState.CLOSED)
+            return
+        self._record(False)
+
+    def record_failure(self) -> None:
+        if self._state is CircuitState.HALF_OPEN:
+            self._transition(CircuitState.OPEN)
+            return
+        self._record(True)
+        if (
+            self._state is CircuitState.CLOSED
+            and len(self._outcomes) >= self.minimum_calls
+            and self._failures / len(self._outcomes) >= self.failure_rate_threshold
+        ):
+            self._transition(CircuitState.OPEN)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """State for the health endpoint."""
+        state = self.state
+        snapshot: Dict[str, Any] = {
+            "state": state.value,
+            "failure_rate": round(self.failure_rate, 3),
+            "calls_in_window": len(self._outcomes),
+        }
+        if state is CircuitState.OPEN:
+            snapshot["retry_after"] = round(self.retry_after, 1)
+        return snapshot
+
+    def reset(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._outcomes.clear()
+        self._failures = 0
+        self._probe_started_at = None
+
+    def _record(self, failed: bool) -> None:
+        now = time.monotonic()
+        self._outcomes.append((now, failed))
+        self._failures += failed
+        self._prune(now)
+
+    def _prune(self, now: float) -> None:
+        while self._outcomes and now - self._outcomes[0][0] > self.window_seconds:
+            _, failed = self._outcomes.popleft()
+            self._failures -= failed
+
+    def _transition(self, state: CircuitState) -> None:
+        previous = self._state
+        failure_rate = self.failure_rate
+        if state is CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+        if state is not CircuitState.HALF_OPEN:
+            self._probe_started_at = None
+        if state is CircuitState.CLOSED:
+            self._outcomes.clear()
+            self._failures = 0
+        self._state = state
+        record_circuit_breaker_transition(self.name, state.value)
+        log = logger.warning if state is CircuitState.OPEN else logger.info
+        log(
+            "Circuit breaker state changed",
+            breaker=self.name,
+            previous_state=previous.value,
+            state=state.value,
+            failure_rate=round(failure_rate, 3),
+        )
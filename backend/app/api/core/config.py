@@ -4,14 +4,17 @@ Application Settings
 
 import os
 from pathlib import Path
-from typing import Any, List, Optional, Type
+from typing import Any, List, Literal, Optional, Type
 
 import structlog
 from pydantic import SecretStr, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic_settings.sources import DotEnvSettingsSource, EnvSettingsSource
 
-from app.api.middleware.logging_middleware import sanitize_error_message
+from app.api.middleware.logging_middleware import (
+    DEFAULT_ACCESS_LOG_HEADERS,
+    sanitize_error_message,
+)
 
 logger = structlog.get_logger()
 
@@ -42,6 +45,7 @@ class CustomEnvSettingsSource(EnvSettingsSource):
             "CORS_ORIGINS",
             "CORS_ALLOW_METHODS",
             "CORS_ALLOW_HEADERS",
+            "ACCESS_LOG_HEADER_ALLOWLIST",
         ] and isinstance(value, str):
             items = [item.strip() for item in value.split(",") if item.strip()]
             logger.debug(f"Parsed comma-separated {field_name} from env", items=items)
@@ -59,6 +63,7 @@ class CustomDotEnvSettingsSource(DotEnvSettingsSource):
             "CORS_ORIGINS",
             "CORS_ALLOW_METHODS",
             "CORS_ALLOW_HEADERS",
+            "ACCESS_LOG_HEADER_ALLOWLIST",
         ] and isinstance(value, str):
             items = [item.strip() for item in value.split(",") if item.strip()]
             logger.debug(f"Parsed comma-separated {field_name} from .env", items=items)
@@ -89,10 +94,71 @@ class Settings(BaseSettings):
     LOG_FILE: str
     LOG_MAX_BYTES: int
     LOG_BACKUP_COUNT: int
+    LOG_QUEUE_SIZE: int = 10000
+    LOG_BATCH_SIZE: int = 256
+    LOG_FLUSH_INTERVAL_SECONDS: float = 0.05
+
+    ACCESS_LOG_SAMPLE_RATE: float = 1.0
+    ACCESS_LOG_SLOW_REQUEST_SECONDS: float = 1.0
+    ACCESS_LOG_MAX_FIELD_LENGTH: int = 256
+    ACCESS_LOG_HEADER_ALLOWLIST: List[str] = list(DEFAULT_ACCESS_LOG_HEADERS)
+
+    FAST_JSON_ENABLED: bool = True
+
+    HTTP_CLIENT_TIMEOUT_SECONDS: float = 10.0
+    HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 20
+    HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+
+    EMAIL_OUTBOX_ENABLED: bool = True
+    EMAIL_OUTBOX_BATCH_SIZE: int = 50
+    EMAIL_OUTBOX_POLL_INTERVAL_SECONDS: float = 2.0
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 5
+    EMAIL_OUTBOX_RETRY_BASE_SECONDS: float = 2.0
+    EMAIL_OUTBOX_LEASE_SECONDS: float = 60.0
+    EMAIL_OUTBOX_FAILED_RETENTION_DAYS: float = 7.0
+
+    EMAIL_SEND_RATE_PER_SECOND: float = 2.0
+    EMAIL_SEND_BURST: int = 2
+    EMAIL_SEND_LIMITER_STORAGE_URI: str = "memory://"
+    EMAIL_BREAKER_FAILURE_RATE: float = 0.5
+    EMAIL_BREAKER_MINIMUM_CALLS: int = 5
+    EMAIL_BREAKER_WINDOW_SECONDS: float = 30.0
+    EMAIL_BREAKER_OPEN_SECONDS: float = 30.0
+
+    INBOUND_EMAIL_WORKERS: int = 4
+    INBOUND_EMAIL_POLL_INTERVAL_SECONDS: float = 2.0
+    INBOUND_EMAIL_MAX_ATTEMPTS: int = 5
+    INBOUND_EMAIL_RETRY_BASE_SECONDS: float = 30.0
+    INBOUND_EMAIL_LEASE_SECONDS: float = 300.0
+    INBOUND_EMAIL_DEDUPE_TTL_SECONDS: float = 86400.0
+
+    HEALTH_SAMPLE_INTERVAL_SECONDS: float = 15.0
+
+    USER_ACTIVITY_FLUSH_INTERVAL_SECONDS: float = 30.0
+    USER_ACTIVITY_MAX_PENDING: int = 10000
+
+    REFERENCE_DATA_CACHE_SECONDS: float = 300.0
+
+    RATE_LIMIT_STORAGE_URI: str = "memory://"
+    RATE_LIMIT_STRATEGY: Literal[
+        "fixed-window", "moving-window", "sliding-window-counter"
+    ] = "fixed-window"
 
     ENVIRONMENT: str
     SLOW_QUERY_THRESHOLD: float
 
+    METRICS_ENABLED: bool = True
+    METRICS_EXPORT_FILE: Optional[str] = None
+    METRICS_EXPORT_INTERVAL_SECONDS: float = 60.0
+    # /metrics is only served to scrapers presenting this bearer token
+    METRICS_BEARER_TOKEN: Optional[SecretStr] = None
+
+    TRACING_ENABLED: bool = False
+    TRACING_SAMPLE_RATIO: float = 1.0
+    TRACING_EXPORT_FILE: Optional[str] = None
+
     CORS_ORIGINS: List[str]
     CORS_ALLOW_CREDENTIALS: bool
     CORS_ALLOW_METHODS: List[str]
@@ -145,11 +211,15 @@ class Settings(BaseSettings):
             )
 
     @field_validator(
-        "CORS_ORIGINS", "CORS_ALLOW_METHODS", "CORS_ALLOW_HEADERS", mode="before"
+        "CORS_ORIGINS",
+        "CORS_ALLOW_METHODS",
+        "CORS_ALLOW_HEADERS",
+        "ACCESS_LOG_HEADER_ALLOWLIST",
+        mode="before",
     )
     @classmethod
     def split_comma_separated_values(cls, value: Any) -> List[str]:
-        """Parse comma-separated strings into lists for CORS settings."""
+        """Parse comma-separated strings into lists for CORS and log settings."""
         if isinstance(value, str):
             items = [item.strip() for item in value.split(",") if item.strip()]
             logger.debug("Parsed comma-separated string into list", items=items)
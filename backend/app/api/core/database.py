@@ -10,6 +10,7 @@ from typing import Any, AsyncGenerator
 
 import structlog
 from sqlalchemy import Connection, event
+from sqlalchemy.engine import ExceptionContext
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -19,6 +20,8 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.orm import declarative_base
 
 from app.api.core.config import settings
+from app.api.core.metrics import record_db_statement_duration, statement_operation
+from app.api.core.tracing import end_span_with_error, start_db_statement_span
 from app.api.middleware.logging_middleware import (
     request_id_ctx_var,
     sanitize_error_message,
@@ -100,6 +103,11 @@ def before_cursor_execute(
     executemany: bool,
 ) -> None:
     conn.info.setdefault("query_start_time", []).append(time.monotonic())
+    conn.info.setdefault("query_span", []).append(
+        start_db_statement_span(
+            statement, conn.dialect.name, statement_operation(statement)
+        )
+    )
 
     logger.debug(
         "Starting database query",
@@ -120,6 +128,8 @@ def after_cursor_execute(
     executemany: bool,
 ) -> None:
     total = time.monotonic() - conn.info["query_start_time"].pop(-1)
+    conn.info["query_span"].pop(-1).end()
+    record_db_statement_duration(statement, total)
 
     logger.debug(
         "Query completed",
@@ -141,4 +151,16 @@ def after_cursor_execute(
         )
 
 
+@event.listens_for(engine.sync_engine, "handle_error")
+def handle_cursor_error(exception_context: ExceptionContext) -> None:
+    """Close the timing and span state opened by a statement that failed."""
+    conn = exception_context.connection
+    if conn is None or not conn.info.get("query_span"):
+        return
+    conn.info["query_start_time"].pop(-1)
+    end_span_with_error(
+        conn.info["query_span"].pop(-1), exception_context.original_exception
+    )
+
+
 logger.info("Database module initialized successfully")
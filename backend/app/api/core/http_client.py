@@ -0,0 +1,108 @@
+"""
+Shared HTTP Client
+- One pooled httpx.AsyncClient for outbound API calls (Resend), opened in the
+  application lifespan and closed on shutdown, so calls reuse keep-alive
+  connections instead of paying a TCP+TLS handshake each time.
+- HTTP/2 when the h2 package is installed (the ``http2`` extra).
+- Records whether each request reused a pooled connection for /metrics.
+"""
+
+import importlib.util
+from typing import Any, Dict, Optional
+
+import httpx
+import structlog
+
+from app.api.core.metrics import record_http_client_request
+
+logger = structlog.get_logger()
+
+DEFAULT_TIMEOUT_SECONDS = 10.0
+DEFAULT_CONNECT_TIMEOUT_SECONDS = 5.0
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+class ConnectionTrace:
+    """httpcore ``trace`` extension noting whether a request opened a connection."""
+
+    def __init__(self) -> None:
+        self.new_connection = False
+
+    async def __call__(self, event_name: str, info: Dict[str, Any]) -> None:
+        if event_name.startswith("connection.connect_") and event_name.endswith(
+            ".complete"
+        ):
+            self.new_connection = True
+
+
+async def _attach_connection_trace(request: httpx.Request) -> None:
+    request.extensions["trace"] = ConnectionTrace()
+
+
+async def _record_connection_reuse(response: httpx.Response) -> None:
+    trace = response.request.extensions.get("trace")
+    if isinstance(trace, ConnectionTrace):
+        record_http_client_request(
+            response.request.url.host, reused=not trace.new_connection
+        )
+
+
+def http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def create_http_client(
+    timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+    connect_timeout_seconds: float = DEFAULT_CONNECT_TIMEOUT_SECONDS,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry_seconds: float = DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+) -> httpx.AsyncClient:
+    """Build a pooled client with explicit timeouts and connection limits."""
+    return httpx.AsyncClient(
+        http2=http2_available(),
+        timeout=httpx.Timeout(timeout_seconds, connect=connect_timeout_seconds),
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry_seconds,
+        ),
+        event_hooks={
+            "request": [_attach_connection_trace],
+            "response": [_record_connection_reuse],
+        },
+    )
+
+
+def start_http_client(**options: Any) -> httpx.AsyncClient:
+    """Create the shared client; called from the application lifespan."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_http_client(**options)
+        logger.info(
+            "HTTP client started",
+            http2=http2_available(),
+            operation="start_http_client",
+        )
+    return _client
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating one with defaults outside the lifespan."""
+    if _client is None or _client.is_closed:
+        return start_http_client()
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close pooled connections; called on application shutdown."""
+    global _client
+    if _client is None:
+        return
+    client, _client = _client, None
+    await client.aclose()
+    logger.info("HTTP client closed", operation="close_http_client")
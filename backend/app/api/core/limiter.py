@@ -1,8 +1,69 @@
 """
 API Rate Limiting
+- Counter storage is chosen by RATE_LIMIT_STORAGE_URI: ``memory://`` (per
+  process), ``redis://host:port`` (shared by every worker and host, needs the
+  ``redis`` extra) or ``sqlite:///path.db`` (shared by the workers of one host)
+- Authenticated endpoints are keyed on the access token's subject so users
+  behind one NAT address get their own buckets; everything else on client IP
 """
 
+import time
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from authlib.jose import JoseError, jwt
+from fastapi import Request
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
-limiter = Limiter(key_func=get_remote_address)
+from app.api.core import rate_limit_storage  # noqa: F401 - registers sqlite://
+from app.api.core.config import settings
+
+USER_KEY_PREFIX = "user:"
+
+
+@lru_cache(maxsize=1024)
+def _access_token_claims(token: str) -> Optional[Tuple[str, float]]:
+    """Return (subject, expiry) of a validly signed access token, otherwise None.
+
+    Only the signature check is cached; expiry is compared on every call by
+    token_subject, so a cached token stops keying a user bucket once it expires.
+    """
+    try:
+        claims = jwt.decode(token, settings.PUBLIC_KEY)
+        subject = claims.get("sub")
+        expires_at = float(claims["exp"])
+    except (JoseError, ValueError, TypeError, KeyError):
+        return None
+    if not subject or claims.get("type") != "access":
+        return None
+    return str(subject), expires_at
+
+
+def token_subject(token: str) -> Optional[str]:
+    """Return the subject of a validly signed, unexpired access token."""
+    claims = _access_token_claims(token)
+    if claims is None:
+        return None
+    subject, expires_at = claims
+    if expires_at <= time.time():
+        return None
+    return subject
+
+
+def user_rate_limit_key(request: Request) -> str:
+    """Key on the bearer token's user, falling back to the client IP."""
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if token and scheme.lower() == "bearer":
+        subject = token_subject(token)
+        if subject:
+            return f"{USER_KEY_PREFIX}{subject}"
+    return get_remote_address(request)
+
+
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=settings.RATE_LIMIT_STORAGE_URI,
+    strategy=settings.RATE_LIMIT_STRATEGY,
+    in_memory_fallback_enabled=True,
+)
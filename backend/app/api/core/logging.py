@@ -2,19 +2,24 @@
 Logging Configuration
 """
 
+import copy
 import logging
+import os
 import sys
 import threading
 import time
+from collections import deque
 from contextlib import contextmanager
 from logging.handlers import RotatingFileHandler
 from typing import (
     Any,
     Callable,
+    Deque,
     Generator,
     List,
     Mapping,
     MutableMapping,
+    Optional,
     Tuple,
     Union,
     cast,
@@ -23,6 +28,9 @@ from typing import (
 import structlog
 
 from app.api.core.config import settings
+from app.api.core.metrics import record_operation_duration
+from app.api.core.serialization import dumps_log_event, fast_json_enabled
+from app.api.core.tracing import span_attributes, tracer
 from app.api.middleware.logging_middleware import request_id_ctx_var
 
 ProcessorType = Callable[
@@ -30,39 +38,193 @@ ProcessorType = Callable[
     Union[Mapping[str, Any], str, bytes, bytearray, Tuple[Any, ...]],
 ]
 
-log_lock = threading.Lock()
 
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that leaves flushing to the batch writer."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
 
-def sync_log_to_file(
-    event_dict: MutableMapping[str, Any],
-) -> Union[Mapping[str, Any], str, bytes, bytearray, Tuple[Any, ...]]:
-    """Sync wrapper to execute logging function safely.
 
-    Note: only the event dictionary is used; logger and method_name
-    parameters were unused and removed to avoid lint warnings.
+class DroppingQueueHandler(logging.Handler):
+    """Buffers records for the file writer, dropping new ones once full.
+
+    Appending to a deque is thread-safe, so emitting takes no handler lock;
+    the drop counter is best effort under concurrent emitters.
     """
-    if settings.LOG_TO_FILE:
-        log_entry: str = f"{event_dict}\n"
+
+    def __init__(self, max_size: int) -> None:
+        super().__init__()
+        self.records: Deque[logging.LogRecord] = deque()
+        self.max_size = max_size
+        self.dropped = 0
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        if not self.filter(record):
+            return False
+        self.emit(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if len(self.records) >= self.max_size:
+            self.dropped += 1
+            return
+        self.records.append(self.prepare(record))
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Resolve arguments and exception info now, as QueueHandler does.
+
+        Structlog records arrive fully rendered, so they are queued untouched.
+        """
+        if not record.args and not record.exc_info and not record.stack_info:
+            return record
+        message = self.format(record)
+        record = copy.copy(record)
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        record.stack_info = None
+        return record
+
+
+class QueuedFileLogWriter:
+    """Writes buffered log records to one file handle from a background thread.
+
+    Request code only appends to a bounded buffer. Every ``flush_interval``
+    seconds the writer drains it in batches of up to ``batch_size`` records and
+    flushes the file once per batch. When the buffer is full new records are
+    dropped and counted, and the writer logs how many were lost.
+    """
+
+    def __init__(
+        self,
+        handler: RotatingFileHandler,
+        max_queue_size: int = 10000,
+        batch_size: int = 256,
+        flush_interval: float = 0.05,
+    ) -> None:
+        self.handler = handler
+        self.batch_size = max(batch_size, 1)
+        self.flush_interval = flush_interval
+        self.queue_handler = DroppingQueueHandler(max_queue_size)
+        self.written = 0
+        self._reported_dropped = 0
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def dropped(self) -> int:
+        return self.queue_handler.dropped
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="file-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Drain the buffer, flush and close the file."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self._drain()
+        self.handler.close()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.flush_interval):
+            self._drain()
+
+    def _drain(self) -> None:
+        records = self.queue_handler.records
+        while records:
+            for _ in range(min(len(records), self.batch_size)):
+                self.handler.handle(records.popleft())
+                self.written += 1
+            self._flush()
+        if self.dropped != self._reported_dropped:
+            self._report_dropped()
+            self._flush()
+
+    def _flush(self) -> None:
         try:
-            with log_lock:
-                append_to_file(log_entry)
+            self.handler.flush()
         except Exception as e:
-            print(f"Failed to log to file: {e}", file=sys.stderr)
-    return event_dict
+            print(f"Failed to flush log file: {e}", file=sys.stderr)
 
+    def _report_dropped(self) -> None:
+        dropped = self.dropped
+        self.handler.handle(
+            logging.makeLogRecord(
+                {
+                    "name": __name__,
+                    "levelno": logging.WARNING,
+                    "levelname": "WARNING",
+                    "msg": "Dropped %d log records: file log queue full",
+                    "args": (dropped - self._reported_dropped,),
+                }
+            )
+        )
+        self._reported_dropped = dropped
 
-def append_to_file(log_entry: str) -> None:
-    """Blocking file write function."""
-    try:
-        with open(settings.LOG_FILE, "a") as log_file:
-            log_file.write(log_entry)
-    except Exception as e:
-        print(f"Failed to write log entry: {e}", file=sys.stderr)
+
+_file_log_writer: Optional[QueuedFileLogWriter] = None
+
+
+def _get_file_log_writer() -> QueuedFileLogWriter:
+    global _file_log_writer
+    if _file_log_writer is not None and (
+        _file_log_writer.handler.baseFilename != os.path.abspath(settings.LOG_FILE)
+    ):
+        stop_file_logging()
+    if _file_log_writer is None:
+        _file_log_writer = QueuedFileLogWriter(
+            BufferedRotatingFileHandler(
+                settings.LOG_FILE,
+                maxBytes=settings.LOG_MAX_BYTES,
+                backupCount=settings.LOG_BACKUP_COUNT,
+                delay=True,
+            ),
+            max_queue_size=settings.LOG_QUEUE_SIZE,
+            batch_size=settings.LOG_BATCH_SIZE,
+            flush_interval=settings.LOG_FLUSH_INTERVAL_SECONDS,
+        )
+    _file_log_writer.start()
+    return _file_log_writer
+
+
+def stop_file_logging() -> None:
+    """Detach the file log queue and drain it to disk; used on shutdown."""
+    global _file_log_writer
+    if _file_log_writer is None:
+        return
+    writer, _file_log_writer = _file_log_writer, None
+    logging.getLogger().removeHandler(writer.queue_handler)
+    writer.stop()
 
 
 @contextmanager
 def log_timing(operation: str, **context: Any) -> Generator[None, None, None]:
-    """Context manager to log timing information for operations."""
+    """Context manager to log timing information for operations.
+
+    The operation runs inside a child span named after it, and its duration
+    is recorded in the operation latency histogram.
+    """
     start_time = time.monotonic()
     request_id = request_id_ctx_var.get()
 
@@ -71,9 +233,13 @@ def log_timing(operation: str, **context: Any) -> Generator[None, None, None]:
     logger.debug(f"Starting {operation}", **log_context)
 
     try:
-        yield
+        with tracer.start_as_current_span(
+            operation, attributes=span_attributes(log_context)
+        ):
+            yield
     finally:
         process_time = time.monotonic() - start_time
+        record_operation_duration(operation, process_time)
         if process_time > settings.SLOW_QUERY_THRESHOLD:
             logger.warning(
                 f"Slow operation detected: {operation}",
@@ -88,36 +254,17 @@ def log_timing(operation: str, **context: Any) -> Generator[None, None, None]:
             )
 
 
-def _file_handler_exists_for(root: logging.Logger) -> bool:
-    for h in root.handlers:
-        try:
-            if isinstance(h, RotatingFileHandler) and (
-                getattr(h, "baseFilename", None) == settings.LOG_FILE
-            ):
-                return True
-        except Exception:
-            continue
-    return False
-
-
-def _build_handlers() -> List[Union[logging.StreamHandler, RotatingFileHandler]]:
-    handlers: List[Union[logging.StreamHandler, RotatingFileHandler]] = [
-        logging.StreamHandler(sys.stdout)
-    ]
+def _build_handlers() -> List[logging.Handler]:
+    handlers: List[logging.Handler] = [logging.StreamHandler(sys.stdout)]
     if settings.LOG_TO_FILE is True:
-        root_logger = logging.getLogger()
-        if not _file_handler_exists_for(root_logger):
-            file_handler = RotatingFileHandler(
-                settings.LOG_FILE,
-                maxBytes=getattr(settings, "LOG_MAX_BYTES", 10 * 1024 * 1024),
-                backupCount=getattr(settings, "LOG_BACKUP_COUNT", 5),
-            )
-            handlers.append(file_handler)
+        handlers.append(_get_file_log_writer().queue_handler)
     return handlers
 
 
 def _is_duplicate_handler(h: Any, existing_handler: Any) -> bool:
     try:
+        if h is existing_handler:
+            return True
         if (
             isinstance(h, RotatingFileHandler)
             and isinstance(existing_handler, RotatingFileHandler)
@@ -151,6 +298,12 @@ def _attach_non_duplicate_handlers(root: logging.Logger, handlers: List) -> None
             root.addHandler(h)
 
 
+def _json_renderer() -> structlog.processors.JSONRenderer:
+    if fast_json_enabled():
+        return structlog.processors.JSONRenderer(serializer=dumps_log_event)
+    return structlog.processors.JSONRenderer()
+
+
 def _build_processors() -> List[ProcessorType]:
     base_processors = [
         structlog.stdlib.filter_by_level,
@@ -160,7 +313,7 @@ def _build_processors() -> List[ProcessorType]:
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer(),
+        _json_renderer(),
     ]
     if settings.ENVIRONMENT == "production":
         # In production we add container context and return the explicit
@@ -174,14 +327,14 @@ def _build_processors() -> List[ProcessorType]:
             add_container_context,
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer(),
+            _json_renderer(),
         ]
         return cast(List[ProcessorType], prod_processors)
     return cast(List[ProcessorType], base_processors)
 
 
 def configure_logging() -> None:
-    """Configures structured logging for FastAPI with async file logging."""
+    """Configures structured logging for FastAPI with queued file logging."""
     handlers = _build_handlers()
     configured_level = getattr(logging, settings.LOG_LEVEL.upper())
     logging.basicConfig(
@@ -0,0 +1,247 @@
+"""
+Metrics Configuration
+- Latency histograms and counters recorded through the OpenTelemetry metrics API.
+- In-memory reader rendered as Prometheus text for the /metrics endpoint.
+- Optional periodic file exporter for local dashboards and debugging.
+"""
+
+import math
+from typing import IO, Any, Dict, List, Mapping, Optional
+
+from opentelemetry import metrics
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import (
+    ConsoleMetricExporter,
+    Histogram,
+    InMemoryMetricReader,
+    MetricReader,
+    PeriodicExportingMetricReader,
+    Sum,
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; tuned for API latencies from sub-millisecond queries to slow requests
+LATENCY_BUCKETS_SECONDS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Route label used when a request did not match any route, keeps cardinality bounded
+UNMATCHED_ROUTE = "unmatched"
+
+# Instruments are created against the global proxy meter so they can be recorded
+# from any module at import time; they become live once configure_metrics runs.
+meter = metrics.get_meter(__name__)
+
+operation_duration = meter.create_histogram(
+    "app.operation.duration",
+    unit="s",
+    description="Duration of timed application operations by operation name",
+    explicit_bucket_boundaries_advisory=LATENCY_BUCKETS_SECONDS,
+)
+db_statement_duration = meter.create_histogram(
+    "db.client.operation.duration",
+    unit="s",
+    description="Duration of database statements by statement type",
+    explicit_bucket_boundaries_advisory=LATENCY_BUCKETS_SECONDS,
+)
+request_duration = meter.create_histogram(
+    "http.server.request.duration",
+    unit="s",
+    description="Duration of HTTP requests by route template",
+    explicit_bucket_boundaries_advisory=LATENCY_BUCKETS_SECONDS,
+)
+
+rate_limiter_wait = meter.create_histogram(
+    "app.rate_limiter.wait",
+    unit="s",
+    description="Time callers waited for a token bucket slot by limiter name",
+    explicit_bucket_boundaries_advisory=LATENCY_BUCKETS_SECONDS,
+)
+
+http_client_requests = meter.create_counter(
+    "http.client.requests",
+    description="Outbound HTTP requests by host and whether a pooled connection was reused",
+)
+
+circuit_breaker_transitions = meter.create_counter(
+    "app.circuit_breaker.transitions",
+    description="Circuit breaker state changes by breaker name and new state",
+)
+
+_metric_reader: Optional[InMemoryMetricReader] = None
+_meter_provider: Optional[MeterProvider] = None
+_export_stream: Optional[IO[str]] = None
+
+
+def configure_metrics(
+    export_file: Optional[str] = None,
+    export_interval_seconds: float = 60.0,
+) -> None:
+    """Install the SDK meter provider; safe to call more than once."""
+    global _metric_reader, _meter_provider, _export_stream
+    if _meter_provider is not None:
+        return
+
+    _metric_reader = InMemoryMetricReader()
+    readers: List[MetricReader] = [_metric_reader]
+    if export_file:
+        _export_stream = open(export_file, "a", encoding="utf-8")
+        readers.append(
+            PeriodicExportingMetricReader(
+                ConsoleMetricExporter(out=_export_stream),
+                export_interval_millis=export_interval_seconds * 1000,
+            )
+        )
+
+    _meter_provider = MeterProvider(metric_readers=readers)
+    metrics.set_meter_provider(_meter_provider)
+
+
+def flush_metrics() -> None:
+    """Push pending data points to the file exporter, if one is configured."""
+    if _meter_provider is None:
+        return
+    try:
+        _meter_provider.force_flush()
+        if _export_stream is not None:
+            _export_stream.flush()
+    except Exception:
+        pass
+
+
+def record_operation_duration(operation: str, duration: float) -> None:
+    operation_duration.record(duration, {"operation": operation})
+
+
+def record_db_statement_duration(statement: str, duration: float) -> None:
+    db_statement_duration.record(
+        duration, {"db.operation": statement_operation(statement)}
+    )
+
+
+def record_request_duration(
+    route: str, method: str, status_code: int, duration: float
+) -> None:
+    request_duration.record(
+        duration,
+        {
+            "http.route": route,
+            "http.request.method": method,
+            "http.response.status_code": status_code,
+        },
+    )
+
+
+def record_http_client_request(host: str, reused: bool) -> None:
+    http_client_requests.add(
+        1,
+        {"server.address": host, "http.connection.reused": str(reused).lower()},
+    )
+
+
+def record_rate_limiter_wait(limiter: str, wait: float) -> None:
+    rate_limiter_wait.record(wait, {"limiter": limiter})
+
+
+def record_circuit_breaker_transition(breaker: str, state: str) -> None:
+    circuit_breaker_transitions.add(1, {"breaker": breaker, "state": state})
+
+
+def statement_operation(statement: str) -> str:
+    """Return the leading SQL keyword (SELECT, INSERT, ...) of a statement."""
+    parts = statement.split(None, 1)
+    return parts[0].upper() if parts else "UNKNOWN"
+
+
+def route_template(scope: Mapping[str, Any]) -> str:
+    """Return the matched route path template (e.g. /api/v1/users/{user_id})."""
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    return path if isinstance(path, str) else UNMATCHED_ROUTE
+
+
+def _prometheus_name(name: str, unit: str) -> str:
+    base = "".join(c if c.isalnum() else "_" for c in name)
+    if unit == "s" and not base.endswith("_seconds"):
+        base = f"{base}_seconds"
+    return base
+
+
+def _render_histogram(name: str, histogram: Histogram) -> List[str]:
+    lines = [f"# TYPE {name} histogram"]
+    for point in histogram.data_points:
+        attributes = dict(point.attributes or {})
+        cumulative = 0
+        bounds = list(point.explicit_bounds) + [math.inf]
+        for bound, count in zip(bounds, point.bucket_counts):
+            cumulative += count
+            labels = _format_labels(attributes, le=_format_bound(bound))
+            lines.append(f"{name}_bucket{labels} {cumulative}")
+        labels = _format_labels(attributes)
+        lines.append(f"{name}_sum{labels} {point.sum}")
+        lines.append(f"{name}_count{labels} {point.count}")
+    return lines
+
+
+def _render_counter(name: str, counter: Sum) -> List[str]:
+    lines = [f"# TYPE {name} counter"]
+    for point in counter.data_points:
+        labels = _format_labels(dict(point.attributes or {}))
+        lines.append(f"{name}_total{labels} {point.value}")
+    return lines
+
+
+def _escape_label_value(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(attributes: Mapping[str, Any], **extra: str) -> str:
+    pairs: Dict[str, Any] = {
+        _prometheus_name(key, ""): value for key, value in attributes.items()
+    }
+    pairs.update(extra)
+    if not pairs:
+        return ""
+    body = ",".join(f'{k}="{_escape_label_value(v)}"' for k, v in pairs.items())
+    return f"{{{body}}}"
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if math.isinf(bound) else repr(float(bound))
+
+
+def render_prometheus_text() -> str:
+    """Render collected histograms and counters in the Prometheus text format."""
+    if _metric_reader is None:
+        return ""
+    metrics_data = _metric_reader.get_metrics_data()
+    if metrics_data is None:
+        return ""
+
+    lines: List[str] = []
+    for resource_metrics in metrics_data.resource_metrics:
+        for scope_metrics in resource_metrics.scope_metrics:
+            for metric in scope_metrics.metrics:
+                name = _prometheus_name(metric.name, metric.unit or "")
+                if isinstance(metric.data, Histogram):
+                    rendered = _render_histogram(name, metric.data)
+                elif isinstance(metric.data, Sum) and metric.data.is_monotonic:
+                    rendered = _render_counter(name, metric.data)
+                else:
+                    continue
+                lines.append(f"# HELP {name} {metric.description}")
+                lines.extend(rendered)
+    return "\n".join(lines) + "\n" if lines else ""
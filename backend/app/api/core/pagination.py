@@ -0,0 +1,39 @@
+"""
+Keyset Pagination
+- Cursors are opaque, URL-safe tokens wrapping the sort key of the last row
+  on a page; the next page continues strictly after that key, so every page
+  costs the same index range scan however deep the client has paged.
+"""
+
+import base64
+import json
+from typing import Any, Callable, Sequence, Tuple
+
+from fastapi import status
+
+from app.api.middleware.error_codes import REQUEST_INVALID_VALUE
+from app.api.middleware.exception_handler import BusinessLogicError
+
+
+def encode_cursor(key: Sequence[Any]) -> str:
+    """Encode a row's sort key as an opaque cursor."""
+    raw = json.dumps([str(value) for value in key], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str, parsers: Sequence[Callable[[str], Any]]
+) -> Tuple[Any, ...]:
+    """Decode a cursor, parsing each key part; anything malformed is a 400."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(key, list) or len(key) != len(parsers):
+            raise ValueError("Cursor key has the wrong shape")
+        return tuple(parse(str(part)) for parse, part in zip(parsers, key))
+    except (ValueError, UnicodeDecodeError):
+        raise BusinessLogicError(
+            message="Invalid pagination cursor",
+            error_code=REQUEST_INVALID_VALUE,
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
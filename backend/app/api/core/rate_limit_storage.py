@@ -0,0 +1,180 @@
+"""
+Rate Limit Storage
+- SQLite counter storage for the ``limits`` library, registered under the
+  ``sqlite://`` scheme so the API limiter can select it by URI.
+- One database file is shared by every worker process on a host; each
+  counter update is a single atomic UPSERT, so workers never lose hits.
+- Supports the fixed window and sliding window counter strategies.
+"""
+
+import sqlite3
+import threading
+import time
+from math import floor
+from typing import Any
+
+from limits.storage import Storage
+from limits.storage.base import SlidingWindowCounterSupport, TimestampedSlidingWindow
+
+PURGE_EVERY_WRITES = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_limits (
+    key TEXT PRIMARY KEY,
+    count INTEGER NOT NULL,
+    expires_at REAL NOT NULL
+)
+"""
+
+_INCR = """
+INSERT INTO rate_limits (key, count, expires_at) VALUES (:key, :amount, :expires_at)
+ON CONFLICT (key) DO UPDATE SET
+    count = CASE WHEN expires_at <= :now
+        THEN excluded.count ELSE count + excluded.count END,
+    expires_at = CASE WHEN expires_at <= :now
+        THEN excluded.expires_at ELSE expires_at END
+RETURNING count
+"""
+
+
+def sqlite_path(uri: str) -> str:
+    """Return the database path of a ``sqlite:///path`` URI (SQLAlchemy style)."""
+    path = uri.split("://", 1)[1]
+    if path.startswith("/"):
+        path = path[1:]
+    return path or ":memory:"
+
+
+class SQLiteStorage(Storage, SlidingWindowCounterSupport, TimestampedSlidingWindow):
+    """Rate limit counters in a SQLite database shared across worker processes.
+
+    URIs follow SQLAlchemy: ``sqlite:///relative.db``, ``sqlite:////abs/path.db``
+    or ``sqlite:///:memory:`` (per-process, for tests).
+    """
+
+    STORAGE_SCHEME = ["sqlite"]
+
+    def __init__(
+        self,
+        uri: str,
+        wrap_exceptions: bool = False,
+        timeout: float = 5.0,
+        **options: Any,
+    ) -> None:
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        self.path = sqlite_path(uri)
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._connection = sqlite3.connect(
+            self.path,
+            timeout=timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        if self.path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(_SCHEMA)
+
+    @property
+    def base_exceptions(self) -> type[Exception] | tuple[type[Exception], ...]:
+        return sqlite3.Error
+
+    def incr(self, key: str, expiry: float, amount: int = 1) -> int:
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                _INCR,
+                {"key": key, "amount": amount, "expires_at": now + expiry, "now": now},
+            ).fetchone()
+            self._writes += 1
+            if self._writes % PURGE_EVERY_WRITES == 0:
+                self._connection.execute(
+                    "DELETE FROM rate_limits WHERE expires_at <= ?", (now,)
+                )
+        return int(row[0])
+
+    def _decr(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self._connection.execute(
+                "UPDATE rate_limits SET count = max(count - ?, 0) WHERE key = ?",
+                (amount, key),
+            )
+
+    def get(self, key: str) -> int:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT count FROM rate_limits WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        return int(row[0]) if row else 0
+
+    def get_expiry(self, key: str) -> float:
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT expires_at FROM rate_limits WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+        return float(row[0]) if row else now
+
+    def check(self) -> bool:
+        try:
+            with self._lock:
+                self._connection.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def reset(self) -> int | None:
+        with self._lock:
+            return self._connection.execute("DELETE FROM rate_limits").rowcount
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM rate_limits WHERE key = ?", (key,))
+
+    def acquire_sliding_window_entry(
+        self, key: str, limit: int, expiry: int, amount: int = 1
+    ) -> bool:
+        if amount > limit:
+            return False
+        now = time.time()
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        previous_count, previous_ttl, current_count, _ = self._sliding_window_info(
+            previous_key, current_key, expiry, now
+        )
+        weighted_count = previous_count * previous_ttl / expiry + current_count
+        if floor(weighted_count) + amount > limit:
+            return False
+        # A new window counter lives for two windows so the next one can weigh it.
+        current_count = self.incr(current_key, 2 * expiry, amount=amount)
+        weighted_count = previous_count * previous_ttl / expiry + current_count
+        if floor(weighted_count) > limit:
+            # Another worker won the race for the last slot.
+            self._decr(current_key, amount)
+            return False
+        return True
+
+    def _sliding_window_info(
+        self, previous_key: str, current_key: str, expiry: int, now: float
+    ) -> tuple[int, float, int, float]:
+        previous_count = self.get(previous_key)
+        current_count = self.get(current_key)
+        previous_ttl = (
+            (1 - (((now - expiry) / expiry) % 1)) * expiry if previous_count else 0.0
+        )
+        current_ttl = (1 - ((now / expiry) % 1)) * expiry + expiry
+        return previous_count, previous_ttl, current_count, current_ttl
+
+    def get_sliding_window(
+        self, key: str, expiry: int
+    ) -> tuple[int, float, int, float]:
+        now = time.time()
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        return self._sliding_window_info(previous_key, current_key, expiry, now)
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        previous_key, current_key = self.sliding_window_keys(key, expiry, time.time())
+        self.clear(previous_key)
+        self.clear(current_key)
@@ -0,0 +1,41 @@
+"""
+JSON Serialization
+- Optional orjson backend (the ``fast-json`` extra) for log rendering and
+  API responses; UUIDs and datetimes are serialized natively.
+- Falls back to the standard library when orjson is not installed or
+  FAST_JSON_ENABLED is off.
+"""
+
+from typing import Any, Callable, Optional
+
+from fastapi.responses import JSONResponse
+
+from app.api.core.config import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - only without the fast-json extra
+    orjson = None  # type: ignore[assignment]
+
+
+def fast_json_enabled() -> bool:
+    """Return True when orjson is installed and FAST_JSON_ENABLED is set."""
+    return orjson is not None and settings.FAST_JSON_ENABLED
+
+
+def dumps_log_event(
+    obj: Any, default: Optional[Callable[[Any], Any]] = None, **_: Any
+) -> str:
+    """``json.dumps``-compatible serializer for structlog's JSONRenderer."""
+    assert orjson is not None
+    return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when enabled, otherwise the stdlib."""
+
+    def render(self, content: Any) -> bytes:
+        if not fast_json_enabled():
+            return super().render(content)
+        assert orjson is not None
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -0,0 +1,240 @@
+"""
+Token Bucket Limiter
+- Paces calls to an external API (Resend) across every worker process, not
+  just within one, by keeping the bucket in a shared backend chosen by URI:
+  ``memory://`` (per process), ``sqlite:///path.db`` (all workers on a host)
+  or ``redis://host:port`` (all hosts; needs the ``redis`` extra).
+- Acquisition reserves a slot atomically and returns how long the caller must
+  wait; callers sleep on their own, so no lock is held while waiting.
+- Reservations never block the event loop: SQLite runs in a worker thread and
+  Redis goes through the asyncio client.
+- Wait times are recorded for /metrics.
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Protocol, Tuple
+
+import structlog
+
+from app.api.core.metrics import record_rate_limiter_wait
+from app.api.core.rate_limit_storage import sqlite_path
+
+logger = structlog.get_logger()
+
+
+class TokenBucketBackend(Protocol):
+    async def reserve(
+        self, key: str, rate: float, capacity: float, max_wait: Optional[float]
+    ) -> Optional[float]:
+        """Take one token, returning the seconds until it is valid.
+
+        The bucket may go into debt so concurrent callers queue up behind each
+        other. Returns None, taking nothing, if the wait would exceed
+        ``max_wait`` (None means no limit).
+        """
+        ...
+
+
+def _refill(
+    state: Optional[Tuple[float, float]],
+    now: float,
+    rate: float,
+    capacity: float,
+    max_wait: Optional[float],
+) -> Tuple[Optional[float], float]:
+    """Return (wait or None, remaining tokens) for a reservation at ``now``."""
+    if state is None:
+        tokens = capacity
+    else:
+        tokens, updated_at = state
+        tokens = min(capacity, tokens + max(0.0, now - updated_at) * rate)
+    tokens -= 1
+    wait = -tokens / rate if tokens < 0 else 0.0
+    if max_wait is not None and wait > max_wait:
+        return None, tokens
+    return wait, tokens
+
+
+class MemoryTokenBucketBackend:
+    """Per-process buckets; the fallback when a shared backend is unavailable."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+
+    async def reserve(
+        self, key: str, rate: float, capacity: float, max_wait: Optional[float]
+    ) -> Optional[float]:
+        now = time.monotonic()
+        with self._lock:
+            wait, tokens = _refill(
+                self._buckets.get(key), now, rate, capacity, max_wait
+            )
+            if wait is not None:
+                self._buckets[key] = (tokens, now)
+        return wait
+
+
+class SQLiteTokenBucketBackend:
+    """Buckets in a SQLite file shared by the worker processes of one host.
+
+    Each reservation runs in a ``BEGIN IMMEDIATE`` transaction, which takes the
+    database write lock, so read-refill-write is atomic across processes. The
+    transaction runs in a worker thread, since waiting on that lock blocks.
+    """
+
+    def __init__(self, uri: str, timeout: float = 5.0) -> None:
+        self.path = sqlite_path(uri)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        if self.path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS token_buckets ("
+            "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+        )
+
+    async def reserve(
+        self, key: str, rate: float, capacity: float, max_wait: Optional[float]
+    ) -> Optional[float]:
+        return await asyncio.to_thread(self._reserve, key, rate, capacity, max_wait)
+
+    def _reserve(
+        self, key: str, rate: float, capacity: float, max_wait: Optional[float]
+    ) -> Optional[float]:
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = connection.execute(
+                    "SELECT tokens, updated_at FROM token_buckets WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                wait, tokens = _refill(row, now, rate, capacity, max_wait)
+                if wait is not None:
+                    connection.execute(
+                        "INSERT INTO token_buckets (key, tokens, updated_at) "
+                        "VALUES (?, ?, ?) ON CONFLICT (key) DO UPDATE SET "
+                        "tokens = excluded.tokens, updated_at = excluded.updated_at",
+                        (key, tokens, now),
+                    )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        return wait
+
+
+# Server clock (TIME) keeps hosts with skewed clocks consistent. Numbers are
+# returned as strings because Redis truncates Lua numbers to integers.
+_REDIS_RESERVE = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local max_wait = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = capacity
+if state[1] then
+    tokens = math.min(capacity,
+        tonumber(state[1]) + math.max(0, now - tonumber(state[2])) * rate)
+end
+tokens = tokens - 1
+local wait = 0
+if tokens < 0 then wait = -tokens / rate end
+if max_wait >= 0 and wait > max_wait then return false end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(wait + capacity / rate) + 1)
+return tostring(wait)
+"""
+
+
+class RedisTokenBucketBackend:
+    """Buckets in Redis, shared across hosts; each reservation is one Lua call."""
+
+    def __init__(self, uri: str, client: Any = None) -> None:
+        if client is None:
+            import redis.asyncio
+
+            client = redis.asyncio.Redis.from_url(uri)
+        self._script = client.register_script(_REDIS_RESERVE)
+
+    async def reserve(
+        self, key: str, rate: float, capacity: float, max_wait: Optional[float]
+    ) -> Optional[float]:
+        result = await self._script(
+            keys=[key], args=[rate, capacity, -1 if max_wait is None else max_wait]
+        )
+        return None if result is None else float(result)
+
+
+def create_token_bucket_backend(uri: str) -> TokenBucketBackend:
+    """Build the backend for a ``memory://``, ``sqlite://`` or ``redis://`` URI."""
+    scheme = uri.split("://", 1)[0]
+    if scheme == "memory":
+        return MemoryTokenBucketBackend()
+    if scheme == "sqlite":
+        return SQLiteTokenBucketBackend(uri)
+    if scheme in ("redis", "rediss"):
+        return RedisTokenBucketBackend(uri)
+    raise ValueError(f"Unsupported token bucket storage URI scheme: {scheme}")
+
+
+class TokenBucketLimiter:
+    """Allow ``rate`` calls per second with bursts of up to ``burst`` calls."""
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        burst: int,
+        backend: Optional[TokenBucketBackend] = None,
+    ) -> None:
+        self.name = name
+        self.key = f"token-bucket:{name}"
+        self.rate = rate
+        self.burst = burst
+        self.backend = backend or MemoryTokenBucketBackend()
+        self._fallback = MemoryTokenBucketBackend()
+
+    async def _reserve(self, max_wait: Optional[float]) -> Optional[float]:
+        try:
+            return await self.backend.reserve(self.key, self.rate, self.burst, max_wait)
+        except Exception as exc:
+            # Pacing per process beats failing the send if the store is down.
+            logger.warning(
+                "Token bucket backend unavailable; using per-process bucket",
+                limiter=self.name,
+                error=str(exc),
+                error_type=type(exc).__name__,
+            )
+            return await self._fallback.reserve(
+                self.key, self.rate, self.burst, max_wait
+            )
+
+    async def try_acquire(self) -> bool:
+        """Take a token only if one is available now; never sleeps."""
+        wait = await self._reserve(max_wait=0.0)
+        if wait is None:
+            return False
+        record_rate_limiter_wait(self.name, 0.0)
+        return True
+
+    async def acquire(self) -> float:
+        """Reserve a token, sleep until it is valid and return the seconds waited."""
+        wait = await self._reserve(max_wait=None) or 0.0
+        record_rate_limiter_wait(self.name, wait)
+        if wait > 0:
+            logger.debug(
+                "Token bucket wait before call",
+                limiter=self.name,
+                wait_seconds=round(wait, 3),
+            )
+            await asyncio.sleep(wait)
+        return wait
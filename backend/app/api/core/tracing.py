@@ -0,0 +1,125 @@
+"""
+Tracing Configuration
+- Parent-based, trace-id ratio sampled tracer provider.
+- Optional JSON-lines span exporter writing to a local file (or stdout).
+- Helpers for child spans around DB statements and outbound HTTP calls.
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+from typing import IO, Any, Generator, Mapping, Optional
+
+from opentelemetry import trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+from opentelemetry.trace import Span, SpanKind, Status, StatusCode
+
+# Export target value that sends spans to stdout instead of a file
+STDOUT_EXPORT_TARGET = "-"
+
+# Statement text is truncated on spans, matching the database debug logs
+MAX_STATEMENT_LENGTH = 200
+
+tracer = trace.get_tracer(__name__)
+
+_tracer_provider: Optional[TracerProvider] = None
+_export_stream: Optional[IO[str]] = None
+
+
+def _format_span(span: ReadableSpan) -> str:
+    return str(span.to_json(indent=None)) + os.linesep
+
+
+def configure_tracing(
+    service_name: str,
+    sample_ratio: float = 1.0,
+    export_file: Optional[str] = None,
+) -> None:
+    """Install the SDK tracer provider; safe to call more than once."""
+    global _tracer_provider, _export_stream
+    if _tracer_provider is not None:
+        return
+
+    _tracer_provider = TracerProvider(
+        sampler=ParentBased(TraceIdRatioBased(min(max(sample_ratio, 0.0), 1.0))),
+        resource=Resource.create({"service.name": service_name}),
+    )
+    if export_file:
+        _export_stream = (
+            sys.stdout
+            if export_file == STDOUT_EXPORT_TARGET
+            else open(export_file, "a", encoding="utf-8")
+        )
+        _tracer_provider.add_span_processor(
+            BatchSpanProcessor(
+                ConsoleSpanExporter(
+                    service_name=service_name,
+                    out=_export_stream,
+                    formatter=_format_span,
+                )
+            )
+        )
+    trace.set_tracer_provider(_tracer_provider)
+
+
+def flush_tracing() -> None:
+    """Export any spans still buffered in the batch processor."""
+    if _tracer_provider is None:
+        return
+    try:
+        _tracer_provider.force_flush()
+        if _export_stream is not None:
+            _export_stream.flush()
+    except Exception:
+        pass
+
+
+def span_attributes(context: Mapping[str, Any]) -> dict[str, Any]:
+    """Keep only values OpenTelemetry accepts as attributes, skipping None."""
+    return {
+        key: value
+        for key, value in context.items()
+        if isinstance(value, (str, bool, int, float))
+    }
+
+
+def start_db_statement_span(statement: str, db_system: str, operation: str) -> Span:
+    """Start a client span for a single cursor execute; the caller must end it."""
+    return tracer.start_span(
+        operation,
+        kind=SpanKind.CLIENT,
+        attributes={
+            "db.system": db_system,
+            "db.operation": operation,
+            "db.statement": statement[:MAX_STATEMENT_LENGTH],
+        },
+    )
+
+
+def end_span_with_error(span: Span, error: BaseException) -> None:
+    span.record_exception(error)
+    span.set_status(Status(StatusCode.ERROR, type(error).__name__))
+    span.end()
+
+
+@contextmanager
+def http_client_span(
+    method: str, url: str, **attributes: Any
+) -> Generator[Span, None, None]:
+    """Wrap an outbound HTTP call in a client span.
+
+    The caller should set ``http.response.status_code`` on the yielded span.
+    """
+    with tracer.start_as_current_span(
+        f"HTTP {method}",
+        kind=SpanKind.CLIENT,
+        attributes={
+            "http.request.method": method,
+            "url.full": url,
+            **span_attributes(attributes),
+        },
+    ) as span:
+        yield span
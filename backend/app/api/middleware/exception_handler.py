@@ -21,6 +21,7 @@ from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoin
 from starlette.responses import Response
 
 from app.api.core.config import settings
+from app.api.core.serialization import FastJSONResponse
 from app.api.middleware.error_codes import (
     AUTH_EXPIRED_TOKEN,
     AUTH_INVALID_CREDENTIALS,
@@ -186,7 +187,7 @@ def create_error_response(
             }
         )
 
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=status_code,
         content={"detail": [error_detail]},
         headers={"X-Request-ID": request_id},
@@ -242,7 +243,7 @@ def validation_exception_handler(request: Request, exc: Exception) -> JSONRespon
     # Format validation errors with security sanitization
     formatted_errors = [_format_validation_error(error) for error in exc.errors()]
 
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
         content={"detail": formatted_errors},
         headers={"X-Request-ID": request_id},
@@ -283,7 +284,7 @@ def pydantic_validation_exception_handler(
             }
         )
 
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
         content={"detail": formatted_errors},
         headers={"X-Request-ID": request_id},
@@ -313,7 +314,7 @@ def http_exception_handler(request: Request, exc: Exception) -> JSONResponse:
         }
     ]
 
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=exc.status_code,
         content={"detail": error_detail},
         headers={"X-Request-ID": request_id},
@@ -3,21 +3,27 @@ Logging Middleware
 """
 
 import json
+import random
 import re
 import time
 import uuid
 from contextvars import ContextVar
-from typing import Any, Awaitable, Callable, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Tuple
 from urllib.parse import urlsplit, urlunsplit
 
 import structlog
-from fastapi import Request, Response
 from opentelemetry import trace
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import URL, QueryParams
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from structlog.contextvars import bind_contextvars, clear_contextvars
 
+from app.api.core.metrics import record_request_duration, route_template
+from app.api.middleware.security_headers_middleware import (
+    SECURITY_HEADER_NAMES,
+    SECURITY_HEADERS,
+)
+
 logger = structlog.get_logger()
 request_id_ctx_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
 
@@ -105,31 +111,72 @@ SENSITIVE_FIELDS = {
     "credential",
 }
 
-limiter = Limiter(key_func=get_remote_address)
+# Every key fragment the header, parameter and field sanitizers redact on
+SENSITIVE_KEYS: frozenset[str] = frozenset(
+    SENSITIVE_FIELDS | SENSITIVE_HEADERS | SENSITIVE_PARAMS
+)
+
+
+def _alternation(words: Iterable[str]) -> str:
+    # Longest first so e.g. "authorization" wins over "auth" at the same position
+    return "|".join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+
+
+_SENSITIVE_KEY_RE = re.compile(_alternation(SENSITIVE_KEYS), re.IGNORECASE)
+
+# "<field>...=value" or "<field>...: value" assignments inside free-form text.
+# Matched against lowercased text: case-insensitive alternations scan far slower.
+_SENSITIVE_ASSIGNMENT_PATTERN = (
+    rf"({_alternation(SENSITIVE_FIELDS)})[^\s]*\s*[=:]\s*[^\s]+"
+)
+_SENSITIVE_ASSIGNMENT_RE = re.compile(_SENSITIVE_ASSIGNMENT_PATTERN)
+_SENSITIVE_ASSIGNMENT_IGNORECASE_RE = re.compile(
+    _SENSITIVE_ASSIGNMENT_PATTERN, re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=4096)
+def is_sensitive_key(key: str) -> bool:
+    """Return True if a header, parameter or field name contains a sensitive key."""
+    return _SENSITIVE_KEY_RE.search(key) is not None
 
 
 def sanitize_headers(headers: Dict) -> Dict:
     """Redact sensitive header values."""
-    sanitized = {}
-    for key, value in headers.items():
-        key_lower = key.lower()
-        if any(sensitive in key_lower for sensitive in SENSITIVE_HEADERS):
-            sanitized[key] = REDACTED
-        else:
-            sanitized[key] = value
-    return sanitized
+    return {
+        key: REDACTED if is_sensitive_key(key) else value
+        for key, value in headers.items()
+    }
 
 
 def sanitize_params(params: Dict) -> Dict:
     """Redact sensitive query parameter values."""
-    sanitized = {}
-    for key, value in params.items():
-        key_lower = key.lower()
-        if any(sensitive in key_lower for sensitive in SENSITIVE_PARAMS):
-            sanitized[key] = REDACTED
-        else:
-            sanitized[key] = value
-    return sanitized
+    return {
+        key: REDACTED if is_sensitive_key(key) else value
+        for key, value in params.items()
+    }
+
+
+def _redact_assignment(match: re.Match[str]) -> str:
+    return f"{match.group(1).lower()}={REDACTED}"
+
+
+def _redact_assignments(text: str) -> str:
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # Some characters change length when lowercased, so offsets would not line up
+        return _SENSITIVE_ASSIGNMENT_IGNORECASE_RE.sub(_redact_assignment, text)
+
+    parts: list[str] = []
+    position = 0
+    for match in _SENSITIVE_ASSIGNMENT_RE.finditer(lowered):
+        parts.append(text[position : match.start()])
+        parts.append(_redact_assignment(match))
+        position = match.end()
+    if not parts:
+        return text
+    parts.append(text[position:])
+    return "".join(parts)
 
 
 def sanitize_error_message(error_msg: str) -> str:
@@ -141,28 +188,18 @@ def sanitize_error_message(error_msg: str) -> str:
     Returns:
         A sanitized version of the error message with sensitive data redacted
     """
-    # Try to parse free-form JSON and scrub known sensitive keys.
-    try:
-        parsed = json.loads(error_msg)
-        if isinstance(parsed, (dict, list)):
-            try:
-                return json.dumps(_scrub_obj(parsed))
-            except Exception:
-                # Fall back to textual redaction if JSON re-dump fails
-                pass
-    except Exception:
-        # Not JSON or failed to parse — fall back to regex scrubbing below
-        pass
-
-    # Textual regex-based redaction for known sensitive fields
-    lower_msg = error_msg.lower()
-    for field in SENSITIVE_FIELDS:
-        if field in lower_msg:
-            pattern = rf"{field}[^\s]*\s*[=:]\s*[^\s]+"
-            error_msg = re.sub(
-                pattern, f"{field}={REDACTED}", error_msg, flags=re.IGNORECASE
-            )
-    return error_msg
+    # Only messages that look like a JSON object or array are worth parsing
+    stripped = error_msg.strip()
+    if stripped[:1] + stripped[-1:] in ("{}", "[]"):
+        try:
+            parsed = json.loads(error_msg)
+            return json.dumps(_scrub_obj(parsed))
+        except Exception:
+            # Not JSON or failed to re-dump — fall back to regex scrubbing below
+            pass
+
+    # Single-pass textual redaction for known sensitive fields
+    return _redact_assignments(error_msg)
 
 
 def _scrub_obj(obj: Any) -> Any:
@@ -173,7 +210,7 @@ def _scrub_obj(obj: Any) -> Any:
     """
     if isinstance(obj, dict):
         return {
-            k: (REDACTED if k.lower() in SENSITIVE_FIELDS else _scrub_obj(v))
+            k: (REDACTED if is_sensitive_key(k) else _scrub_obj(v))
             for k, v in obj.items()
         }
     if isinstance(obj, list):
@@ -183,64 +220,202 @@ def _scrub_obj(obj: Any) -> Any:
 
 tracer = trace.get_tracer(__name__)
 
+# Response headers the middleware owns; any value the app set is replaced
+_REPLACED_RESPONSE_HEADERS: frozenset[bytes] = SECURITY_HEADER_NAMES | {b"x-request-id"}
+
+# Request and response headers included in access logs by default
+DEFAULT_ACCESS_LOG_HEADERS: tuple[str, ...] = (
+    "accept",
+    "content-length",
+    "content-type",
+    "origin",
+    "referer",
+    "retry-after",
+    "user-agent",
+    "x-forwarded-for",
+    "x-ratelimit-limit",
+    "x-ratelimit-remaining",
+)
+
+# Allow-list entry that logs every (sanitized) header
+ALL_HEADERS = "*"
+
+TRUNCATED_SUFFIX = "...[truncated]"
+
+
+def truncate_value(value: str, max_length: Optional[int]) -> str:
+    """Cap a logged string at max_length characters, marking the cut."""
+    if max_length is None or len(value) <= max_length:
+        return value
+    return value[:max_length] + TRUNCATED_SUFFIX
+
+
+def _decode_headers(raw_headers: Iterable[Tuple[bytes, bytes]]) -> Dict[str, str]:
+    return {
+        key.decode("latin-1").lower(): value.decode("latin-1")
+        for key, value in raw_headers
+    }
+
+
+def _span_log_ids(span: trace.Span) -> Tuple[Optional[str], Optional[str]]:
+    """Return hex trace and span ids for log correlation, if the span has them."""
+    span_ctx = span.get_span_context()
+    try:
+        trace_id = (
+            format(span_ctx.trace_id, "032x")
+            if getattr(span_ctx, "trace_id", None)
+            else None
+        )
+        span_id = (
+            format(span_ctx.span_id, "016x")
+            if getattr(span_ctx, "span_id", None)
+            else None
+        )
+    except Exception:
+        return None, None
+    return trace_id, span_id
+
 
-class AsyncLoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
+class AsyncLoggingMiddleware:
+    """Pure ASGI middleware for request context, logging, tracing and security headers.
+
+    The wrapped app runs in the same task, so contextvars bound here are visible
+    to handlers and streaming responses pass through untouched; only the
+    ``http.response.start`` message is rewritten to append the fixed headers.
+
+    Access logs are sampled: a ``sample_rate`` fraction of requests log both the
+    request and the response. Error (4xx/5xx) and slow responses are always
+    logged; when the request line was sampled out its fields are folded into
+    the response line instead. Logged headers are limited to
+    ``header_allowlist`` (``"*"`` for all) and string fields are capped at
+    ``max_field_length`` characters.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = 1.0,
+        slow_request_seconds: float = 1.0,
+        max_field_length: Optional[int] = 256,
+        header_allowlist: Iterable[str] = DEFAULT_ACCESS_LOG_HEADERS,
+    ) -> None:
+        self.app = app
+        self.sample_rate = sample_rate
+        self.slow_request_seconds = slow_request_seconds
+        self.max_field_length = max_field_length
+        allowlist = {header.lower() for header in header_allowlist}
+        self.header_allowlist: Optional[frozenset[str]] = (
+            None if ALL_HEADERS in allowlist else frozenset(allowlist)
+        )
+
+    def _is_sampled(self) -> bool:
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+    def _loggable_headers(self, headers: Iterable[Tuple[str, str]]) -> Dict[str, str]:
+        allowlist = self.header_allowlist
+        selected = {
+            key: value
+            for key, value in headers
+            if allowlist is None or key in allowlist
+        }
+        return {
+            key: truncate_value(value, self.max_field_length)
+            for key, value in sanitize_headers(selected).items()
+        }
+
+    def _request_log_fields(
+        self, scope: Scope, url: str, client_ip: str
+    ) -> Dict[str, Any]:
+        raw_headers: Iterable[Tuple[bytes, bytes]] = scope.get("headers", [])
+        params = sanitize_params(dict(QueryParams(scope.get("query_string", b""))))
+        return {
+            "method": scope["method"],
+            "url": truncate_value(redact_url_tokens(url), self.max_field_length),
+            "client_ip": client_ip,
+            "headers": self._loggable_headers(
+                (key.decode("latin-1").lower(), value.decode("latin-1"))
+                for key, value in raw_headers
+            ),
+            "query_params": {
+                key: truncate_value(value, self.max_field_length)
+                for key, value in params.items()
+            },
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Logs incoming requests, outgoing responses, and rate-limiting events."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         clear_contextvars()
         request_id = str(uuid.uuid4())
-        bind_contextvars(
-            request_id=request_id,
-            ip=request.client.host if request.client else "Unknown",
-            method=request.method,
-            path=request.url.path,
-        )
+        method: str = scope["method"]
+        path: str = scope["path"]
+        client = scope.get("client")
+        client_ip: str = client[0] if client else "Unknown"
+        bind_contextvars(request_id=request_id, ip=client_ip, method=method, path=path)
         request_id_ctx_var.set(request_id)
         start_time = time.monotonic()
-
-        client_ip: Optional[str] = request.client.host if request.client else "Unknown"
-
-        with tracer.start_as_current_span("http_request") as span:
-            span.set_attribute("http.method", request.method)
-            span.set_attribute("http.url", str(request.url))
-            span.set_attribute(
-                "http.client_ip", client_ip if client_ip is not None else ""
-            )
-
+        url = str(URL(scope=scope))
+        request_id_header = (b"x-request-id", request_id.encode("latin-1"))
+        status_code = 500
+        sampled = self._is_sampled()
+
+        with tracer.start_as_current_span(
+            "http_request", kind=trace.SpanKind.SERVER
+        ) as span:
+            span.set_attribute("http.method", method)
+            span.set_attribute("http.url", url)
+            span.set_attribute("http.client_ip", client_ip)
             # Add trace/span ids into the context for log correlation
-            span_ctx = span.get_span_context()
-            trace_id = None
-            span_id = None
-            try:
-                trace_id = (
-                    format(span_ctx.trace_id, "032x")
-                    if getattr(span_ctx, "trace_id", None)
-                    else None
-                )
-                span_id = (
-                    format(span_ctx.span_id, "016x")
-                    if getattr(span_ctx, "span_id", None)
-                    else None
+            trace_id, span_id = _span_log_ids(span)
+
+            if sampled:
+                logger.info(
+                    "Incoming request",
+                    request_id=request_id,
+                    **self._request_log_fields(scope, url, client_ip),
                 )
-            except Exception:
-                trace_id = None
-                span_id = None
 
-            logger.info(
-                "Incoming request",
-                request_id=request_id,
-                method=request.method,
-                url=redact_url_tokens(str(request.url)),
-                client_ip=client_ip,
-                headers=sanitize_headers(dict(request.headers)),
-                query_params=sanitize_params(dict(request.query_params)),
-            )
+            async def send_with_headers(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    raw_headers = message.get("headers", [])
+                    self._log_response(
+                        scope,
+                        url,
+                        request_id,
+                        client_ip,
+                        status_code,
+                        _decode_headers(raw_headers),
+                        time.monotonic() - start_time,
+                        sampled,
+                    )
+                    message = {
+                        **message,
+                        "headers": [
+                            *(
+                                header
+                                for header in raw_headers
+                                if header[0].lower() not in _REPLACED_RESPONSE_HEADERS
+                            ),
+                            *SECURITY_HEADERS,
+                            request_id_header,
+                        ],
+                    }
+                await send(message)
 
             try:
-                response: Response = await call_next(request)
+                await self.app(scope, receive, send_with_headers)
             except Exception as exc:
+                record_request_duration(
+                    route_template(scope),
+                    method,
+                    500,
+                    time.monotonic() - start_time,
+                )
                 error_category = (
                     "OperationalError"
                     if isinstance(exc, (OSError, ConnectionError))
@@ -254,33 +429,61 @@ class AsyncLoggingMiddleware(BaseHTTPMiddleware):
                     error_type=type(exc).__name__,
                     error_category=error_category,
                     exc_info=True,
-                    path=request.url.path,
-                    method=request.method,
+                    path=path,
+                    method=method,
                     trace_id=trace_id,
                     span_id=span_id,
                 )
                 raise
 
-            rate_limit_remaining = response.headers.get("X-RateLimit-Remaining", None)
-            if rate_limit_remaining == "0":
-                logger.warning(
-                    "Rate limit exceeded",
-                    request_id=request_id,
-                    client_ip=client_ip,
-                    method=request.method,
-                    path=request.url.path,
-                )
+            route = route_template(scope)
+            span.set_attribute("http.route", route)
+            span.set_attribute("http.status_code", status_code)
+            record_request_duration(
+                route,
+                method,
+                status_code,
+                time.monotonic() - start_time,
+            )
 
-            process_time = time.monotonic() - start_time
-            logger.info(
-                "Outgoing response",
-                request_id=request_id_ctx_var.get(),
-                status_code=response.status_code,
-                process_time=f"{process_time:.3f}s",
-                response_headers=sanitize_headers(dict(response.headers)),
-                content_length=response.headers.get("content-length"),
-                rate_limit_remaining=rate_limit_remaining,
-                rate_limit_limit=response.headers.get("X-RateLimit-Limit", "N/A"),
+    def _log_response(
+        self,
+        scope: Scope,
+        url: str,
+        request_id: str,
+        client_ip: str,
+        status_code: int,
+        response_headers: Dict[str, str],
+        process_time: float,
+        sampled: bool,
+    ) -> None:
+        rate_limit_remaining = response_headers.get("x-ratelimit-remaining")
+        if rate_limit_remaining == "0":
+            logger.warning(
+                "Rate limit exceeded",
+                request_id=request_id,
+                client_ip=client_ip,
+                method=scope["method"],
+                path=scope["path"],
             )
-            response.headers["X-Request-ID"] = request_id
-            return response
+
+        slow = process_time >= self.slow_request_seconds
+        if not (sampled or slow or status_code >= 400):
+            return
+
+        # Requests sampled out on the way in still get their details logged here
+        request_fields = (
+            {} if sampled else self._request_log_fields(scope, url, client_ip)
+        )
+        logger.info(
+            "Outgoing response",
+            request_id=request_id_ctx_var.get(),
+            status_code=status_code,
+            process_time=f"{process_time:.3f}s",
+            slow=slow,
+            response_headers=self._loggable_headers(response_headers.items()),
+            content_length=response_headers.get("content-length"),
+            rate_limit_remaining=rate_limit_remaining,
+            rate_limit_limit=response_headers.get("x-ratelimit-limit", "N/A"),
+            **request_fields,
+        )
@@ -2,6 +2,8 @@ from app.api.models.disease_and_pest.disease_model import Disease
 from app.api.models.disease_and_pest.intervention_model import Intervention
 from app.api.models.disease_and_pest.pest_model import Pest
 from app.api.models.disease_and_pest.symptom_model import Symptom
+from app.api.models.email.email_outbox_model import EmailOutbox
+from app.api.models.email.inbound_email_model import InboundEmail
 from app.api.models.family.botanical_group_model import BotanicalGroup
 from app.api.models.family.family_model import Family
 from app.api.models.grow_guide.calendar_model import Day
@@ -26,4 +28,6 @@ __all__ = [
     "Intervention",
     "Day",
     "Feed",
+    "EmailOutbox",
+    "InboundEmail",
 ]
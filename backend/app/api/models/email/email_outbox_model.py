@@ -0,0 +1,67 @@
+"""
+Email Outbox Model
+- Transactional emails queued in the same transaction as the change that
+  triggers them, then delivered by the background outbox worker.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import (
+    JSON,
+    CheckConstraint,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.api.core.database import Base
+
+EMAIL_STATUS_PENDING = "pending"
+EMAIL_STATUS_FAILED = "failed"
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class EmailOutbox(Base):
+    """A queued Resend send request awaiting delivery."""
+
+    __tablename__ = "email_outbox"
+
+    email_outbox_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+        nullable=False,
+    )
+    email_kind: Mapped[str] = mapped_column(String(50), nullable=False)
+    payload: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(10), nullable=False, default=EMAIL_STATUS_PENDING
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=_utcnow
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('pending', 'failed')", name="check_email_outbox_status"
+        ),
+        CheckConstraint("attempts >= 0", name="check_email_outbox_attempts"),
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
@@ -0,0 +1,73 @@
+"""
+Inbound Email Model
+- Resend inbound webhook deliveries, stored before the webhook is
+  acknowledged and forwarded by the background inbound email worker.
+- ``svix_id`` is unique, so a redelivery is recognised in every process; a
+  processed row keeps only its id until the dedupe window has passed.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import (
+    JSON,
+    CheckConstraint,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.api.core.database import Base
+
+INBOUND_STATUS_PENDING = "pending"
+INBOUND_STATUS_PROCESSED = "processed"
+INBOUND_STATUS_FAILED = "failed"
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class InboundEmail(Base):
+    """A verified inbound email webhook delivery awaiting forwarding."""
+
+    __tablename__ = "inbound_emails"
+
+    inbound_email_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+        nullable=False,
+    )
+    svix_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    payload: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(10), nullable=False, default=INBOUND_STATUS_PENDING
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=_utcnow
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("svix_id", name="uq_inbound_emails_svix_id"),
+        CheckConstraint(
+            "status IN ('pending', 'processed', 'failed')",
+            name="check_inbound_emails_status",
+        ),
+        CheckConstraint("attempts >= 0", name="check_inbound_emails_attempts"),
+        Index("ix_inbound_emails_status_next_attempt_at", "status", "next_attempt_at"),
+    )
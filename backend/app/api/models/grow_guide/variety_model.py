@@ -14,11 +14,13 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -256,8 +258,31 @@ class Variety(Base):
             "notes IS NULL OR (LENGTH(notes) >= 5 AND LENGTH(notes) <= 500)",
             name="check_notes_length",
         ),
+        # Keyset pagination of the public catalogue by (name, id)
+        Index(
+            "ix_variety_public_name_id",
+            "variety_name",
+            "variety_id",
+            postgresql_where=text("is_public"),
+            sqlite_where=text("is_public"),
+        ),
     )
 
+    # Fetch server-generated values (last_updated) with RETURNING on INSERT
+    # and UPDATE instead of expiring them for a later SELECT.
+    __mapper_args__ = {"eager_defaults": True}
+
+
+# Trigram name search over the public catalogue (pg_trgm). Other databases
+# search with the in-memory index in services/grow_guide/variety_search_index.
+Index(
+    "ix_variety_public_name_trgm",
+    func.lower(Variety.variety_name).label("variety_name_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"variety_name_lower": "gin_trgm_ops"},
+    postgresql_where=text("is_public"),
+).ddl_if(dialect="postgresql")
+
 
 class VarietyWaterDay(Base):
     """Junction table linking varieties to their watering days."""
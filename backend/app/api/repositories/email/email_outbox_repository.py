@@ -0,0 +1,137 @@
+"""
+Email Outbox Repository
+- Encapsulates database operations for the EmailOutbox model
+- Claims due rows with a lease so several workers never send the same email
+- Failed emails keep only their envelope: the rendered body can carry
+  single-use token links, which should not sit in the database
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, cast
+from uuid import UUID
+
+import structlog
+from sqlalchemy import CursorResult, delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.core.logging import log_timing
+from app.api.middleware.error_handler import translate_db_exceptions
+from app.api.middleware.logging_middleware import request_id_ctx_var
+from app.api.models.email.email_outbox_model import (
+    EMAIL_STATUS_FAILED,
+    EMAIL_STATUS_PENDING,
+    EmailOutbox,
+)
+
+logger = structlog.get_logger()
+
+# Payload keys kept on a failed email so it can still be traced
+_ENVELOPE_KEYS = ("from", "to", "subject")
+
+
+def _envelope(payload: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: payload[key] for key in _ENVELOPE_KEYS if key in payload}
+
+
+class EmailOutboxRepository:
+    """Email outbox repository for database operations."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.request_id = request_id_ctx_var.get()
+
+    def add(self, email_kind: str, payload: Dict[str, Any]) -> EmailOutbox:
+        """Queue an email in the current transaction."""
+        email = EmailOutbox()
+        email.email_kind = email_kind
+        email.payload = payload
+        self.db.add(email)
+        return email
+
+    @translate_db_exceptions
+    async def claim_due(self, limit: int, lease_seconds: float) -> List[EmailOutbox]:
+        """Lease up to ``limit`` due emails, pushing their next attempt past the lease.
+
+        Rows locked by another worker are skipped (PostgreSQL); an expired
+        lease makes an email due again if its worker died mid-send.
+        """
+        now = datetime.now(timezone.utc)
+        with log_timing("db_claim_due_emails", request_id=self.request_id):
+            query = (
+                select(EmailOutbox)
+                .where(
+                    EmailOutbox.status == EMAIL_STATUS_PENDING,
+                    EmailOutbox.next_attempt_at <= now,
+                )
+                .order_by(EmailOutbox.next_attempt_at)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            emails = list((await self.db.execute(query)).scalars().all())
+            leased_until = now + timedelta(seconds=lease_seconds)
+            for email in emails:
+                email.next_attempt_at = leased_until
+            await self.db.flush()
+            return emails
+
+    @translate_db_exceptions
+    async def delete_sent(self, email_ids: Sequence[UUID]) -> None:
+        """Remove delivered emails."""
+        if email_ids:
+            await self.db.execute(
+                delete(EmailOutbox).where(EmailOutbox.email_outbox_id.in_(email_ids))
+            )
+
+    @translate_db_exceptions
+    async def defer(self, email_ids: Sequence[UUID], delay_seconds: float) -> None:
+        """Reschedule emails that were not attempted, leaving their attempts as is."""
+        if email_ids:
+            await self.db.execute(
+                update(EmailOutbox)
+                .where(EmailOutbox.email_outbox_id.in_(email_ids))
+                .values(
+                    next_attempt_at=datetime.now(timezone.utc)
+                    + timedelta(seconds=delay_seconds)
+                )
+            )
+
+    @translate_db_exceptions
+    async def record_failure(
+        self,
+        email_id: UUID,
+        error: str,
+        retry_in_seconds: Optional[float],
+        max_attempts: int,
+    ) -> Optional[EmailOutbox]:
+        """Count a failed attempt and reschedule it.
+
+        The email is marked failed once max_attempts is reached, or at once when
+        ``retry_in_seconds`` is None (a permanent provider rejection); its body
+        is dropped then, keeping only the envelope.
+        """
+        email = await self.db.get(EmailOutbox, email_id)
+        if email is None:
+            return None
+        email.attempts += 1
+        email.last_error = error[:1000]
+        if retry_in_seconds is None or email.attempts >= max_attempts:
+            email.status = EMAIL_STATUS_FAILED
+            email.payload = _envelope(email.payload)
+        else:
+            email.next_attempt_at = datetime.now(timezone.utc) + timedelta(
+                seconds=retry_in_seconds
+            )
+        await self.db.flush()
+        return email
+
+    @translate_db_exceptions
+    async def purge_failed(self, older_than: datetime) -> int:
+        """Delete failed emails queued before ``older_than``; returns the count."""
+        with log_timing("db_purge_failed_emails", request_id=self.request_id):
+            result = await self.db.execute(
+                delete(EmailOutbox).where(
+                    EmailOutbox.status == EMAIL_STATUS_FAILED,
+                    EmailOutbox.created_at < older_than,
+                )
+            )
+            return cast(CursorResult[Any], result).rowcount
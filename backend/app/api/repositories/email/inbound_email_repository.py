@@ -0,0 +1,146 @@
+"""
+Inbound Email Repository
+- Encapsulates database operations for the InboundEmail model
+- Stores deliveries idempotently by ``svix_id`` and claims due ones with a
+  lease so several workers never forward the same email
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, cast
+from uuid import UUID
+
+import structlog
+from sqlalchemy import CursorResult, delete, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.core.logging import log_timing
+from app.api.middleware.error_handler import translate_db_exceptions
+from app.api.middleware.logging_middleware import request_id_ctx_var
+from app.api.models.email.inbound_email_model import (
+    INBOUND_STATUS_FAILED,
+    INBOUND_STATUS_PENDING,
+    INBOUND_STATUS_PROCESSED,
+    InboundEmail,
+)
+
+logger = structlog.get_logger()
+
+
+class InboundEmailRepository:
+    """Inbound email repository for database operations."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.request_id = request_id_ctx_var.get()
+
+    @translate_db_exceptions
+    async def add(self, svix_id: Optional[str], payload: Dict[str, Any]) -> bool:
+        """Store a delivery in the current transaction.
+
+        Returns False, storing nothing, if ``svix_id`` was already stored.
+        """
+        insert = (
+            postgresql_insert
+            if self.db.get_bind().dialect.name == "postgresql"
+            else sqlite_insert
+        )
+        with log_timing("db_add_inbound_email", request_id=self.request_id):
+            stmt = (
+                insert(InboundEmail)
+                .values(svix_id=svix_id, payload=payload)
+                .on_conflict_do_nothing(index_elements=["svix_id"])
+                .returning(InboundEmail.inbound_email_id)
+            )
+            return (await self.db.execute(stmt)).scalar_one_or_none() is not None
+
+    @translate_db_exceptions
+    async def claim_due(self, limit: int, lease_seconds: float) -> List[InboundEmail]:
+        """Lease up to ``limit`` due deliveries, pushing their next attempt past the lease.
+
+        Rows locked by another worker are skipped (PostgreSQL); an expired
+        lease makes a delivery due again if its worker died mid-forward.
+        """
+        now = datetime.now(timezone.utc)
+        with log_timing("db_claim_due_inbound_emails", request_id=self.request_id):
+            query = (
+                select(InboundEmail)
+                .where(
+                    InboundEmail.status == INBOUND_STATUS_PENDING,
+                    InboundEmail.next_attempt_at <= now,
+                )
+                .order_by(InboundEmail.next_attempt_at)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            emails = list((await self.db.execute(query)).scalars().all())
+            leased_until = now + timedelta(seconds=lease_seconds)
+            for email in emails:
+                email.next_attempt_at = leased_until
+            await self.db.flush()
+            return emails
+
+    @translate_db_exceptions
+    async def mark_processed(self, inbound_email_ids: Sequence[UUID]) -> None:
+        """Mark deliveries forwarded, dropping their content but keeping the svix_id."""
+        if inbound_email_ids:
+            await self.db.execute(
+                update(InboundEmail)
+                .where(InboundEmail.inbound_email_id.in_(inbound_email_ids))
+                .values(status=INBOUND_STATUS_PROCESSED, payload={}, last_error=None)
+            )
+
+    @translate_db_exceptions
+    async def defer(
+        self, inbound_email_ids: Sequence[UUID], delay_seconds: float
+    ) -> None:
+        """Reschedule deliveries without counting an attempt."""
+        if inbound_email_ids:
+            await self.db.execute(
+                update(InboundEmail)
+                .where(InboundEmail.inbound_email_id.in_(inbound_email_ids))
+                .values(
+                    next_attempt_at=datetime.now(timezone.utc)
+                    + timedelta(seconds=delay_seconds)
+                )
+            )
+
+    @translate_db_exceptions
+    async def record_failure(
+        self,
+        inbound_email_id: UUID,
+        error: str,
+        retry_in_seconds: float,
+        max_attempts: int,
+    ) -> Optional[InboundEmail]:
+        """Count a failed attempt and reschedule it.
+
+        The delivery is marked failed, keeping its content for a manual
+        replay, once max_attempts is reached.
+        """
+        email = await self.db.get(InboundEmail, inbound_email_id)
+        if email is None:
+            return None
+        email.attempts += 1
+        email.last_error = error[:1000]
+        if email.attempts >= max_attempts:
+            email.status = INBOUND_STATUS_FAILED
+        else:
+            email.next_attempt_at = datetime.now(timezone.utc) + timedelta(
+                seconds=retry_in_seconds
+            )
+        await self.db.flush()
+        return email
+
+    @translate_db_exceptions
+    async def purge_processed(self, older_than: datetime) -> int:
+        """Delete processed deliveries received before ``older_than``; returns the count."""
+        with log_timing("db_purge_inbound_emails", request_id=self.request_id):
+            result = await self.db.execute(
+                delete(InboundEmail).where(
+                    InboundEmail.status == INBOUND_STATUS_PROCESSED,
+                    InboundEmail.created_at < older_than,
+                )
+            )
+            return cast(CursorResult[Any], result).rowcount
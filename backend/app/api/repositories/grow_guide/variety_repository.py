@@ -3,17 +3,29 @@ Variety Repository
 - Encapsulate the logic required to access the: Variety, Variety Water Day, Planting Conditions, Feed, Lifecycle and Frequency tables.
 """
 
-from typing import List, Optional
+from datetime import datetime
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 from uuid import UUID
 
 import structlog
-from sqlalchemy import delete, func, or_, select
+from sqlalchemy import Select, case, delete, func, insert, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 from app.api.core.logging import log_timing
 from app.api.middleware.error_handler import translate_db_exceptions
 from app.api.middleware.logging_middleware import request_id_ctx_var
+from app.api.models.family.family_model import Family
 from app.api.models.grow_guide.calendar_model import Day
 from app.api.models.grow_guide.guide_options_model import (
     Feed,
@@ -28,6 +40,66 @@ from app.api.models.user.user_model import UserActiveVariety
 logger = structlog.get_logger()
 
 
+class FamilyRow(NamedTuple):
+    family_id: UUID
+    family_name: str
+
+
+class LifecycleRow(NamedTuple):
+    lifecycle_id: UUID
+    lifecycle_name: str
+    productivity_years: int
+
+
+class VarietyListRow(NamedTuple):
+    """The columns VarietyListRead needs, without an ORM entity behind them."""
+
+    variety_id: UUID
+    variety_name: str
+    is_public: bool
+    last_updated: datetime
+    family: FamilyRow
+    lifecycle: LifecycleRow
+    is_active: bool = False
+
+
+def _variety_list_select(*extra: Any) -> Select[Any]:
+    """Select the list-view columns of Variety, joined to family and lifecycle."""
+    return (
+        select(
+            Variety.variety_id,
+            Variety.variety_name,
+            Variety.is_public,
+            Variety.last_updated,
+            Family.family_id,
+            Family.family_name,
+            Lifecycle.lifecycle_id,
+            Lifecycle.lifecycle_name,
+            Lifecycle.productivity_years,
+            *extra,
+        )
+        .join(Family, Variety.family_id == Family.family_id)
+        .join(Lifecycle, Variety.lifecycle_id == Lifecycle.lifecycle_id)
+    )
+
+
+def _variety_list_row(row: Sequence[Any], is_active: bool = False) -> VarietyListRow:
+    return VarietyListRow(
+        row[0],
+        row[1],
+        row[2],
+        row[3],
+        FamilyRow(row[4], row[5]),
+        LifecycleRow(row[6], row[7], row[8]),
+        is_active,
+    )
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input only matches literally."""
+    return value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
 class VarietyRepository:
     """Variety repository for database operations."""
 
@@ -75,28 +147,43 @@ class VarietyRepository:
     async def create_variety(self, variety: Variety) -> Variety:
         """Create a new variety."""
         with log_timing("db_create_variety", request_id=self.request_id):
+            # last_updated comes back via INSERT ... RETURNING (eager_defaults).
             self.db.add(variety)
             await self.db.flush()
-            await self.db.refresh(variety)
             return variety
 
     @translate_db_exceptions
     async def get_variety_by_id(
         self, variety_id: UUID, user_id: UUID
     ) -> Optional[Variety]:
-        """Get a variety by ID, ensuring it belongs to the user or is public."""
+        """Get a variety by ID, ensuring it belongs to the user or is public.
+
+        One statement: the reference relationships are joined in, and whether
+        the user has the variety active comes back as an EXISTS column.
+        """
         with log_timing("db_get_variety_by_id", request_id=self.request_id):
+            is_active = (
+                select(UserActiveVariety.variety_id)
+                .where(
+                    UserActiveVariety.user_id == user_id,
+                    UserActiveVariety.variety_id == Variety.variety_id,
+                )
+                .correlate(Variety)
+                .exists()
+            )
             stmt = (
-                select(Variety)
+                select(Variety, is_active.label("is_active"))
                 .options(
-                    selectinload(Variety.family),
-                    selectinload(Variety.lifecycle),
-                    selectinload(Variety.planting_conditions),
-                    selectinload(Variety.feed),
-                    selectinload(Variety.feed_frequency),
-                    selectinload(Variety.water_frequency),
-                    selectinload(Variety.high_temp_water_frequency),
-                    selectinload(Variety.water_days).selectinload(VarietyWaterDay.day),
+                    joinedload(Variety.family, innerjoin=True),
+                    joinedload(Variety.lifecycle, innerjoin=True),
+                    joinedload(Variety.planting_conditions, innerjoin=True),
+                    joinedload(Variety.feed),
+                    joinedload(Variety.feed_frequency),
+                    joinedload(Variety.water_frequency, innerjoin=True),
+                    joinedload(Variety.high_temp_water_frequency, innerjoin=True),
+                    joinedload(Variety.water_days).joinedload(
+                        VarietyWaterDay.day, innerjoin=True
+                    ),
                 )
                 .where(
                     Variety.variety_id == variety_id,
@@ -104,25 +191,18 @@ class VarietyRepository:
                 )
             )
             result = await self.db.execute(stmt)
-            variety = result.scalar_one_or_none()
+            # The water_days join repeats the variety once per day.
+            row = result.unique().one_or_none()
 
-            if variety is None:
+            if row is None:
                 return None
 
-            is_active = False
-            if variety.owner_user_id == user_id:
-                active_stmt = (
-                    select(func.count(UserActiveVariety.variety_id))
-                    .where(
-                        UserActiveVariety.user_id == user_id,
-                        UserActiveVariety.variety_id == variety.variety_id,
-                    )
-                    .limit(1)
-                )
-                active_result = await self.db.execute(active_stmt)
-                is_active = (active_result.scalar_one_or_none() or 0) > 0
-
-            setattr(variety, "is_active", is_active)
+            variety: Variety = row[0]
+            active = row[1]
+            # Only the owner's own varieties count as active.
+            setattr(
+                variety, "is_active", bool(active) and variety.owner_user_id == user_id
+            )
             return variety
 
     @translate_db_exceptions
@@ -139,55 +219,173 @@ class VarietyRepository:
             return result.scalar_one_or_none()
 
     @translate_db_exceptions
-    async def get_user_varieties(self, user_id: UUID) -> List[Variety]:
-        """Get all varieties belonging to a user."""
+    async def get_owned_variety_ids(
+        self, variety_ids: Sequence[UUID], user_id: UUID
+    ) -> Set[UUID]:
+        """Return which of ``variety_ids`` are owned by the specified user."""
+        with log_timing("db_get_owned_variety_ids", request_id=self.request_id):
+            stmt = select(Variety.variety_id).where(
+                Variety.variety_id.in_(variety_ids),
+                Variety.owner_user_id == user_id,
+            )
+            result = await self.db.execute(stmt)
+            return set(result.scalars().all())
+
+    @translate_db_exceptions
+    async def get_user_varieties(
+        self, user_id: UUID, variety_ids: Optional[Sequence[UUID]] = None
+    ) -> List[VarietyListRow]:
+        """Get list rows for a user's varieties, optionally only ``variety_ids``."""
         with log_timing("db_get_user_varieties", request_id=self.request_id):
-            active_count_subquery = (
-                select(func.count(UserActiveVariety.variety_id))
+            is_active = (
+                select(UserActiveVariety.variety_id)
                 .where(
                     UserActiveVariety.user_id == user_id,
                     UserActiveVariety.variety_id == Variety.variety_id,
                 )
                 .correlate(Variety)
-                .scalar_subquery()
+                .exists()
             )
-
             stmt = (
-                select(Variety, active_count_subquery.label("active_variety_count"))
-                .options(
-                    selectinload(Variety.lifecycle),
-                    selectinload(Variety.family),  # eager load family for list view
-                )
+                _variety_list_select(is_active)
                 .where(Variety.owner_user_id == user_id)
                 .order_by(Variety.variety_name)
             )
+            if variety_ids is not None:
+                stmt = stmt.where(Variety.variety_id.in_(variety_ids))
             result = await self.db.execute(stmt)
-            rows = result.unique().all()
-
-            varieties: List[Variety] = []
-            for variety, active_variety_count in rows:
-                setattr(variety, "is_active", (active_variety_count or 0) > 0)
-                varieties.append(variety)
-            return varieties
+            return [_variety_list_row(row, bool(row[-1])) for row in result]
 
     @translate_db_exceptions
-    async def get_public_varieties(self) -> List[Variety]:
-        """Get all public varieties."""
+    async def get_public_varieties(self) -> List[VarietyListRow]:
+        """Get list rows for every public variety."""
         with log_timing("db_get_public_varieties", request_id=self.request_id):
             stmt = (
-                select(Variety)
-                .options(
-                    selectinload(Variety.lifecycle),
-                    selectinload(Variety.family),  # eager load family for list view
-                )
+                _variety_list_select()
                 .where(Variety.is_public)
                 .order_by(Variety.variety_name)
             )
             result = await self.db.execute(stmt)
-            varieties = list(result.scalars().unique().all())
-            for variety in varieties:
-                setattr(variety, "is_active", False)
-            return varieties
+            return [_variety_list_row(row) for row in result]
+
+    @translate_db_exceptions
+    async def get_public_varieties_page(
+        self, limit: int, after: Optional[Tuple[str, UUID]] = None
+    ) -> List[VarietyListRow]:
+        """Get up to ``limit`` public varieties ordered by (name, id), after a key.
+
+        Keyset pagination: the ix_variety_public_name_id index serves every
+        page as a range scan, with no OFFSET rows to skip.
+        """
+        with log_timing("db_get_public_varieties_page", request_id=self.request_id):
+            stmt = (
+                _variety_list_select()
+                .where(Variety.is_public)
+                .order_by(Variety.variety_name, Variety.variety_id)
+                .limit(limit)
+            )
+            if after is not None:
+                stmt = stmt.where(
+                    tuple_(Variety.variety_name, Variety.variety_id) > after
+                )
+            result = await self.db.execute(stmt)
+            return [_variety_list_row(row) for row in result]
+
+    @property
+    def supports_trigram_search(self) -> bool:
+        """True on PostgreSQL, where pg_trgm backs search_public_varieties."""
+        return self.db.get_bind().dialect.name == "postgresql"
+
+    @translate_db_exceptions
+    async def search_public_varieties(
+        self,
+        query: str,
+        family_id: Optional[UUID],
+        lifecycle_id: Optional[UUID],
+        limit: int,
+        offset: int,
+    ) -> List[VarietyListRow]:
+        """Rank public varieties whose name matches ``query`` (PostgreSQL only).
+
+        Matches are substrings or pg_trgm-similar names, served by the
+        ix_variety_public_name_trgm GIN index. Ranked by exact name, name
+        prefix, word prefix, substring, then trigram similarity; within a
+        tier shorter names come first.
+        """
+        with log_timing("db_search_public_varieties", request_id=self.request_id):
+            q = query.strip().lower()
+            pattern = _escape_like(q)
+            name = func.lower(Variety.variety_name)
+            contains = name.like(f"%{pattern}%", escape="/")
+            tier = case(
+                (name == q, 0),
+                (name.like(f"{pattern}%", escape="/"), 1),
+                (name.like(f"% {pattern}%", escape="/"), 2),
+                (contains, 3),
+                else_=4,
+            )
+            similarity = case((contains, 0.0), else_=func.similarity(name, q))
+            stmt = (
+                _variety_list_select()
+                .where(Variety.is_public, or_(contains, name.op("%")(q)))
+                .order_by(
+                    tier,
+                    similarity.desc(),
+                    func.length(name),
+                    name,
+                    Variety.variety_id,
+                )
+                .limit(limit)
+                .offset(offset)
+            )
+            if family_id is not None:
+                stmt = stmt.where(Variety.family_id == family_id)
+            if lifecycle_id is not None:
+                stmt = stmt.where(Variety.lifecycle_id == lifecycle_id)
+            result = await self.db.execute(stmt)
+            return [_variety_list_row(row) for row in result]
+
+    @translate_db_exceptions
+    async def get_public_catalogue_signature(self) -> Tuple[int, Optional[datetime]]:
+        """Get the public variety count and latest update, to detect changes."""
+        with log_timing(
+            "db_get_public_catalogue_signature", request_id=self.request_id
+        ):
+            stmt = select(func.count(), func.max(Variety.last_updated)).where(
+                Variety.is_public
+            )
+            count, last_updated = (await self.db.execute(stmt)).one()
+            return count, last_updated
+
+    @translate_db_exceptions
+    async def get_public_variety_search_rows(
+        self,
+    ) -> Sequence[Tuple[UUID, str, UUID, UUID]]:
+        """Get (id, name, family_id, lifecycle_id) for every public variety."""
+        with log_timing(
+            "db_get_public_variety_search_rows", request_id=self.request_id
+        ):
+            stmt = select(
+                Variety.variety_id,
+                Variety.variety_name,
+                Variety.family_id,
+                Variety.lifecycle_id,
+            ).where(Variety.is_public)
+            return (await self.db.execute(stmt)).tuples().all()
+
+    @translate_db_exceptions
+    async def get_public_varieties_by_ids(
+        self, variety_ids: Sequence[UUID]
+    ) -> List[VarietyListRow]:
+        """Get list rows for the given public varieties, in no particular order."""
+        if not variety_ids:
+            return []
+        with log_timing("db_get_public_varieties_by_ids", request_id=self.request_id):
+            stmt = _variety_list_select().where(
+                Variety.is_public, Variety.variety_id.in_(variety_ids)
+            )
+            result = await self.db.execute(stmt)
+            return [_variety_list_row(row) for row in result]
 
     @translate_db_exceptions
     async def get_public_variety_by_id(self, variety_id: UUID) -> Optional[Variety]:
@@ -199,12 +397,37 @@ class VarietyRepository:
             result = await self.db.execute(stmt)
             return result.scalar_one_or_none()
 
+    @translate_db_exceptions
+    async def get_public_varieties_for_copying(
+        self, variety_ids: Sequence[UUID]
+    ) -> List[Variety]:
+        """Get the public varieties with the given IDs, in no particular order."""
+        with log_timing(
+            "db_get_public_varieties_for_copying", request_id=self.request_id
+        ):
+            stmt = select(Variety).where(
+                Variety.variety_id.in_(variety_ids), Variety.is_public
+            )
+            result = await self.db.execute(stmt)
+            return list(result.scalars().all())
+
+    @translate_db_exceptions
+    async def create_varieties(self, varieties: Sequence[Variety]) -> None:
+        """Create several varieties in one flush.
+
+        The ORM batches same-table INSERTs, so this is one multi-row INSERT
+        (with RETURNING for last_updated) rather than a statement per row.
+        """
+        with log_timing("db_create_varieties", request_id=self.request_id):
+            self.db.add_all(varieties)
+            await self.db.flush()
+
     @translate_db_exceptions
     async def update_variety(self, variety: Variety) -> Variety:
         """Update an existing variety."""
         with log_timing("db_update_variety", request_id=self.request_id):
+            # last_updated comes back via UPDATE ... RETURNING (eager_defaults).
             await self.db.flush()
-            await self.db.refresh(variety)
             return variety
 
     @translate_db_exceptions
@@ -237,6 +460,22 @@ class VarietyRepository:
             await self.db.flush()
             return water_days
 
+    @translate_db_exceptions
+    async def insert_water_days(
+        self, variety_day_ids: Sequence[Tuple[UUID, UUID]]
+    ) -> None:
+        """Insert (variety_id, day_id) water day associations in one executemany."""
+        if not variety_day_ids:
+            return
+        with log_timing("db_insert_water_days", request_id=self.request_id):
+            await self.db.execute(
+                insert(VarietyWaterDay),
+                [
+                    {"variety_id": variety_id, "day_id": day_id}
+                    for variety_id, day_id in variety_day_ids
+                ],
+            )
+
     @translate_db_exceptions
     async def get_default_day_ids_for_frequency(self, frequency_id: UUID) -> List[UUID]:
         """Return the default day IDs configured for a frequency."""
@@ -253,14 +492,56 @@ class VarietyRepository:
             return [row[0] for row in result.fetchall()]
 
     @translate_db_exceptions
-    async def delete_water_days(self, variety_id: UUID) -> None:
-        """Delete all water day associations for a variety."""
-        with log_timing("db_delete_water_days", request_id=self.request_id):
-            stmt = delete(VarietyWaterDay).where(
-                VarietyWaterDay.variety_id == variety_id
+    async def get_default_day_ids_for_frequencies(
+        self, frequency_ids: Collection[UUID]
+    ) -> Dict[UUID, List[UUID]]:
+        """Return the default day IDs of each frequency, in day order."""
+        with log_timing(
+            "db_get_default_day_ids_for_frequencies", request_id=self.request_id
+        ):
+            stmt = (
+                select(FrequencyDefaultDay.frequency_id, FrequencyDefaultDay.day_id)
+                .join(Day, Day.day_id == FrequencyDefaultDay.day_id)
+                .where(FrequencyDefaultDay.frequency_id.in_(frequency_ids))
+                .order_by(Day.day_number)
             )
-            await self.db.execute(stmt)
-            await self.db.flush()
+            result = await self.db.execute(stmt)
+            day_ids: Dict[UUID, List[UUID]] = {}
+            for frequency_id, day_id in result:
+                day_ids.setdefault(frequency_id, []).append(day_id)
+            return day_ids
+
+    @translate_db_exceptions
+    async def sync_water_days(self, variety: Variety, day_ids: Sequence[UUID]) -> None:
+        """Make the variety's water days exactly ``day_ids``.
+
+        Only the difference from the loaded water_days is written: one bulk
+        DELETE for days dropped and one bulk INSERT for days added. The
+        collection is expired so the next load reflects the new set.
+        """
+        with log_timing("db_sync_water_days", request_id=self.request_id):
+            current = {water_day.day_id for water_day in variety.water_days}
+            wanted = set(day_ids)
+            removed = current - wanted
+            added = [
+                day_id for day_id in dict.fromkeys(day_ids) if day_id not in current
+            ]
+            if removed:
+                await self.db.execute(
+                    delete(VarietyWaterDay).where(
+                        VarietyWaterDay.variety_id == variety.variety_id,
+                        VarietyWaterDay.day_id.in_(removed),
+                    )
+                )
+            if added:
+                await self.db.execute(
+                    insert(VarietyWaterDay),
+                    [
+                        {"variety_id": variety.variety_id, "day_id": day_id}
+                        for day_id in added
+                    ],
+                )
+            self.db.expire(variety, ["water_days"])
 
     @translate_db_exceptions
     async def variety_name_exists_for_user(
@@ -281,6 +562,14 @@ class VarietyRepository:
             result = await self.db.execute(stmt)
             return result.scalar_one_or_none() is not None
 
+    @translate_db_exceptions
+    async def get_user_variety_names(self, user_id: UUID) -> List[str]:
+        """Return the names of every variety the user owns."""
+        with log_timing("db_get_user_variety_names", request_id=self.request_id):
+            stmt = select(Variety.variety_name).where(Variety.owner_user_id == user_id)
+            result = await self.db.execute(stmt)
+            return list(result.scalars().all())
+
     @translate_db_exceptions
     async def get_user_variety_names_for_copying(
         self, user_id: UUID, base_name: str
@@ -3,12 +3,14 @@ User Repository
 - Encapsulates database operations for User model
 """
 
-from typing import Any, List, Optional
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence, cast
 from uuid import UUID
 
 import structlog
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import CursorResult, delete, literal, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -22,6 +24,8 @@ from app.api.middleware.logging_middleware import (
     request_id_ctx_var,
 )
 from app.api.models import User
+from app.api.models.grow_guide.calendar_model import Day
+from app.api.models.grow_guide.guide_options_model import Feed
 from app.api.models.user.user_model import (
     UserActiveVariety,
     UserAllotment,
@@ -35,26 +39,56 @@ from app.api.schemas.user.user_allotment_schema import (
 logger = structlog.get_logger()
 
 
+class FeedDayRow(NamedTuple):
+    """A user's feed day preference with the feed and day names."""
+
+    feed_id: UUID
+    feed_name: str
+    day_id: UUID
+    day_name: str
+
+
+def _dialect_insert(db: AsyncSession) -> Callable[..., Any]:
+    """Return the insert construct supporting ON CONFLICT for ``db``'s dialect.
+
+    PostgreSQL and SQLite both support ``ON CONFLICT``; their SQLAlchemy
+    insert constructs share the same ``on_conflict_*`` methods.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql_insert
+    return sqlite_insert
+
+
 class UserRepository:
     @translate_db_exceptions
     async def ensure_user_feed_days(
         self, user_id: str, feeds: list[Any], default_day: Any
     ) -> None:
-        """Ensure a UserFeedDay exists for each feed for the user, creating any missing ones with the default day."""
+        """Ensure a UserFeedDay exists for each feed for the user, creating any missing ones with the default day.
+
+        One INSERT ... ON CONFLICT DO NOTHING, so existing preferences are kept
+        without reading them first.
+        """
+        if not feeds or not default_day:
+            return
         user_uuid = UUID(user_id)
-        # Get all user_feed_day for this user
-        query = select(UserFeedDay).where(UserFeedDay.user_id == user_uuid)
-        result = await self.db.execute(query)
-        user_feed_days = result.scalars().all()
-        existing_feed_ids = {ufd.feed_id for ufd in user_feed_days}
-        for feed in feeds:
-            if feed.feed_id not in existing_feed_ids and default_day:
-                new_preference = UserFeedDay()
-                new_preference.user_id = user_uuid
-                new_preference.feed_id = feed.feed_id
-                new_preference.day_id = default_day.day_id
-                self.db.add(new_preference)
-        await self.db.flush()
+        with log_timing(
+            "db_ensure_user_feed_days", request_id=self.request_id, user_id=user_id
+        ):
+            stmt = _dialect_insert(self.db)(UserFeedDay).on_conflict_do_nothing(
+                index_elements=["user_id", "feed_id"]
+            )
+            await self.db.execute(
+                stmt,
+                [
+                    {
+                        "user_id": user_uuid,
+                        "feed_id": feed.feed_id,
+                        "day_id": default_day.day_id,
+                    }
+                    for feed in feeds
+                ],
+            )
 
     """User repository for database operations."""
 
@@ -323,8 +357,13 @@ class UserRepository:
     @translate_db_exceptions
     async def update_user_feed_day(
         self, user_id: str, feed_id: str, day_id: str
-    ) -> UserFeedDay:
-        """Update or create a user's feed day preference."""
+    ) -> Optional[FeedDayRow]:
+        """Update or create a user's feed day preference.
+
+        A single INSERT ... SELECT ... ON CONFLICT DO UPDATE ... RETURNING. The
+        SELECT reads the feed and day by id, so nothing is written when either
+        does not exist and None is returned; RETURNING also selects their names.
+        """
         log_context = {
             "user_id": str(user_id),
             "feed_id": str(feed_id),
@@ -333,41 +372,46 @@ class UserRepository:
         with log_timing(
             "db_update_user_feed_day", request_id=self.request_id, **log_context
         ):
-            # Convert string IDs to UUIDs
             user_uuid = UUID(user_id)
             feed_uuid = UUID(feed_id)
             day_uuid = UUID(day_id)
 
-            # Check if preference already exists
-            query = select(UserFeedDay).where(
-                UserFeedDay.user_id == user_uuid, UserFeedDay.feed_id == feed_uuid
-            )
-            result = await self.db.execute(query)
-            existing = result.scalar_one_or_none()
-
-            if existing:
-                # Update existing preference
-                existing.day_id = day_uuid
-                self.db.add(existing)
-                logger.info(
-                    "User feed day preference updated",
-                    operation="update_user_feed_day",
-                    **log_context,
+            stmt = _dialect_insert(self.db)(UserFeedDay).from_select(
+                ["user_id", "feed_id", "day_id"],
+                select(
+                    literal(user_uuid, UserFeedDay.user_id.type),
+                    Feed.feed_id,
+                    Day.day_id,
                 )
-                return existing
-            else:
-                # Create new preference
-                new_preference = UserFeedDay()
-                new_preference.user_id = user_uuid
-                new_preference.feed_id = feed_uuid
-                new_preference.day_id = day_uuid
-                self.db.add(new_preference)
-                logger.info(
-                    "User feed day preference created",
-                    operation="create_user_feed_day",
-                    **log_context,
-                )
-                return new_preference
+                .select_from(Feed)
+                .join(Day, Day.day_id == day_uuid)
+                # SQLite needs a WHERE to tell the upsert's ON CONFLICT from a join's ON
+                .where(Feed.feed_id == feed_uuid),
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["user_id", "feed_id"],
+                set_={"day_id": stmt.excluded.day_id},
+            ).returning(
+                UserFeedDay.feed_id,
+                select(Feed.feed_name)
+                .where(Feed.feed_id == feed_uuid)
+                .scalar_subquery()
+                .label("feed_name"),
+                UserFeedDay.day_id,
+                select(Day.day_name)
+                .where(Day.day_id == day_uuid)
+                .scalar_subquery()
+                .label("day_name"),
+            )
+            row = (await self.db.execute(stmt)).one_or_none()
+            if row is None:
+                return None
+            logger.info(
+                "User feed day preference upserted",
+                operation="update_user_feed_day",
+                **log_context,
+            )
+            return FeedDayRow(row.feed_id, row.feed_name, row.day_id, row.day_name)
 
     @translate_db_exceptions
     async def get_active_varieties(self, user_id: str) -> List[UserActiveVariety]:
@@ -460,3 +504,71 @@ class UserRepository:
                 **log_context,
             )
             return True
+
+    @translate_db_exceptions
+    async def add_active_varieties(
+        self, user_id: UUID, variety_ids: Sequence[UUID]
+    ) -> None:
+        """Mark several varieties active in one INSERT, skipping any already active.
+
+        Uses ``ON CONFLICT DO NOTHING`` (PostgreSQL and SQLite both support it),
+        so there is no per-variety existence check and concurrent activations
+        of the same variety cannot fail on the primary key.
+        """
+        if not variety_ids:
+            return
+        log_context = {"user_id": str(user_id), "variety_count": len(variety_ids)}
+        with log_timing(
+            "db_add_active_varieties",
+            request_id=self.request_id,
+            **log_context,
+        ):
+            stmt = _dialect_insert(self.db)(UserActiveVariety).on_conflict_do_nothing(
+                index_elements=["user_id", "variety_id"]
+            )
+            await self.db.execute(
+                stmt,
+                [
+                    {"user_id": user_id, "variety_id": variety_id}
+                    for variety_id in variety_ids
+                ],
+            )
+            logger.info(
+                "User active variety associations created",
+                operation="create_user_active_varieties",
+                **log_context,
+            )
+
+    @translate_db_exceptions
+    async def delete_active_varieties(
+        self, user_id: UUID, variety_ids: Sequence[UUID]
+    ) -> int:
+        """Delete several active variety associations in one statement.
+
+        Returns the number of associations removed.
+        """
+        if not variety_ids:
+            return 0
+        log_context = {"user_id": str(user_id), "variety_count": len(variety_ids)}
+        with log_timing(
+            "db_delete_active_varieties",
+            request_id=self.request_id,
+            **log_context,
+        ):
+            result = cast(
+                CursorResult[Any],
+                await self.db.execute(
+                    delete(UserActiveVariety).where(
+                        UserActiveVariety.user_id == user_id,
+                        UserActiveVariety.variety_id.in_(variety_ids),
+                    )
+                ),
+            )
+            deleted = result.rowcount
+            logger.info(
+                "User active variety associations deleted",
+                operation="delete_user_active_varieties",
+                deleted=deleted,
+                **log_context,
+            )
+            return deleted
@@ -9,7 +9,7 @@ from typing import Any, Dict, Mapping
 import structlog
 from pydantic import BaseModel, model_validator
 
-from app.api.middleware.logging_middleware import SENSITIVE_FIELDS
+from app.api.middleware.logging_middleware import is_sensitive_key
 
 logger = structlog.get_logger()
 
@@ -36,22 +36,17 @@ class SecureBaseModel(BaseModel):
         Returns:
             Dict with sensitive fields redacted for safe logging
         """
-        data = self.dict()
-        for field in SENSITIVE_FIELDS:
-            if field in data:
-                data[field] = REDACTED_VALUE
-            for key in data.keys():
-                if any(sensitive in key.lower() for sensitive in SENSITIVE_FIELDS):
-                    data[key] = REDACTED_VALUE
-        return data
+        return {
+            key: REDACTED_VALUE if is_sensitive_key(key) else value
+            for key, value in self.dict().items()
+        }
 
     @classmethod
     @model_validator(mode="before")
     def validate_fields(cls, values: Mapping[str, Any]) -> Dict[str, Any]:
         """Log validation attempts without exposing sensitive data."""
         safe_values = {
-            k: (REDACTED_VALUE if any(s in k.lower() for s in SENSITIVE_FIELDS) else v)
-            for k, v in values.items()
+            k: (REDACTED_VALUE if is_sensitive_key(k) else v) for k, v in values.items()
         }
 
         class_name = cls.__name__ if hasattr(cls, "__name__") else str(cls)
@@ -0,0 +1,34 @@
+"""
+Bootstrap Schema
+- Everything the SPA loads on sign-in, returned in one response.
+"""
+
+from typing import List, Optional
+
+from pydantic import Field
+
+from app.api.schemas.base_schema import SecureBaseModel
+from app.api.schemas.grow_guide.variety_schema import VarietyOptionsRead
+from app.api.schemas.todo.weekly_todo_schema import WeeklyTodoRead
+from app.api.schemas.user.user_active_varieties_schema import UserActiveVarietyRead
+from app.api.schemas.user.user_allotment_schema import UserAllotmentRead
+from app.api.schemas.user.user_preference_schema import UserPreferencesRead
+from app.api.schemas.user.user_schema import UserProfileResponse
+
+
+class BootstrapUserRead(SecureBaseModel):
+    """Schema for the per-user part of the bootstrap response."""
+
+    profile: UserProfileResponse
+    preferences: UserPreferencesRead
+    allotment: Optional[UserAllotmentRead] = Field(
+        default=None, description="The user's allotment, or null if not yet created"
+    )
+    active_varieties: List[UserActiveVarietyRead]
+    weekly_todo: WeeklyTodoRead
+
+
+class BootstrapRead(BootstrapUserRead):
+    """Schema for the bootstrap response, including shared reference data."""
+
+    variety_options: VarietyOptionsRead
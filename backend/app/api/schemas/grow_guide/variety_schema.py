@@ -312,6 +312,17 @@ class VarietyUpdate(SecureBaseModel):
         return values
 
 
+class VarietyCopyRequest(SecureBaseModel):
+    """Schema for copying several public varieties in one request."""
+
+    variety_ids: List[UUID] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="IDs of the public varieties to copy",
+    )
+
+
 class VarietyRead(SecureBaseModel):
     """Schema for reading a variety with all related information."""
 
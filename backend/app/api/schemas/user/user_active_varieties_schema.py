@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import List
 from uuid import UUID
 
-from pydantic import Field
+from pydantic import Field, model_validator
 from pydantic.config import ConfigDict
 
 from app.api.schemas.base_schema import SecureBaseModel
@@ -19,6 +19,32 @@ class UserActiveVarietyCreate(SecureBaseModel):
     variety_id: UUID = Field(..., description="The ID of the variety to activate")
 
 
+class UserActiveVarietyBulkUpdate(SecureBaseModel):
+    """Request payload for activating and deactivating several varieties at once."""
+
+    activate: List[UUID] = Field(
+        default_factory=list,
+        max_length=100,
+        description="IDs of the varieties to mark as active",
+    )
+    deactivate: List[UUID] = Field(
+        default_factory=list,
+        max_length=100,
+        description="IDs of the varieties to remove from the active list",
+    )
+
+    @model_validator(mode="after")
+    def validate_variety_sets(self) -> "UserActiveVarietyBulkUpdate":
+        """Require at least one ID and no ID in both lists."""
+        if not self.activate and not self.deactivate:
+            raise ValueError(
+                "At least one variety to activate or deactivate is required"
+            )
+        if set(self.activate) & set(self.deactivate):
+            raise ValueError("A variety cannot be both activated and deactivated")
+        return self
+
+
 class ActiveVarietySummary(SecureBaseModel):
     """Minimal representation of a variety linked to an active association."""
 
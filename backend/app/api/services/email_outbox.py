@@ -0,0 +1,344 @@
+"""
+Email Outbox
+- enqueue_email writes a Resend send request into the outbox inside the
+  caller's transaction, so an email exists only if the change that triggered
+  it commits and the request never waits on the provider.
+- EmailOutboxWorker, started in the application lifespan, drains due emails:
+  several at once through Resend's batch endpoint, one at a time otherwise,
+  rescheduling transient failures with the _compute_delay backoff.
+- While the Resend circuit breaker is open the worker leaves emails queued
+  instead of spending their attempts on a failing provider; emails claimed
+  just before it opens are rescheduled for when it half-opens, uncounted.
+- Sent emails are deleted; failed ones keep only their envelope and are
+  purged once older than the retention period.
+"""
+
+import asyncio
+import hashlib
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence, Tuple
+from uuid import UUID
+
+import httpx
+import structlog
+from resend.emails._emails import Emails
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.core.circuit_breaker import CircuitOpenError
+from app.api.core.http_client import get_http_client
+from app.api.middleware.logging_middleware import (
+    request_id_ctx_var,
+    sanitize_error_message,
+)
+from app.api.models.email.email_outbox_model import EmailOutbox
+from app.api.repositories.email.email_outbox_repository import (
+    EmailOutboxRepository,
+)
+from app.api.services.email_service import (
+    _compute_delay,
+    _is_retryable,
+    _post_to_resend,
+    _rate_limit_window,
+    get_email_circuit_breaker,
+)
+
+logger = structlog.get_logger()
+
+# Resend accepts at most 100 emails per batch request
+RESEND_BATCH_LIMIT = 100
+STOP_TIMEOUT_SECONDS = 15.0
+PURGE_INTERVAL_SECONDS = 3600.0
+
+ClaimedEmail = Tuple[UUID, Any, int]
+
+
+class DeliveryResult(NamedTuple):
+    email_id: UUID
+    attempts: int
+    error: Optional[str] = None
+    retryable: bool = False
+    # Not attempted: the circuit breaker refused the call
+    deferred: bool = False
+
+    @property
+    def sent(self) -> bool:
+        return self.error is None
+
+
+def enqueue_email(
+    db: AsyncSession, params: Emails.SendParams, email_kind: str
+) -> EmailOutbox:
+    """Queue an email in the current transaction; the caller commits."""
+    email = EmailOutboxRepository(db).add(email_kind, dict(params))
+    logger.info(
+        "Email queued",
+        email_kind=email_kind,
+        request_id=request_id_ctx_var.get(),
+        operation="enqueue_email",
+    )
+    return email
+
+
+class EmailOutboxWorker:
+    """Background task delivering queued emails."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        batch_size: int = 50,
+        poll_interval_seconds: float = 2.0,
+        max_attempts: int = 5,
+        retry_base_seconds: float = 2.0,
+        lease_seconds: float = 60.0,
+        failed_retention_days: float = 7.0,
+        client_factory: Callable[[], httpx.AsyncClient] = get_http_client,
+    ) -> None:
+        self.session_factory = session_factory
+        self.batch_size = max(1, min(batch_size, RESEND_BATCH_LIMIT))
+        self.poll_interval_seconds = poll_interval_seconds
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.lease_seconds = lease_seconds
+        self.failed_retention_days = failed_retention_days
+        self.client_factory = client_factory
+        self._next_purge_at = 0.0
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run(), name="email-outbox-worker")
+
+    def notify(self) -> None:
+        """Wake the worker, e.g. after a transaction that queued emails commits."""
+        self._wakeup.set()
+
+    async def stop(self) -> None:
+        """Finish the batch in flight, then stop."""
+        if self._task is None:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(self._task, STOP_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Email outbox worker did not stop in time; cancelled",
+                operation="email_outbox_worker",
+            )
+        self._task = None
+
+    async def _run(self) -> None:
+        logger.info("Email outbox worker started", operation="email_outbox_worker")
+        while not self._stopping:
+            try:
+                if time.monotonic() >= self._next_purge_at:
+                    self._next_purge_at = time.monotonic() + PURGE_INTERVAL_SECONDS
+                    await self.purge_failed()
+                processed = await self.drain_once()
+            except Exception as exc:
+                logger.error(
+                    "Email outbox drain failed",
+                    error=sanitize_error_message(str(exc)),
+                    error_type=type(exc).__name__,
+                    operation="email_outbox_worker",
+                )
+                processed = 0
+            if processed >= self.batch_size or self._stopping:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+        logger.info("Email outbox worker stopped", operation="email_outbox_worker")
+
+    async def purge_failed(self) -> int:
+        """Delete failed emails older than the retention period."""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.failed_retention_days)
+        async with self.session_factory() as db:
+            purged = await EmailOutboxRepository(db).purge_failed(cutoff)
+            await db.commit()
+        if purged:
+            logger.info(
+                "Failed emails purged",
+                purged=purged,
+                operation="email_outbox_worker",
+            )
+        return purged
+
+    async def drain_once(self) -> int:
+        """Deliver one batch of due emails; returns how many were attempted."""
+        breaker = get_email_circuit_breaker()
+        if not breaker.allows_calls():
+            logger.debug(
+                "Email provider circuit open; leaving emails queued",
+                retry_after=round(breaker.retry_after, 1),
+                operation="email_outbox_worker",
+            )
+            return 0
+        async with self.session_factory() as db:
+            emails = await EmailOutboxRepository(db).claim_due(
+                self.batch_size, self.lease_seconds
+            )
+            claimed: List[ClaimedEmail] = [
+                (email.email_outbox_id, email.payload, email.attempts)
+                for email in emails
+            ]
+            await db.commit()
+        if not claimed:
+            return 0
+
+        results = await self._deliver(claimed)
+
+        async with self.session_factory() as db:
+            repo = EmailOutboxRepository(db)
+            await repo.delete_sent([r.email_id for r in results if r.sent])
+            # A half-open breaker reports retry_after 0 while its probe runs
+            await repo.defer(
+                [r.email_id for r in results if r.deferred],
+                max(breaker.retry_after, self.poll_interval_seconds),
+            )
+            for result in results:
+                if result.sent or result.deferred:
+                    continue
+                attempt = result.attempts + 1
+                retry_in = (
+                    _compute_delay(attempt, self.retry_base_seconds)
+                    if result.retryable
+                    else None
+                )
+                email = await repo.record_failure(
+                    result.email_id, result.error or "", retry_in, self.max_attempts
+                )
+                logger.warning(
+                    "Email delivery failed",
+                    email_outbox_id=str(result.email_id),
+                    attempt=attempt,
+                    error=result.error,
+                    next_delay=retry_in,
+                    status=email.status if email else None,
+                    operation="email_outbox_worker",
+                )
+            await db.commit()
+
+        logger.info(
+            "Email outbox batch processed",
+            attempted=len(results),
+            sent=sum(1 for r in results if r.sent),
+            deferred=sum(1 for r in results if r.deferred),
+            operation="email_outbox_worker",
+        )
+        return len(claimed)
+
+    async def _deliver(self, claimed: Sequence[ClaimedEmail]) -> List[DeliveryResult]:
+        if len(claimed) == 1:
+            return [await self._send_single(*claimed[0])]
+        return await self._send_batch(claimed)
+
+    async def _send_batch(
+        self, claimed: Sequence[ClaimedEmail]
+    ) -> List[DeliveryResult]:
+        ids = ",".join(sorted(str(email_id) for email_id, _, _ in claimed))
+        idempotency_key = (
+            f"email-outbox-batch/{hashlib.sha256(ids.encode()).hexdigest()}"
+        )
+        await _rate_limit_window()
+        try:
+            response = await _post_to_resend(
+                "/emails/batch",
+                [payload for _, payload, _ in claimed],
+                client=self.client_factory(),
+                idempotency_key=idempotency_key,
+                batch_size=len(claimed),
+            )
+        except CircuitOpenError as exc:
+            return [
+                DeliveryResult(email_id, attempts, str(exc), deferred=True)
+                for email_id, _, attempts in claimed
+            ]
+        except httpx.HTTPError as exc:
+            error = sanitize_error_message(str(exc))
+            return [
+                DeliveryResult(email_id, attempts, error, retryable=True)
+                for email_id, _, attempts in claimed
+            ]
+
+        if response.status_code < 400:
+            return [
+                DeliveryResult(email_id, attempts) for email_id, _, attempts in claimed
+            ]
+
+        error = f"status {response.status_code}: {response.text[:300]}"
+        if _is_retryable(response.status_code):
+            return [
+                DeliveryResult(email_id, attempts, error, retryable=True)
+                for email_id, _, attempts in claimed
+            ]
+
+        # One invalid email rejects the whole batch; isolate it by sending singly.
+        logger.warning(
+            "Email batch rejected; sending individually",
+            status_code=response.status_code,
+            batch_size=len(claimed),
+            operation="email_outbox_worker",
+        )
+        return [await self._send_single(*email) for email in claimed]
+
+    async def _send_single(
+        self, email_id: UUID, payload: Any, attempts: int
+    ) -> DeliveryResult:
+        await _rate_limit_window()
+        try:
+            response = await _post_to_resend(
+                "/emails",
+                payload,
+                client=self.client_factory(),
+                idempotency_key=f"email-outbox/{email_id}",
+            )
+        except CircuitOpenError as exc:
+            return DeliveryResult(email_id, attempts, str(exc), deferred=True)
+        except httpx.HTTPError as exc:
+            return DeliveryResult(
+                email_id, attempts, sanitize_error_message(str(exc)), retryable=True
+            )
+        if response.status_code < 400:
+            return DeliveryResult(email_id, attempts)
+        return DeliveryResult(
+            email_id,
+            attempts,
+            f"status {response.status_code}: {response.text[:300]}",
+            retryable=_is_retryable(response.status_code),
+        )
+
+
+_worker: Optional[EmailOutboxWorker] = None
+
+
+def start_email_outbox_worker(
+    session_factory: Callable[[], AsyncSession], **options: Any
+) -> EmailOutboxWorker:
+    """Start the shared worker; called from the application lifespan."""
+    global _worker
+    if _worker is None:
+        _worker = EmailOutboxWorker(session_factory, **options)
+        _worker.start()
+    return _worker
+
+
+async def stop_email_outbox_worker() -> None:
+    """Stop the shared worker; called on application shutdown."""
+    global _worker
+    if _worker is None:
+        return
+    worker, _worker = _worker, None
+    await worker.stop()
+
+
+def notify_email_outbox() -> None:
+    """Wake the worker, if running, so newly committed emails go out promptly."""
+    if _worker is not None:
+        _worker.notify()
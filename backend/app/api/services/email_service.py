@@ -1,17 +1,22 @@
 """
 Email Service
 - Outbound transactional & inbound forwarding utilities.
+- Message builders for transactional emails, which are queued in the email
+  outbox and delivered by its background worker. Bodies come from templates
+  compiled once at startup (see email_templates).
 - Resilient send with retry/backoff for transient Resend API failures.
+- Sends are paced by a token bucket shared by every worker process, so the
+  provider quota holds however many workers run.
+- All Resend calls share the lifespan-managed pooled HTTP client.
+- A circuit breaker fails Resend calls fast while the provider is failing,
+  rather than holding callers in retry backoff.
 - Centralized subject normalization for forwarded emails.
 """
 
 import asyncio
 import re
-import time
-from collections import deque
 from datetime import datetime, timezone
-from textwrap import dedent
-from typing import Any, Deque, Dict, cast
+from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
 
 import httpx
 import resend
@@ -21,15 +26,23 @@ from pydantic import EmailStr
 from resend.emails._emails import Emails
 
 from app.api.core.auth_utils import create_token
+from app.api.core.circuit_breaker import CircuitBreaker
 from app.api.core.config import settings
+from app.api.core.http_client import get_http_client
 from app.api.core.logging import log_timing
+from app.api.core.token_bucket import TokenBucketLimiter, create_token_bucket_backend
+from app.api.core.tracing import http_client_span
 from app.api.middleware.logging_middleware import (
     request_id_ctx_var,
     sanitize_error_message,
 )
+from app.api.services.email_templates import (
+    FORWARDED_EMAIL,
+    PASSWORD_RESET_EMAIL,
+    VERIFICATION_EMAIL,
+)
 
 logger = structlog.get_logger()
-current_year = datetime.now().year
 
 # Resend config
 resend.api_key = settings.RESEND_API_KEY_SEND.get_secret_value()
@@ -37,8 +50,8 @@ RESEND_API_BASE_URL = "https://api.resend.com"
 
 EMAIL_SERVICE_UNAVAILABLE_MSG = "Email service is temporarily unavailable"
 
-_EMAIL_SEND_TIMESTAMPS: Deque[float] = deque()
-_EMAIL_SEND_LOCK = asyncio.Lock()
+_email_send_limiter: Optional[TokenBucketLimiter] = None
+_email_circuit_breaker: Optional[CircuitBreaker] = None
 
 JSON_MIME = "application/json"
 
@@ -59,24 +72,38 @@ def _is_retryable(status_code: int) -> bool:
     return status_code == 429 or status_code >= 500
 
 
-async def _rate_limit_window(max_per_sec: int = 2) -> None:
-    async with _EMAIL_SEND_LOCK:
-        now = time.monotonic()
-        while _EMAIL_SEND_TIMESTAMPS and now - _EMAIL_SEND_TIMESTAMPS[0] > 1.0:
-            _EMAIL_SEND_TIMESTAMPS.popleft()
-        if len(_EMAIL_SEND_TIMESTAMPS) >= max_per_sec:
-            sleep_for = 1.0 - (now - _EMAIL_SEND_TIMESTAMPS[0])
-            if sleep_for > 0:
-                logger.debug(
-                    "Rate limiter sleeping before send",
-                    sleep_for=round(sleep_for, 3),
-                    operation="send_email_retry",
-                )
-                await asyncio.sleep(sleep_for)
-            now = time.monotonic()
-            while _EMAIL_SEND_TIMESTAMPS and now - _EMAIL_SEND_TIMESTAMPS[0] > 1.0:
-                _EMAIL_SEND_TIMESTAMPS.popleft()
-        _EMAIL_SEND_TIMESTAMPS.append(time.monotonic())
+def get_email_send_limiter() -> TokenBucketLimiter:
+    """Return the Resend send limiter, creating it from settings on first use."""
+    global _email_send_limiter
+    if _email_send_limiter is None:
+        _email_send_limiter = TokenBucketLimiter(
+            "resend",
+            rate=settings.EMAIL_SEND_RATE_PER_SECOND,
+            burst=settings.EMAIL_SEND_BURST,
+            backend=create_token_bucket_backend(
+                settings.EMAIL_SEND_LIMITER_STORAGE_URI
+            ),
+        )
+    return _email_send_limiter
+
+
+def get_email_circuit_breaker() -> CircuitBreaker:
+    """Return the Resend circuit breaker, creating it from settings on first use."""
+    global _email_circuit_breaker
+    if _email_circuit_breaker is None:
+        _email_circuit_breaker = CircuitBreaker(
+            "resend",
+            failure_rate_threshold=settings.EMAIL_BREAKER_FAILURE_RATE,
+            minimum_calls=settings.EMAIL_BREAKER_MINIMUM_CALLS,
+            window_seconds=settings.EMAIL_BREAKER_WINDOW_SECONDS,
+            open_seconds=settings.EMAIL_BREAKER_OPEN_SECONDS,
+        )
+    return _email_circuit_breaker
+
+
+async def _rate_limit_window() -> None:
+    """Wait for a Resend send slot shared across worker processes."""
+    await get_email_send_limiter().acquire()
 
 
 def _parse_success_response(response: httpx.Response) -> Dict[str, Any]:
@@ -89,6 +116,44 @@ def _parse_success_response(response: httpx.Response) -> Dict[str, Any]:
     return {"raw": raw_json}
 
 
+async def _post_to_resend(
+    path: str,
+    body: Any,
+    client: httpx.AsyncClient | None = None,
+    idempotency_key: str | None = None,
+    **span_attributes: Any,
+) -> httpx.Response:
+    """POST a JSON body to the Resend API with the send key.
+
+    Raises CircuitOpenError without calling Resend while the breaker is open.
+    Network errors and 5xx responses count as breaker failures.
+    """
+    breaker = get_email_circuit_breaker()
+    breaker.before_call()
+    headers = {
+        "Authorization": f"Bearer {settings.RESEND_API_KEY_SEND.get_secret_value()}",
+        "Content-Type": JSON_MIME,
+        "Accept": JSON_MIME,
+    }
+    if idempotency_key:
+        headers["Idempotency-Key"] = idempotency_key
+    url = f"{RESEND_API_BASE_URL}{path}"
+    try:
+        with http_client_span("POST", url, **span_attributes) as span:
+            response = await (client or get_http_client()).post(
+                url, json=body, headers=headers
+            )
+            span.set_attribute("http.response.status_code", response.status_code)
+    except httpx.HTTPError:
+        breaker.record_failure()
+        raise
+    if response.status_code >= 500:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    return response
+
+
 async def _send_email_with_retry(
     params: Emails.SendParams,
     max_attempts: int = 5,
@@ -97,17 +162,9 @@ async def _send_email_with_retry(
     """Send email via Resend with exponential backoff and simple rate limiting."""
     await _rate_limit_window()
 
-    headers = {
-        "Authorization": f"Bearer {settings.RESEND_API_KEY_SEND.get_secret_value()}",
-        "Content-Type": JSON_MIME,
-        "Accept": JSON_MIME,
-    }
-    url = f"{RESEND_API_BASE_URL}/emails"
-
     for attempt in range(1, max_attempts + 1):
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(url, json=params, headers=headers)
+            response = await _post_to_resend("/emails", params, attempt=attempt)
         except httpx.HTTPError as exc:
             if attempt == max_attempts:
                 raise RuntimeError(f"Network error sending email: {exc}") from exc
@@ -119,6 +176,8 @@ async def _send_email_with_retry(
                 next_delay=delay,
                 operation="send_email_retry",
             )
+            # Stop backing off once the failures have opened the breaker.
+            get_email_circuit_breaker().raise_if_open()
             await asyncio.sleep(delay)
             continue
 
@@ -155,16 +214,26 @@ async def _send_email_with_retry(
             body_preview=body_preview,
             operation="send_email_retry",
         )
+        get_email_circuit_breaker().raise_if_open()
         await asyncio.sleep(delay)
 
     raise RuntimeError("Failed to send email (exhausted attempts)")
 
 
-async def send_verification_email(
+def _verification_link(user_id: str, from_reset: bool) -> str:
+    token = create_token(
+        user_id=user_id,
+        expiry_seconds=3600,  # 1 hour
+        token_type="email_verification",
+    )
+    return f"{settings.FRONTEND_URL}/verify-email?token={token}&fromReset={str(from_reset).lower()}"
+
+
+def build_verification_email(
     user_email: EmailStr, user_id: str, from_reset: bool = False
-) -> dict[str, str]:
+) -> Emails.SendParams:
     """
-    Send an email verification link to the user.
+    Build the email verification message for a user.
 
     Args:
         user_email: The user's email address
@@ -172,177 +241,62 @@ async def send_verification_email(
         from_reset: Whether this verification is part of password reset flow
 
     Returns:
-        dict: Success message
-
-    Raises:
-        HTTPException: If email sending fails
+        Emails.SendParams: Resend send parameters
     """
-    log_context = {
-        "user_id": user_id,
-        "email": user_email,
-        "request_id": request_id_ctx_var.get(),
-        "operation": "send_verification_email",
-        "is_from_reset": from_reset,
-    }
+    verification_link = _verification_link(user_id, from_reset)
 
-    try:
-        with log_timing("email_verification", request_id=log_context["request_id"]):
-            token = create_token(
-                user_id=user_id,
-                expiry_seconds=3600,  # 1 hour
-                token_type="email_verification",
-            )
-
-            verification_link = f"{settings.FRONTEND_URL}/verify-email?token={token}&fromReset={str(from_reset).lower()}"
-
-            logger.debug(
-                "Generated verification link",
-                frontend_url=settings.FRONTEND_URL,
-                token_expiry="1 hour",
-                **log_context,
-            )
-
-            email_body = f"""Dear Allotment Member,
-
-Thank you for creating an account. We're excited to have you join our community of gardening enthusiasts.
-
-To complete your registration and access all features, please verify your email address by clicking the link below:
-
-{verification_link}
-
-This verification link will expire in 1 hour for security purposes. If you don't complete the verification within this timeframe, you'll need to request a new verification email.
-
-If you did not create an account with Allotment, please disregard this email or contact our support team.
-
-Best regards,
-The Allotment Team
+    logger.debug(
+        "Generated verification link",
+        frontend_url=settings.FRONTEND_URL,
+        token_expiry="1 hour",
+        user_id=user_id,
+        is_from_reset=from_reset,
+        operation="build_verification_email",
+    )
 
-------------------------------
-This is an automated message. Please do not reply directly to this email.
-© {current_year} Allotment Service. All rights reserved."""
+    return VERIFICATION_EMAIL.render(
+        settings.MAIL_FROM, user_email, {"verification_link": verification_link}
+    )
 
-            params: Emails.SendParams = {
-                "from": settings.MAIL_FROM,
-                "to": user_email,
-                "subject": "Email Verification Required - Allotment Service",
-                "text": email_body,
-            }
 
-            response = await _send_email_with_retry(params)
+def build_verification_emails(
+    recipients: Iterable[Tuple[EmailStr, str]], from_reset: bool = False
+) -> List[Emails.SendParams]:
+    """
+    Build verification messages for many users, e.g. a re-verification campaign.
 
-            logger.info(
-                "Verification email sent successfully",
-                email_id=response.get("id"),
-                **log_context,
-            )
-            return {"message": "Verification email sent successfully"}
+    Args:
+        recipients: (email, user_id) pairs
+        from_reset: Whether this verification is part of password reset flow
 
-    except (httpx.HTTPError, RuntimeError) as e:
-        sanitized_error = sanitize_error_message(str(e))
-        logger.error(
-            "Resend API error",
-            error=sanitized_error,
-            error_type=type(e).__name__,
-            **log_context,
-        )
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=EMAIL_SERVICE_UNAVAILABLE_MSG,
-        )
-    except Exception as e:
-        sanitized_error = sanitize_error_message(str(e))
-        logger.exception(
-            "Unhandled exception during email sending",
-            error=sanitized_error,
-            error_type=type(e).__name__,
-            **log_context,
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to send verification email",
-        )
+    Returns:
+        List[Emails.SendParams]: Resend send parameters, one per recipient
+    """
+    return VERIFICATION_EMAIL.render_batch(
+        settings.MAIL_FROM,
+        (
+            (user_email, {"verification_link": _verification_link(user_id, from_reset)})
+            for user_email, user_id in recipients
+        ),
+    )
 
 
-async def send_password_reset_email(
+def build_password_reset_email(
     user_email: EmailStr, reset_url: str
-) -> dict[str, str]:
+) -> Emails.SendParams:
     """
-    Send a password reset link to the user.
+    Build the password reset message for a user.
 
     Args:
         user_email: The user's email address
         reset_url: The password reset URL with token
 
     Returns:
-        dict: Success message
-
-    Raises:
-        HTTPException: If email sending fails
+        Emails.SendParams: Resend send parameters
     """
-    log_context = {
-        "email": user_email,
-        "request_id": request_id_ctx_var.get(),
-        "operation": "send_password_reset_email",
-    }
-
-    try:
-        with log_timing("email_password_reset", request_id=log_context["request_id"]):
-            email_body = f"""Dear Allotment Member,
-
-You recently requested to reset your password. Click the link below to set a new password:
-
-{reset_url}
-
-This password reset link will expire in 1 hour for security purposes. 
-If you did not request a password reset, please ignore this email or contact support if you have concerns.
-
-Best regards,
-The Allotment Team
-
-------------------------------
-This is an automated message. Please do not reply directly to this email.
-© {current_year} Allotment Service. All rights reserved."""
-
-            params: Emails.SendParams = {
-                "from": settings.MAIL_FROM,
-                "to": user_email,
-                "subject": "Password Reset - Allotment Service",
-                "text": email_body,
-            }
-
-            response = await _send_email_with_retry(params)
-
-            logger.info(
-                "Password reset email sent successfully",
-                email_id=response.get("id"),
-                **log_context,
-            )
-            return {"message": "Password reset email sent successfully"}
-
-    except (httpx.HTTPError, RuntimeError) as e:
-        sanitized_error = sanitize_error_message(str(e))
-        logger.error(
-            "Resend API error",
-            error=sanitized_error,
-            error_type=type(e).__name__,
-            **log_context,
-        )
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=EMAIL_SERVICE_UNAVAILABLE_MSG,
-        )
-    except Exception as e:
-        sanitized_error = sanitize_error_message(str(e))
-        logger.exception(
-            "Unhandled exception during email sending",
-            error=sanitized_error,
-            error_type=type(e).__name__,
-            **log_context,
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to send password reset email",
-        )
+    return PASSWORD_RESET_EMAIL.render(
+        settings.MAIL_FROM, user_email, {"reset_url": reset_url}
+    )
 
 
 async def _fetch_inbound_email_content(email_id: str) -> tuple[str | None, str | None]:
@@ -357,6 +311,10 @@ async def _fetch_inbound_email_content(email_id: str) -> tuple[str | None, str |
         "Accept": "application/json",
     }
 
+    # Raises CircuitOpenError rather than forwarding without the body.
+    breaker = get_email_circuit_breaker()
+    breaker.before_call()
+
     logger.info(
         "Attempting to fetch inbound email content",
         email_id=email_id,
@@ -365,8 +323,13 @@ async def _fetch_inbound_email_content(email_id: str) -> tuple[str | None, str |
     )
 
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(url, headers=headers)
+        with http_client_span("GET", url) as span:
+            response = await get_http_client().get(url, headers=headers, timeout=5.0)
+            span.set_attribute("http.response.status_code", response.status_code)
+            if response.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
             response.raise_for_status()
     except httpx.HTTPStatusError as exc:
         logger.warning(
@@ -378,6 +341,7 @@ async def _fetch_inbound_email_content(email_id: str) -> tuple[str | None, str |
         )
         return None, None
     except httpx.HTTPError as exc:
+        breaker.record_failure()
         logger.warning(
             "HTTP error while fetching inbound email content",
             email_id=email_id,
@@ -462,9 +426,6 @@ async def forward_inbound_email(
         with log_timing("email_forward_inbound", request_id=log_context["request_id"]):
             base_subject = subject or "(No subject)"
             cleaned_subject = re.sub(r"^(?:\[Fwd\]\s*)+", "", base_subject).strip()
-            final_subject = (
-                f"[Fwd] {cleaned_subject}" if cleaned_subject else "[Fwd] (No subject)"
-            )
 
             resolved_body = (
                 body.strip()
@@ -472,25 +433,17 @@ async def forward_inbound_email(
                 else "(Email body not included in webhook - please check original message)"
             )
 
-            forwarded_body = dedent(
-                f"""
-                Forwarded message from: {from_email}
-                Subject: {cleaned_subject or "(No subject)"}
-                Received: {datetime.now(timezone.utc).isoformat()}
-
-                --- Original Message ---
-
-                {resolved_body}
-                """
-            ).strip()
-
-            params: Emails.SendParams = {
-                "from": settings.CONTACT_FROM,
-                "to": settings.CONTACT_TO,
-                "reply_to": reply_to or from_email,
-                "subject": final_subject,
-                "text": forwarded_body,
-            }
+            params = FORWARDED_EMAIL.render(
+                settings.CONTACT_FROM,
+                settings.CONTACT_TO,
+                {
+                    "from_email": from_email,
+                    "subject": cleaned_subject or "(No subject)",
+                    "received": datetime.now(timezone.utc).isoformat(),
+                    "body": resolved_body,
+                },
+                reply_to=reply_to or from_email,
+            )
 
             response = await _send_email_with_retry(params)
             logger.info(
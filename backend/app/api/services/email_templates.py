@@ -0,0 +1,170 @@
+"""
+Email Templates
+- Templates are compiled once, at import during startup: the source is split
+  into static text and named ``{slot}`` placeholders, and constants such as
+  the footer year are folded into the static text.
+- Rendering drops the slot values between the cached static parts and joins
+  once; nothing is parsed or dedented per send.
+- render_batch builds the messages for many recipients in one call, for bulk
+  sends such as digests or re-verification campaigns.
+"""
+
+from datetime import datetime
+from string import Formatter
+from textwrap import dedent
+from typing import Any, Iterable, List, Mapping, Optional, Tuple
+
+from resend.emails._emails import Emails
+
+
+class CompiledTemplate:
+    """Template text split into static parts and the slots between them."""
+
+    __slots__ = ("slots", "_parts", "_positions")
+
+    def __init__(self, source: str, **constants: Any) -> None:
+        static: List[str] = [""]
+        slots: List[str] = []
+        for literal, field, spec, conversion in Formatter().parse(source):
+            static[-1] += literal
+            if field is None:
+                continue
+            if not field.isidentifier() or spec or conversion:
+                raise ValueError(f"Unsupported template placeholder: {{{field}}}")
+            if field in constants:
+                static[-1] += str(constants[field])
+                continue
+            slots.append(field)
+            static.append("")
+        self.slots: Tuple[str, ...] = tuple(slots)
+        # Static text and slot markers alternate; rendering copies the list,
+        # drops the values into the slot positions and joins once.
+        self._parts: List[str] = []
+        self._positions: List[Tuple[int, str]] = []
+        for slot, text in zip((None, *slots), static):
+            if slot is not None:
+                self._positions.append((len(self._parts), slot))
+                self._parts.append("")
+            if text:
+                self._parts.append(text)
+
+    def render(self, values: Mapping[str, Any]) -> str:
+        """Fill every slot from ``values``; a missing slot raises KeyError."""
+        parts = self._parts.copy()
+        for position, slot in self._positions:
+            parts[position] = str(values[slot])
+        return "".join(parts)
+
+    def render_many(self, rows: Iterable[Mapping[str, Any]]) -> List[str]:
+        return [self.render(values) for values in rows]
+
+
+class EmailTemplate:
+    """A compiled subject and plain-text body for one kind of email."""
+
+    def __init__(self, name: str, subject: str, text: str, **constants: Any) -> None:
+        self.name = name
+        self.subject = CompiledTemplate(subject, **constants)
+        self.text = CompiledTemplate(text, **constants)
+        # Most subjects have no slots; render those once here.
+        self._fixed_subject = None if self.subject.slots else self.subject.render({})
+
+    def render(
+        self,
+        sender: str,
+        to: str,
+        values: Mapping[str, Any],
+        reply_to: Optional[str] = None,
+    ) -> Emails.SendParams:
+        params: Emails.SendParams = {
+            "from": sender,
+            "to": to,
+            "subject": self._fixed_subject or self.subject.render(values),
+            "text": self.text.render(values),
+        }
+        if reply_to:
+            params["reply_to"] = reply_to
+        return params
+
+    def render_batch(
+        self, sender: str, recipients: Iterable[Tuple[str, Mapping[str, Any]]]
+    ) -> List[Emails.SendParams]:
+        """Render one message per ``(to, values)`` pair."""
+        render_text = self.text.render
+        fixed_subject = self._fixed_subject
+        render_subject = self.subject.render
+        return [
+            {
+                "from": sender,
+                "to": to,
+                "subject": fixed_subject or render_subject(values),
+                "text": render_text(values),
+            }
+            for to, values in recipients
+        ]
+
+
+_FOOTER = """\
+Best regards,
+The Allotment Team
+
+------------------------------
+This is an automated message. Please do not reply directly to this email.
+© {current_year} Allotment Service. All rights reserved."""
+
+_CONSTANTS = {"current_year": datetime.now().year}
+
+VERIFICATION_EMAIL = EmailTemplate(
+    "email_verification",
+    subject="Email Verification Required - Allotment Service",
+    text="""\
+Dear Allotment Member,
+
+Thank you for creating an account. We're excited to have you join our community of gardening enthusiasts.
+
+To complete your registration and access all features, please verify your email address by clicking the link below:
+
+{verification_link}
+
+This verification link will expire in 1 hour for security purposes. If you don't complete the verification within this timeframe, you'll need to request a new verification email.
+
+If you did not create an account with Allotment, please disregard this email or contact our support team.
+
+"""
+    + _FOOTER,
+    **_CONSTANTS,
+)
+
+PASSWORD_RESET_EMAIL = EmailTemplate(
+    "password_reset",
+    subject="Password Reset - Allotment Service",
+    text="""\
+Dear Allotment Member,
+
+You recently requested to reset your password. Click the link below to set a new password:
+
+{reset_url}
+
+This password reset link will expire in 1 hour for security purposes. 
+If you did not request a password reset, please ignore this email or contact support if you have concerns.
+
+"""
+    + _FOOTER,
+    **_CONSTANTS,
+)
+
+FORWARDED_EMAIL = EmailTemplate(
+    "forwarded_inbound",
+    subject="[Fwd] {subject}",
+    text=dedent(
+        """
+        Forwarded message from: {from_email}
+        Subject: {subject}
+        Received: {received}
+
+        --- Original Message ---
+
+        {body}
+        """
+    ).strip(),
+)
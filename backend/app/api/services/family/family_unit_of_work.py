@@ -13,6 +13,7 @@ from typing import Any, List, Optional, Type
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.core.logging import log_timing
 from app.api.middleware.logging_middleware import (
     request_id_ctx_var,
     sanitize_error_message,
@@ -89,9 +90,13 @@ class FamilyUnitOfWork:
         logger.info("Starting operation to fetch botanical groups", **log_context)
 
         try:
-            botanical_groups = (
-                await self.family_repo.get_all_botanical_groups_with_families()
-            )
+            with log_timing(
+                "uow_get_all_botanical_groups_with_families",
+                request_id=self.request_id,
+            ):
+                botanical_groups = (
+                    await self.family_repo.get_all_botanical_groups_with_families()
+                )
             logger.info(
                 "Successfully retrieved botanical groups",
                 count=len(botanical_groups),
@@ -116,4 +121,5 @@ class FamilyUnitOfWork:
         Returns:
             A Pydantic schema containing detailed family information, or None if not found.
         """
-        return await self.family_repo.get_family_info(family_id)
+        with log_timing("uow_get_family_details", request_id=self.request_id):
+            return await self.family_repo.get_family_info(family_id)
@@ -5,7 +5,7 @@ Grow Guide Unit of Work
 """
 
 from types import TracebackType
-from typing import List, Optional, Type
+from typing import AsyncIterator, List, Optional, Sequence, Set, Tuple, Type
 from uuid import UUID
 
 import structlog
@@ -13,6 +13,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.core.logging import log_timing
+from app.api.core.pagination import decode_cursor, encode_cursor
 from app.api.factories.variety_factory import VarietyFactory
 from app.api.middleware.error_handler import translate_db_exceptions
 from app.api.middleware.exception_handler import (
@@ -35,13 +36,25 @@ from app.api.models.grow_guide.variety_model import Variety
 from app.api.repositories.family.family_repository import FamilyRepository
 from app.api.repositories.grow_guide.day_repository import DayRepository
 from app.api.repositories.grow_guide.month_repository import MonthRepository
-from app.api.repositories.grow_guide.variety_repository import VarietyRepository
+from app.api.repositories.grow_guide.variety_repository import (
+    VarietyListRow,
+    VarietyRepository,
+)
 from app.api.repositories.grow_guide.week_repository import WeekRepository
 from app.api.schemas.grow_guide.variety_schema import VarietyCreate, VarietyUpdate
+from app.api.services.grow_guide.variety_search_index import (
+    get_variety_search_index_cache,
+)
 
 logger = structlog.get_logger()
 
 
+def decode_public_varieties_cursor(cursor: str) -> Tuple[str, UUID]:
+    """Decode a public varieties cursor; anything malformed is a 400."""
+    variety_name, variety_id = decode_cursor(cursor, (str, UUID))
+    return variety_name, variety_id
+
+
 class GrowGuideUnitOfWork:
     """Unit of Work for managing grow guide-related transactions."""
 
@@ -318,7 +331,7 @@ class GrowGuideUnitOfWork:
             return variety
 
     @translate_db_exceptions
-    async def get_user_varieties(self, user_id: UUID) -> List[Variety]:
+    async def get_user_varieties(self, user_id: UUID) -> List[VarietyListRow]:
         """Get all varieties belonging to a user."""
         log_context = {
             "request_id": self.request_id,
@@ -338,7 +351,7 @@ class GrowGuideUnitOfWork:
             return varieties
 
     @translate_db_exceptions
-    async def get_public_varieties(self) -> List[Variety]:
+    async def get_public_varieties(self) -> List[VarietyListRow]:
         """Get all public varieties."""
         log_context = {
             "request_id": self.request_id,
@@ -356,6 +369,105 @@ class GrowGuideUnitOfWork:
             )
             return varieties
 
+    @translate_db_exceptions
+    async def get_public_varieties_page(
+        self, limit: int, cursor: Optional[str] = None
+    ) -> Tuple[List[VarietyListRow], Optional[str]]:
+        """Get one page of public varieties and the cursor for the next page."""
+        log_context = {
+            "request_id": self.request_id,
+            "operation": "get_public_varieties_page_uow",
+            "limit": limit,
+        }
+
+        logger.info("Getting public varieties page", **log_context)
+
+        after = decode_public_varieties_cursor(cursor) if cursor else None
+        with log_timing("uow_get_public_varieties_page", request_id=self.request_id):
+            # One extra row tells us whether another page follows.
+            varieties = await self.variety_repo.get_public_varieties_page(
+                limit + 1, after
+            )
+            next_cursor = None
+            if len(varieties) > limit:
+                varieties = varieties[:limit]
+                last = varieties[-1]
+                next_cursor = encode_cursor((last.variety_name, last.variety_id))
+            logger.info(
+                "Public varieties page retrieved successfully",
+                count=len(varieties),
+                has_more=next_cursor is not None,
+                **log_context,
+            )
+            return varieties, next_cursor
+
+    async def iter_public_variety_batches(
+        self, batch_size: int, after: Optional[Tuple[str, UUID]] = None
+    ) -> AsyncIterator[List[VarietyListRow]]:
+        """Yield public varieties in keyset batches of ``batch_size`` rows.
+
+        Starts after the ``after`` sort key when given, e.g. a resumed stream.
+        Only one batch is held at a time, so memory stays flat however large
+        the catalogue grows.
+        """
+        while True:
+            batch = await self.variety_repo.get_public_varieties_page(batch_size, after)
+            if batch:
+                yield batch
+            if len(batch) < batch_size:
+                return
+            after = (batch[-1].variety_name, batch[-1].variety_id)
+
+    @translate_db_exceptions
+    async def search_public_varieties(
+        self,
+        query: str,
+        family_id: Optional[UUID] = None,
+        lifecycle_id: Optional[UUID] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[VarietyListRow]:
+        """Search public varieties by name, best match first.
+
+        PostgreSQL ranks in the database using pg_trgm; other databases use
+        the in-memory trigram index, rebuilt when the catalogue changes.
+        """
+        log_context = {
+            "request_id": self.request_id,
+            "operation": "search_public_varieties_uow",
+            "limit": limit,
+            "offset": offset,
+        }
+
+        logger.info("Searching public varieties", **log_context)
+
+        with log_timing("uow_search_public_varieties", request_id=self.request_id):
+            if self.variety_repo.supports_trigram_search:
+                varieties = await self.variety_repo.search_public_varieties(
+                    query, family_id, lifecycle_id, limit, offset
+                )
+            else:
+                signature = await self.variety_repo.get_public_catalogue_signature()
+                index = await get_variety_search_index_cache().get(
+                    signature, self.variety_repo.get_public_variety_search_rows
+                )
+                page_ids = index.search(
+                    query, family_id, lifecycle_id, limit=offset + limit
+                )[offset:]
+                by_id = {
+                    variety.variety_id: variety
+                    for variety in await self.variety_repo.get_public_varieties_by_ids(
+                        page_ids
+                    )
+                }
+                # A variety deleted since the index was built is simply skipped.
+                varieties = [by_id[vid] for vid in page_ids if vid in by_id]
+
+            logger.info(
+                "Public variety search completed", count=len(varieties), **log_context
+            )
+            return varieties
+
     @translate_db_exceptions
     async def update_variety(
         self, variety_id: UUID, variety_data: VarietyUpdate, user_id: UUID
@@ -409,7 +521,6 @@ class GrowGuideUnitOfWork:
                 variety_data.water_frequency_id is not None
                 and variety_data.water_frequency_id != old_water_frequency_id
             ):
-                await self.variety_repo.delete_water_days(variety_id)
                 # At this point variety_data.water_frequency_id is not None and the factory
                 # will have applied it to updated_variety; assert for type narrowing.
                 assert updated_variety.water_frequency_id is not None, (
@@ -425,17 +536,10 @@ class GrowGuideUnitOfWork:
                         message="No default watering days configured for selected water frequency",
                         status_code=422,
                     )
-                water_days_data = [{"day_id": d} for d in default_day_ids]
-                water_days = VarietyFactory.create_water_days(
-                    variety_id, water_days_data
+                # Only days that differ from the current set are written.
+                await self.variety_repo.sync_water_days(
+                    updated_variety, default_day_ids
                 )
-                await self.variety_repo.create_water_days(water_days)
-                # IMPORTANT: After the bulk delete + insert, SQLAlchemy's in-memory relationship
-                # collection still contains the previously loaded (now deleted) VarietyWaterDay
-                # objects because the bulk DELETE does not synchronize the session state.
-                # Assign the freshly created list so that subsequent serialization (before commit)
-                # reflects the regenerated set rather than the stale one.
-                updated_variety.water_days = water_days
 
             # Return the mutated instance; API layer does an explicit get_variety for full serialization.
             logger.info("Variety updated successfully", **log_context)
@@ -490,6 +594,80 @@ class GrowGuideUnitOfWork:
             logger.info("Public variety copied successfully", **log_context)
             return created
 
+    @translate_db_exceptions
+    async def copy_public_varieties_to_user(
+        self, public_variety_ids: Sequence[UUID], user_id: UUID
+    ) -> List[VarietyListRow]:
+        """Copy several public varieties to the user in one transaction.
+
+        The sources load in one query, copy names are chosen in memory from a
+        single scan of the user's names, and the varieties and their water
+        days are inserted in bulk. Any unknown or private ID fails the lot.
+        """
+        variety_ids = list(dict.fromkeys(public_variety_ids))
+        log_context = {
+            "request_id": self.request_id,
+            "operation": "copy_public_varieties_to_user_uow",
+            "user_id": str(user_id),
+            "count": len(variety_ids),
+        }
+        logger.info("Copying public varieties to user", **log_context)
+        with log_timing(
+            "uow_copy_public_varieties_to_user", request_id=self.request_id
+        ):
+            sources = {
+                source.variety_id: source
+                for source in await self.variety_repo.get_public_varieties_for_copying(
+                    variety_ids
+                )
+            }
+            for variety_id in variety_ids:
+                if variety_id not in sources:
+                    raise ResourceNotFoundError("variety", str(variety_id))
+
+            existing_names = set(
+                await self.variety_repo.get_user_variety_names(user_id)
+            )
+            default_day_ids = (
+                await self.variety_repo.get_default_day_ids_for_frequencies(
+                    {source.water_frequency_id for source in sources.values()}
+                )
+            )
+
+            copies = []
+            for variety_id in variety_ids:
+                source = sources[variety_id]
+                if not default_day_ids.get(source.water_frequency_id):
+                    raise BusinessLogicError(
+                        message="No default watering days configured for selected water frequency",
+                        status_code=422,
+                    )
+                name = self._next_copy_name(source.variety_name, existing_names)
+                existing_names.add(name)
+                copies.append(
+                    VarietyFactory.create_variety(
+                        self._build_copy_payload(source, name), user_id
+                    )
+                )
+
+            await self.variety_repo.create_varieties(copies)
+            await self.variety_repo.insert_water_days(
+                [
+                    (copy.variety_id, day_id)
+                    for copy in copies
+                    for day_id in default_day_ids[copy.water_frequency_id]
+                ]
+            )
+
+            rows = {
+                row.variety_id: row
+                for row in await self.variety_repo.get_user_varieties(
+                    user_id, [copy.variety_id for copy in copies]
+                )
+            }
+            logger.info("Public varieties copied successfully", **log_context)
+            return [rows[copy.variety_id] for copy in copies]
+
     async def _get_public_source_or_404(self, public_variety_id: UUID) -> Variety:
         """Fetch the public source variety or raise ResourceNotFoundError."""
         source = await self.variety_repo.get_public_variety_by_id(public_variety_id)
@@ -510,6 +688,11 @@ class GrowGuideUnitOfWork:
                 user_id, base_name
             )
         )
+        return self._next_copy_name(base_name, existing_names)
+
+    @staticmethod
+    def _next_copy_name(base_name: str, existing_names: Set[str]) -> str:
+        """Apply the copy naming rules against a set of names already taken."""
         if base_name not in existing_names:
             return base_name
         used: set[int] = set()
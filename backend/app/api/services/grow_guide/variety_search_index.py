@@ -0,0 +1,218 @@
+"""
+Variety Search Index
+- In-memory trigram index over public variety names, used where the database
+  has no pg_trgm (SQLite in local development and tests).
+- Names are indexed the way pg_trgm does it (lower-cased words, each padded
+  with two spaces before and one after), so a query's trigrams find
+  substring, prefix and misspelt matches from the posting lists alone.
+- Results are ranked like the PostgreSQL query: exact name, then name
+  prefix, word prefix, substring, and finally trigram similarity; within a
+  tier shorter names (closer to the query) come first.
+- The index is rebuilt from the repository whenever the public catalogue's
+  signature (row count and latest update) changes.
+"""
+
+import asyncio
+import heapq
+import re
+from collections import Counter
+from datetime import datetime
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+from uuid import UUID
+
+import structlog
+
+from app.api.core.logging import log_timing
+
+logger = structlog.get_logger()
+
+# Same default as pg_trgm's similarity threshold for the % operator
+SIMILARITY_THRESHOLD = 0.3
+
+MATCH_EXACT = 0
+MATCH_PREFIX = 1
+MATCH_WORD_PREFIX = 2
+MATCH_SUBSTRING = 3
+MATCH_SIMILAR = 4
+
+# (variety_id, variety_name, family_id, lifecycle_id)
+SearchRow = Tuple[UUID, str, UUID, UUID]
+CatalogueSignature = Tuple[int, Optional[datetime]]
+
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """Return the pg_trgm-style trigrams of already lower-cased ``text``."""
+    grams: Set[str] = set()
+    for word in _WORD.findall(text):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+class VarietySearchIndex:
+    """Trigram posting lists over lower-cased public variety names.
+
+    Rows are held by position, sorted by (name, id) so that the position is
+    also the final tie-break; posting lists of small ints keep counting shared
+    trigrams cheap compared with hashing UUIDs.
+    """
+
+    def __init__(self, rows: Iterable[SearchRow]) -> None:
+        ordered = sorted(
+            (variety_name.lower(), str(variety_id), variety_id, family_id, lifecycle_id)
+            for variety_id, variety_name, family_id, lifecycle_id in rows
+        )
+        self._ids: List[UUID] = []
+        self._names: List[str] = []
+        self._filters: List[Tuple[UUID, UUID]] = []
+        self._trigram_counts: List[int] = []
+        self._postings: Dict[str, List[int]] = {}
+        for position, (name, _, variety_id, family_id, lifecycle_id) in enumerate(
+            ordered
+        ):
+            grams = trigrams(name)
+            self._ids.append(variety_id)
+            self._names.append(name)
+            self._filters.append((family_id, lifecycle_id))
+            self._trigram_counts.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _wanted(
+        self,
+        position: int,
+        family_id: Optional[UUID],
+        lifecycle_id: Optional[UUID],
+    ) -> bool:
+        row_family_id, row_lifecycle_id = self._filters[position]
+        return (family_id is None or row_family_id == family_id) and (
+            lifecycle_id is None or row_lifecycle_id == lifecycle_id
+        )
+
+    def _substring_matches(self, q: str) -> Set[int]:
+        # Any name containing q contains every trigram inside q's words, so
+        # intersecting those posting lists (smallest first) narrows the scan.
+        inner = {
+            word[i : i + 3] for word in _WORD.findall(q) for i in range(len(word) - 2)
+        }
+        if not inner:
+            # No word long enough for an inner trigram ("er" in "cherry").
+            return {position for position, name in enumerate(self._names) if q in name}
+        postings = sorted((self._postings.get(gram, []) for gram in inner), key=len)
+        hits = set(postings[0])
+        for posting in postings[1:]:
+            hits.intersection_update(posting)
+        return {position for position in hits if q in self._names[position]}
+
+    def search(
+        self,
+        query: str,
+        family_id: Optional[UUID] = None,
+        lifecycle_id: Optional[UUID] = None,
+        limit: Optional[int] = None,
+    ) -> List[UUID]:
+        """Return the ids of matching varieties, best match first.
+
+        With ``limit`` only the best ``limit`` matches are kept, and trigram
+        similarity is only computed when substring matches cannot fill it.
+        """
+        q = query.strip().lower()
+        if not q:
+            return []
+
+        matches = self._substring_matches(q)
+        ranked: List[Tuple[int, float, int, int]] = []
+        for position in matches:
+            if not self._wanted(position, family_id, lifecycle_id):
+                continue
+            name = self._names[position]
+            if name == q:
+                tier = MATCH_EXACT
+            elif name.startswith(q):
+                tier = MATCH_PREFIX
+            elif f" {q}" in name:
+                tier = MATCH_WORD_PREFIX
+            else:
+                tier = MATCH_SUBSTRING
+            ranked.append((tier, 0.0, len(name), position))
+
+        if limit is None or len(ranked) < limit:
+            query_grams = trigrams(q)
+            shared: Counter[int] = Counter()
+            for gram in query_grams:
+                shared.update(self._postings.get(gram, ()))
+            for position, common in shared.items():
+                if position in matches or not self._wanted(
+                    position, family_id, lifecycle_id
+                ):
+                    continue
+                union = len(query_grams) + self._trigram_counts[position] - common
+                similarity = common / union
+                if similarity >= SIMILARITY_THRESHOLD:
+                    name = self._names[position]
+                    ranked.append((MATCH_SIMILAR, -similarity, len(name), position))
+
+        best = sorted(ranked) if limit is None else heapq.nsmallest(limit, ranked)
+        return [self._ids[entry[-1]] for entry in best]
+
+
+class VarietySearchIndexCache:
+    """The current index, rebuilt when the catalogue signature changes."""
+
+    def __init__(self) -> None:
+        self._signature: Optional[CatalogueSignature] = None
+        self._index: Optional[VarietySearchIndex] = None
+        self._building = asyncio.Lock()
+
+    def _current(self, signature: CatalogueSignature) -> Optional[VarietySearchIndex]:
+        return self._index if self._signature == signature else None
+
+    async def get(
+        self,
+        signature: CatalogueSignature,
+        load_rows: Callable[[], Awaitable[Iterable[SearchRow]]],
+    ) -> VarietySearchIndex:
+        index = self._current(signature)
+        if index is not None:
+            return index
+        async with self._building:
+            # Another request may have rebuilt it while we waited.
+            index = self._current(signature)
+            if index is not None:
+                return index
+            with log_timing("build_variety_search_index"):
+                index = VarietySearchIndex(await load_rows())
+            logger.info("Variety search index built", varieties=len(index))
+            self._signature, self._index = signature, index
+            return index
+
+    def clear(self) -> None:
+        self._signature = None
+        self._index = None
+
+
+_variety_search_index_cache: Optional[VarietySearchIndexCache] = None
+
+
+def get_variety_search_index_cache() -> VarietySearchIndexCache:
+    """Return the process-wide search index cache."""
+    global _variety_search_index_cache
+    if _variety_search_index_cache is None:
+        _variety_search_index_cache = VarietySearchIndexCache()
+    return _variety_search_index_cache
@@ -0,0 +1,209 @@
+"""
+Health Sampler
+- A background task, started in the application lifespan, samples CPU,
+  memory and disk usage and database connectivity on an interval into a
+  cached snapshot, so health probes never open a session or call psutil.
+- Logs when resources cross or return below their warning thresholds.
+- If the snapshot is missing or stale (no lifespan, or the task has died) the
+  next reader samples once on demand.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+import psutil
+import structlog
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.core.database import AsyncSessionLocal
+from app.api.middleware.logging_middleware import sanitize_error_message
+
+logger = structlog.get_logger()
+
+CPU_WARNING_THRESHOLD = 85
+MEMORY_WARNING_THRESHOLD = 85
+DISK_WARNING_THRESHOLD = 85
+
+# A snapshot older than this many intervals is re-sampled by the reader
+STALE_AFTER_INTERVALS = 3
+
+
+class HealthSnapshot(NamedTuple):
+    database: str
+    cpu_usage: float
+    memory_usage: float
+    disk_usage: float
+    sampled_at: float
+
+    @property
+    def age(self) -> float:
+        return max(0.0, time.time() - self.sampled_at)
+
+
+class HealthSampler:
+    """Periodically samples system resources and database connectivity."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        interval_seconds: float = 15.0,
+        db_timeout_seconds: float = 5.0,
+    ) -> None:
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self.db_timeout_seconds = db_timeout_seconds
+        self._snapshot: Optional[HealthSnapshot] = None
+        self._critical: Dict[str, bool] = {
+            "cpu_critical": False,
+            "memory_critical": False,
+            "disk_critical": False,
+            "any_critical": False,
+        }
+        self._sampling = asyncio.Lock()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def snapshot(self) -> Optional[HealthSnapshot]:
+        return self._snapshot
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="health-sampler")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sample_once()
+            except Exception as exc:
+                logger.error(
+                    "Health sampling failed",
+                    error=sanitize_error_message(str(exc)),
+                    error_type=type(exc).__name__,
+                    operation="health_sampler",
+                )
+            await asyncio.sleep(self.interval_seconds)
+
+    async def current(self) -> HealthSnapshot:
+        """Return the cached snapshot, sampling first if it is missing or stale."""
+        snapshot = self._snapshot
+        if (
+            snapshot is not None
+            and snapshot.age <= self.interval_seconds * STALE_AFTER_INTERVALS
+        ):
+            return snapshot
+        async with self._sampling:
+            # Another reader may have refreshed it while we waited.
+            if self._snapshot is not snapshot and self._snapshot is not None:
+                return self._snapshot
+            return await self.sample_once()
+
+    async def sample_once(self) -> HealthSnapshot:
+        database = await self._check_database()
+        cpu_usage = psutil.cpu_percent()
+        memory_usage = psutil.virtual_memory().percent
+        disk_usage = psutil.disk_usage("/").percent
+        logger.debug(
+            "System resources status",
+            database=database,
+            cpu_usage=cpu_usage,
+            memory_usage=memory_usage,
+            disk_usage=disk_usage,
+        )
+        self._log_resource_transitions(cpu_usage, memory_usage, disk_usage)
+        self._snapshot = HealthSnapshot(
+            database, cpu_usage, memory_usage, disk_usage, time.time()
+        )
+        return self._snapshot
+
+    async def _check_database(self) -> str:
+        try:
+            async with self.session_factory() as db:
+                result = await asyncio.wait_for(
+                    db.scalar(text("SELECT 1")), self.db_timeout_seconds
+                )
+        except Exception as e:
+            logger.error(
+                "Database health check failed",
+                error="Database connectivity issue",
+                error_type=type(e).__name__,
+            )
+            return "unhealthy"
+        db_status = "healthy" if result == 1 else "unhealthy"
+        if db_status != (self._snapshot.database if self._snapshot else "healthy"):
+            logger.info("Database health check", status=db_status)
+        return db_status
+
+    def _log_resource_transitions(
+        self, cpu_usage: float, memory_usage: float, disk_usage: float
+    ) -> None:
+        previous = self._critical
+        current: Dict[str, bool] = {
+            "cpu_critical": cpu_usage > CPU_WARNING_THRESHOLD,
+            "memory_critical": memory_usage > MEMORY_WARNING_THRESHOLD,
+            "disk_critical": disk_usage > DISK_WARNING_THRESHOLD,
+        }
+        current["any_critical"] = any(current.values())
+
+        if current["any_critical"] != previous["any_critical"]:
+            if current["any_critical"]:
+                logger.warning(
+                    "System resources near capacity",
+                    cpu_usage=cpu_usage,
+                    memory_usage=memory_usage,
+                    disk_usage=disk_usage,
+                )
+            else:
+                logger.info(
+                    "System resources returned to normal levels",
+                    cpu_usage=cpu_usage,
+                    memory_usage=memory_usage,
+                    disk_usage=disk_usage,
+                )
+        if current["cpu_critical"] and not previous["cpu_critical"]:
+            logger.warning("CPU usage critical", cpu_usage=cpu_usage)
+        if current["memory_critical"] and not previous["memory_critical"]:
+            logger.warning("Memory usage critical", memory_usage=memory_usage)
+        if current["disk_critical"] and not previous["disk_critical"]:
+            logger.warning("Disk usage critical", disk_usage=disk_usage)
+
+        self._critical = current
+
+
+_sampler: Optional[HealthSampler] = None
+
+
+def start_health_sampler(
+    session_factory: Callable[[], AsyncSession], **options: Any
+) -> HealthSampler:
+    """Start the shared sampler; called from the application lifespan."""
+    global _sampler
+    if _sampler is None:
+        _sampler = HealthSampler(session_factory, **options)
+    _sampler.start()
+    return _sampler
+
+
+def get_health_sampler() -> HealthSampler:
+    """Return the shared sampler; outside the lifespan it samples on demand."""
+    global _sampler
+    if _sampler is None:
+        _sampler = HealthSampler(AsyncSessionLocal)
+    return _sampler
+
+
+async def stop_health_sampler() -> None:
+    """Stop the shared sampler; called on application shutdown."""
+    global _sampler
+    if _sampler is None:
+        return
+    sampler, _sampler = _sampler, None
+    await sampler.stop()
@@ -0,0 +1,311 @@
+"""
+Inbound Email Queue
+- The Resend webhook stores each verified delivery in the inbound_emails
+  table and returns 202 only once that commits, so a crash, deploy or
+  shutdown never loses an acknowledged email; if the store fails the webhook
+  errors and Resend redelivers.
+- Redeliveries are dropped by the unique ``svix_id`` in every process, for
+  as long as processed rows are kept (the dedupe window).
+- InboundEmailQueue, started in the application lifespan, claims due
+  deliveries with a lease and forwards up to ``workers`` at once. Failures
+  are retried with the _compute_delay backoff and, after max_attempts, kept
+  as failed for a manual replay rather than dropped.
+- While the Resend circuit breaker is not closed, deliveries stay queued
+  without spending their attempts.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.core.circuit_breaker import CircuitState
+from app.api.middleware.logging_middleware import (
+    request_id_ctx_var,
+    sanitize_error_message,
+)
+from app.api.models.email.inbound_email_model import INBOUND_STATUS_FAILED
+from app.api.repositories.email.inbound_email_repository import (
+    InboundEmailRepository,
+)
+from app.api.schemas.inbound_email_schema import InboundEmailPayload
+from app.api.services.email_service import (
+    _compute_delay,
+    _fetch_inbound_email_content,
+    forward_inbound_email,
+    get_email_circuit_breaker,
+)
+
+logger = structlog.get_logger()
+
+STOP_TIMEOUT_SECONDS = 15.0
+PURGE_INTERVAL_SECONDS = 3600.0
+
+ClaimedDelivery = Tuple[UUID, Optional[str], Dict[str, Any], int]
+
+
+async def enqueue_inbound_email(
+    db: AsyncSession, svix_id: Optional[str], payload: InboundEmailPayload
+) -> bool:
+    """Store a delivery in the current transaction; False if ``svix_id`` is a redelivery.
+
+    The caller commits, and acknowledges the webhook only after that.
+    """
+    return await InboundEmailRepository(db).add(
+        svix_id, payload.model_dump(mode="json", by_alias=True)
+    )
+
+
+async def process_inbound_email(payload: InboundEmailPayload) -> None:
+    """Fetch the body if the webhook omitted it, then forward to CONTACT_TO."""
+    data = payload.data
+    log_context = {
+        "request_id": request_id_ctx_var.get(),
+        "operation": "process_inbound_email",
+        "from": data.from_,
+        "subject": data.subject,
+    }
+    if not data.text and not data.html and data.email_id:
+        logger.debug(
+            "Body missing from webhook; fetching via API",
+            email_id=data.email_id,
+            **log_context,
+        )
+        text_body, html_body = await _fetch_inbound_email_content(data.email_id)
+        body = text_body or html_body or ""
+    else:
+        body = data.text or data.html or ""
+
+    logger.debug(
+        "Webhook body content",
+        has_text=bool(data.text),
+        has_html=bool(data.html),
+        body_length=len(body),
+        text_length=len(data.text) if data.text else 0,
+        html_length=len(data.html) if data.html else 0,
+        **log_context,
+    )
+    await forward_inbound_email(
+        from_email=str(data.from_),
+        subject=data.subject or "(No subject)",
+        body=body,
+        reply_to=data.reply_to,
+        email_id=data.email_id,
+    )
+    logger.info("Inbound email processed successfully", **log_context)
+
+
+class InboundEmailQueue:
+    """Background task forwarding stored inbound email deliveries."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        workers: int = 4,
+        poll_interval_seconds: float = 2.0,
+        max_attempts: int = 5,
+        retry_base_seconds: float = 30.0,
+        lease_seconds: float = 300.0,
+        dedupe_ttl_seconds: float = 86400.0,
+    ) -> None:
+        self.session_factory = session_factory
+        self.workers = max(1, workers)
+        self.poll_interval_seconds = poll_interval_seconds
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.lease_seconds = lease_seconds
+        self.dedupe_ttl_seconds = dedupe_ttl_seconds
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._next_purge_at = 0.0
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run(), name="inbound-email-queue")
+
+    def notify(self) -> None:
+        """Wake the worker, e.g. after the webhook stored a delivery."""
+        self._wakeup.set()
+
+    async def stop(self, timeout: float = STOP_TIMEOUT_SECONDS) -> None:
+        """Finish the deliveries in flight (up to ``timeout``), then stop.
+
+        Anything still queued stays stored and is forwarded after restart.
+        """
+        if self._task is None:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(self._task, timeout)
+        except asyncio.TimeoutError:
+            # wait_for cancelled the task; leased deliveries become due again.
+            logger.warning(
+                "Inbound email queue did not stop in time; cancelled",
+                operation="inbound_email_worker",
+            )
+        self._task = None
+
+    async def _run(self) -> None:
+        logger.info("Inbound email queue started", operation="inbound_email_worker")
+        while not self._stopping:
+            try:
+                if time.monotonic() >= self._next_purge_at:
+                    self._next_purge_at = time.monotonic() + PURGE_INTERVAL_SECONDS
+                    await self.purge_processed()
+                processed = await self.drain_once()
+            except Exception as exc:
+                logger.error(
+                    "Inbound email drain failed",
+                    error=sanitize_error_message(str(exc)),
+                    error_type=type(exc).__name__,
+                    operation="inbound_email_worker",
+                )
+                processed = 0
+            if processed >= self.workers or self._stopping:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+        logger.info("Inbound email queue stopped", operation="inbound_email_worker")
+
+    async def purge_processed(self) -> int:
+        """Forget processed deliveries older than the dedupe window."""
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.dedupe_ttl_seconds)
+        async with self.session_factory() as db:
+            purged = await InboundEmailRepository(db).purge_processed(cutoff)
+            await db.commit()
+        if purged:
+            logger.debug(
+                "Processed inbound emails purged",
+                purged=purged,
+                operation="inbound_email_worker",
+            )
+        return purged
+
+    async def drain_once(self) -> int:
+        """Forward one batch of due deliveries; returns how many were attempted."""
+        breaker = get_email_circuit_breaker()
+        if not breaker.allows_calls():
+            logger.debug(
+                "Email provider circuit open; leaving inbound emails queued",
+                retry_after=round(breaker.retry_after, 1),
+                operation="inbound_email_worker",
+            )
+            return 0
+        async with self.session_factory() as db:
+            emails = await InboundEmailRepository(db).claim_due(
+                self.workers, self.lease_seconds
+            )
+            claimed: List[ClaimedDelivery] = [
+                (email.inbound_email_id, email.svix_id, email.payload, email.attempts)
+                for email in emails
+            ]
+            await db.commit()
+        if not claimed:
+            return 0
+
+        errors = await asyncio.gather(
+            *(self._process(payload) for _, _, payload, _ in claimed)
+        )
+
+        async with self.session_factory() as db:
+            repo = InboundEmailRepository(db)
+            await repo.mark_processed(
+                [email[0] for email, error in zip(claimed, errors) if error is None]
+            )
+            failed = [
+                (email, error)
+                for email, error in zip(claimed, errors)
+                if error is not None
+            ]
+            if failed and breaker.state is not CircuitState.CLOSED:
+                # The provider is failing, not these emails; keep their attempts.
+                delay = max(breaker.retry_after, self.poll_interval_seconds)
+                await repo.defer([email[0] for email, _ in failed], delay)
+                logger.info(
+                    "Email provider circuit not closed; deferring inbound emails",
+                    deferred=len(failed),
+                    retry_in=round(delay, 1),
+                    operation="inbound_email_worker",
+                )
+                failed = []
+            for (inbound_email_id, svix_id, _, attempts), error in failed:
+                attempt = attempts + 1
+                retry_in = _compute_delay(attempt, self.retry_base_seconds)
+                email = await repo.record_failure(
+                    inbound_email_id, error or "", retry_in, self.max_attempts
+                )
+                if email is not None and email.status == INBOUND_STATUS_FAILED:
+                    logger.error(
+                        "Inbound email failed; kept for manual replay",
+                        inbound_email_id=str(inbound_email_id),
+                        svix_id=svix_id,
+                        attempt=attempt,
+                        error=error,
+                        operation="inbound_email_worker",
+                    )
+                    continue
+                logger.warning(
+                    "Inbound email forwarding failed",
+                    inbound_email_id=str(inbound_email_id),
+                    svix_id=svix_id,
+                    attempt=attempt,
+                    error=error,
+                    next_delay=retry_in,
+                    operation="inbound_email_worker",
+                )
+            await db.commit()
+
+        logger.info(
+            "Inbound email batch processed",
+            attempted=len(claimed),
+            forwarded=sum(1 for error in errors if error is None),
+            operation="inbound_email_worker",
+        )
+        return len(claimed)
+
+    async def _process(self, payload: Dict[str, Any]) -> Optional[str]:
+        """Forward one delivery; returns the error, or None once forwarded."""
+        try:
+            await process_inbound_email(InboundEmailPayload.model_validate(payload))
+        except Exception as exc:
+            return sanitize_error_message(str(exc)) or type(exc).__name__
+        return None
+
+
+_queue: Optional[InboundEmailQueue] = None
+
+
+def start_inbound_email_queue(
+    session_factory: Callable[[], AsyncSession], **options: Any
+) -> InboundEmailQueue:
+    """Start the shared worker; called from the application lifespan."""
+    global _queue
+    if _queue is None:
+        _queue = InboundEmailQueue(session_factory, **options)
+        _queue.start()
+    return _queue
+
+
+async def stop_inbound_email_queue() -> None:
+    """Stop the shared worker; stored deliveries wait for the next start."""
+    global _queue
+    if _queue is None:
+        return
+    queue, _queue = _queue, None
+    await queue.stop()
+
+
+def notify_inbound_email_queue() -> None:
+    """Wake the worker, if running, so a newly stored delivery goes out promptly."""
+    if _queue is not None:
+        _queue.notify()
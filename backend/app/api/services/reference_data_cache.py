@@ -0,0 +1,72 @@
+"""
+Reference Data Cache
+- Variety options (lifecycles, planting conditions, frequencies, feeds, weeks,
+  families and days) are the same for every user and change only with
+  migrations, so they are loaded once per process and kept as serialised
+  JSON bytes.
+- Responses splice the cached bytes in directly; nothing is re-queried or
+  re-serialised until the entry expires.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.core.config import settings
+from app.api.schemas.grow_guide.variety_schema import VarietyOptionsRead
+from app.api.services.grow_guide.grow_guide_unit_of_work import GrowGuideUnitOfWork
+
+logger = structlog.get_logger()
+
+
+class ReferenceDataCache:
+    """Variety options serialised once and reused until they expire."""
+
+    def __init__(self, ttl_seconds: float = 300.0) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._variety_options: Optional[bytes] = None
+        self._expires_at = 0.0
+        self._loading = asyncio.Lock()
+
+    def _fresh(self) -> Optional[bytes]:
+        if self._variety_options is not None and time.monotonic() < self._expires_at:
+            return self._variety_options
+        return None
+
+    async def variety_options_json(self, db: AsyncSession) -> bytes:
+        """Return the serialised variety options, loading them with ``db`` if stale."""
+        cached = self._fresh()
+        if cached is not None:
+            return cached
+        async with self._loading:
+            # Another request may have loaded them while we waited.
+            cached = self._fresh()
+            if cached is not None:
+                return cached
+            async with GrowGuideUnitOfWork(db) as uow:
+                options = await uow.get_variety_options()
+            body = VarietyOptionsRead(**options).model_dump_json().encode()
+            self._variety_options = body
+            self._expires_at = time.monotonic() + self.ttl_seconds
+            logger.debug("Variety options cached", size_bytes=len(body))
+            return body
+
+    def invalidate(self) -> None:
+        self._variety_options = None
+        self._expires_at = 0.0
+
+
+_reference_data_cache: Optional[ReferenceDataCache] = None
+
+
+def get_reference_data_cache() -> ReferenceDataCache:
+    """Return the shared cache, creating it from settings on first use."""
+    global _reference_data_cache
+    if _reference_data_cache is None:
+        _reference_data_cache = ReferenceDataCache(
+            ttl_seconds=settings.REFERENCE_DATA_CACHE_SECONDS
+        )
+    return _reference_data_cache
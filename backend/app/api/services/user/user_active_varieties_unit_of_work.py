@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import uuid
 from types import TracebackType
-from typing import List, Optional, Type
+from typing import List, Optional, Sequence, Type
 
 import structlog
 from sqlalchemy.exc import IntegrityError
@@ -176,6 +176,48 @@ class UserActiveVarietiesUnitOfWork:
                 **log_context,
             )
 
+    @translate_db_exceptions
+    async def update_active_varieties(
+        self,
+        user_id: str,
+        activate: Sequence[uuid.UUID],
+        deactivate: Sequence[uuid.UUID],
+    ) -> List[UserActiveVariety]:
+        """Activate and deactivate several varieties, returning the final active set.
+
+        Ownership of every variety to activate is checked in one query; already
+        active varieties are skipped by the insert and unknown deactivations are
+        ignored, so repeating the request is harmless.
+        """
+        parsed_user_id = self._parse_uuid(user_id, "user_id")
+        activate_ids = list(dict.fromkeys(activate))
+        deactivate_ids = list(dict.fromkeys(deactivate))
+        log_context = {
+            "user_id": user_id,
+            "activate_count": len(activate_ids),
+            "deactivate_count": len(deactivate_ids),
+            "request_id": self.request_id,
+        }
+
+        with log_timing("uow_update_active_varieties", **log_context):
+            if activate_ids:
+                owned = await self.variety_repo.get_owned_variety_ids(
+                    activate_ids, parsed_user_id
+                )
+                missing = [vid for vid in activate_ids if vid not in owned]
+                if missing:
+                    logger.warning(
+                        "Varieties not found for activation",
+                        missing_count=len(missing),
+                        **log_context,
+                    )
+                    raise ResourceNotFoundError("Variety", str(missing[0]))
+                await self.user_repo.add_active_varieties(parsed_user_id, activate_ids)
+
+            await self.user_repo.delete_active_varieties(parsed_user_id, deactivate_ids)
+            logger.info("User active varieties updated", **log_context)
+            return await self.user_repo.get_active_varieties(str(parsed_user_id))
+
     def _parse_uuid(self, value: str, field: str) -> uuid.UUID:
         try:
             return uuid.UUID(str(value))
@@ -169,28 +169,15 @@ class UserPreferencesUnitOfWork:
                     status_code=400,
                 )
 
-            # Update the preference
-            await self.user_repo.update_user_feed_day(user_id, feed_id, day_id)
-
-            # Get the updated preference with feed and day names for response
-            user_feed_days = await self.user_repo.get_user_feed_days(user_id)
-
-            # Find the updated preference in the results
-            updated_feed_day = None
-            for ufd in user_feed_days:
-                if str(ufd.feed_id) == feed_id and str(ufd.day_id) == day_id:
-                    updated_feed_day = ufd
-                    break
+            # Upsert the preference; feed and day names come back with it
+            updated_feed_day = await self.user_repo.update_user_feed_day(
+                user_id, feed_id, day_id
+            )
 
             if not updated_feed_day:
-                logger.warning("Updated preference not found in results", **log_context)
+                logger.warning("Feed or day not found for preference", **log_context)
                 raise ResourceNotFoundError("Feed preference", feed_id)
 
             logger.info("User feed preference updated successfully", **log_context)
 
-            return FeedDayRead(
-                feed_id=updated_feed_day.feed_id,
-                feed_name=updated_feed_day.feed.feed_name,
-                day_id=updated_feed_day.day_id,
-                day_name=updated_feed_day.day.day_name,
-            )
+            return FeedDayRead.model_validate(updated_feed_day)
@@ -3,6 +3,8 @@ User Unit of Work
 - Manages user-related transactions as a single unit of work.
 - Coordinates operations across the UserRepository and ensures atomicity.
 - Handles transaction management (commit/rollback) for user-related operations.
+- Queues transactional emails in the same transaction, so they are only sent
+  if the change that triggered them commits.
 """
 
 from types import TracebackType
@@ -12,6 +14,7 @@ import structlog
 from authlib.jose import jwt
 from fastapi import HTTPException, status
 from pydantic import ValidationError
+from resend.emails._emails import Emails
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -40,9 +43,10 @@ from app.api.schemas.user.user_allotment_schema import (
     UserAllotmentUpdate,
 )
 from app.api.schemas.user.user_schema import UserCreate, VerificationStatusResponse
+from app.api.services.email_outbox import enqueue_email, notify_email_outbox
 from app.api.services.email_service import (
-    send_password_reset_email,
-    send_verification_email,
+    build_password_reset_email,
+    build_verification_email,
 )
 
 if TYPE_CHECKING:
@@ -64,6 +68,12 @@ class UserUnitOfWork:
         self.db = db
         self.user_repo = UserRepository(db)
         self.request_id = request_id_ctx_var.get()
+        self._emails_queued = False
+
+    def queue_email(self, params: Emails.SendParams, email_kind: str) -> None:
+        """Queue an email for delivery once this unit of work commits."""
+        enqueue_email(self.db, params, email_kind)
+        self._emails_queued = True
 
     async def __aenter__(self) -> "UserUnitOfWork":
         """Enter the runtime context for the Unit of Work."""
@@ -111,6 +121,8 @@ class UserUnitOfWork:
                         transaction="commit",
                         **log_context,
                     )
+                if self._emails_queued:
+                    notify_email_outbox()
             except IntegrityError as ie:
                 sanitized_error = sanitize_error_message(str(ie))
                 logger.error(
@@ -265,9 +277,14 @@ class UserUnitOfWork:
                 **log_context,
             )
             timing_context = {k: v for k, v in log_context.items() if k != "operation"}
-            with log_timing("send_verification_email", **timing_context):
-                await send_verification_email(
-                    user_email=user_email, user_id=str(user.user_id), from_reset=True
+            with log_timing("queue_verification_email", **timing_context):
+                self.queue_email(
+                    build_verification_email(
+                        user_email=user_email,
+                        user_id=str(user.user_id),
+                        from_reset=True,
+                    ),
+                    "email_verification",
                 )
                 return {
                     "status": "unverified",
@@ -282,8 +299,11 @@ class UserUnitOfWork:
             )
             reset_url = f"{settings.FRONTEND_URL}/set-new-password?token={token}"
 
-            await send_password_reset_email(user_email=user_email, reset_url=reset_url)
-            logger.info("Password reset email sent", **log_context)
+            self.queue_email(
+                build_password_reset_email(user_email=user_email, reset_url=reset_url),
+                "password_reset",
+            )
+            logger.info("Password reset email queued", **log_context)
 
             return {
                 "status": "success",
@@ -432,14 +452,16 @@ class UserUnitOfWork:
                 user = UserFactory.create_user(user_data)
                 created_user = await self.user_repo.create_user(user)
 
-                # Send verification email
-                await send_verification_email(
-                    created_user.user_email, str(created_user.user_id)
+                self.queue_email(
+                    build_verification_email(
+                        created_user.user_email, str(created_user.user_id)
+                    ),
+                    "email_verification",
                 )
 
                 safe_context["user_id"] = str(created_user.user_id)
                 logger.info(
-                    "User registered and verification email sent", **safe_context
+                    "User registered and verification email queued", **safe_context
                 )
 
                 return created_user
@@ -567,12 +589,15 @@ class UserUnitOfWork:
 
         log_context["user_id"] = str(user.user_id)
 
-        with log_timing("uow_send_verification_email", request_id=self.request_id):
-            await send_verification_email(
-                user_email=user_email, user_id=str(user.user_id)
+        with log_timing("uow_queue_verification_email", request_id=self.request_id):
+            self.queue_email(
+                build_verification_email(
+                    user_email=user_email, user_id=str(user.user_id)
+                ),
+                "email_verification",
             )
 
-        logger.info("Verification email sent successfully", **log_context)
+        logger.info("Verification email queued", **log_context)
 
     @translate_db_exceptions
     async def get_verification_status_service(
@@ -0,0 +1,199 @@
+"""
+User Activity Buffer
+- Login and authenticated requests record a user's last-active time here
+  instead of writing it to the database on the request path.
+- Timestamps are coalesced per user (only the latest is kept) and a
+  background task, started in the application lifespan, writes them in one
+  bulk UPDATE per flush; a last flush runs on shutdown, so at most one
+  interval of activity is lost if the process dies.
+- Updates only ever move last_active_date forward, so flushes from several
+  processes cannot overwrite a newer value with an older one.
+- Without a running flush task (outside the lifespan) the buffer stops
+  taking new users at max_pending instead of growing without bound.
+"""
+
+import asyncio
+from datetime import UTC, datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+import structlog
+from sqlalchemy import DateTime, bindparam, cast, column, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.core.database import AsyncSessionLocal
+from app.api.core.logging import log_timing
+from app.api.middleware.logging_middleware import sanitize_error_message
+from app.api.models import User
+
+logger = structlog.get_logger()
+
+_user_table = User.__table__
+
+
+class UserActivityBuffer:
+    """Coalesces last-active timestamps per user and writes them in bulk."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        flush_interval_seconds: float = 30.0,
+        max_pending: int = 10000,
+        batch_size: int = 1000,
+    ) -> None:
+        self.session_factory = session_factory
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self._pending: Dict[UUID, datetime] = {}
+        self._flushing = asyncio.Lock()
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def record(self, user_id: UUID, at: Optional[datetime] = None) -> None:
+        """Note that ``user_id`` was active at ``at`` (default: now)."""
+        if (
+            self._task is None
+            and len(self._pending) >= self.max_pending
+            and user_id not in self._pending
+        ):
+            # Nothing will flush the buffer, so waking a flush cannot help.
+            return
+        self._merge(user_id, at or datetime.now(UTC))
+        if len(self._pending) >= self.max_pending:
+            # Flush early rather than let the buffer grow without bound.
+            self._wake.set()
+
+    def _merge(self, user_id: UUID, at: datetime) -> None:
+        current = self._pending.get(user_id)
+        if current is None or at > current:
+            self._pending[user_id] = at
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="user-activity-buffer")
+
+    async def stop(self) -> None:
+        """Stop the background task and write out anything still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Write the buffered timestamps; returns the number of users written.
+
+        On failure the timestamps are merged back so the next flush retries
+        them.
+        """
+        async with self._flushing:
+            if not self._pending:
+                return 0
+            pending, self._pending = self._pending, {}
+            rows = list(pending.items())
+            try:
+                with log_timing("flush_user_activity", users=len(rows)):
+                    async with self.session_factory() as db:
+                        for start in range(0, len(rows), self.batch_size):
+                            await self._write(db, rows[start : start + self.batch_size])
+                        await db.commit()
+            except Exception as exc:
+                # Merge rather than record, so a failing database does not
+                # trigger an immediate early flush.
+                for user_id, at in rows:
+                    self._merge(user_id, at)
+                logger.error(
+                    "Failed to flush user activity",
+                    error=sanitize_error_message(str(exc)),
+                    error_type=type(exc).__name__,
+                    users=len(rows),
+                    operation="user_activity_buffer",
+                )
+                return 0
+            logger.debug("User activity flushed", users=len(rows))
+            return len(rows)
+
+    async def _write(self, db: AsyncSession, rows: List[Tuple[UUID, datetime]]) -> None:
+        if db.get_bind().dialect.name == "postgresql":
+            # UPDATE ... FROM (VALUES ...): one statement for the whole batch.
+            activity = values(
+                column("user_id", _user_table.c.user_id.type),
+                column("last_active_date", DateTime(timezone=True)),
+                name="activity",
+            ).data(rows)
+            last_active = cast(activity.c.last_active_date, DateTime(timezone=True))
+            await db.execute(
+                update(_user_table)
+                .where(
+                    _user_table.c.user_id == activity.c.user_id,
+                    _user_table.c.last_active_date < last_active,
+                )
+                .values(last_active_date=last_active)
+            )
+            return
+        # SQLite cannot name the columns of a VALUES derived table, so run
+        # the same update as one executemany.
+        await db.execute(
+            update(_user_table)
+            .where(
+                _user_table.c.user_id == bindparam("activity_user_id"),
+                _user_table.c.last_active_date < bindparam("activity_at"),
+            )
+            .values(last_active_date=bindparam("activity_at")),
+            [{"activity_user_id": user_id, "activity_at": at} for user_id, at in rows],
+        )
+
+
+_buffer: Optional[UserActivityBuffer] = None
+
+
+def start_user_activity_buffer(
+    session_factory: Callable[[], AsyncSession], **options: Any
+) -> UserActivityBuffer:
+    """Start the shared buffer's flush task; called from the application lifespan.
+
+    A buffer created earlier by get_user_activity_buffer is replaced by one
+    with these settings, keeping what it had recorded.
+    """
+    global _buffer
+    if _buffer is None or _buffer._task is None:
+        previous, _buffer = _buffer, UserActivityBuffer(session_factory, **options)
+        if previous is not None:
+            for user_id, at in previous._pending.items():
+                _buffer._merge(user_id, at)
+    _buffer.start()
+    return _buffer
+
+
+def get_user_activity_buffer() -> UserActivityBuffer:
+    """Return the shared buffer.
+
+    Outside the lifespan nothing flushes it, so it holds at most max_pending users.
+    """
+    global _buffer
+    if _buffer is None:
+        _buffer = UserActivityBuffer(AsyncSessionLocal)
+    return _buffer
+
+
+async def stop_user_activity_buffer() -> None:
+    """Stop the shared buffer, flushing what remains; called on shutdown."""
+    global _buffer
+    if _buffer is None:
+        return
+    buffer, _buffer = _buffer, None
+    await buffer.stop()
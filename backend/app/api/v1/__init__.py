@@ -2,6 +2,7 @@ from fastapi import APIRouter
 
 from app.api.v1 import (
     auth,
+    bootstrap,
     health,
     registration,
 )
@@ -32,6 +33,7 @@ router.include_router(
 )
 router.include_router(user.router, prefix="/users", tags=["User"])
 router.include_router(auth.router, prefix="/auth", tags=["Auth"])
+router.include_router(bootstrap.router, prefix="/bootstrap", tags=["Bootstrap"])
 router.include_router(
     user_allotment.router, prefix="/users/allotment", tags=["User Allotment"]
 )
@@ -40,7 +40,7 @@ from app.api.schemas.user.user_schema import (
     UserLogin,
 )
 from app.api.services.email_service import (
-    send_verification_email,
+    build_verification_email,
 )
 from app.api.services.user.user_unit_of_work import UserUnitOfWork
 
@@ -247,9 +247,15 @@ async def request_password_reset(
             logger.info(
                 "User email not verified, sending verification email", **log_context
             )
-            await send_verification_email(
-                user_email=user.user_email, user_id=str(user.user_id), from_reset=True
-            )
+            async with UserUnitOfWork(db) as uow:
+                uow.queue_email(
+                    build_verification_email(
+                        user_email=user.user_email,
+                        user_id=str(user.user_id),
+                        from_reset=True,
+                    ),
+                    "email_verification",
+                )
             return MessageResponse(
                 message="Your email is not verified. A verification email has been sent to your address."
             )
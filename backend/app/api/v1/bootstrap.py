@@ -0,0 +1,137 @@
+"""
+Bootstrap Endpoint
+- Returns everything the SPA loads on sign-in in one response: profile,
+  preferences, allotment, active varieties, this week's todo list and the
+  variety options.
+- The user is authenticated once and every part is read through the
+  existing units of work on the same database session.
+- Variety options come pre-serialised from the reference data cache and are
+  spliced into the response body as-is.
+"""
+
+from typing import Optional
+
+import structlog
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.core.auth_utils import get_current_user
+from app.api.core.database import get_db
+from app.api.core.limiter import limiter, user_rate_limit_key
+from app.api.core.logging import log_timing
+from app.api.middleware.error_handler import safe_operation
+from app.api.middleware.logging_middleware import request_id_ctx_var
+from app.api.models.user.user_model import User
+from app.api.schemas.bootstrap_schema import BootstrapRead, BootstrapUserRead
+from app.api.schemas.todo.weekly_todo_schema import WeeklyTodoRead
+from app.api.schemas.user.user_active_varieties_schema import UserActiveVarietyRead
+from app.api.schemas.user.user_allotment_schema import UserAllotmentRead
+from app.api.schemas.user.user_schema import UserProfileResponse
+from app.api.services.reference_data_cache import get_reference_data_cache
+from app.api.services.todo.weekly_todo import WeeklyTodoUnitOfWork
+from app.api.services.user.user_active_varieties_unit_of_work import (
+    UserActiveVarietiesUnitOfWork,
+)
+from app.api.services.user.user_preferences_unit_of_work import (
+    UserPreferencesUnitOfWork,
+)
+from app.api.services.user.user_unit_of_work import UserUnitOfWork
+
+router = APIRouter()
+logger = structlog.get_logger()
+
+
+@router.get(
+    "",
+    response_model=BootstrapRead,
+    status_code=status.HTTP_200_OK,
+    summary="Get session bootstrap data",
+    description=(
+        "Get the authenticated user's profile, preferences, allotment, active varieties "
+        "and weekly todo list together with the variety options, in one request. "
+        "Optionally specify a week number (1-52), otherwise the current week is used."
+    ),
+)
+@limiter.limit("20/minute", key_func=user_rate_limit_key)
+async def get_bootstrap(
+    request: Request,
+    week_number: Optional[int] = Query(
+        None,
+        ge=1,
+        le=52,
+        description="Week number (1-52). If not provided, uses current week.",
+    ),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> Response:
+    user_uuid = current_user.user_id
+    user_id = str(user_uuid)
+    # Read the profile before any unit of work commits or rolls back the
+    # shared session and expires the loaded user.
+    profile = UserProfileResponse(
+        user_id=user_id,
+        user_email=current_user.user_email,
+        user_first_name=current_user.user_first_name,
+        user_country_code=current_user.user_country_code,
+        is_email_verified=current_user.is_email_verified,
+    )
+    log_context = {
+        "request_id": request_id_ctx_var.get(),
+        "operation": "get_bootstrap",
+        "user_id": user_id,
+        "week_number": week_number,
+    }
+    logger.info("Fetching bootstrap data", **log_context)
+
+    async with safe_operation("fetching bootstrap data", log_context):
+        with log_timing("get_bootstrap_endpoint", request_id=log_context["request_id"]):
+            # get_current_user shares this request's session, so every read
+            # below reuses the connection it already checked out.
+            async with UserPreferencesUnitOfWork(db) as preferences_uow:
+                preferences = await preferences_uow.get_user_preferences(user_id)
+
+            try:
+                async with UserUnitOfWork(db) as user_uow:
+                    allotment = await user_uow.get_user_allotment(user_uuid)
+            except HTTPException as exc:
+                if exc.status_code != status.HTTP_404_NOT_FOUND:
+                    raise
+                # New users have no allotment yet; the SPA shows the setup form.
+                allotment = None
+
+            async with UserActiveVarietiesUnitOfWork(db) as active_uow:
+                active_varieties = await active_uow.get_active_varieties(user_id)
+
+            async with WeeklyTodoUnitOfWork(db) as todo_uow:
+                todo_data = await todo_uow.get_weekly_todo(user_id, week_number)
+
+            variety_options = await get_reference_data_cache().variety_options_json(db)
+
+            user_data = BootstrapUserRead(
+                profile=profile,
+                preferences=preferences,
+                allotment=UserAllotmentRead.model_validate(allotment)
+                if allotment is not None
+                else None,
+                active_varieties=[
+                    UserActiveVarietyRead.model_validate(av) for av in active_varieties
+                ],
+                weekly_todo=WeeklyTodoRead(**todo_data),
+            )
+
+        logger.info("Bootstrap data fetched successfully", **log_context)
+        # Both parts are JSON objects: open with the cached options and
+        # continue with the per-user fields.
+        user_json = user_data.model_dump_json().encode()
+        return Response(
+            content=b'{"variety_options":' + variety_options + b"," + user_json[1:],
+            media_type="application/json",
+        )
@@ -4,32 +4,48 @@ Variety Endpoints
 - Handles grow guide management for authenticated users.
 """
 
-from typing import List
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
 import structlog
-from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.core.auth_utils import get_current_user
 from app.api.core.database import get_db
-from app.api.core.limiter import limiter
+from app.api.core.limiter import limiter, user_rate_limit_key
 from app.api.core.logging import log_timing
+from app.api.middleware.error_codes import REQUEST_INVALID_VALUE
 from app.api.middleware.error_handler import safe_operation
-from app.api.middleware.logging_middleware import request_id_ctx_var
+from app.api.middleware.exception_handler import BusinessLogicError
+from app.api.middleware.logging_middleware import (
+    request_id_ctx_var,
+    sanitize_error_message,
+)
 from app.api.models.user.user_model import User
 from app.api.schemas.grow_guide.variety_schema import (
+    VarietyCopyRequest,
     VarietyCreate,
     VarietyListRead,
     VarietyOptionsRead,
     VarietyRead,
     VarietyUpdate,
 )
-from app.api.services.grow_guide.grow_guide_unit_of_work import GrowGuideUnitOfWork
+from app.api.services.grow_guide.grow_guide_unit_of_work import (
+    GrowGuideUnitOfWork,
+    decode_public_varieties_cursor,
+)
 
 router = APIRouter()
 logger = structlog.get_logger()
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_OFFSET = 1000
+
 
 @router.get(
     "/metadata",
@@ -41,7 +57,7 @@ logger = structlog.get_logger()
         "including lifecycles, planting conditions, frequencies, feeds, weeks, families, and days."
     ),
 )
-@limiter.limit("30/minute")
+@limiter.limit("30/minute", key_func=user_rate_limit_key)
 async def get_variety_options(
     request: Request,
     db: AsyncSession = Depends(get_db),
@@ -72,7 +88,7 @@ async def get_variety_options(
     summary="Create a new variety",
     description="Create a new grow guide variety for the authenticated user.",
 )
-@limiter.limit("10/minute")
+@limiter.limit("10/minute", key_func=user_rate_limit_key)
 async def create_variety(
     request: Request,
     variety_data: VarietyCreate,
@@ -110,16 +126,31 @@ async def create_variety(
     description=(
         "List varieties. Use the 'visibility' query parameter to choose between"
         " a user's own varieties (visibility=user, default) or public varieties"
-        " (visibility=public)."
+        " (visibility=public). Public varieties can be paged by passing 'limit'"
+        " and then each response's X-Next-Cursor header as 'cursor', or"
+        " streamed with stream=true, from the start or from 'cursor'."
     ),
 )
-@limiter.limit("30/minute")
+@limiter.limit("30/minute", key_func=user_rate_limit_key)
 async def list_varieties(
     request: Request,
+    response: Response,
     visibility: str = Query("user", pattern="^(user|public)$"),
+    limit: Optional[int] = Query(
+        None,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description=f"Public page size (default {DEFAULT_PAGE_SIZE} when paging).",
+    ),
+    cursor: Optional[str] = Query(
+        None, description="The X-Next-Cursor header of the previous public page."
+    ),
+    stream: bool = Query(
+        False, description="Stream every public variety as it is fetched."
+    ),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> List[VarietyListRead]:
+) -> Union[List[VarietyListRead], Response]:
     operation = (
         "get_public_varieties" if visibility == "public" else "get_user_varieties"
     )
@@ -136,10 +167,32 @@ async def list_varieties(
     }
     logger.info("Fetching varieties", **log_context)
 
+    paged = limit is not None or cursor is not None
+    if visibility != "public" and (paged or stream):
+        raise BusinessLogicError(
+            message="Pagination and streaming are only available for public varieties",
+            error_code=REQUEST_INVALID_VALUE,
+        )
+    if stream:
+        # Decode before streaming, while a bad cursor can still be a 400.
+        after = decode_public_varieties_cursor(cursor) if cursor else None
+        return StreamingResponse(
+            _stream_public_varieties(
+                db, limit or DEFAULT_PAGE_SIZE, after, log_context
+            ),
+            media_type="application/json",
+        )
+
     async with safe_operation("fetching varieties", log_context):
         with log_timing(timing_key, request_id=log_context["request_id"]):
             async with GrowGuideUnitOfWork(db) as uow:
-                if visibility == "public":
+                if paged:
+                    varieties, next_cursor = await uow.get_public_varieties_page(
+                        limit or DEFAULT_PAGE_SIZE, cursor
+                    )
+                    if next_cursor:
+                        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+                elif visibility == "public":
                     varieties = await uow.get_public_varieties()
                 else:
                     varieties = await uow.get_user_varieties(current_user.user_id)
@@ -152,6 +205,88 @@ async def list_varieties(
             return [VarietyListRead.model_validate(v) for v in varieties]
 
 
+async def _stream_public_varieties(
+    db: AsyncSession,
+    batch_size: int,
+    after: Optional[Tuple[str, UUID]],
+    log_context: Dict[str, Any],
+) -> AsyncIterator[bytes]:
+    """Serialise public varieties into a JSON array one keyset batch at a time.
+
+    Starts after the ``after`` sort key when the client resumes from a cursor.
+    """
+    count = 0
+    try:
+        with log_timing(
+            "stream_public_varieties_endpoint", request_id=log_context["request_id"]
+        ):
+            async with GrowGuideUnitOfWork(db) as uow:
+                yield b"["
+                async for batch in uow.iter_public_variety_batches(batch_size, after):
+                    rows = b",".join(
+                        VarietyListRead.model_validate(v).model_dump_json().encode()
+                        for v in batch
+                    )
+                    yield (b"," + rows) if count else rows
+                    count += len(batch)
+                yield b"]"
+    except Exception as e:
+        # Headers are already sent; the client sees a truncated array.
+        logger.error(
+            "Error while streaming public varieties",
+            error=sanitize_error_message(str(e)),
+            error_type=type(e).__name__,
+            streamed=count,
+            **log_context,
+        )
+        raise
+    logger.info("Varieties streamed successfully", count=count, **log_context)
+
+
+@router.get(
+    "/search",
+    response_model=List[VarietyListRead],
+    status_code=status.HTTP_200_OK,
+    summary="Search public varieties",
+    description=(
+        "Search public varieties by name, best match first: exact name, name"
+        " prefix, word prefix, substring, then similar spellings. Optionally"
+        " filter by family and lifecycle, and page with limit and offset."
+    ),
+)
+@limiter.limit("60/minute", key_func=user_rate_limit_key)
+async def search_varieties(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=100, description="Search text."),
+    family_id: Optional[UUID] = Query(None, description="Only this family."),
+    lifecycle_id: Optional[UUID] = Query(None, description="Only this lifecycle."),
+    limit: int = Query(DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0, le=MAX_SEARCH_OFFSET),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> List[VarietyListRead]:
+    log_context = {
+        "request_id": request_id_ctx_var.get(),
+        "operation": "search_varieties",
+        "user_id": str(current_user.user_id),
+        "limit": limit,
+        "offset": offset,
+    }
+    logger.info("Searching varieties", **log_context)
+
+    async with safe_operation("searching varieties", log_context):
+        with log_timing(
+            "search_varieties_endpoint", request_id=log_context["request_id"]
+        ):
+            async with GrowGuideUnitOfWork(db) as uow:
+                varieties = await uow.search_public_varieties(
+                    q, family_id, lifecycle_id, limit, offset
+                )
+
+            logger.info("Variety search completed", count=len(varieties), **log_context)
+            return [VarietyListRead.model_validate(v) for v in varieties]
+
+
 @router.get(
     "/{variety_id}",
     response_model=VarietyRead,
@@ -159,7 +294,7 @@ async def list_varieties(
     summary="Get variety by ID",
     description="Get a specific variety by ID. Must be owned by user or be public.",
 )
-@limiter.limit("60/minute")
+@limiter.limit("60/minute", key_func=user_rate_limit_key)
 async def get_variety(
     request: Request,
     variety_id: UUID,
@@ -190,7 +325,7 @@ async def get_variety(
     summary="Update variety",
     description="Update an existing variety. Only the owner can update.",
 )
-@limiter.limit("10/minute")
+@limiter.limit("10/minute", key_func=user_rate_limit_key)
 async def update_variety(
     request: Request,
     variety_id: UUID,
@@ -229,7 +364,7 @@ async def update_variety(
     summary="Delete variety",
     description="Delete a variety. Only the owner can delete.",
 )
-@limiter.limit("10/minute")
+@limiter.limit("10/minute", key_func=user_rate_limit_key)
 async def delete_variety(
     request: Request,
     variety_id: UUID,
@@ -261,7 +396,7 @@ async def delete_variety(
     summary="Copy public variety",
     description=("Copy a public variety to your account."),
 )
-@limiter.limit("10/minute")
+@limiter.limit("10/minute", key_func=user_rate_limit_key)
 async def copy_variety(
     request: Request,
     variety_id: UUID,
@@ -289,3 +424,44 @@ async def copy_variety(
                     created.variety_id, current_user.user_id
                 )
             return VarietyRead.model_validate(complete)
+
+
+@router.post(
+    "/copy",
+    response_model=List[VarietyListRead],
+    status_code=status.HTTP_201_CREATED,
+    summary="Copy public varieties",
+    description=(
+        "Copy several public varieties to your account in one transaction."
+        " Names that clash get the same '(copy N)' suffixes as single copies;"
+        " if any ID is not a public variety nothing is copied."
+    ),
+)
+@limiter.limit("5/minute", key_func=user_rate_limit_key)
+async def copy_varieties(
+    request: Request,
+    copy_request: VarietyCopyRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> List[VarietyListRead]:
+    log_context = {
+        "request_id": request_id_ctx_var.get(),
+        "operation": "copy_public_varieties",
+        "user_id": str(current_user.user_id),
+        "count": len(copy_request.variety_ids),
+    }
+    logger.info("Copying public varieties", **log_context)
+
+    async with safe_operation("copying public varieties", log_context):
+        with log_timing(
+            "copy_varieties_endpoint", request_id=log_context["request_id"]
+        ):
+            async with GrowGuideUnitOfWork(db) as uow:
+                copies = await uow.copy_public_varieties_to_user(
+                    copy_request.variety_ids, current_user.user_id
+                )
+
+            logger.info(
+                "Varieties copied successfully", copied=len(copies), **log_context
+            )
+            return [VarietyListRead.model_validate(copy) for copy in copies]
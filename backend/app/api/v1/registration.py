@@ -38,8 +38,8 @@ from app.api.schemas.user.user_schema import (
     UserCreate,
 )
 from app.api.services.email_service import (
-    send_password_reset_email,
-    send_verification_email,
+    build_password_reset_email,
+    build_verification_email,
 )
 from app.api.services.grow_guide.grow_guide_unit_of_work import GrowGuideUnitOfWork
 from app.api.services.user.user_unit_of_work import UserUnitOfWork
@@ -101,12 +101,24 @@ async def create_user(
             (d for d in days if d.day_number == 7), days[0] if days else None
         )
 
-        # Create user and feed-day preferences atomically in a single UoW commit.
+        # Create user, feed-day preferences and the queued verification email
+        # atomically in a single UoW commit.
         with log_timing("create_user_account", request_id=log_context["request_id"]):
             async with UserUnitOfWork(db) as uow:
                 new_user = await uow.create_user_with_feed_days(
                     user, feeds, default_day
                 )
+                if not new_user or not new_user.user_id:
+                    raise BusinessLogicError(
+                        message="Failed to create user",
+                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    )
+                uow.queue_email(
+                    build_verification_email(
+                        user_email=user.user_email, user_id=str(new_user.user_id)
+                    ),
+                    "email_verification",
+                )
 
     except BaseApplicationError:
         raise
@@ -125,32 +137,8 @@ async def create_user(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         )
 
-    if not new_user or not new_user.user_id:
-        raise BusinessLogicError(
-            message="Failed to create user",
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
-
     log_context["user_id"] = str(new_user.user_id)
 
-    # Send verification email (non-blocking)
-    try:
-        with log_timing(
-            "send_verification_email", request_id=log_context["request_id"]
-        ):
-            await send_verification_email(
-                user_email=user.user_email, user_id=str(new_user.user_id)
-            )
-    except Exception as email_error:
-        # Log but don't fail registration for email issues
-        sanitized_error = sanitize_error_message(str(email_error))
-        logger.error(
-            "Failed to send verification email during registration",
-            error=sanitized_error,
-            error_type=type(email_error).__name__,
-            **log_context,
-        )
-
     # Generate tokens
     with log_timing("generate_tokens", request_id=log_context["request_id"]):
         access_token = create_token(user_id=str(new_user.user_id), token_type="access")
@@ -230,6 +218,16 @@ async def verify_email_token(
 
     async with UserUnitOfWork(db) as uow:
         user = await uow.verify_email(user_id)
+        if from_reset:
+            # When verifying email from password reset flow, automatically queue password reset email
+            reset_token = create_token(user_id=user_id, token_type="reset")
+            reset_url = f"{settings.FRONTEND_URL}/reset-password?token={reset_token}"
+            uow.queue_email(
+                build_password_reset_email(
+                    user_email=user.user_email, reset_url=reset_url
+                ),
+                "password_reset",
+            )
     logger.info(
         "Email verification processed",
         is_verified=user.is_email_verified,
@@ -237,16 +235,6 @@ async def verify_email_token(
     )
 
     if from_reset:
-        # When verifying email from password reset flow, automatically send password reset email
-        with log_timing(
-            "send_password_reset_email", request_id=log_context["request_id"]
-        ):
-            reset_token = create_token(user_id=user_id, token_type="reset")
-            reset_url = f"{settings.FRONTEND_URL}/reset-password?token={reset_token}"
-            await send_password_reset_email(
-                user_email=user.user_email, reset_url=reset_url
-            )
-
         return MessageResponse(
             message="Email verified successfully. You can now reset your password."
         )
@@ -11,7 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.core.auth_utils import get_current_user
 from app.api.core.database import get_db
-from app.api.core.limiter import limiter
+from app.api.core.limiter import limiter, user_rate_limit_key
 from app.api.core.logging import log_timing
 from app.api.middleware.error_handler import safe_operation
 from app.api.middleware.logging_middleware import request_id_ctx_var
@@ -33,7 +33,7 @@ logger = structlog.get_logger()
         "Optionally specify a week number (1-52), otherwise returns tasks for the current week."
     ),
 )
-@limiter.limit("52/minute")
+@limiter.limit("52/minute", key_func=user_rate_limit_key)
 async def get_weekly_todo(
     request: Request,
     week_number: Optional[int] = Query(
@@ -11,11 +11,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.core.auth_utils import get_current_user
 from app.api.core.database import get_db
-from app.api.core.limiter import limiter
+from app.api.core.limiter import limiter, user_rate_limit_key
 from app.api.core.logging import log_timing
 from app.api.middleware.error_handler import safe_operation
 from app.api.middleware.logging_middleware import request_id_ctx_var
 from app.api.schemas.user.user_active_varieties_schema import (
+    UserActiveVarietyBulkUpdate,
     UserActiveVarietyCreate,
     UserActiveVarietyListRead,
     UserActiveVarietyRead,
@@ -35,7 +36,7 @@ logger = structlog.get_logger()
     summary="List active varieties",
     description="Return the varieties the authenticated user has marked as active.",
 )
-@limiter.limit("20/minute")
+@limiter.limit("20/minute", key_func=user_rate_limit_key)
 async def list_active_varieties(
     request: Request,
     db: AsyncSession = Depends(get_db),
@@ -74,7 +75,7 @@ async def list_active_varieties(
     summary="Activate a variety",
     description="Mark a variety as active for the authenticated user.",
 )
-@limiter.limit("15/minute")
+@limiter.limit("15/minute", key_func=user_rate_limit_key)
 async def activate_variety(
     payload: UserActiveVarietyCreate,
     request: Request,
@@ -105,13 +106,58 @@ async def activate_variety(
         return UserActiveVarietyRead.model_validate(active_variety)
 
 
+@router.post(
+    "/bulk",
+    response_model=UserActiveVarietyListRead,
+    status_code=status.HTTP_200_OK,
+    summary="Update several active varieties",
+    description=(
+        "Activate and deactivate several of the authenticated user's varieties "
+        "in one request and return the resulting active list."
+    ),
+)
+@limiter.limit("15/minute", key_func=user_rate_limit_key)
+async def update_active_varieties(
+    payload: UserActiveVarietyBulkUpdate,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: Any = Depends(get_current_user),
+) -> UserActiveVarietyListRead:
+    log_context = {
+        "user_id": str(current_user.user_id),
+        "activate_count": len(payload.activate),
+        "deactivate_count": len(payload.deactivate),
+        "request_id": request_id_ctx_var.get(),
+        "operation": "update_active_varieties",
+    }
+    logger.info("Updating user active varieties", **log_context)
+
+    async with safe_operation("updating user active varieties", log_context):
+        with log_timing(
+            "update_active_varieties_endpoint",
+            request_id=log_context["request_id"],
+            user_id=log_context["user_id"],
+        ):
+            async with UserActiveVarietiesUnitOfWork(db) as uow:
+                active_varieties = await uow.update_active_varieties(
+                    str(current_user.user_id), payload.activate, payload.deactivate
+                )
+
+        logger.info("User active varieties updated", **log_context)
+        return UserActiveVarietyListRead(
+            active_varieties=[
+                UserActiveVarietyRead.model_validate(av) for av in active_varieties
+            ]
+        )
+
+
 @router.delete(
     "/{variety_id}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Deactivate a variety",
     description="Remove a variety from the authenticated user's active list.",
 )
-@limiter.limit("15/minute")
+@limiter.limit("15/minute", key_func=user_rate_limit_key)
 async def deactivate_variety(
     variety_id: str,
     request: Request,
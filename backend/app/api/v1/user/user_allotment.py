@@ -11,7 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.core.auth_utils import get_current_user
 from app.api.core.database import get_db
-from app.api.core.limiter import limiter
+from app.api.core.limiter import limiter, user_rate_limit_key
 from app.api.middleware.logging_middleware import request_id_ctx_var
 from app.api.schemas.user.user_allotment_schema import (
     UserAllotmentCreate,
@@ -31,7 +31,7 @@ logger = structlog.get_logger()
     summary="Create user allotment",
     description="Create an allotment for the authenticated user.",
 )
-@limiter.limit("3/minute")
+@limiter.limit("3/minute", key_func=user_rate_limit_key)
 async def create_user_allotment(
     request: Request,
     allotment: UserAllotmentCreate,
@@ -57,7 +57,7 @@ async def create_user_allotment(
     summary="Get user allotment",
     description="Get the allotment for the authenticated user.",
 )
-@limiter.limit("10/minute")
+@limiter.limit("10/minute", key_func=user_rate_limit_key)
 async def get_user_allotment(
     request: Request,
     db: AsyncSession = Depends(get_db),
@@ -88,7 +88,7 @@ async def get_user_allotment(
     summary="Update user allotment",
     description="Update the allotment for the authenticated user.",
 )
-@limiter.limit("3/minute")
+@limiter.limit("3/minute", key_func=user_rate_limit_key)
 async def update_user_allotment(
     request: Request,
     allotment: UserAllotmentUpdate,
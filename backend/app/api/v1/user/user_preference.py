@@ -11,7 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.core.auth_utils import get_current_user
 from app.api.core.database import get_db
-from app.api.core.limiter import limiter
+from app.api.core.limiter import limiter, user_rate_limit_key
 from app.api.core.logging import log_timing
 from app.api.middleware.error_handler import safe_operation
 from app.api.middleware.logging_middleware import request_id_ctx_var
@@ -35,7 +35,7 @@ logger = structlog.get_logger()
     summary="Get user preferences",
     description="Get all user preferences including feed days and available options.",
 )
-@limiter.limit("10/minute")
+@limiter.limit("10/minute", key_func=user_rate_limit_key)
 async def get_user_preferences(
     request: Request,
     db: AsyncSession = Depends(get_db),
@@ -66,7 +66,7 @@ async def get_user_preferences(
     summary="Update user feed preference",
     description="Update the day preference for a specific feed type.",
 )
-@limiter.limit("10/minute")
+@limiter.limit("10/minute", key_func=user_rate_limit_key)
 async def update_user_feed_preference(
     feed_id: str,
     preference_update: UserFeedDayUpdate,
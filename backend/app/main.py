@@ -3,36 +3,70 @@ Application Entrypoint
 """
 
 import atexit
+import hmac
 import logging
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Dict
+from typing import AsyncGenerator, Dict, Optional
 
 import structlog
-from fastapi import Depends, FastAPI, HTTPException, Request, status
+from fastapi import Depends, FastAPI, Header, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from svix.webhooks import Webhook, WebhookVerificationError
 
 from app.api.core.config import settings
+from app.api.core.database import AsyncSessionLocal, get_db
+from app.api.core.http_client import close_http_client, start_http_client
 from app.api.core.limiter import limiter
-from app.api.core.logging import configure_logging
+from app.api.core.logging import configure_logging, stop_file_logging
+from app.api.core.metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    configure_metrics,
+    flush_metrics,
+    render_prometheus_text,
+)
+from app.api.core.tracing import configure_tracing, flush_tracing
 from app.api.middleware.exception_handler import register_exception_handlers
 from app.api.middleware.logging_middleware import (
     AsyncLoggingMiddleware,
     request_id_ctx_var,
     sanitize_error_message,
 )
-from app.api.middleware.security_headers_middleware import (
-    SecurityHeadersMiddleware,
-)
 from app.api.schemas.client_error_schema import ClientErrorLog
 from app.api.schemas.inbound_email_schema import InboundEmailPayload
-from app.api.services.email_service import (
-    _fetch_inbound_email_content,
-    forward_inbound_email,
+from app.api.services.email_outbox import (
+    start_email_outbox_worker,
+    stop_email_outbox_worker,
+)
+from app.api.services.health_sampler import (
+    start_health_sampler,
+    stop_health_sampler,
+)
+from app.api.services.inbound_email_queue import (
+    enqueue_inbound_email,
+    notify_inbound_email_queue,
+    start_inbound_email_queue,
+    stop_inbound_email_queue,
+)
+from app.api.services.user_activity_buffer import (
+    start_user_activity_buffer,
+    stop_user_activity_buffer,
 )
 from app.api.v1 import router as api_router
 
 configure_logging()
+if settings.METRICS_ENABLED:
+    configure_metrics(
+        export_file=settings.METRICS_EXPORT_FILE,
+        export_interval_seconds=settings.METRICS_EXPORT_INTERVAL_SECONDS,
+    )
+if settings.TRACING_ENABLED:
+    configure_tracing(
+        service_name=settings.APP_NAME,
+        sample_ratio=settings.TRACING_SAMPLE_RATIO,
+        export_file=settings.TRACING_EXPORT_FILE,
+    )
 
 logger = structlog.get_logger()
 
@@ -47,6 +81,41 @@ logger.info(
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     try:
+        start_http_client(
+            timeout_seconds=settings.HTTP_CLIENT_TIMEOUT_SECONDS,
+            connect_timeout_seconds=settings.HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS,
+            max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry_seconds=settings.HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS,
+        )
+        if settings.EMAIL_OUTBOX_ENABLED:
+            start_email_outbox_worker(
+                AsyncSessionLocal,
+                batch_size=settings.EMAIL_OUTBOX_BATCH_SIZE,
+                poll_interval_seconds=settings.EMAIL_OUTBOX_POLL_INTERVAL_SECONDS,
+                max_attempts=settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+                retry_base_seconds=settings.EMAIL_OUTBOX_RETRY_BASE_SECONDS,
+                lease_seconds=settings.EMAIL_OUTBOX_LEASE_SECONDS,
+                failed_retention_days=settings.EMAIL_OUTBOX_FAILED_RETENTION_DAYS,
+            )
+        start_health_sampler(
+            AsyncSessionLocal,
+            interval_seconds=settings.HEALTH_SAMPLE_INTERVAL_SECONDS,
+        )
+        start_user_activity_buffer(
+            AsyncSessionLocal,
+            flush_interval_seconds=settings.USER_ACTIVITY_FLUSH_INTERVAL_SECONDS,
+            max_pending=settings.USER_ACTIVITY_MAX_PENDING,
+        )
+        start_inbound_email_queue(
+            AsyncSessionLocal,
+            workers=settings.INBOUND_EMAIL_WORKERS,
+            poll_interval_seconds=settings.INBOUND_EMAIL_POLL_INTERVAL_SECONDS,
+            max_attempts=settings.INBOUND_EMAIL_MAX_ATTEMPTS,
+            retry_base_seconds=settings.INBOUND_EMAIL_RETRY_BASE_SECONDS,
+            lease_seconds=settings.INBOUND_EMAIL_LEASE_SECONDS,
+            dedupe_ttl_seconds=settings.INBOUND_EMAIL_DEDUPE_TTL_SECONDS,
+        )
         logger.info(
             "Application startup complete",
             app_name=settings.APP_NAME,
@@ -69,6 +138,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             app_name=settings.APP_NAME,
             version=settings.APP_VERSION,
         )
+        await stop_health_sampler()
+        await stop_inbound_email_queue()
+        await stop_user_activity_buffer()
+        await stop_email_outbox_worker()
+        await close_http_client()
+        flush_tracing()
+        flush_metrics()
         flush_logs()
 
 
@@ -87,10 +163,15 @@ logger.debug("Registering exception handlers")
 register_exception_handlers(app)
 
 
-# Logging Middleware
+# Logging Middleware (also sets request ids and security headers)
 logger.debug("Adding logging middleware")
-app.add_middleware(SecurityHeadersMiddleware)
-app.add_middleware(AsyncLoggingMiddleware)
+app.add_middleware(
+    AsyncLoggingMiddleware,
+    sample_rate=settings.ACCESS_LOG_SAMPLE_RATE,
+    slow_request_seconds=settings.ACCESS_LOG_SLOW_REQUEST_SECONDS,
+    max_field_length=settings.ACCESS_LOG_MAX_FIELD_LENGTH,
+    header_allowlist=settings.ACCESS_LOG_HEADER_ALLOWLIST,
+)
 
 
 # CORS Middleware
@@ -101,6 +182,7 @@ app.add_middleware(
     allow_credentials=settings.CORS_ALLOW_CREDENTIALS,
     allow_methods=settings.CORS_ALLOW_METHODS,
     allow_headers=settings.CORS_ALLOW_HEADERS,
+    expose_headers=["X-Next-Cursor"],
 )
 
 
@@ -142,6 +224,33 @@ async def root() -> Dict[str, str]:
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+@limiter.limit("60/minute")
+async def metrics(
+    request: Request, authorization: Optional[str] = Header(None)
+) -> Response:
+    """Expose collected latency histograms in the Prometheus text format.
+
+    Served only when METRICS_BEARER_TOKEN is configured, and only to callers
+    presenting it as a bearer token.
+    """
+    token = settings.METRICS_BEARER_TOKEN
+    if not settings.METRICS_ENABLED or not token or not token.get_secret_value():
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    scheme, _, presented = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(
+        presented.encode(), token.get_secret_value().encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return Response(
+        content=render_prometheus_text(), media_type=PROMETHEUS_CONTENT_TYPE
+    )
+
+
 @app.post("/api/v1/log-client-error", tags=["Utility"])
 @limiter.limit("20/minute")
 async def handle_log_client_error(
@@ -207,26 +316,31 @@ async def verify_resend_signature(request: Request) -> InboundEmailPayload:
 @app.post(
     "/webhooks/inbound-email",
     tags=["Webhooks"],
-    status_code=status.HTTP_200_OK,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Resend inbound email webhook",
-    description="Receives inbound emails from Resend and forwards them to CONTACT_TO",
+    description="Receives inbound emails from Resend and queues them for forwarding to CONTACT_TO",
 )
 @limiter.limit("30/minute")
 async def handle_inbound_email(
     request: Request,
     payload: InboundEmailPayload = Depends(verify_resend_signature),
+    db: AsyncSession = Depends(get_db),
 ) -> Dict[str, str]:
     """
     Webhook endpoint for Resend inbound emails.
 
-    Receives emails sent to contact@mail.allotment.wiki and forwards them
-    to the configured CONTACT_TO inbox.
+    Stores emails sent to contact@mail.allotment.wiki for forwarding to the
+    configured CONTACT_TO inbox and acknowledges once they are committed;
+    redeliveries of an already accepted ``svix-id`` are dropped. If the email
+    cannot be stored the request fails, so Resend delivers it again.
     """
     data = payload.data
+    svix_id = request.headers.get("svix-id") or None
     log_context = {
         "request_id": request_id_ctx_var.get(),
         "operation": "inbound_email_webhook",
         "event_type": payload.type,
+        "svix_id": svix_id,
         "from": data.from_,
         "to": ",".join([str(addr) for addr in data.to])
         if isinstance(data.to, list)
@@ -241,47 +355,15 @@ async def handle_inbound_email(
         )
         return {"message": "Event ignored"}
 
-    logger.info("Inbound email received", **log_context)
-
-    try:
-        if not data.text and not data.html and data.email_id:
-            logger.debug(
-                "Body missing from webhook; fetching via API",
-                email_id=data.email_id,
-                **log_context,
-            )
-            text_body, html_body = await _fetch_inbound_email_content(data.email_id)
-            body = text_body or html_body or ""
-        else:
-            body = data.text or data.html or ""
+    accepted = await enqueue_inbound_email(db, svix_id, payload)
+    if not accepted:
+        logger.info("Duplicate inbound email delivery ignored", **log_context)
+        return {"message": "Duplicate delivery ignored"}
+    await db.commit()
+    notify_inbound_email_queue()
 
-        logger.debug(
-            "Webhook body content",
-            has_text=bool(data.text),
-            has_html=bool(data.html),
-            body_length=len(body),
-            text_length=len(data.text) if data.text else 0,
-            html_length=len(data.html) if data.html else 0,
-            **log_context,
-        )
-        subject = data.subject or "(No subject)"
-        await forward_inbound_email(
-            from_email=str(data.from_),
-            subject=subject,
-            body=body,
-            reply_to=data.reply_to,
-            email_id=data.email_id,
-        )
-        logger.info("Inbound email processed successfully", **log_context)
-        return {"message": "Email forwarded"}
-    except Exception as exc:
-        logger.error(
-            "Failed to process inbound email",
-            error=sanitize_error_message(str(exc)),
-            error_type=type(exc).__name__,
-            **log_context,
-        )
-        raise
+    logger.info("Inbound email received", **log_context)
+    return {"message": "Email queued"}
 
 
 def flush_logs() -> None:
@@ -301,6 +383,9 @@ def flush_logs() -> None:
             logger.info("Flushing logs before shutdown")
             structlog.get_logger().info("Application shutting down")
 
+        # Drain queued file log records before the remaining handlers close
+        stop_file_logging()
+
         for handler in logger.handlers:
             try:
                 if hasattr(handler, "flush"):
@@ -0,0 +1,5 @@
+"""
+Benchmarks
+- Standalone scripts comparing the cost of hot paths before and after a change.
+- Run from the backend directory, e.g. ``python -m benchmarks.bench_file_logging``.
+"""
@@ -0,0 +1,166 @@
+"""
+Access Logging Benchmark
+- Calls AsyncLoggingMiddleware directly with browser-like request headers and
+  renders its log events to JSON, counting the bytes written.
+- Compares full logging (every header, no caps, every request) with the
+  header allow-list + field caps and with sampling of successful requests.
+- Reports log bytes per request and CPU time per request.
+
+Usage: python -m benchmarks.bench_access_logging [--requests N]
+       [--error-ratio R] [--sample-rate R]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, List, MutableMapping, Tuple
+
+import structlog
+
+from app.api.middleware.logging_middleware import AsyncLoggingMiddleware
+
+
+class CountingSink:
+    """Write target that only counts the rendered bytes."""
+
+    def __init__(self) -> None:
+        self.bytes_written = 0
+        self.lines = 0
+
+    def write(self, data: str) -> None:
+        self.bytes_written += len(data)
+        self.lines += data.count("\n")
+
+    def flush(self) -> None:
+        pass
+
+
+HEADERS: List[Tuple[bytes, bytes]] = [
+    (b"host", b"api.example.com"),
+    (b"user-agent", b"Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 Chrome/126"),
+    (b"accept", b"application/json, text/plain, */*"),
+    (b"accept-language", b"en-GB,en;q=0.9"),
+    (b"accept-encoding", b"gzip, deflate, br, zstd"),
+    (b"authorization", b"Bearer " + b"x" * 600),
+    (b"cookie", b"refresh_token=" + b"y" * 400),
+    (b"origin", b"https://app.example.com"),
+    (b"referer", b"https://app.example.com/grow-guides/" + b"z" * 36),
+    (b"sec-ch-ua", b'"Chromium";v="126", "Not.A/Brand";v="24"'),
+    (b"sec-fetch-mode", b"cors"),
+    (b"sec-fetch-site", b"same-site"),
+]
+
+RESPONSE_HEADERS: List[Tuple[bytes, bytes]] = [
+    (b"content-type", b"application/json"),
+    (b"content-length", b"2048"),
+    (b"x-ratelimit-limit", b"100"),
+    (b"x-ratelimit-remaining", b"87"),
+    (b"vary", b"Origin"),
+]
+
+
+def _scope(request_no: int) -> Dict[str, Any]:
+    return {
+        "type": "http",
+        "method": "GET",
+        "scheme": "https",
+        "server": ("api.example.com", 443),
+        "path": f"/api/v1/grow-guides/{request_no}",
+        "query_string": b"page=1&search=tomato",
+        "root_path": "",
+        "headers": HEADERS,
+        "client": ("203.0.113.7", 52100),
+    }
+
+
+def _make_app(error_every: int) -> Any:
+    async def app(scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        request_no = int(scope["path"].rsplit("/", 1)[1])
+        status = 500 if error_every and request_no % error_every == 0 else 200
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": RESPONSE_HEADERS,
+            }
+        )
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    return app
+
+
+async def _noop_receive() -> Dict[str, Any]:
+    return {"type": "http.request", "body": b""}
+
+
+async def _noop_send(message: MutableMapping[str, Any]) -> None:
+    return None
+
+
+async def _drive(middleware: AsyncLoggingMiddleware, requests: int) -> None:
+    for request_no in range(requests):
+        await middleware(_scope(request_no), _noop_receive, _noop_send)
+
+
+def _measure(
+    name: str, requests: int, error_every: int, **options: Any
+) -> Tuple[str, float, float, float]:
+    sink = CountingSink()
+    structlog.configure(
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.JSONRenderer(),
+        ],
+        logger_factory=structlog.WriteLoggerFactory(file=sink),  # type: ignore[arg-type]
+        cache_logger_on_first_use=False,
+    )
+    middleware = AsyncLoggingMiddleware(_make_app(error_every), **options)
+    start = time.process_time()
+    asyncio.run(_drive(middleware, requests))
+    cpu = time.process_time() - start
+    return (
+        name,
+        sink.bytes_written / requests,
+        sink.lines / requests,
+        cpu / requests * 1_000_000,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--error-ratio", type=float, default=0.02)
+    parser.add_argument("--sample-rate", type=float, default=0.1)
+    args = parser.parse_args()
+    error_every = round(1 / args.error_ratio) if args.error_ratio else 0
+
+    results = [
+        _measure(
+            "full (previous)",
+            args.requests,
+            error_every,
+            header_allowlist=["*"],
+            max_field_length=None,
+        ),
+        _measure("allow-list + caps", args.requests, error_every),
+        _measure(
+            f"+ sample {args.sample_rate:g}",
+            args.requests,
+            error_every,
+            sample_rate=args.sample_rate,
+        ),
+    ]
+
+    print(
+        f"{args.requests} requests, {args.error_ratio:.0%} errors, "
+        f"{len(HEADERS)} request headers"
+    )
+    print(f"{'config':<20} {'bytes/req':>10} {'lines/req':>10} {'cpu us/req':>11}")
+    for name, size, lines, cpu in results:
+        print(f"{name:<20} {size:>10.0f} {lines:>10.2f} {cpu:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Email Template Benchmark
+- Renders the verification and forwarded-email bodies for a batch of
+  recipients the previous way (an f-string per send, plus textwrap.dedent
+  for forwarded mail) and through the compiled templates' render_batch.
+- Token signing is left out so the numbers reflect body rendering only.
+
+Usage: python -m benchmarks.bench_email_templates [--recipients N] [--repeat N]
+"""
+
+import argparse
+import time
+from datetime import datetime
+from textwrap import dedent
+from typing import Any, Callable, Dict, List, Tuple
+
+from app.api.services.email_templates import FORWARDED_EMAIL, VERIFICATION_EMAIL
+
+current_year = datetime.now().year
+
+
+def _legacy_verification(to: str, link: str) -> Dict[str, Any]:
+    email_body = f"""Dear Allotment Member,
+
+Thank you for creating an account. We're excited to have you join our community of gardening enthusiasts.
+
+To complete your registration and access all features, please verify your email address by clicking the link below:
+
+{link}
+
+This verification link will expire in 1 hour for security purposes. If you don't complete the verification within this timeframe, you'll need to request a new verification email.
+
+If you did not create an account with Allotment, please disregard this email or contact our support team.
+
+Best regards,
+The Allotment Team
+
+------------------------------
+This is an automated message. Please do not reply directly to this email.
+© {current_year} Allotment Service. All rights reserved."""
+    return {
+        "from": "noreply@example.com",
+        "to": to,
+        "subject": "Email Verification Required - Allotment Service",
+        "text": email_body,
+    }
+
+
+def _legacy_forward(sender: str, body: str) -> Dict[str, Any]:
+    forwarded_body = dedent(
+        f"""
+        Forwarded message from: {sender}
+        Subject: Hello
+        Received: 2026-01-01T00:00:00+00:00
+
+        --- Original Message ---
+
+        {body}
+        """
+    ).strip()
+    return {
+        "from": "contact@example.com",
+        "to": "inbox@example.com",
+        "subject": "[Fwd] Hello",
+        "text": forwarded_body,
+    }
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--recipients", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    recipients: List[Tuple[str, str]] = [
+        (f"user{i}@example.com", f"https://allotment.wiki/verify-email?token={i:032d}")
+        for i in range(args.recipients)
+    ]
+    body = "Hi,\n\nA question about my plot.\n\nThanks"
+    cases = (
+        (
+            "verification f-string",
+            lambda: [_legacy_verification(to, link) for to, link in recipients],
+        ),
+        (
+            "verification compiled",
+            lambda: VERIFICATION_EMAIL.render_batch(
+                "noreply@example.com",
+                ((to, {"verification_link": link}) for to, link in recipients),
+            ),
+        ),
+        (
+            "forward f-string+dedent",
+            lambda: [_legacy_forward(to, body) for to, _ in recipients],
+        ),
+        (
+            "forward compiled",
+            lambda: FORWARDED_EMAIL.render_batch(
+                "contact@example.com",
+                (
+                    (
+                        "inbox@example.com",
+                        {
+                            "from_email": to,
+                            "subject": "Hello",
+                            "received": "2026-01-01T00:00:00+00:00",
+                            "body": body,
+                        },
+                    )
+                    for to, _ in recipients
+                ),
+            ),
+        ),
+    )
+
+    print(f"{args.recipients} recipients, best of {args.repeat}")
+    print(f"{'render':<26} {'total ms':>9} {'us/email':>9}")
+    for name, fn in cases:
+        elapsed = _time(fn, args.repeat)
+        print(
+            f"{name:<26} {elapsed * 1e3:>9.1f} {elapsed / args.recipients * 1e6:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
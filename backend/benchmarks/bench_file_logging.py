@@ -0,0 +1,164 @@
+"""
+File Logging Benchmark
+- Simulates log-heavy requests on the event loop and measures their throughput.
+- Compares the previous per-event ``open()`` + lock append and the synchronous
+  RotatingFileHandler against the queued background file writer.
+- ``--io-latency`` adds a delay to every flush to model slow or network-backed
+  volumes, where blocking writes on the request path hurt most.
+
+Usage: python -m benchmarks.bench_file_logging [--requests N] [--lines N]
+       [--io-latency SECONDS]
+"""
+
+import argparse
+import asyncio
+import logging
+import tempfile
+import threading
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import IO, Any, Callable, List, Tuple
+
+from app.api.core.logging import BufferedRotatingFileHandler, QueuedFileLogWriter
+
+MAX_BYTES = 1024 * 1024 * 1024
+
+# Simulated per-flush storage latency in seconds, set from --io-latency
+io_latency = 0.0
+
+
+class SlowStream:
+    """File wrapper that sleeps on every flush to model slow storage."""
+
+    def __init__(self, stream: IO[str]) -> None:
+        self.stream = stream
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.stream, name)
+
+    def flush(self) -> None:
+        if io_latency:
+            time.sleep(io_latency)
+        self.stream.flush()
+
+    def close(self) -> None:
+        self.flush()
+        self.stream.close()
+
+
+class LegacyAppendHandler(logging.Handler):
+    """The previous approach: take a global lock and open the file per event."""
+
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self.path = path
+        self.file_lock = threading.Lock()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        entry = f"{self.format(record)}\n"
+        with self.file_lock:
+            log_file = SlowStream(open(self.path, "a"))
+            log_file.write(entry)
+            log_file.close()
+
+
+class SlowRotatingFileHandler(RotatingFileHandler):
+    def _open(self) -> Any:
+        return SlowStream(super()._open())
+
+
+class SlowBufferedRotatingFileHandler(BufferedRotatingFileHandler):
+    def _open(self) -> Any:
+        return SlowStream(super()._open())
+
+
+async def _request(logger: logging.Logger, request_no: int, lines: int) -> None:
+    for line in range(lines):
+        logger.info(
+            '{"event": "Incoming request", "request_id": "%s", "line": %d}',
+            request_no,
+            line,
+        )
+        await asyncio.sleep(0)
+
+
+async def _run_requests(logger: logging.Logger, requests: int, lines: int) -> None:
+    await asyncio.gather(*(_request(logger, i, lines) for i in range(requests)))
+
+
+def _measure(
+    name: str,
+    make_handler: Callable[[str], Tuple[logging.Handler, Callable[[], None]]],
+    directory: Path,
+    requests: int,
+    lines: int,
+) -> Tuple[str, float, float]:
+    path = str(directory / f"{name.replace(' ', '_')}.log")
+    handler, finish = make_handler(path)
+    logger = logging.getLogger(f"bench.{name}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    try:
+        start = time.perf_counter()
+        asyncio.run(_run_requests(logger, requests, lines))
+        on_loop = time.perf_counter() - start
+        finish()
+        total = time.perf_counter() - start
+    finally:
+        logger.removeHandler(handler)
+    return name, requests / on_loop, total
+
+
+def _legacy(path: str) -> Tuple[logging.Handler, Callable[[], None]]:
+    return LegacyAppendHandler(path), lambda: None
+
+
+def _rotating(path: str) -> Tuple[logging.Handler, Callable[[], None]]:
+    handler = SlowRotatingFileHandler(path, maxBytes=MAX_BYTES, backupCount=1)
+    return handler, handler.close
+
+
+def _queued(path: str) -> Tuple[logging.Handler, Callable[[], None]]:
+    writer = QueuedFileLogWriter(
+        SlowBufferedRotatingFileHandler(path, maxBytes=MAX_BYTES, backupCount=1),
+        max_queue_size=1_000_000,
+    )
+    writer.start()
+    return writer.queue_handler, writer.stop
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--lines", type=int, default=10)
+    parser.add_argument("--io-latency", type=float, default=0.0)
+    args = parser.parse_args()
+
+    global io_latency
+    io_latency = args.io_latency
+
+    results: List[Tuple[str, float, float]] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        for name, factory in (
+            ("open per event", _legacy),
+            ("rotating handler", _rotating),
+            ("queued writer", _queued),
+        ):
+            results.append(
+                _measure(name, factory, directory, args.requests, args.lines)
+            )
+
+    print(
+        f"{args.requests} requests x {args.lines} log lines each, "
+        f"{args.io_latency * 1000:.2f}ms simulated flush latency"
+    )
+    print(f"{'strategy':<18} {'requests/s on loop':>20} {'total incl. drain':>18}")
+    for name, throughput, total in results:
+        print(f"{name:<18} {throughput:>20.0f} {total:>17.3f}s")
+
+
+if __name__ == "__main__":
+    main()
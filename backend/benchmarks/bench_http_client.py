@@ -0,0 +1,95 @@
+"""
+HTTP Client Benchmark
+- Starts a local keep-alive HTTP/1.1 server and sends sequential POSTs the
+  way _send_email_with_retry does.
+- Compares a new httpx.AsyncClient per request (previous behaviour) with the
+  shared pooled client, reporting latency per request and the connection
+  reuse ratio from the client's trace hook.
+- Plain TCP on loopback: a real Resend call also saves the TLS handshake, so
+  the gap in production is wider than shown here.
+
+Usage: python -m benchmarks.bench_http_client [--requests N]
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List, Tuple
+
+import httpx
+
+from app.api.core import http_client
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; avoid delayed-ACK stalls.
+    disable_nagle_algorithm = True
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = b'{"id": "email-id"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+PAYLOAD = {"from": "noreply@example.com", "to": "user@example.com", "text": "x" * 800}
+
+
+async def _per_request_clients(url: str, requests: int) -> None:
+    for _ in range(requests):
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            await client.post(url, json=PAYLOAD)
+
+
+async def _shared_client(url: str, requests: int) -> None:
+    async with http_client.create_http_client() as client:
+        for _ in range(requests):
+            await client.post(url, json=PAYLOAD)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/emails"
+
+    reuse: List[bool] = []
+
+    def _record(host: str, reused: bool) -> None:
+        reuse.append(reused)
+
+    http_client.record_http_client_request = _record
+
+    results: List[Tuple[str, float, float]] = []
+    for name, run in (
+        ("client per request", _per_request_clients),
+        ("shared pooled client", _shared_client),
+    ):
+        reuse.clear()
+        start = time.perf_counter()
+        asyncio.run(run(url, args.requests))
+        elapsed = time.perf_counter() - start
+        ratio = sum(reuse) / len(reuse) if reuse else 0.0
+        results.append((name, elapsed / args.requests * 1e6, ratio))
+    server.shutdown()
+
+    print(f"{args.requests} sequential POSTs to a local keep-alive server")
+    print(f"{'client':<22} {'us/request':>11} {'reused':>8}")
+    for name, micros, ratio in results:
+        print(f"{name:<22} {micros:>11.0f} {ratio:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
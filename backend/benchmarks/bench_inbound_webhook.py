@@ -0,0 +1,170 @@
+"""
+Inbound Webhook Benchmark
+- Replays a burst of Resend webhook deliveries in which most are
+  redeliveries of a few svix-ids, as happens after Resend times out.
+- Compares the old inline handler (fetch and forward before responding, no
+  deduplication) with the queue: store the delivery in a SQLite file
+  database, acknowledge once committed, drop redeliveries by svix-id and
+  forward on a worker pool. Forwarding is simulated with a fixed latency.
+- Reports acknowledgements per second, mean response latency, emails actually
+  forwarded and the time until every unique email has been forwarded.
+
+Usage: python -m benchmarks.bench_inbound_webhook [--deliveries N] [--unique N]
+       [--latency-ms MS] [--workers N]
+"""
+
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+from unittest.mock import patch
+
+import structlog
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.api.core.database import Base
+from app.api.models import InboundEmail
+from app.api.models.email.inbound_email_model import INBOUND_STATUS_PENDING
+from app.api.schemas.inbound_email_schema import InboundEmailPayload
+from app.api.services.inbound_email_queue import (
+    InboundEmailQueue,
+    enqueue_inbound_email,
+    process_inbound_email,
+)
+
+
+def _deliveries(total: int, unique: int) -> List[Tuple[str, InboundEmailPayload]]:
+    payloads = [
+        InboundEmailPayload.model_validate(
+            {
+                "type": "email.received",
+                "data": {
+                    "from": "sender@example.com",
+                    "to": ["contact@example.com"],
+                    "subject": f"Message {i}",
+                    "text": "Body",
+                },
+            }
+        )
+        for i in range(unique)
+    ]
+    return [(f"msg_{i % unique}", payloads[i % unique]) for i in range(total)]
+
+
+async def _pending(session_factory: Callable[[], AsyncSession]) -> int:
+    async with session_factory() as db:
+        return (
+            await db.scalar(
+                select(func.count()).where(
+                    InboundEmail.status == INBOUND_STATUS_PENDING
+                )
+            )
+            or 0
+        )
+
+
+async def _run(
+    mode: str,
+    deliveries: List[Tuple[str, InboundEmailPayload]],
+    latency: float,
+    workers: int,
+    database: Path,
+) -> Tuple[float, float, int, float]:
+    forwarded = 0
+
+    async def _forward(**_: Any) -> None:
+        nonlocal forwarded
+        await asyncio.sleep(latency)
+        forwarded += 1
+
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{database}", connect_args={"timeout": 30}
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    queue = InboundEmailQueue(
+        session_factory, workers=workers, poll_interval_seconds=0.01
+    )
+    latencies: List[float] = []
+
+    async def _deliver(svix_id: str, payload: InboundEmailPayload) -> None:
+        started = time.perf_counter()
+        if mode == "inline":
+            await process_inbound_email(payload)
+        else:
+            async with session_factory() as db:
+                if await enqueue_inbound_email(db, svix_id, payload):
+                    await db.commit()
+                    queue.notify()
+        latencies.append(time.perf_counter() - started)
+
+    with patch("app.api.services.inbound_email_queue.forward_inbound_email", _forward):
+        queue.start()
+        started = time.perf_counter()
+        await asyncio.gather(*(_deliver(*delivery) for delivery in deliveries))
+        acked = time.perf_counter() - started
+        while await _pending(session_factory):
+            await asyncio.sleep(0.01)
+        done = time.perf_counter() - started
+        await queue.stop()
+    await engine.dispose()
+
+    return len(deliveries) / acked, sum(latencies) / len(latencies), forwarded, done
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--deliveries", type=int, default=2000)
+    parser.add_argument("--unique", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING)
+    )
+    deliveries = _deliveries(args.deliveries, args.unique)
+    latency = args.latency_ms / 1e3
+    with tempfile.TemporaryDirectory() as tmp:
+        results = [
+            (
+                mode,
+                *asyncio.run(
+                    _run(
+                        mode,
+                        deliveries,
+                        latency,
+                        args.workers,
+                        Path(tmp) / f"{mode}.db",
+                    )
+                ),
+            )
+            for mode in ("inline", "queue")
+        ]
+
+    print(
+        f"{args.deliveries} deliveries of {args.unique} emails, "
+        f"{args.latency_ms:.0f} ms per forward, {args.workers} workers"
+    )
+    print(
+        f"{'handler':<8} {'acks/s':>12} {'mean ack ms':>12} "
+        f"{'forwarded':>10} {'all done s':>11}"
+    )
+    for mode, acks, mean_latency, forwarded, done in results:
+        print(
+            f"{mode:<8} {acks:>12.0f} {mean_latency * 1e3:>12.3f} "
+            f"{forwarded:>10} {done:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+JSON Serialization Benchmark
+- Builds the largest response payloads (WeeklyTodoRead, VarietyOptionsRead and
+  the public variety list) and times each way of turning them into JSON bytes:
+  - jsonable_encoder + stdlib JSONResponse (routes without a response model)
+  - jsonable_encoder + FastJSONResponse (orjson)
+  - Pydantic TypeAdapter.dump_json, FastAPI's path for routes with a response
+    model
+- Times structlog's JSONRenderer with the stdlib and orjson serializers on a
+  typical access-log event.
+
+Usage: python -m benchmarks.bench_json [--iterations N] [--varieties N]
+"""
+
+import argparse
+import timeit
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Tuple
+
+import structlog
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.api.core.serialization import FastJSONResponse, dumps_log_event
+from app.api.schemas.grow_guide.variety_schema import (
+    VarietyListRead,
+    VarietyOptionsRead,
+)
+from app.api.schemas.todo.weekly_todo_schema import WeeklyTodoRead
+
+NOW = datetime(2026, 5, 1, 12, 0, tzinfo=timezone.utc)
+DAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+
+def _variety_task(i: int) -> Dict[str, Any]:
+    return {
+        "variety_id": uuid.uuid4(),
+        "variety_name": f"Variety {i}",
+        "family_name": f"Family {i % 12}",
+    }
+
+
+def _weekly_todo(varieties: int) -> WeeklyTodoRead:
+    tasks = [_variety_task(i) for i in range(varieties)]
+    return WeeklyTodoRead.model_validate(
+        {
+            "week_id": uuid.uuid4(),
+            "week_number": 18,
+            "week_start_date": "28/04",
+            "week_end_date": "04/05",
+            "weekly_tasks": {
+                "sow_tasks": tasks,
+                "transplant_tasks": tasks[::2],
+                "harvest_tasks": tasks[::3],
+                "prune_tasks": tasks[::4],
+                "compost_tasks": tasks[::5],
+            },
+            "daily_tasks": {
+                day: {
+                    "day_id": uuid.uuid4(),
+                    "day_number": day,
+                    "day_name": DAY_NAMES[day - 1],
+                    "feed_tasks": [
+                        {
+                            "feed_id": uuid.uuid4(),
+                            "feed_name": f"Feed {f}",
+                            "varieties": tasks[f::4],
+                        }
+                        for f in range(3)
+                    ],
+                    "water_tasks": tasks,
+                }
+                for day in range(1, 8)
+            },
+        }
+    )
+
+
+def _named(key: str, count: int, **extra: Any) -> List[Dict[str, Any]]:
+    return [
+        {f"{key}_id": uuid.uuid4(), f"{key}_name": f"{key} {i}", **extra}
+        for i in range(count)
+    ]
+
+
+def _variety_options() -> VarietyOptionsRead:
+    return VarietyOptionsRead.model_validate(
+        {
+            "lifecycles": _named("lifecycle", 3, productivity_years=1),
+            "planting_conditions": [
+                {"planting_condition_id": uuid.uuid4(), "planting_condition": "Sun"}
+                for _ in range(4)
+            ],
+            "frequencies": _named("frequency", 8, frequency_days_per_year=52),
+            "feed_frequencies": _named("frequency", 4, frequency_days_per_year=26),
+            "feeds": _named("feed", 10),
+            "weeks": [
+                {
+                    "week_id": uuid.uuid4(),
+                    "week_number": n,
+                    "week_start_date": "01/01",
+                    "week_end_date": "07/01",
+                }
+                for n in range(1, 53)
+            ],
+            "families": _named("family", 30),
+            "days": [
+                {"day_id": uuid.uuid4(), "day_number": n, "day_name": name}
+                for n, name in enumerate(DAY_NAMES, start=1)
+            ],
+        }
+    )
+
+
+def _public_varieties(count: int) -> List[VarietyListRead]:
+    return [
+        VarietyListRead.model_validate(
+            {
+                "variety_id": uuid.uuid4(),
+                "variety_name": f"Public variety {i}",
+                "family": {"family_id": uuid.uuid4(), "family_name": "Solanaceae"},
+                "lifecycle": {
+                    "lifecycle_id": uuid.uuid4(),
+                    "lifecycle_name": "Annual",
+                    "productivity_years": 1,
+                },
+                "is_public": True,
+                "last_updated": NOW,
+                "is_active": i % 3 == 0,
+            }
+        )
+        for i in range(count)
+    ]
+
+
+def _time(func: Callable[[], Any], iterations: int) -> float:
+    """Best-of-three microseconds per call."""
+    return min(timeit.repeat(func, number=iterations, repeat=3)) / iterations * 1e6
+
+
+def _response_rows(
+    name: str, value: Any, adapter: TypeAdapter, iterations: int
+) -> List[Tuple[str, str, float]]:
+    name = f"{name} ({len(adapter.dump_json(value)) // 1024} KiB)"
+    return [
+        (
+            name,
+            "jsonable_encoder + stdlib",
+            _time(lambda: JSONResponse(jsonable_encoder(value)).body, iterations),
+        ),
+        (
+            name,
+            "jsonable_encoder + orjson",
+            _time(lambda: FastJSONResponse(jsonable_encoder(value)).body, iterations),
+        ),
+        (
+            name,
+            "pydantic dump_json",
+            _time(lambda: adapter.dump_json(value), iterations),
+        ),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--varieties", type=int, default=500)
+    args = parser.parse_args()
+
+    rows: List[Tuple[str, str, float]] = []
+    rows += _response_rows(
+        "WeeklyTodoRead",
+        _weekly_todo(40),
+        TypeAdapter(WeeklyTodoRead),
+        args.iterations,
+    )
+    rows += _response_rows(
+        "VarietyOptionsRead",
+        _variety_options(),
+        TypeAdapter(VarietyOptionsRead),
+        args.iterations,
+    )
+    rows += _response_rows(
+        f"{args.varieties} varieties",
+        _public_varieties(args.varieties),
+        TypeAdapter(List[VarietyListRead]),
+        args.iterations,
+    )
+
+    event = {
+        "event": "Outgoing response",
+        "request_id": str(uuid.uuid4()),
+        "user_id": uuid.uuid4(),
+        "status_code": 200,
+        "process_time": "0.012s",
+        "response_headers": {"content-type": "application/json"},
+        "timestamp": NOW,
+        "logger": "app.api.middleware.logging_middleware",
+        "level": "info",
+    }
+    for serializer_name, renderer in (
+        ("stdlib", structlog.processors.JSONRenderer()),
+        ("orjson", structlog.processors.JSONRenderer(serializer=dumps_log_event)),
+    ):
+        rows.append(
+            (
+                "log event",
+                f"JSONRenderer {serializer_name}",
+                _time(lambda: renderer(None, "info", dict(event)), 20_000),
+            )
+        )
+
+    print(f"{'payload':<30} {'strategy':<28} {'us/op':>10}")
+    for payload, strategy, micros in rows:
+        print(f"{payload:<30} {strategy:<28} {micros:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Middleware Benchmark
+- Drives a small FastAPI app in-process through httpx's ASGI transport.
+- Compares the previous pair of BaseHTTPMiddleware classes (logging + security
+  headers) against the single pure ASGI AsyncLoggingMiddleware.
+- Reports JSON request throughput and streamed response throughput.
+
+Usage: python -m benchmarks.bench_middleware [--requests N] [--concurrency N]
+       [--chunks N]
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+import uuid
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Tuple
+
+import httpx
+import structlog
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from structlog.contextvars import bind_contextvars, clear_contextvars
+
+from app.api.middleware.logging_middleware import (
+    AsyncLoggingMiddleware,
+    redact_url_tokens,
+    request_id_ctx_var,
+    sanitize_headers,
+    sanitize_params,
+    tracer,
+)
+
+logger = structlog.get_logger()
+
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    """The previous request logging middleware, reduced to its per-request work."""
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        clear_contextvars()
+        request_id = str(uuid.uuid4())
+        client_ip = request.client.host if request.client else "Unknown"
+        bind_contextvars(
+            request_id=request_id,
+            ip=client_ip,
+            method=request.method,
+            path=request.url.path,
+        )
+        request_id_ctx_var.set(request_id)
+        start_time = time.monotonic()
+        with tracer.start_as_current_span("http_request") as span:
+            span.set_attribute("http.method", request.method)
+            span.set_attribute("http.url", str(request.url))
+            logger.info(
+                "Incoming request",
+                url=redact_url_tokens(str(request.url)),
+                headers=sanitize_headers(dict(request.headers)),
+                query_params=sanitize_params(dict(request.query_params)),
+            )
+            response = await call_next(request)
+            logger.info(
+                "Outgoing response",
+                status_code=response.status_code,
+                process_time=f"{time.monotonic() - start_time:.3f}s",
+                response_headers=sanitize_headers(dict(response.headers)),
+            )
+            response.headers["X-Request-ID"] = request_id
+            return response
+
+
+class LegacySecurityHeadersMiddleware(BaseHTTPMiddleware):
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        response = await call_next(request)
+        response.headers["X-Content-Type-Options"] = "nosniff"
+        response.headers["X-Frame-Options"] = "DENY"
+        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        response.headers["X-XSS-Protection"] = "0"
+        response.headers["Strict-Transport-Security"] = (
+            "max-age=31536000; includeSubDomains"
+        )
+        response.headers["Content-Security-Policy"] = "default-src 'none'"
+        return response
+
+
+def _build_app(legacy: bool, chunks: int) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int) -> Dict[str, int]:
+        return {"item_id": item_id}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def body() -> AsyncIterator[bytes]:
+            for _ in range(chunks):
+                yield b"x" * 1024
+
+        return StreamingResponse(body(), media_type="application/octet-stream")
+
+    if legacy:
+        app.add_middleware(LegacySecurityHeadersMiddleware)
+        app.add_middleware(LegacyLoggingMiddleware)
+    else:
+        app.add_middleware(AsyncLoggingMiddleware)
+    return app
+
+
+async def _load(app: FastAPI, path: str, requests: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def one(i: int) -> None:
+            async with semaphore:
+                response = await client.get(path.format(i=i))
+                assert response.headers["x-frame-options"] == "DENY"
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        return requests / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--chunks", type=int, default=64)
+    args = parser.parse_args()
+
+    # Filter log events so the numbers reflect middleware mechanics, not rendering
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING)
+    )
+
+    results: List[Tuple[str, float, float]] = []
+    for name, legacy in (("BaseHTTPMiddleware x2", True), ("pure ASGI", False)):
+        app = _build_app(legacy, args.chunks)
+        asyncio.run(_load(app, "/items/{i}", 200, args.concurrency))  # warm up
+        json_rps = asyncio.run(
+            _load(app, "/items/{i}", args.requests, args.concurrency)
+        )
+        stream_rps = asyncio.run(
+            _load(app, "/stream", args.requests // 5, args.concurrency)
+        )
+        results.append((name, json_rps, stream_rps))
+
+    print(
+        f"{args.requests} JSON requests, {args.requests // 5} streamed responses "
+        f"of {args.chunks} x 1KiB chunks, concurrency {args.concurrency}"
+    )
+    print(f"{'middleware':<22} {'JSON req/s':>12} {'stream req/s':>14}")
+    for name, json_rps, stream_rps in results:
+        print(f"{name:<22} {json_rps:>12.0f} {stream_rps:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
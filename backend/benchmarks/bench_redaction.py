@@ -0,0 +1,142 @@
+"""
+Redaction Benchmark
+- Times sanitize_error_message over representative error messages: plain
+  database errors, text with key=value secrets, bracketed messages and JSON
+  payloads.
+- Times sanitize_headers over a browser-like header dict.
+- Compares the previous implementation (JSON parse on every call, one freshly
+  formatted regex per sensitive field) with the precompiled single-pass engine.
+
+Usage: python -m benchmarks.bench_redaction [--iterations N]
+"""
+
+import argparse
+import json
+import re
+import timeit
+from typing import Any, Callable, Dict, List, Tuple
+
+from app.api.middleware.logging_middleware import (
+    REDACTED,
+    SENSITIVE_FIELDS,
+    SENSITIVE_HEADERS,
+    sanitize_error_message,
+    sanitize_headers,
+)
+
+MESSAGES: List[Tuple[str, str]] = [
+    (
+        "db error",
+        "(sqlalchemy.dialects.postgresql.asyncpg.IntegrityError) duplicate key value "
+        'violates unique constraint "uq_user_email" DETAIL: Key (user_email)=(a@b.com) '
+        "already exists.",
+    ),
+    ("short", "Variety not found"),
+    (
+        "secrets",
+        "auth failed for user_id=42 token=eyJhbGciOiJSUzI1NiJ9.x.y password: hunter2",
+    ),
+    ("bracketed", "[Errno 111] Connect call failed ('127.0.0.1', 5432)"),
+    (
+        "json",
+        json.dumps(
+            {
+                "error": "invalid_grant",
+                "user": {"id": 42, "refresh_token": "abc", "email": "a@b.com"},
+                "items": [{"name": "tomato", "api_key": "k"} for _ in range(5)],
+            }
+        ),
+    ),
+]
+
+HEADERS: Dict[str, str] = {
+    "host": "api.example.com",
+    "user-agent": "Mozilla/5.0",
+    "accept": "application/json",
+    "accept-language": "en-GB,en;q=0.9",
+    "accept-encoding": "gzip, deflate, br",
+    "authorization": "Bearer x",
+    "cookie": "refresh_token=y",
+    "origin": "https://app.example.com",
+    "referer": "https://app.example.com/",
+    "content-type": "application/json",
+}
+
+
+def _legacy_scrub_obj(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        return {
+            k: (REDACTED if k.lower() in SENSITIVE_FIELDS else _legacy_scrub_obj(v))
+            for k, v in obj.items()
+        }
+    if isinstance(obj, list):
+        return [_legacy_scrub_obj(v) for v in obj]
+    return obj
+
+
+def legacy_sanitize_error_message(error_msg: str) -> str:
+    try:
+        parsed = json.loads(error_msg)
+        if isinstance(parsed, (dict, list)):
+            try:
+                return json.dumps(_legacy_scrub_obj(parsed))
+            except Exception:
+                pass
+    except Exception:
+        pass
+
+    lower_msg = error_msg.lower()
+    for field in SENSITIVE_FIELDS:
+        if field in lower_msg:
+            pattern = rf"{field}[^\s]*\s*[=:]\s*[^\s]+"
+            error_msg = re.sub(
+                pattern, f"{field}={REDACTED}", error_msg, flags=re.IGNORECASE
+            )
+    return error_msg
+
+
+def legacy_sanitize_headers(headers: Dict) -> Dict:
+    sanitized = {}
+    for key, value in headers.items():
+        key_lower = key.lower()
+        if any(sensitive in key_lower for sensitive in SENSITIVE_HEADERS):
+            sanitized[key] = REDACTED
+        else:
+            sanitized[key] = value
+    return sanitized
+
+
+def _time(func: Callable[[], Any], iterations: int) -> float:
+    """Best-of-three microseconds per call."""
+    return min(timeit.repeat(func, number=iterations, repeat=3)) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    rows: List[Tuple[str, float, float]] = []
+    for name, message in MESSAGES:
+        rows.append(
+            (
+                f"message: {name}",
+                _time(lambda: legacy_sanitize_error_message(message), args.iterations),
+                _time(lambda: sanitize_error_message(message), args.iterations),
+            )
+        )
+    rows.append(
+        (
+            "headers",
+            _time(lambda: legacy_sanitize_headers(HEADERS), args.iterations),
+            _time(lambda: sanitize_headers(HEADERS), args.iterations),
+        )
+    )
+
+    print(f"{'input':<20} {'previous us':>12} {'current us':>11} {'speedup':>8}")
+    for name, legacy, current in rows:
+        print(f"{name:<20} {legacy:>12.2f} {current:>11.2f} {legacy / current:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
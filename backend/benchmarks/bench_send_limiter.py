@@ -0,0 +1,92 @@
+"""
+Send Limiter Benchmark
+- Starts several worker processes that each send as fast as the email send
+  limiter allows, the way uvicorn workers share one Resend quota.
+- Compares a per-process bucket (memory://, like the old per-process deque)
+  with a SQLite-backed bucket shared by all workers, reporting the aggregate
+  send rate against the configured quota and the mean wait per send.
+
+Usage: python -m benchmarks.bench_send_limiter [--workers N] [--sends N] [--rate R]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+from app.api.core.token_bucket import TokenBucketLimiter, create_token_bucket_backend
+
+
+def _worker(
+    uri: str,
+    rate: float,
+    sends: int,
+    start_at: float,
+    queue: "multiprocessing.Queue[float]",
+) -> None:
+    limiter = TokenBucketLimiter(
+        "bench", rate=rate, burst=1, backend=create_token_bucket_backend(uri)
+    )
+
+    async def _run() -> float:
+        waited = 0.0
+        for _ in range(sends):
+            waited += await limiter.acquire()
+        return waited
+
+    time.sleep(max(0.0, start_at - time.time()))
+    queue.put(asyncio.run(_run()))
+
+
+def _run_workers(
+    uri: str, workers: int, sends: int, rate: float
+) -> Tuple[float, float]:
+    queue: "multiprocessing.Queue[float]" = multiprocessing.Queue()
+    start_at = time.time() + 0.5
+    processes = [
+        multiprocessing.Process(
+            target=_worker, args=(uri, rate, sends, start_at, queue)
+        )
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    waits: List[float] = [queue.get() for _ in processes]
+    for process in processes:
+        process.join()
+    elapsed = time.time() - start_at
+    total = workers * sends
+    return total / elapsed, sum(waits) / total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--sends", type=int, default=100)
+    parser.add_argument("--rate", type=float, default=100.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        backends = (
+            ("per-process memory", "memory://"),
+            ("shared sqlite", f"sqlite:///{Path(tmp) / 'buckets.db'}"),
+        )
+        results = [
+            (name, *_run_workers(uri, args.workers, args.sends, args.rate))
+            for name, uri in backends
+        ]
+
+    print(f"{args.workers} workers x {args.sends} sends, quota {args.rate:.0f} sends/s")
+    print(f"{'bucket':<20} {'sends/s':>9} {'x quota':>8} {'mean wait ms':>13}")
+    for name, throughput, mean_wait in results:
+        print(
+            f"{name:<20} {throughput:>9.1f} {throughput / args.rate:>8.2f}"
+            f" {mean_wait * 1e3:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
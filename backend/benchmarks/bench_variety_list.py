@@ -0,0 +1,185 @@
+"""
+Variety List Benchmark
+- Seeds an in-memory SQLite database with one user's varieties and times the
+  list view the previous way (full Variety entities with selectinload'ed
+  family and lifecycle, is_active set per entity) against the repository's
+  column-only VarietyListRow projection.
+- Both paths end in VarietyListRead, as the endpoint does; peak memory is
+  the tracemalloc high-water mark of one fresh-session load.
+
+Usage: python -m benchmarks.bench_variety_list [--varieties N] [--repeat N]
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+import tracemalloc
+import uuid
+from typing import Any, Awaitable, Callable, List
+
+import structlog
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import selectinload
+from sqlalchemy.pool import StaticPool
+
+from app.api.core.database import Base
+from app.api.models import Family, UserActiveVariety
+from app.api.models.enums import LifecycleType
+from app.api.models.family.botanical_group_model import BotanicalGroup
+from app.api.models.grow_guide.guide_options_model import Lifecycle
+from app.api.models.grow_guide.variety_model import Variety
+from app.api.repositories.grow_guide.variety_repository import VarietyRepository
+from app.api.schemas.grow_guide.variety_schema import VarietyListRead
+
+Loader = Callable[[AsyncSession, uuid.UUID], Awaitable[List[Any]]]
+
+
+async def _legacy_user_varieties(db: AsyncSession, user_id: uuid.UUID) -> List[Any]:
+    active_count_subquery = (
+        select(func.count(UserActiveVariety.variety_id))
+        .where(
+            UserActiveVariety.user_id == user_id,
+            UserActiveVariety.variety_id == Variety.variety_id,
+        )
+        .correlate(Variety)
+        .scalar_subquery()
+    )
+    stmt = (
+        select(Variety, active_count_subquery.label("active_variety_count"))
+        .options(selectinload(Variety.lifecycle), selectinload(Variety.family))
+        .where(Variety.owner_user_id == user_id)
+        .order_by(Variety.variety_name)
+    )
+    varieties = []
+    for variety, active_variety_count in (await db.execute(stmt)).unique().all():
+        setattr(variety, "is_active", (active_variety_count or 0) > 0)
+        varieties.append(variety)
+    return varieties
+
+
+async def _projected_user_varieties(db: AsyncSession, user_id: uuid.UUID) -> List[Any]:
+    return await VarietyRepository(db).get_user_varieties(user_id)
+
+
+async def _seed(sessions: async_sessionmaker[AsyncSession], size: int) -> uuid.UUID:
+    user_id = uuid.uuid4()
+    group_id, family_id, lifecycle_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    async with sessions() as db:
+        await db.execute(
+            insert(BotanicalGroup).values(
+                botanical_group_id=group_id,
+                botanical_group_name="group",
+                rotate_years=2,
+            )
+        )
+        await db.execute(
+            insert(Family).values(
+                family_id=family_id,
+                family_name="family",
+                botanical_group_id=group_id,
+            )
+        )
+        await db.execute(
+            insert(Lifecycle).values(
+                lifecycle_id=lifecycle_id,
+                lifecycle_name=LifecycleType.ANNUAL,
+                productivity_years=1,
+            )
+        )
+        # SQLite does not enforce foreign keys here, so the remaining
+        # references can be random ids.
+        rows = [
+            {
+                "variety_id": uuid.uuid4(),
+                "owner_user_id": user_id,
+                "variety_name": f"Variety {i:05d}",
+                "family_id": family_id,
+                "lifecycle_id": lifecycle_id,
+                "sow_week_start_id": uuid.uuid4(),
+                "sow_week_end_id": uuid.uuid4(),
+                "planting_conditions_id": uuid.uuid4(),
+                "soil_ph": 6.5,
+                "plant_depth_cm": 2,
+                "plant_space_cm": 30,
+                "water_frequency_id": uuid.uuid4(),
+                "high_temp_degrees": 30,
+                "high_temp_water_frequency_id": uuid.uuid4(),
+                "harvest_week_start_id": uuid.uuid4(),
+                "harvest_week_end_id": uuid.uuid4(),
+                "notes": "Sow under cover and harden off before planting out.",
+                "is_public": False,
+            }
+            for i in range(size)
+        ]
+        await db.execute(insert(Variety), rows)
+        await db.execute(
+            insert(UserActiveVariety),
+            [
+                {"user_id": user_id, "variety_id": row["variety_id"]}
+                for row in rows[::3]
+            ],
+        )
+        await db.commit()
+    return user_id
+
+
+async def _load(
+    sessions: async_sessionmaker[AsyncSession], loader: Loader, user_id: uuid.UUID
+) -> List[VarietyListRead]:
+    async with sessions() as db:
+        return [VarietyListRead.model_validate(v) for v in await loader(db, user_id)]
+
+
+async def _run(size: int, repeat: int) -> None:
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    user_id = await _seed(sessions, size)
+
+    print(f"{size} varieties, best of {repeat}")
+    print(f"{'load':<12} {'total ms':>9} {'us/row':>8} {'peak MiB':>9}")
+    for name, loader in (
+        ("entities", _legacy_user_varieties),
+        ("projection", _projected_user_varieties),
+    ):
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            await _load(sessions, loader, user_id)
+            best = min(best, time.perf_counter() - started)
+        tracemalloc.start()
+        await _load(sessions, loader, user_id)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(
+            f"{name:<12} {best * 1e3:>9.1f} {best / size * 1e6:>8.1f}"
+            f" {peak / 2**20:>9.1f}"
+        )
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--varieties", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    # Keep the repository's timing logs out of the measurement.
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING)
+    )
+    asyncio.run(_run(args.varieties, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Variety Search Benchmark
+- Builds a synthetic public catalogue and times VarietySearchIndex (the
+  SQLite fallback behind /grow-guides/search) against a linear scan that
+  ranks every name the same way, and against a bare substring filter (what
+  the client does today with the full listing, without ranking or
+  misspelling tolerance).
+- Queries mix exact names, prefixes, mid-word substrings and misspellings;
+  each search keeps the top 20.
+
+Usage: python -m benchmarks.bench_variety_search [--varieties N] [--repeat N]
+"""
+
+import argparse
+import heapq
+import random
+import statistics
+import time
+import uuid
+from typing import Callable, List, Sequence
+
+from app.api.services.grow_guide.variety_search_index import (
+    SIMILARITY_THRESHOLD,
+    SearchRow,
+    VarietySearchIndex,
+    trigrams,
+)
+
+PREFIXES = (
+    "Cherry", "Beefsteak", "Golden", "Early", "Giant", "Purple", "Sweet",
+    "Dwarf", "Winter", "Red", "Striped", "Heritage",
+)  # fmt: skip
+CROPS = (
+    "Tomato", "Potato", "Bean", "Pea", "Carrot", "Onion", "Leek", "Squash",
+    "Courgette", "Lettuce", "Cabbage", "Kale", "Pepper", "Aubergine",
+)  # fmt: skip
+QUERIES = ("tomato", "golden be", "arrot", "pe", "tomatoe", "courgete", "xyz")
+
+
+def _catalogue(size: int) -> List[SearchRow]:
+    rng = random.Random(42)
+    families = [uuid.uuid4() for _ in range(len(CROPS))]
+    lifecycles = [uuid.uuid4() for _ in range(3)]
+    rows: List[SearchRow] = []
+    for i in range(size):
+        crop = rng.randrange(len(CROPS))
+        name = f"{rng.choice(PREFIXES)} {CROPS[crop]} {i}"
+        rows.append((uuid.uuid4(), name, families[crop], rng.choice(lifecycles)))
+    return rows
+
+
+def _filter(rows: Sequence[SearchRow], query: str) -> List[uuid.UUID]:
+    q = query.lower()
+    return [row[0] for row in rows if q in row[1].lower()]
+
+
+def _ranked_scan(rows: Sequence[SearchRow], query: str) -> List[uuid.UUID]:
+    q = query.lower()
+    query_grams = trigrams(q)
+    ranked = []
+    for variety_id, variety_name, _, _ in rows:
+        name = variety_name.lower()
+        if q in name:
+            tier = 0 if name == q else 1 if name.startswith(q) else 2
+            ranked.append((tier, 0.0, len(name), name, variety_id))
+            continue
+        grams = trigrams(name)
+        common = len(query_grams & grams)
+        similarity = common / (len(query_grams) + len(grams) - common)
+        if similarity >= SIMILARITY_THRESHOLD:
+            ranked.append((3, -similarity, len(name), name, variety_id))
+    return [entry[-1] for entry in heapq.nsmallest(20, ranked)]
+
+
+def _latencies(fn: Callable[[str], object], repeat: int) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        for query in QUERIES:
+            started = time.perf_counter()
+            fn(query)
+            samples.append(time.perf_counter() - started)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--varieties", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = _catalogue(args.varieties)
+    started = time.perf_counter()
+    index = VarietySearchIndex(rows)
+    build = time.perf_counter() - started
+
+    print(f"{args.varieties} varieties, index built in {build * 1e3:.0f} ms")
+    print(f"{'search':<12} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    for name, fn in (
+        ("index", lambda q: index.search(q, limit=20)),
+        ("ranked scan", lambda q: _ranked_scan(rows, q)),
+        ("filter", lambda q: _filter(rows, q)),
+    ):
+        samples = sorted(_latencies(fn, args.repeat))
+        p95 = samples[int(len(samples) * 0.95) - 1]
+        print(
+            f"{name:<12} {statistics.median(samples) * 1e3:>8.2f} "
+            f"{p95 * 1e3:>8.2f} {samples[-1] * 1e3:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""add variety public name index
+
+Revision ID: 7b1e4f2c9d3a
+Revises: 3c7d2a91e4b5
+Create Date: 2026-10-18 14:27:05.512931
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7b1e4f2c9d3a"
+down_revision: Union[str, None] = "3c7d2a91e4b5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_variety_public_name_id",
+        "variety",
+        ["variety_name", "variety_id"],
+        unique=False,
+        postgresql_where=sa.text("is_public"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_variety_public_name_id", table_name="variety")
@@ -0,0 +1,36 @@
+"""add variety name trigram index
+
+Revision ID: d4a8c61f0b27
+Revises: 7b1e4f2c9d3a
+Create Date: 2026-10-18 16:03:41.208764
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4a8c61f0b27"
+down_revision: Union[str, None] = "7b1e4f2c9d3a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_variety_public_name_trgm",
+        "variety",
+        [sa.text("lower(variety_name) gin_trgm_ops")],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_where=sa.text("is_public"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_variety_public_name_trgm", table_name="variety")
@@ -0,0 +1,59 @@
+"""add inbound emails
+
+Revision ID: 5e9b3f7a1c82
+Revises: d4a8c61f0b27
+Create Date: 2026-10-19 10:41:17.604392
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e9b3f7a1c82"
+down_revision: Union[str, None] = "d4a8c61f0b27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "inbound_emails",
+        sa.Column("inbound_email_id", sa.UUID(), nullable=False),
+        sa.Column("svix_id", sa.String(length=255), nullable=True),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("status", sa.String(length=10), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.CheckConstraint(
+            "status IN ('pending', 'processed', 'failed')",
+            name="check_inbound_emails_status",
+        ),
+        sa.CheckConstraint("attempts >= 0", name="check_inbound_emails_attempts"),
+        sa.PrimaryKeyConstraint("inbound_email_id"),
+        sa.UniqueConstraint("svix_id", name="uq_inbound_emails_svix_id"),
+    )
+    op.create_index(
+        "ix_inbound_emails_status_next_attempt_at",
+        "inbound_emails",
+        ["status", "next_attempt_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_inbound_emails_status_next_attempt_at", table_name="inbound_emails"
+    )
+    op.drop_table("inbound_emails")
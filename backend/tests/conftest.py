@@ -17,13 +17,16 @@ from app.api.models.grow_guide.calendar_model import Day
 from app.api.models.grow_guide.guide_options_model import Feed
 from app.api.repositories.user.user_repository import UserRepository
 from app.api.services import email_service
+from app.api.services.grow_guide.variety_search_index import (
+    get_variety_search_index_cache,
+)
+from app.api.services.reference_data_cache import get_reference_data_cache
 from app.main import app
 from tests.test_helpers import (
     make_user_allotment,
     make_user_create_schema,
     make_user_feed_day,
     make_user_model,
-    mock_email_service,
 )
 from tests.testing_db import TestingSessionLocal, engine
 
@@ -141,6 +144,27 @@ def prevent_real_emails(monkeypatch):
     monkeypatch.setattr(email_service, "resend", MockResend)
 
 
+@pytest.fixture(autouse=True)
+def reset_email_circuit_breaker():
+    """Keep failures simulated by one test from opening the breaker for the next."""
+    yield
+    email_service.get_email_circuit_breaker().reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_reference_data_cache():
+    """Drop variety options cached from one test's seed data before the next."""
+    yield
+    get_reference_data_cache().invalidate()
+
+
+@pytest.fixture(autouse=True)
+def reset_variety_search_index():
+    """Rebuild the in-memory variety search index from each test's own data."""
+    yield
+    get_variety_search_index_cache().clear()
+
+
 @pytest.fixture(autouse=True)
 def disable_rate_limits():
     """Disable rate limits for tests."""
@@ -405,9 +429,6 @@ def sample_user_data_variant():
 @pytest.fixture
 async def registered_user(client, mocker, sample_user_data):
     """Create and return a registered user with tokens."""
-    # Mock email service to prevent actual emails
-    mock_email_service(mocker, "app.api.v1.registration.send_verification_email")
-
     response = await client.post(
         f"{settings.API_PREFIX}/registration",
         json=sample_user_data,
@@ -555,8 +576,8 @@ def standard_unit_mocks(mocker):
 
 @pytest.fixture
 def mock_email_in_unit_test(mocker):
-    """Mock email service for unit tests."""
-    return mocker.patch("app.api.v1.registration.send_verification_email")
+    """Mock the verification email builder for unit tests."""
+    return mocker.patch("app.api.v1.registration.build_verification_email")
 
 
 @pytest.fixture
@@ -609,8 +630,6 @@ def user_factory(client, mocker, user_payload_factory):
     async def _create(payload=None):
         if payload is None:
             payload = user_payload_factory()
-        # mock email each call (idempotent)
-        mock_email_service(mocker, "app.api.v1.registration.send_verification_email")
         return await client.post(f"{settings.API_PREFIX}/registration", json=payload)
 
     return _create
@@ -644,7 +663,6 @@ def register_user(client, mocker):
     """
 
     async def _register(prefix: str = "user") -> dict:
-        mock_email_service(mocker, "app.api.v1.registration.send_verification_email")
         email = f"{prefix}_{uuid.uuid4().hex[:8]}@example.com"
         payload = {
             "user_email": email,
@@ -675,15 +693,14 @@ def suppress_logging(monkeypatch):
 
 @pytest.fixture
 def reset_health_state():
-    """Reset internal health module resource state before & after a test."""
-    import app.api.v1.health as health_mod
-
-    orig = health_mod._previous_resources_state.copy()
-    health_mod._previous_resources_state = {k: False for k in orig.keys()}
-    # Run test
-    yield
-    # Restore original state
-    health_mod._previous_resources_state = {k: False for k in orig.keys()}
+    """Install a fresh health sampler on the test database for one test."""
+    from app.api.services import health_sampler
+
+    original = health_sampler._sampler
+    sampler = health_sampler.HealthSampler(TestingSessionLocal)
+    health_sampler._sampler = sampler
+    yield sampler
+    health_sampler._sampler = original
 
 
 @pytest.fixture
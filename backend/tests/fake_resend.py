@@ -0,0 +1,71 @@
+"""
+Fake Resend API
+- Minimal ASGI stand-in for the /emails and /emails/batch endpoints, served
+  through httpx.ASGITransport so outbox tests exercise real HTTP requests.
+- Records every request and can fail the next calls with scripted statuses or
+  reject individual recipients as Resend does for invalid addresses.
+"""
+
+import uuid
+from typing import Any, Dict, List, Set
+
+import httpx
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+
+class FakeResend:
+    def __init__(self) -> None:
+        self.requests: List[Dict[str, Any]] = []
+        self.fail_with: List[int] = []
+        self.rejected_recipients: Set[str] = set()
+        self.app = Starlette(
+            routes=[
+                Route("/emails", self._send, methods=["POST"]),
+                Route("/emails/batch", self._send_batch, methods=["POST"]),
+            ]
+        )
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=self.app))
+
+    @property
+    def delivered(self) -> List[Dict[str, Any]]:
+        """Emails accepted so far, in order."""
+        accepted: List[Dict[str, Any]] = []
+        for request in self.requests:
+            if request["status"] < 400:
+                accepted.extend(request["emails"])
+        return accepted
+
+    async def _record(self, request: Request, emails: List[Dict[str, Any]]) -> int:
+        if self.fail_with:
+            status = self.fail_with.pop(0)
+        elif any(email.get("to") in self.rejected_recipients for email in emails):
+            status = 422
+        else:
+            status = 200
+        self.requests.append(
+            {
+                "path": request.url.path,
+                "idempotency_key": request.headers.get("idempotency-key"),
+                "emails": emails,
+                "status": status,
+            }
+        )
+        return status
+
+    async def _send(self, request: Request) -> JSONResponse:
+        status = await self._record(request, [await request.json()])
+        if status >= 400:
+            return JSONResponse({"message": "fake failure"}, status_code=status)
+        return JSONResponse({"id": str(uuid.uuid4())})
+
+    async def _send_batch(self, request: Request) -> JSONResponse:
+        emails = await request.json()
+        status = await self._record(request, emails)
+        if status >= 400:
+            return JSONResponse({"message": "fake failure"}, status_code=status)
+        return JSONResponse({"data": [{"id": str(uuid.uuid4())} for _ in emails]})
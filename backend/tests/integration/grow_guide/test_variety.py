@@ -8,6 +8,8 @@ import pytest
 from fastapi import status
 
 from app.api.core.config import settings
+from app.api.models.grow_guide.variety_model import Variety
+from tests.testing_db import TestingSessionLocal
 
 
 class TestVarietyEndpointsIntegration:
@@ -646,3 +648,307 @@ class TestVarietyEndpointsIntegration:
         )
         assert response2.status_code == status.HTTP_409_CONFLICT
         assert "already exists" in response2.text.lower()
+
+
+@pytest.fixture
+async def public_catalogue(seed_public_variety_data):
+    """Clone the seeded public variety into a small public catalogue."""
+    async with TestingSessionLocal() as session:
+        source = await session.get(Variety, seed_public_variety_data["variety_id"])
+        columns = {
+            column.key: getattr(source, column.key)
+            for column in Variety.__table__.columns
+            if column.key not in ("variety_id", "variety_name", "last_updated")
+        }
+        for name in ("Aubergine", "Bean", "Courgette", "Pea"):
+            session.add(Variety(variety_id=uuid4(), variety_name=name, **columns))
+        await session.commit()
+    return ["Aubergine", "Bean", "Courgette", "Pea", "Public Tomato"]
+
+
+class TestPublicVarietyPagination:
+    """Keyset pages and streaming for the public variety listing."""
+
+    URL = f"{settings.API_PREFIX}/grow-guides"
+
+    @pytest.mark.asyncio
+    async def test_pages_follow_next_cursor(
+        self, client, integration_auth_headers, public_catalogue
+    ):
+        names, cursor, pages = [], None, 0
+        while True:
+            params = {"visibility": "public", "limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = await client.get(
+                self.URL, params=params, headers=integration_auth_headers
+            )
+            assert response.status_code == status.HTTP_200_OK
+            page = response.json()
+            assert len(page) <= 2
+            names.extend(v["variety_name"] for v in page)
+            pages += 1
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+
+        assert names == public_catalogue
+        assert pages == 3
+
+    @pytest.mark.asyncio
+    async def test_stream_returns_whole_catalogue(
+        self, client, integration_auth_headers, public_catalogue
+    ):
+        full = await client.get(
+            self.URL, params={"visibility": "public"}, headers=integration_auth_headers
+        )
+        streamed = await client.get(
+            self.URL,
+            params={"visibility": "public", "stream": "true", "limit": 2},
+            headers=integration_auth_headers,
+        )
+
+        assert streamed.status_code == status.HTTP_200_OK
+        assert streamed.headers["content-type"] == "application/json"
+        assert [v["variety_name"] for v in streamed.json()] == public_catalogue
+        assert streamed.json() == full.json()
+
+    @pytest.mark.asyncio
+    async def test_stream_of_empty_catalogue_is_empty_array(
+        self, client, integration_auth_headers
+    ):
+        response = await client.get(
+            self.URL,
+            params={"visibility": "public", "stream": "true"},
+            headers=integration_auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+
+    @pytest.mark.asyncio
+    async def test_stream_resumes_after_cursor(
+        self, client, integration_auth_headers, public_catalogue
+    ):
+        first_page = await client.get(
+            self.URL,
+            params={"visibility": "public", "limit": 2},
+            headers=integration_auth_headers,
+        )
+        streamed = await client.get(
+            self.URL,
+            params={
+                "visibility": "public",
+                "stream": "true",
+                "cursor": first_page.headers["X-Next-Cursor"],
+            },
+            headers=integration_auth_headers,
+        )
+
+        assert streamed.status_code == status.HTTP_200_OK
+        assert [v["variety_name"] for v in streamed.json()] == public_catalogue[2:]
+
+    @pytest.mark.asyncio
+    async def test_stream_with_invalid_cursor_rejected(
+        self, client, integration_auth_headers
+    ):
+        response = await client.get(
+            self.URL,
+            params={"visibility": "public", "stream": "true", "cursor": "not-a-cursor"},
+            headers=integration_auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_rejected(self, client, integration_auth_headers):
+        response = await client.get(
+            self.URL,
+            params={"visibility": "public", "cursor": "not-a-cursor"},
+            headers=integration_auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.asyncio
+    async def test_page_size_is_capped(self, client, integration_auth_headers):
+        response = await client.get(
+            self.URL,
+            params={"visibility": "public", "limit": 1000},
+            headers=integration_auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+    @pytest.mark.asyncio
+    async def test_paging_own_varieties_rejected(
+        self, client, integration_auth_headers
+    ):
+        response = await client.get(
+            self.URL, params={"limit": 2}, headers=integration_auth_headers
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestPublicVarietySearch:
+    """Name search over the public catalogue (in-memory index under SQLite)."""
+
+    URL = f"{settings.API_PREFIX}/grow-guides/search"
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_prefix_matches_first(
+        self, client, integration_auth_headers, public_catalogue
+    ):
+        response = await client.get(
+            self.URL, params={"q": "pe"}, headers=integration_auth_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [v["variety_name"] for v in response.json()] == ["Pea"]
+
+    @pytest.mark.asyncio
+    async def test_search_tolerates_misspelling(
+        self, client, integration_auth_headers, public_catalogue
+    ):
+        response = await client.get(
+            self.URL, params={"q": "tomatoe"}, headers=integration_auth_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data[0]["variety_name"] == "Public Tomato"
+        assert data[0]["family"]["family_name"]
+
+    @pytest.mark.asyncio
+    async def test_search_filters_and_pages(
+        self,
+        client,
+        integration_auth_headers,
+        public_catalogue,
+        seed_public_variety_data,
+    ):
+        other_family = str(uuid4())
+        filtered = await client.get(
+            self.URL,
+            params={"q": "a", "family_id": other_family},
+            headers=integration_auth_headers,
+        )
+        first = await client.get(
+            self.URL, params={"q": "a", "limit": 2}, headers=integration_auth_headers
+        )
+        second = await client.get(
+            self.URL,
+            params={"q": "a", "limit": 2, "offset": 2},
+            headers=integration_auth_headers,
+        )
+
+        assert filtered.json() == []
+        names = [v["variety_name"] for v in first.json() + second.json()]
+        assert names == ["Aubergine", "Pea", "Bean", "Public Tomato"]
+
+    @pytest.mark.asyncio
+    async def test_search_excludes_private_varieties(
+        self, client, integration_auth_headers, seed_variety_data
+    ):
+        response = await client.get(
+            self.URL,
+            params={"q": seed_variety_data["variety_name"]},
+            headers=integration_auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+
+    @pytest.mark.asyncio
+    async def test_search_requires_query(self, client, integration_auth_headers):
+        response = await client.get(self.URL, headers=integration_auth_headers)
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+class TestBulkCopyPublicVarieties:
+    """Copying several public varieties in one request."""
+
+    URL = f"{settings.API_PREFIX}/grow-guides/copy"
+
+    async def _public_ids(self, client, headers):
+        response = await client.get(
+            f"{settings.API_PREFIX}/grow-guides",
+            params={"visibility": "public"},
+            headers=headers,
+        )
+        return {v["variety_name"]: v["variety_id"] for v in response.json()}
+
+    @pytest.mark.asyncio
+    async def test_copies_in_request_order_with_water_days(
+        self, client, integration_auth_headers, public_catalogue
+    ):
+        ids = await self._public_ids(client, integration_auth_headers)
+        requested = ["Pea", "Aubergine", "Public Tomato"]
+
+        response = await client.post(
+            self.URL,
+            json={"variety_ids": [ids[name] for name in requested]},
+            headers=integration_auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        copies = response.json()
+        assert [c["variety_name"] for c in copies] == requested
+        assert not any(c["is_public"] for c in copies)
+        assert not {c["variety_id"] for c in copies} & set(ids.values())
+        detail = await client.get(
+            f"{settings.API_PREFIX}/grow-guides/{copies[0]['variety_id']}",
+            headers=integration_auth_headers,
+        )
+        assert detail.json()["water_days"]
+
+    @pytest.mark.asyncio
+    async def test_name_collisions_get_copy_suffixes(
+        self, client, integration_auth_headers, public_catalogue
+    ):
+        ids = await self._public_ids(client, integration_auth_headers)
+        body = {"variety_ids": [ids["Bean"], ids["Bean"], ids["Pea"]]}
+
+        first = await client.post(self.URL, json=body, headers=integration_auth_headers)
+        second = await client.post(
+            self.URL, json=body, headers=integration_auth_headers
+        )
+        third = await client.post(self.URL, json=body, headers=integration_auth_headers)
+
+        assert [c["variety_name"] for c in first.json()] == ["Bean", "Pea"]
+        assert [c["variety_name"] for c in second.json()] == [
+            "Bean (copy)",
+            "Pea (copy)",
+        ]
+        assert [c["variety_name"] for c in third.json()] == [
+            "Bean (copy 2)",
+            "Pea (copy 2)",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unknown_id_copies_nothing(
+        self, client, integration_auth_headers, public_catalogue
+    ):
+        ids = await self._public_ids(client, integration_auth_headers)
+
+        response = await client.post(
+            self.URL,
+            json={"variety_ids": [ids["Bean"], str(uuid4())]},
+            headers=integration_auth_headers,
+        )
+        owned = await client.get(
+            f"{settings.API_PREFIX}/grow-guides", headers=integration_auth_headers
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert owned.json() == []
+
+    @pytest.mark.asyncio
+    async def test_requires_at_least_one_id(self, client, integration_auth_headers):
+        response = await client.post(
+            self.URL, json={"variety_ids": []}, headers=integration_auth_headers
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
@@ -0,0 +1,133 @@
+"""
+Integration tests for the session bootstrap endpoint.
+"""
+
+import uuid
+from unittest.mock import patch
+
+import pytest
+from fastapi import status
+
+from app.api.core.config import settings
+
+PREFIX = settings.API_PREFIX
+
+WEEKLY_TODO_PATH = (
+    "app.api.services.todo.weekly_todo.WeeklyTodoUnitOfWork.get_weekly_todo"
+)
+VARIETY_OPTIONS_PATH = (
+    "app.api.services.grow_guide.grow_guide_unit_of_work."
+    "GrowGuideUnitOfWork.get_variety_options"
+)
+
+
+def _todo_data(week_number: int = 20) -> dict:
+    return {
+        "week_id": str(uuid.uuid4()),
+        "week_number": week_number,
+        "week_start_date": "05/13",
+        "week_end_date": "05/19",
+        "weekly_tasks": {
+            "sow_tasks": [],
+            "transplant_tasks": [],
+            "harvest_tasks": [],
+            "prune_tasks": [],
+            "compost_tasks": [],
+        },
+        "daily_tasks": {},
+    }
+
+
+class TestBootstrapIntegration:
+    @pytest.mark.asyncio
+    async def test_bootstrap_returns_every_section(
+        self, client, register_user, seed_family_data, seed_day_data, seed_feed_data
+    ) -> None:
+        headers = await register_user("bootstrap_user")
+        allotment = {
+            "allotment_postal_zip_code": "12345",
+            "allotment_width_meters": 10.0,
+            "allotment_length_meters": 20.0,
+        }
+        resp = await client.post(
+            f"{PREFIX}/users/allotment", json=allotment, headers=headers
+        )
+        assert resp.status_code == status.HTTP_201_CREATED
+
+        with patch(WEEKLY_TODO_PATH, return_value=_todo_data()):
+            response = await client.get(f"{PREFIX}/bootstrap", headers=headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()
+        assert set(data) == {
+            "variety_options",
+            "profile",
+            "preferences",
+            "allotment",
+            "active_varieties",
+            "weekly_todo",
+        }
+        assert data["profile"]["user_first_name"] == "TestUser"
+        assert data["allotment"]["allotment_postal_zip_code"] == "12345"
+        assert data["active_varieties"] == []
+        assert data["weekly_todo"]["week_number"] == 20
+        assert len(data["preferences"]["available_days"]) == 7
+        assert data["variety_options"]["families"][0]["family_name"] == "testfamily"
+        assert len(data["variety_options"]["days"]) == 7
+
+    @pytest.mark.asyncio
+    async def test_bootstrap_without_allotment(self, client, register_user) -> None:
+        headers = await register_user("bootstrap_no_allotment")
+
+        with patch(WEEKLY_TODO_PATH, return_value=_todo_data(30)) as mock_todo:
+            response = await client.get(
+                f"{PREFIX}/bootstrap", params={"week_number": 30}, headers=headers
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["allotment"] is None
+        assert mock_todo.call_args.args[-1] == 30
+
+    @pytest.mark.asyncio
+    async def test_bootstrap_reuses_cached_variety_options(
+        self, client, register_user
+    ) -> None:
+        headers = await register_user("bootstrap_cached")
+        options = {
+            "lifecycles": [],
+            "planting_conditions": [],
+            "frequencies": [],
+            "feed_frequencies": [],
+            "feeds": [],
+            "weeks": [],
+            "families": [],
+            "days": [],
+        }
+
+        with (
+            patch(WEEKLY_TODO_PATH, return_value=_todo_data()),
+            patch(VARIETY_OPTIONS_PATH, return_value=options) as mock_options,
+        ):
+            first = await client.get(f"{PREFIX}/bootstrap", headers=headers)
+            second = await client.get(f"{PREFIX}/bootstrap", headers=headers)
+
+        assert first.status_code == second.status_code == status.HTTP_200_OK
+        assert first.json()["variety_options"] == second.json()["variety_options"]
+        mock_options.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_bootstrap_unauthorized(self, client) -> None:
+        response = await client.get(f"{PREFIX}/bootstrap")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    @pytest.mark.asyncio
+    async def test_bootstrap_invalid_week_number(self, client, register_user) -> None:
+        headers = await register_user("bootstrap_bad_week")
+
+        response = await client.get(
+            f"{PREFIX}/bootstrap", params={"week_number": 53}, headers=headers
+        )
+
+        assert response.status_code == 422
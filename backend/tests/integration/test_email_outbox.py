@@ -0,0 +1,266 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import update
+
+from app.api.core.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.api.models import EmailOutbox
+from app.api.models.email.email_outbox_model import (
+    EMAIL_STATUS_FAILED,
+    EMAIL_STATUS_PENDING,
+)
+from app.api.repositories.email.email_outbox_repository import (
+    EmailOutboxRepository,
+)
+from app.api.services.email_outbox import EmailOutboxWorker, enqueue_email
+from tests.fake_resend import FakeResend
+from tests.test_helpers import get_queued_emails
+from tests.testing_db import TestingSessionLocal
+
+
+def _params(to: str) -> dict:
+    return {
+        "from": "test@resend.dev",
+        "to": to,
+        "subject": "Subject",
+        "text": "Body",
+    }
+
+
+async def _enqueue(*recipients: str) -> None:
+    async with TestingSessionLocal() as session:
+        for to in recipients:
+            enqueue_email(session, _params(to), "email_verification")
+        await session.commit()
+
+
+async def _make_due() -> None:
+    async with TestingSessionLocal() as session:
+        await session.execute(
+            update(EmailOutbox).values(
+                next_attempt_at=datetime.now(timezone.utc) - timedelta(seconds=1)
+            )
+        )
+        await session.commit()
+
+
+@pytest.fixture
+def fake_resend():
+    return FakeResend()
+
+
+@pytest.fixture
+def worker(fake_resend, mocker):
+    mocker.patch(
+        "app.api.services.email_outbox._rate_limit_window", new_callable=AsyncMock
+    )
+    return EmailOutboxWorker(
+        TestingSessionLocal,
+        batch_size=10,
+        poll_interval_seconds=60.0,
+        max_attempts=2,
+        retry_base_seconds=1.0,
+        client_factory=fake_resend.client,
+    )
+
+
+class TestEmailOutboxWorker:
+    @pytest.mark.asyncio
+    async def test_drain_sends_batch_and_deletes_rows(self, worker, fake_resend):
+        await _enqueue("a@example.com", "b@example.com", "c@example.com")
+
+        assert await worker.drain_once() == 3
+
+        assert len(fake_resend.requests) == 1
+        request = fake_resend.requests[0]
+        assert request["path"] == "/emails/batch"
+        assert request["idempotency_key"].startswith("email-outbox-batch/")
+        assert sorted(email["to"] for email in request["emails"]) == [
+            "a@example.com",
+            "b@example.com",
+            "c@example.com",
+        ]
+        assert await get_queued_emails() == []
+        assert await worker.drain_once() == 0
+
+    @pytest.mark.asyncio
+    async def test_single_email_uses_send_endpoint(self, worker, fake_resend):
+        await _enqueue("solo@example.com")
+        [queued] = await get_queued_emails()
+
+        await worker.drain_once()
+
+        [request] = fake_resend.requests
+        assert request["path"] == "/emails"
+        assert request["idempotency_key"] == f"email-outbox/{queued.email_outbox_id}"
+        assert await get_queued_emails() == []
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_is_rescheduled(self, worker, fake_resend):
+        await _enqueue("a@example.com", "b@example.com")
+        fake_resend.fail_with = [503]
+
+        await worker.drain_once()
+
+        queued = await get_queued_emails()
+        assert len(queued) == 2
+        assert all(email.status == EMAIL_STATUS_PENDING for email in queued)
+        assert all(email.attempts == 1 for email in queued)
+        assert all("503" in email.last_error for email in queued)
+        # Backoff keeps them out of the next drain until they are due again.
+        assert await worker.drain_once() == 0
+
+        await _make_due()
+        await worker.drain_once()
+
+        assert sorted(email["to"] for email in fake_resend.delivered) == [
+            "a@example.com",
+            "b@example.com",
+        ]
+        # Same batch, same key: Resend deduplicates a retry of a send it accepted.
+        assert (
+            fake_resend.requests[0]["idempotency_key"]
+            == fake_resend.requests[1]["idempotency_key"]
+        )
+        assert await get_queued_emails() == []
+
+    @pytest.mark.asyncio
+    async def test_rejected_batch_falls_back_to_single_sends(self, worker, fake_resend):
+        await _enqueue("good@example.com", "bad@example.com")
+        fake_resend.rejected_recipients = {"bad@example.com"}
+
+        await worker.drain_once()
+
+        assert [request["path"] for request in fake_resend.requests] == [
+            "/emails/batch",
+            "/emails",
+            "/emails",
+        ]
+        assert [email["to"] for email in fake_resend.delivered] == ["good@example.com"]
+        [failed] = await get_queued_emails()
+        assert failed.payload["to"] == "bad@example.com"
+        assert failed.status == EMAIL_STATUS_FAILED
+
+    @pytest.mark.asyncio
+    async def test_email_fails_after_max_attempts(self, worker, fake_resend):
+        await _enqueue("a@example.com")
+        fake_resend.fail_with = [500, 500]
+
+        await worker.drain_once()
+        await _make_due()
+        await worker.drain_once()
+
+        [email] = await get_queued_emails()
+        assert email.attempts == 2
+        assert email.status == EMAIL_STATUS_FAILED
+        await _make_due()
+        assert await worker.drain_once() == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_email_keeps_only_envelope(self, worker, fake_resend):
+        await _enqueue("a@example.com")
+        fake_resend.fail_with = [422]
+
+        await worker.drain_once()
+
+        [email] = await get_queued_emails()
+        assert email.status == EMAIL_STATUS_FAILED
+        assert email.payload == {
+            "from": "test@resend.dev",
+            "to": "a@example.com",
+            "subject": "Subject",
+        }
+
+    @pytest.mark.asyncio
+    async def test_purge_failed_removes_only_expired_failures(self, worker):
+        await _enqueue("old@example.com", "new@example.com", "pending@example.com")
+        async with TestingSessionLocal() as session:
+            await session.execute(
+                update(EmailOutbox)
+                .where(EmailOutbox.payload["to"].as_string() != "pending@example.com")
+                .values(status=EMAIL_STATUS_FAILED)
+            )
+            await session.execute(
+                update(EmailOutbox)
+                .where(EmailOutbox.payload["to"].as_string() == "old@example.com")
+                .values(created_at=datetime.now(timezone.utc) - timedelta(days=8))
+            )
+            await session.commit()
+
+        assert await worker.purge_failed() == 1
+
+        remaining = sorted(email.payload["to"] for email in await get_queued_emails())
+        assert remaining == ["new@example.com", "pending@example.com"]
+
+    @pytest.mark.asyncio
+    async def test_notify_wakes_running_worker(self, worker, fake_resend):
+        worker.start()
+        try:
+            await _enqueue("wake@example.com")
+            worker.notify()
+            for _ in range(100):
+                if fake_resend.delivered:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await worker.stop()
+
+        assert [email["to"] for email in fake_resend.delivered] == ["wake@example.com"]
+
+    @pytest.mark.asyncio
+    async def test_emails_stay_queued_while_breaker_open(
+        self, worker, fake_resend, mocker
+    ):
+        breaker = CircuitBreaker("test-resend", minimum_calls=1)
+        breaker.record_failure()
+        mocker.patch(
+            "app.api.services.email_outbox.get_email_circuit_breaker",
+            return_value=breaker,
+        )
+        await _enqueue("a@example.com")
+
+        assert await worker.drain_once() == 0
+
+        assert fake_resend.requests == []
+        [email] = await get_queued_emails()
+        assert email.status == EMAIL_STATUS_PENDING
+        assert email.attempts == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("recipients", [["a@example.com"], ["a@x.com", "b@x.com"]])
+    async def test_breaker_opening_mid_drain_does_not_spend_attempts(
+        self, worker, fake_resend, mocker, recipients
+    ):
+        mocker.patch(
+            "app.api.services.email_outbox._post_to_resend",
+            side_effect=CircuitOpenError("resend", 30.0),
+        )
+        await _enqueue(*recipients)
+
+        assert await worker.drain_once() == len(recipients)
+
+        emails = await get_queued_emails()
+        assert len(emails) == len(recipients)
+        for email in emails:
+            assert email.status == EMAIL_STATUS_PENDING
+            assert email.attempts == 0
+            assert email.last_error is None
+        async with TestingSessionLocal() as session:
+            assert await EmailOutboxRepository(session).claim_due(10, 60.0) == []
+
+
+class TestEmailOutboxRepository:
+    @pytest.mark.asyncio
+    async def test_claim_due_leases_rows(self):
+        await _enqueue("a@example.com")
+
+        async with TestingSessionLocal() as session:
+            claimed = await EmailOutboxRepository(session).claim_due(10, 60.0)
+            await session.commit()
+        async with TestingSessionLocal() as session:
+            again = await EmailOutboxRepository(session).claim_due(10, 60.0)
+
+        assert len(claimed) == 1
+        assert again == []
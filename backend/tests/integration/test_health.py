@@ -6,7 +6,6 @@ from unittest.mock import patch
 import pytest
 from sqlalchemy.exc import SQLAlchemyError
 
-import app.api.v1.health
 from app.api.core.config import settings
 
 PREFIX = settings.API_PREFIX
@@ -16,13 +15,13 @@ PREFIX = settings.API_PREFIX
 async def test_health_healthy_database(client, reset_health_state):
     """Healthy path with deterministic resource metrics (avoid flakiness)."""
     with (
-        patch("app.api.v1.health.psutil.cpu_percent", return_value=10.0),
+        patch("app.api.services.health_sampler.psutil.cpu_percent", return_value=10.0),
         patch(
-            "app.api.v1.health.psutil.virtual_memory",
+            "app.api.services.health_sampler.psutil.virtual_memory",
             return_value=SimpleNamespace(percent=10.0),
         ),
         patch(
-            "app.api.v1.health.psutil.disk_usage",
+            "app.api.services.health_sampler.psutil.disk_usage",
             return_value=SimpleNamespace(percent=10.0),
         ),
         patch("sqlalchemy.ext.asyncio.AsyncSession.scalar", return_value=1),
@@ -35,6 +34,37 @@ async def test_health_healthy_database(client, reset_health_state):
     assert set(["cpu_usage", "memory_usage", "disk_usage"]).issubset(
         data["resources"].keys()
     )
+    assert data["email_provider"]["state"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_health_degraded_while_email_circuit_open(client, reset_health_state):
+    """An open email provider circuit is reported and degrades overall status."""
+    from app.api.services.email_service import get_email_circuit_breaker
+
+    breaker = get_email_circuit_breaker()
+    for _ in range(breaker.minimum_calls):
+        breaker.record_failure()
+
+    with (
+        patch("app.api.services.health_sampler.psutil.cpu_percent", return_value=10.0),
+        patch(
+            "app.api.services.health_sampler.psutil.virtual_memory",
+            return_value=SimpleNamespace(percent=10.0),
+        ),
+        patch(
+            "app.api.services.health_sampler.psutil.disk_usage",
+            return_value=SimpleNamespace(percent=10.0),
+        ),
+        patch("sqlalchemy.ext.asyncio.AsyncSession.scalar", return_value=1),
+    ):
+        response = await client.get(f"{PREFIX}/health")
+
+    data = response.json()
+    assert data["status"] == "degraded"
+    assert data["database"] == "healthy"
+    assert data["email_provider"]["state"] == "open"
+    assert data["email_provider"]["retry_after"] > 0
 
 
 @pytest.mark.asyncio
@@ -56,13 +86,13 @@ async def test_health_database_states(
             return_value=scalar_value,
             side_effect=scalar_side_effect,
         ),
-        patch("app.api.v1.health.psutil.cpu_percent", return_value=10.0),
+        patch("app.api.services.health_sampler.psutil.cpu_percent", return_value=10.0),
         patch(
-            "app.api.v1.health.psutil.virtual_memory",
+            "app.api.services.health_sampler.psutil.virtual_memory",
             return_value=SimpleNamespace(percent=10.0),
         ),
         patch(
-            "app.api.v1.health.psutil.disk_usage",
+            "app.api.services.health_sampler.psutil.disk_usage",
             return_value=SimpleNamespace(percent=10.0),
         ),
     ):
@@ -158,15 +188,15 @@ async def test_health_resource_scenarios(
 ):
     """Resource usage permutations (CPU/memory/disk) including state transitions."""
     # Seed previous state explicitly for scenario
-    app.api.v1.health._previous_resources_state = prev_state.copy()
+    reset_health_state._critical = prev_state.copy()
     with (
-        patch("app.api.v1.health.psutil.cpu_percent", return_value=cpu),
+        patch("app.api.services.health_sampler.psutil.cpu_percent", return_value=cpu),
         patch(
-            "app.api.v1.health.psutil.virtual_memory",
+            "app.api.services.health_sampler.psutil.virtual_memory",
             return_value=SimpleNamespace(percent=mem),
         ),
         patch(
-            "app.api.v1.health.psutil.disk_usage",
+            "app.api.services.health_sampler.psutil.disk_usage",
             return_value=SimpleNamespace(percent=disk),
         ),
         patch("sqlalchemy.ext.asyncio.AsyncSession.scalar", return_value=1),
@@ -180,3 +210,70 @@ async def test_health_resource_scenarios(
     assert data["resources"]["disk_usage"] == disk
     # Degraded if database unhealthy (not here) else ok
     assert data["status"] in ["ok", "degraded"]
+
+
+def _patch_resources(cpu: float = 10.0):
+    return (
+        patch("app.api.services.health_sampler.psutil.cpu_percent", return_value=cpu),
+        patch(
+            "app.api.services.health_sampler.psutil.virtual_memory",
+            return_value=SimpleNamespace(percent=10.0),
+        ),
+        patch(
+            "app.api.services.health_sampler.psutil.disk_usage",
+            return_value=SimpleNamespace(percent=10.0),
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_health_serves_cached_snapshot(client, reset_health_state):
+    """Repeated checks read the snapshot instead of sampling again."""
+    cpu_patch, memory_patch, disk_patch = _patch_resources()
+    with cpu_patch as mock_cpu, memory_patch, disk_patch:
+        first = await client.get(f"{PREFIX}/health")
+        second = await client.get(f"{PREFIX}/health")
+
+    assert first.status_code == second.status_code == 200
+    assert mock_cpu.call_count == 1
+    assert second.json()["database"] == "healthy"
+    assert "sample_age" in second.json()
+
+
+@pytest.mark.asyncio
+async def test_liveness_touches_nothing(client, reset_health_state):
+    with patch("app.api.services.health_sampler.psutil.cpu_percent") as mock_cpu:
+        response = await client.get(f"{PREFIX}/health/live")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+    mock_cpu.assert_not_called()
+    assert reset_health_state.snapshot is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "scalar_side_effect,expected_code,expected_status",
+    [
+        (None, 200, "ready"),
+        (SQLAlchemyError("Connection failed"), 503, "not_ready"),
+    ],
+)
+async def test_readiness_reflects_database_sample(
+    client, reset_health_state, scalar_side_effect, expected_code, expected_status
+):
+    cpu_patch, memory_patch, disk_patch = _patch_resources()
+    with (
+        cpu_patch,
+        memory_patch,
+        disk_patch,
+        patch(
+            "sqlalchemy.ext.asyncio.AsyncSession.scalar",
+            return_value=1,
+            side_effect=scalar_side_effect,
+        ),
+    ):
+        response = await client.get(f"{PREFIX}/health/ready")
+
+    assert response.status_code == expected_code
+    assert response.json()["status"] == expected_status
@@ -1,5 +1,5 @@
 import asyncio
-from unittest.mock import MagicMock, mock_open, patch
+import json
 
 import pytest
 import structlog
@@ -7,12 +7,16 @@ import structlog
 from app.api.core.config import settings
 from app.api.core.logging import log_timing
 from app.api.middleware.logging_middleware import (
+    TRUNCATED_SUFFIX,
     AsyncLoggingMiddleware,
+    is_sensitive_key,
     request_id_ctx_var,
     sanitize_error_message,
     sanitize_headers,
     sanitize_params,
+    truncate_value,
 )
+from app.api.schemas.base_schema import SecureBaseModel
 
 
 @pytest.mark.asyncio
@@ -24,14 +28,19 @@ async def test_structlog_basic(caplog):
 
 
 @pytest.mark.asyncio
-async def test_file_logging():
-    from app.api.core.logging import sync_log_to_file
+async def test_file_logging(tmp_path, monkeypatch):
+    from app.api.core import logging as core_logging
 
-    event = {"event": "Test Event", "level": "info"}
-    with patch("builtins.open", mock_open()) as mocked_file:
-        with patch("app.api.core.logging.settings.LOG_TO_FILE", True):
-            sync_log_to_file(event)
-            mocked_file.assert_called_once_with(settings.LOG_FILE, "a")
+    log_file = tmp_path / "app.log"
+    monkeypatch.setattr(settings, "LOG_TO_FILE", True)
+    monkeypatch.setattr(settings, "LOG_FILE", str(log_file))
+    core_logging.configure_logging()
+    try:
+        structlog.get_logger().info("Test Event")
+    finally:
+        core_logging.stop_file_logging()
+
+    assert "Test Event" in log_file.read_text()
 
 
 @pytest.mark.asyncio
@@ -78,48 +87,250 @@ def test_sanitize_error_message(msg, expected):
     assert sanitize_error_message(msg) == expected
 
 
+@pytest.mark.parametrize(
+    "msg,expected",
+    [
+        (
+            "login failed Password: hunter2 and api_key=k1",
+            "login failed password=[REDACTED] and api_key=[REDACTED]",
+        ),
+        ("Authorization=Bearer abc", "authorization=[REDACTED] abc"),
+        ("[Errno 111] Connection refused", "[Errno 111] Connection refused"),
+        ("İstanbul TOKEN=abc end", "İstanbul token=[REDACTED] end"),
+        (
+            '{"user": "u1", "nested": [{"refresh_token": "t"}]}',
+            '{"user": "u1", "nested": [{"refresh_token": "[REDACTED]"}]}',
+        ),
+    ],
+)
+def test_sanitize_error_message_single_pass_redaction(msg, expected):
+    assert sanitize_error_message(msg) == expected
+
+
+@pytest.mark.parametrize(
+    "key,expected",
+    [
+        ("X-API-Key", True),
+        ("Cookie", True),
+        ("refresh_token", True),
+        ("user_password", True),
+        ("content-type", False),
+        ("variety_name", False),
+    ],
+)
+def test_is_sensitive_key(key, expected):
+    assert is_sensitive_key(key) is expected
+
+
+def test_sanitizers_share_sensitive_keys():
+    data = {"cookie": "c", "api_key": "k", "page": "1"}
+    assert sanitize_headers(data) == sanitize_params(data)
+    assert sanitize_error_message(json.dumps(data)) == json.dumps(
+        {"cookie": "[REDACTED]", "api_key": "[REDACTED]", "page": "1"}
+    )
+
+
+def test_secure_dict_redacts_sensitive_fields():
+    class LoginSchema(SecureBaseModel):
+        user_email: str
+        user_password: str
+
+    model = LoginSchema(user_email="a@b.com", user_password="pw")
+
+    assert model.secure_dict() == {
+        "user_email": "a@b.com",
+        "user_password": "[REDACTED]",
+    }
+
+
+def _http_scope(path: str = "/api/test", query_string: bytes = b"") -> dict:
+    return {
+        "type": "http",
+        "method": "GET",
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query_string,
+        "root_path": "",
+        "headers": [(b"user-agent", b"test-agent"), (b"authorization", b"Bearer x")],
+        "client": ("127.0.0.1", 1234),
+    }
+
+
+async def _run_middleware(app, scope: dict, **options) -> list:
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    await AsyncLoggingMiddleware(app, **options)(scope, receive, send)
+    return sent
+
+
+def _status_app(status: int, headers: list | None = None, delay: float = 0.0):
+    async def app(scope, receive, send):
+        if delay:
+            await asyncio.sleep(delay)
+        await send(
+            {"type": "http.response.start", "status": status, "headers": headers or []}
+        )
+        await send({"type": "http.response.body", "body": b""})
+
+    return app
+
+
+def _access_log_events(caplog) -> list:
+    events = [json.loads(r.message) for r in caplog.records]
+    return [
+        event
+        for event in events
+        if event["event"] in ("Incoming request", "Outgoing response")
+    ]
+
+
 @pytest.mark.asyncio
 async def test_logging_middleware_request_response(caplog):
-    middleware = AsyncLoggingMiddleware(None)
-    req = MagicMock()
-    req.method = "GET"
-    req.url.path = "/api/test"
-    req.url.__str__.return_value = "http://testserver/api/test"
-    req.client.host = "127.0.0.1"
-    req.headers = {"User-Agent": "test-agent"}
-    req.query_params = {}
-    resp = MagicMock()
-    resp.status_code = 200
-    resp.headers = {"Content-Type": "application/json", "Content-Length": "10"}
-
-    async def call_next(_):
-        return resp
+    async def app(scope, receive, send):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", b"10"),
+                    (b"x-request-id", b"from-handler"),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": b'{"ok": 1}'})
 
     caplog.set_level("INFO")
-    result = await middleware.dispatch(req, call_next)
-    assert result == resp
+    sent = await _run_middleware(app, _http_scope())
+
+    start, body = sent
+    headers = dict(start["headers"])
+    assert start["status"] == 200
+    assert headers[b"x-request-id"] == request_id_ctx_var.get().encode()
+    assert [name for name, _ in start["headers"]].count(b"x-request-id") == 1
+    assert headers[b"x-frame-options"] == b"DENY"
+    assert headers[b"content-security-policy"] == b"default-src 'none'"
+    assert body["body"] == b'{"ok": 1}'
     msgs = [r.message for r in caplog.records]
     assert any("Incoming request" in m for m in msgs)
     assert any("Outgoing response" in m for m in msgs)
+    assert not any("Bearer x" in m for m in msgs)
+
+
+@pytest.mark.asyncio
+async def test_logging_middleware_passes_streamed_chunks_through():
+    chunks = [b"one", b"two", b"three"]
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        for chunk in chunks:
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+    sent = await _run_middleware(app, _http_scope())
+
+    assert [m["body"] for m in sent[1:]] == [*chunks, b""]
+
+
+@pytest.mark.asyncio
+async def test_logging_middleware_ignores_non_http_scopes():
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(scope["type"])
+
+    await AsyncLoggingMiddleware(app)({"type": "lifespan"}, None, None)
+
+    assert seen == ["lifespan"]
 
 
 @pytest.mark.asyncio
 async def test_logging_middleware_exception_handling(caplog):
-    middleware = AsyncLoggingMiddleware(None)
-    req = MagicMock()
-    req.method = "GET"
-    req.url.path = "/api/test"
-    req.url.__str__.return_value = "http://testserver/api/test"
-    req.client.host = "127.0.0.1"
-    req.headers = {"User-Agent": "test-agent"}
-    req.query_params = {}
-
-    async def call_next(_):
+    async def app(scope, receive, send):
         raise ValueError("Test error with password=secret123")
 
     caplog.set_level("ERROR")
     with pytest.raises(ValueError):
-        await middleware.dispatch(req, call_next)
+        await _run_middleware(app, _http_scope())
 
     msgs = [r.message for r in caplog.records]
     assert any("password=[REDACTED]" in m for m in msgs)
+
+
+@pytest.mark.asyncio
+async def test_logging_middleware_samples_out_successful_requests(caplog):
+    caplog.set_level("INFO")
+    await _run_middleware(_status_app(200), _http_scope(), sample_rate=0.0)
+
+    assert _access_log_events(caplog) == []
+
+
+@pytest.mark.asyncio
+async def test_logging_middleware_always_logs_sampled_out_errors(caplog):
+    caplog.set_level("INFO")
+    await _run_middleware(_status_app(404), _http_scope(), sample_rate=0.0)
+
+    (event,) = _access_log_events(caplog)
+    assert event["event"] == "Outgoing response"
+    assert event["status_code"] == 404
+    assert event["url"] == "http://testserver/api/test"
+    assert event["headers"] == {"user-agent": "test-agent"}
+
+
+@pytest.mark.asyncio
+async def test_logging_middleware_always_logs_slow_requests(caplog):
+    caplog.set_level("INFO")
+    await _run_middleware(
+        _status_app(200, delay=0.01),
+        _http_scope(),
+        sample_rate=0.0,
+        slow_request_seconds=0.005,
+    )
+
+    (event,) = _access_log_events(caplog)
+    assert event["slow"] is True
+
+
+@pytest.mark.asyncio
+async def test_logging_middleware_applies_header_allowlist_and_caps(caplog):
+    caplog.set_level("INFO")
+    await _run_middleware(
+        _status_app(200, headers=[(b"x-internal", b"hidden"), (b"etag", b"e1")]),
+        _http_scope(path="/api/" + "a" * 100),
+        header_allowlist=["user-agent", "etag"],
+        max_field_length=30,
+    )
+
+    incoming, outgoing = _access_log_events(caplog)
+    assert incoming["headers"] == {"user-agent": "test-agent"}
+    assert incoming["url"] == f"http://testserver/api/{'a' * 8}{TRUNCATED_SUFFIX}"
+    assert outgoing["response_headers"] == {"etag": "e1"}
+
+
+@pytest.mark.asyncio
+async def test_logging_middleware_wildcard_allowlist_logs_all_headers(caplog):
+    caplog.set_level("INFO")
+    await _run_middleware(_status_app(200), _http_scope(), header_allowlist=["*"])
+
+    incoming, _ = _access_log_events(caplog)
+    assert incoming["headers"]["authorization"] == "[REDACTED]"
+
+
+@pytest.mark.parametrize(
+    "value,max_length,expected",
+    [
+        ("short", 10, "short"),
+        ("0123456789", 4, f"0123{TRUNCATED_SUFFIX}"),
+        ("unbounded", None, "unbounded"),
+    ],
+)
+def test_truncate_value(value, max_length, expected):
+    assert truncate_value(value, max_length) == expected
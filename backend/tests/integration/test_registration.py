@@ -8,7 +8,7 @@ from app.api.core.auth_utils import create_token
 from app.api.core.config import settings
 from app.api.middleware.exception_handler import BaseApplicationError
 from app.api.models import User
-from tests.test_helpers import mock_email_service, mock_user_uow
+from tests.test_helpers import get_queued_emails, mock_user_uow
 from tests.testing_db import TestingSessionLocal
 
 REGISTRATION_PREFIX = f"{settings.API_PREFIX}/registration"
@@ -18,10 +18,6 @@ class TestUserRegistration:
     @pytest.mark.asyncio
     async def test_register_user(self, client, mocker):
         """Test user registration endpoint."""
-        _mock_email = mock_email_service(
-            mocker, "app.api.v1.registration.send_verification_email"
-        )
-
         response = await client.post(
             f"{REGISTRATION_PREFIX}",
             json={
@@ -36,13 +32,14 @@ class TestUserRegistration:
         data = response.json()
         assert "access_token" in data
         assert data["token_type"] == "bearer"
-        _mock_email.assert_called_once()
+
+        queued = await get_queued_emails("email_verification")
+        assert [email.payload["to"] for email in queued] == ["test@example.com"]
+        assert "/verify-email?token=" in queued[0].payload["text"]
 
     @pytest.mark.asyncio
     async def test_register_user_sets_datetime_fields(self, client, mocker):
         """Test that user registration sets registered_date and last_active_date."""
-        mock_email_service(mocker, "app.api.v1.registration.send_verification_email")
-
         response = await client.post(
             f"{REGISTRATION_PREFIX}",
             json={
@@ -86,7 +83,6 @@ class TestUserRegistration:
         self, client, mocker, desc, user_email, configure_uow
     ):
         """User creation failure cases (only: create_user returns None -> 500)."""
-        mock_email_service(mocker, "app.api.v1.registration.send_verification_email")
         configure_uow(mocker)
         response = await client.post(
             f"{REGISTRATION_PREFIX}",
@@ -103,8 +99,6 @@ class TestUserRegistration:
     @pytest.mark.asyncio
     async def test_register_user_handles_general_exception(self, client, mocker):
         """Test user registration handles unexpected exceptions."""
-        mock_email_service(mocker, "app.api.v1.registration.send_verification_email")
-
         mock_db_execute = mocker.patch("sqlalchemy.ext.asyncio.AsyncSession.execute")
         mock_db_execute.side_effect = Exception("Unexpected database error")
 
@@ -125,13 +119,10 @@ class TestUserRegistration:
         )
 
     @pytest.mark.asyncio
-    async def test_register_user_email_service_failure_with_logging(
-        self, client, mocker, caplog
-    ):
-        """Test that email service failure is properly logged but doesn't break registration."""
-        # Mock the email service to fail
-        mock_send_email = mocker.patch(
-            "app.api.v1.registration.send_verification_email",
+    async def test_register_user_does_not_call_email_provider(self, client, mocker):
+        """Registration only queues the email, so a Resend outage cannot slow or fail it."""
+        mock_post = mocker.patch(
+            "app.api.services.email_service._post_to_resend",
             side_effect=Exception("Email service unavailable"),
         )
 
@@ -145,40 +136,41 @@ class TestUserRegistration:
             },
         )
 
-        # Registration should still succeed even if email fails
         assert response.status_code == status.HTTP_201_CREATED
         data = response.json()
         assert "access_token" in data
         assert "user_id" in data
 
-        # Verify email service was called
-        mock_send_email.assert_called_once()
+        mock_post.assert_not_called()
+        assert len(await get_queued_emails("email_verification")) == 1
 
     @pytest.mark.asyncio
-    async def test_register_user_email_service_exception(self, client, mocker):
-        """Test user registration when the email service fails."""
+    async def test_register_user_email_queue_failure_rolls_back(self, client, mocker):
+        """The user and its verification email commit together or not at all."""
+        email = "email-service-fail@example.com"
         mocker.patch(
-            "app.api.v1.registration.send_verification_email",
-            side_effect=Exception("Email service down"),
+            "app.api.v1.registration.build_verification_email",
+            side_effect=Exception("Email build failed"),
         )
 
         response = await client.post(
             f"{REGISTRATION_PREFIX}",
             json={
-                "user_email": "email-service-fail@example.com",
+                "user_email": email,
                 "user_password": "TestPass123!@",
                 "user_first_name": "Test",
                 "user_country_code": "GB",
             },
         )
-        # The user should still be created, and a token returned.
-        assert response.status_code == status.HTTP_201_CREATED
-        assert "access_token" in response.json()
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+
+        async with TestingSessionLocal() as session:
+            result = await session.execute(select(User).where(User.user_email == email))
+            assert result.scalar_one_or_none() is None
 
     @pytest.mark.asyncio
     async def test_register_user_general_exception(self, client, mocker):
         """Test user registration handles general exceptions during user creation."""
-        mocker.patch("app.api.v1.registration.send_verification_email")
         with patch("app.api.v1.registration.UserUnitOfWork") as mock_uow:
             mock_uow_instance = AsyncMock()
             mock_uow_instance.create_user_with_feed_days.side_effect = Exception(
@@ -203,7 +195,6 @@ class TestUserRegistration:
     @pytest.mark.asyncio
     async def test_register_user_base_application_error(self, client, mocker):
         """Test user registration with a BaseApplicationError from the UoW."""
-        mock_email_service(mocker, "app.api.v1.registration.send_verification_email")
         with patch("app.api.v1.registration.UserUnitOfWork") as mock_uow:
             mock_uow_instance = AsyncMock()
             mock_uow_instance.create_user_with_feed_days.side_effect = (
@@ -229,8 +220,6 @@ class TestUserRegistration:
     @pytest.mark.asyncio
     async def test_register_user_with_email_already_registered(self, client, mocker):
         """Test user registration when email is already registered."""
-        mock_email_service(mocker, "app.api.v1.registration.send_verification_email")
-
         # Mock database query to return an existing user
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = MagicMock()  # Existing user
@@ -255,7 +244,6 @@ class TestUserRegistration:
         self, client, mocker
     ):
         """If feed-day creation fails inside the UoW, no user row should persist."""
-        mock_email_service(mocker, "app.api.v1.registration.send_verification_email")
         email = "rollback-feed-day@example.com"
 
         mocker.patch(
@@ -284,7 +272,6 @@ class TestUserRegistration:
         self, client, seed_feed_data, mocker
     ):
         """Registration must fail closed if feeds exist but no default day is available."""
-        mock_email_service(mocker, "app.api.v1.registration.send_verification_email")
         email = "missing-default-day@example.com"
 
         response = await client.post(
@@ -302,16 +289,13 @@ class TestUserRegistration:
         async with TestingSessionLocal() as session:
             result = await session.execute(select(User).where(User.user_email == email))
             assert result.scalar_one_or_none() is None
+        assert await get_queued_emails() == []
 
 
 class TestEmailVerification:
     @pytest.mark.asyncio
     async def test_verify_email(self, client, mocker):
         """Test verifying a user's email."""
-        mock_send_email = mock_email_service(
-            mocker, "app.api.v1.registration.send_verification_email"
-        )
-
         user_data = {
             "user_email": "verify@example.com",
             "user_password": "SecurePass123!",
@@ -337,17 +321,12 @@ class TestEmailVerification:
         assert verify_response.status_code == status.HTTP_200_OK
         assert verify_response.json()["message"] == "Email verified successfully"
 
-        mock_send_email.assert_called_once_with(
-            user_email=user_data["user_email"], user_id=user_id
-        )
+        queued = await get_queued_emails("email_verification")
+        assert [email.payload["to"] for email in queued] == [user_data["user_email"]]
 
     @pytest.mark.asyncio
     async def test_verify_email_from_reset_flow(self, client, mocker):
         """Test verifying email with fromReset=true returns specific message."""
-        mock_send_email = mock_email_service(
-            mocker, "app.api.v1.registration.send_password_reset_email"
-        )
-
         user_data = {
             "user_email": "verify-reset@example.com",
             "user_password": "SecurePass123!",
@@ -368,7 +347,8 @@ class TestEmailVerification:
         assert verify_response.status_code == status.HTTP_200_OK
         assert "You can now reset your password" in verify_response.json()["message"]
 
-        mock_send_email.assert_called_once()
+        queued = await get_queued_emails("password_reset")
+        assert [email.payload["to"] for email in queued] == [user_data["user_email"]]
 
     @pytest.mark.asyncio
     async def test_verify_email_invalid_token_format(self, client):
@@ -402,10 +382,6 @@ class TestEmailVerification:
     @pytest.mark.asyncio
     async def test_verify_email_invalid_user(self, client, mocker):
         """Test verifying an email for a non-existent user."""
-        mock_send_email = mock_email_service(
-            mocker, "app.api.v1.registration.send_verification_email"
-        )
-
         # Create a valid token for a non-existent user ID
         invalid_user_id = "00000000-0000-0000-0000-000000000000"
         invalid_token = create_token(user_id=invalid_user_id)
@@ -415,7 +391,7 @@ class TestEmailVerification:
             json={"token": invalid_token},
         )
         assert response.status_code == status.HTTP_404_NOT_FOUND
-        mock_send_email.assert_not_called()
+        assert await get_queued_emails() == []
 
     @pytest.mark.asyncio
     async def test_verify_email_user_not_found_patch(self, client, mocker):
@@ -471,10 +447,6 @@ class TestEmailVerification:
     @pytest.mark.asyncio
     async def test_verify_email_from_password_reset_query_param(self, client, mocker):
         """Test email verification with fromReset in request body."""
-        mock_send_email = mock_email_service(
-            mocker, "app.api.v1.registration.send_password_reset_email"
-        )
-
         user_data = {
             "user_email": "reset-verify@example.com",
             "user_password": "SecurePass123!",
@@ -495,4 +467,5 @@ class TestEmailVerification:
         assert verify_response.status_code == status.HTTP_200_OK
         assert "You can now reset your password" in verify_response.json()["message"]
 
-        mock_send_email.assert_called_once()
+        queued = await get_queued_emails("password_reset")
+        assert [email.payload["to"] for email in queued] == [user_data["user_email"]]
@@ -7,6 +7,7 @@ import pytest
 from app.api.core.auth_utils import create_token
 from app.api.core.config import settings
 from app.api.middleware.exception_handler import BaseApplicationError
+from tests.test_helpers import get_queued_emails
 
 AUTH_PREFIX = f"{settings.API_PREFIX}/auth"
 USER_PREFIX = f"{settings.API_PREFIX}/users"
@@ -80,14 +81,16 @@ class TestPasswordReset:
             "sqlalchemy.ext.asyncio.AsyncSession.execute",
             AsyncMock(return_value=mock_result),
         )
-        send_ver = mocker.patch("app.api.v1.auth.send_verification_email")
         resp = await client.post(
             f"{AUTH_PREFIX}/password-resets",
             json={"user_email": "unverified@example.com"},
         )
         assert resp.status_code == 200
         assert "verification email has been sent" in resp.json()["message"].lower()
-        send_ver.assert_called_once()
+        mocker.stopall()
+        queued = await get_queued_emails("email_verification")
+        assert [email.payload["to"] for email in queued] == ["unverified@example.com"]
+        assert "fromReset=true" in queued[0].payload["text"]
 
     @pytest.mark.asyncio
     async def test_request_password_reset_verified_success(self, client, mocker):
@@ -7,10 +7,12 @@ from fastapi.testclient import TestClient
 
 from app.api.core.config import settings
 from app.api.middleware.exception_handler import ResourceNotFoundError
+from app.api.models.grow_guide.variety_model import Variety
 from app.api.schemas.user.user_active_varieties_schema import (
     ActiveVarietySummary,
     UserActiveVarietyRead,
 )
+from tests.testing_db import TestingSessionLocal
 
 PREFIX = settings.API_PREFIX
 
@@ -183,3 +185,93 @@ class TestUserActiveVarietiesIntegration:
         assert over_resp.status_code in {200, 429}
         if over_resp.status_code == 429:
             assert "per 1 minute" in over_resp.text
+
+
+@pytest.fixture
+async def owned_varieties(seed_variety_data):
+    """Clone the seeded variety so the user owns several, keyed by name."""
+    async with TestingSessionLocal() as session:
+        source = await session.get(Variety, seed_variety_data["variety_id"])
+        columns = {
+            column.key: getattr(source, column.key)
+            for column in Variety.__table__.columns
+            if column.key not in ("variety_id", "variety_name", "last_updated")
+        }
+        ids = {"Test Tomato": str(seed_variety_data["variety_id"])}
+        for name in ("Bean", "Pea"):
+            variety_id = uuid.uuid4()
+            session.add(Variety(variety_id=variety_id, variety_name=name, **columns))
+            ids[name] = str(variety_id)
+        await session.commit()
+    return ids
+
+
+class TestBulkActiveVarieties:
+    """Activating and deactivating several varieties in one request."""
+
+    URL = f"{PREFIX}/users/active-varieties/bulk"
+
+    @staticmethod
+    def _active_names(response):
+        return sorted(
+            av["variety"]["variety_name"] for av in response.json()["active_varieties"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_activates_and_deactivates_returning_final_set(
+        self, client, integration_auth_headers, owned_varieties
+    ):
+        first = await client.post(
+            self.URL,
+            json={"activate": list(owned_varieties.values())},
+            headers=integration_auth_headers,
+        )
+        second = await client.post(
+            self.URL,
+            json={
+                "activate": [owned_varieties["Pea"]],
+                "deactivate": [owned_varieties["Bean"], owned_varieties["Test Tomato"]],
+            },
+            headers=integration_auth_headers,
+        )
+        listed = await client.get(
+            f"{PREFIX}/users/active-varieties", headers=integration_auth_headers
+        )
+
+        assert first.status_code == 200
+        assert self._active_names(first) == ["Bean", "Pea", "Test Tomato"]
+        assert second.status_code == 200
+        assert self._active_names(second) == ["Pea"]
+        assert self._active_names(listed) == ["Pea"]
+
+    @pytest.mark.asyncio
+    async def test_unowned_variety_activates_nothing(
+        self, client, integration_auth_headers, owned_varieties
+    ):
+        response = await client.post(
+            self.URL,
+            json={"activate": [owned_varieties["Bean"], str(uuid.uuid4())]},
+            headers=integration_auth_headers,
+        )
+        listed = await client.get(
+            f"{PREFIX}/users/active-varieties", headers=integration_auth_headers
+        )
+
+        assert response.status_code == 404
+        assert listed.json()["active_varieties"] == []
+
+    @pytest.mark.asyncio
+    async def test_rejects_empty_and_overlapping_requests(
+        self, client, integration_auth_headers
+    ):
+        variety_id = str(uuid.uuid4())
+
+        empty = await client.post(self.URL, json={}, headers=integration_auth_headers)
+        overlapping = await client.post(
+            self.URL,
+            json={"activate": [variety_id], "deactivate": [variety_id]},
+            headers=integration_auth_headers,
+        )
+
+        assert empty.status_code == 422
+        assert overlapping.status_code == 422
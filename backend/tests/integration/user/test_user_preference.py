@@ -12,7 +12,6 @@ from app.api.schemas.user.user_preference_schema import (
     FeedRead,
     UserPreferencesRead,
 )
-from tests.test_helpers import mock_email_service
 
 PREFIX = settings.API_PREFIX
 
@@ -89,7 +88,6 @@ class TestUserPreferenceIntegration:
     ):
         """Test updating user feed preference with invalid data."""
         # Create a user and get a real token
-        mock_email_service(mocker, "app.api.v1.registration.send_verification_email")
         reg_resp = await client.post(
             f"{PREFIX}/registration",
             json={
@@ -125,7 +123,6 @@ class TestUserPreferenceIntegration:
     ):
         """Test update when the updated preference is not found in results (edge case)."""
         # Create a user and get a real token
-        mock_email_service(mocker, "app.api.v1.registration.send_verification_email")
         reg_resp = await client.post(
             f"{PREFIX}/registration",
             json={
@@ -157,7 +154,6 @@ class TestUserPreferenceIntegration:
     ):
         """Test getting user preferences when no preferences exist."""
         # Create a user and get a real token
-        mock_email_service(mocker, "app.api.v1.registration.send_verification_email")
         reg_resp = await client.post(
             f"{PREFIX}/registration",
             json={
@@ -190,7 +186,6 @@ class TestUserPreferenceIntegration:
     ):
         """Test updating user feed preference with invalid feed ID format."""
         # Create a user and get a real token
-        mock_email_service(mocker, "app.api.v1.registration.send_verification_email")
         reg_resp = await client.post(
             f"{PREFIX}/registration",
             json={
@@ -265,3 +260,41 @@ class TestUserPreferenceIntegration:
         if over_resp.status_code == 429:
             # slowapi default detail format like {"detail":"10 per 1 minute"}
             assert "per 1 minute" in over_resp.text
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_buckets_are_per_user(
+        self, client: TestClient, register_user
+    ):
+        """Users sharing one client IP are limited on their own token subject."""
+        from app.api.core.limiter import limiter
+
+        first_user = await register_user("pref_rl_a")
+        second_user = await register_user("pref_rl_b")
+        mock_prefs = UserPreferencesRead(
+            user_feed_days=[], available_feeds=[], available_days=[]
+        )
+        with patch(
+            "app.api.services.user.user_preferences_unit_of_work.UserPreferencesUnitOfWork.get_user_preferences",
+            return_value=mock_prefs,
+        ):
+            original = limiter.enabled
+            limiter.enabled = True
+            limiter._storage.reset()
+            try:
+                first_statuses = [
+                    (
+                        await client.get(
+                            f"{PREFIX}/users/preferences", headers=first_user
+                        )
+                    ).status_code
+                    for _ in range(11)
+                ]
+                second_resp = await client.get(
+                    f"{PREFIX}/users/preferences", headers=second_user
+                )
+            finally:
+                limiter._storage.reset()
+                limiter.enabled = original
+
+        assert first_statuses == [200] * 10 + [429]
+        assert second_resp.status_code == 200
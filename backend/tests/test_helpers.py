@@ -2,7 +2,12 @@
 Test Helper Functions and Utilities
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import select
+
+from app.api.models import EmailOutbox
+from tests.testing_db import TestingSessionLocal
 
 
 def validate_user_response_schema(user_data: Dict[str, Any]) -> None:
@@ -60,6 +65,15 @@ def mock_email_service(mocker, email_service_path: str, success: bool = True):
     return mock_send
 
 
+async def get_queued_emails(email_kind: Optional[str] = None) -> List[EmailOutbox]:
+    """Return emails waiting in the outbox, optionally filtered by kind."""
+    query = select(EmailOutbox).order_by(EmailOutbox.created_at)
+    if email_kind is not None:
+        query = query.where(EmailOutbox.email_kind == email_kind)
+    async with TestingSessionLocal() as session:
+        return list((await session.execute(query)).scalars().all())
+
+
 def build_user_stub(
     mocker,
     user_id: Optional[str] = None,
@@ -515,6 +515,82 @@ class TestGrowGuideUnitOfWorkVarietyCRUD:
             "uow_get_public_varieties", request_id=uow.request_id
         )
 
+    async def test_get_public_varieties_page_returns_next_cursor(self, uow):
+        """A full page plus one extra row yields a cursor at the page's last row."""
+        varieties = [
+            make_variety(
+                uuid.uuid4(),
+                variety_id=uuid.uuid4(),
+                variety_name=name,
+                is_public=True,
+            )
+            for name in ("A", "B", "C")
+        ]
+        uow.variety_repo.get_public_varieties_page.return_value = varieties
+
+        page, next_cursor = await uow.get_public_varieties_page(2)
+
+        assert page == varieties[:2]
+        uow.variety_repo.get_public_varieties_page.assert_called_once_with(3, None)
+
+        uow.variety_repo.get_public_varieties_page.return_value = varieties[2:]
+        page, last_cursor = await uow.get_public_varieties_page(2, next_cursor)
+
+        assert page == varieties[2:]
+        assert last_cursor is None
+        uow.variety_repo.get_public_varieties_page.assert_called_with(
+            3, ("B", varieties[1].variety_id)
+        )
+
+    async def test_iter_public_variety_batches_stops_on_short_batch(self, uow):
+        """Batches continue after the last key until a batch comes back short."""
+        first = [make_variety(uuid.uuid4(), variety_name=n) for n in ("A", "B")]
+        second = [make_variety(uuid.uuid4(), variety_name="C")]
+        uow.variety_repo.get_public_varieties_page.side_effect = [first, second]
+
+        batches = [batch async for batch in uow.iter_public_variety_batches(2)]
+
+        assert batches == [first, second]
+        calls = uow.variety_repo.get_public_varieties_page.call_args_list
+        assert calls[1].args == (2, ("B", first[1].variety_id))
+
+    async def test_search_public_varieties_uses_database_on_postgres(self, uow):
+        """With pg_trgm available the repository does the ranking."""
+        uow.variety_repo.supports_trigram_search = True
+        uow.variety_repo.search_public_varieties.return_value = ["result"]
+
+        result = await uow.search_public_varieties("tom", limit=5, offset=10)
+
+        assert result == ["result"]
+        uow.variety_repo.search_public_varieties.assert_called_once_with(
+            "tom", None, None, 5, 10
+        )
+        uow.variety_repo.get_public_variety_search_rows.assert_not_called()
+
+    async def test_search_public_varieties_pages_in_memory_index(self, uow):
+        """Elsewhere the in-memory index ranks and the page is loaded by id."""
+        family_id, lifecycle_id = uuid.uuid4(), uuid.uuid4()
+        varieties = [
+            make_variety(uuid.uuid4(), variety_id=uuid.uuid4(), variety_name=name)
+            for name in ("Tomato", "Cherry Tomato", "Beefsteak Tomato")
+        ]
+        uow.variety_repo.supports_trigram_search = False
+        uow.variety_repo.get_public_catalogue_signature.return_value = (3, None)
+        uow.variety_repo.get_public_variety_search_rows.return_value = [
+            (v.variety_id, v.variety_name, family_id, lifecycle_id) for v in varieties
+        ]
+        uow.variety_repo.get_public_varieties_by_ids.return_value = list(
+            reversed(varieties)
+        )
+
+        result = await uow.search_public_varieties("tomato", limit=2, offset=1)
+
+        assert [v.variety_name for v in result] == [
+            "Cherry Tomato",
+            "Beefsteak Tomato",
+        ]
+        uow.variety_repo.search_public_varieties.assert_not_called()
+
     async def test_update_variety_success(self, uow, user_id, mocker):
         """Test successful variety update."""
         mock_logger = mocker.patch(
@@ -629,17 +705,16 @@ class TestGrowGuideUnitOfWorkVarietyCRUD:
         uow.variety_repo.get_default_day_ids_for_frequency.return_value = (
             default_day_ids
         )
-        water_days = [AsyncMock()]
-        mock_factory.create_water_days.return_value = water_days
 
         result = await uow.update_variety(variety_id, variety_data, user_id)
         assert result == updated_variety
-        uow.variety_repo.delete_water_days.assert_called_once_with(variety_id)
         uow.variety_repo.get_default_day_ids_for_frequency.assert_called_once_with(
             new_freq
         )
-        mock_factory.create_water_days.assert_called_once()
-        uow.variety_repo.create_water_days.assert_called_once_with(water_days)
+        uow.variety_repo.sync_water_days.assert_called_once_with(
+            updated_variety, default_day_ids
+        )
+        uow.variety_repo.create_water_days.assert_not_called()
 
     async def test_delete_variety_success(self, uow, user_id, mocker):
         """Test successful variety deletion."""
@@ -712,6 +787,65 @@ class TestGrowGuideUnitOfWorkVarietyCRUD:
         with pytest.raises(ResourceNotFoundError):
             await uow.copy_public_variety_to_user(uuid.uuid4(), user_id)
 
+    async def test_copy_public_varieties_names_in_memory_and_inserts_in_bulk(
+        self, uow, user_id, mocker
+    ):
+        """One name scan covers every copy; writes go through the bulk methods."""
+        mocker.patch("app.api.services.grow_guide.grow_guide_unit_of_work.log_timing")
+        frequency_id, day_id = uuid.uuid4(), uuid.uuid4()
+        sources = [
+            make_variety(
+                uuid.uuid4(),
+                variety_id=uuid.uuid4(),
+                variety_name=name,
+                water_frequency_id=frequency_id,
+                is_public=True,
+            )
+            for name in ("Bean", "Bean", "Pea")
+        ]
+        uow.variety_repo.get_public_varieties_for_copying.return_value = sources
+        uow.variety_repo.get_user_variety_names.return_value = ["Bean", "Bean (copy)"]
+        uow.variety_repo.get_default_day_ids_for_frequencies.return_value = {
+            frequency_id: [day_id]
+        }
+
+        async def assign_ids(copies):
+            for copy in copies:
+                copy.variety_id = uuid.uuid4()
+
+        uow.variety_repo.create_varieties.side_effect = assign_ids
+        uow.variety_repo.get_user_varieties.side_effect = lambda user, ids: [
+            mocker.Mock(variety_id=vid) for vid in reversed(ids)
+        ]
+
+        result = await uow.copy_public_varieties_to_user(
+            [s.variety_id for s in sources], user_id
+        )
+
+        copies = uow.variety_repo.create_varieties.call_args.args[0]
+        assert [c.variety_name for c in copies] == [
+            "Bean (copy 2)",
+            "Bean (copy 3)",
+            "Pea",
+        ]
+        assert all(c.owner_user_id == user_id and not c.is_public for c in copies)
+        uow.variety_repo.insert_water_days.assert_called_once_with(
+            [(c.variety_id, day_id) for c in copies]
+        )
+        assert [r.variety_id for r in result] == [c.variety_id for c in copies]
+
+    async def test_copy_public_varieties_unknown_id_fails_before_writing(
+        self, uow, user_id, mocker
+    ):
+        """A missing or private source raises before anything is created."""
+        mocker.patch("app.api.services.grow_guide.grow_guide_unit_of_work.log_timing")
+        uow.variety_repo.get_public_varieties_for_copying.return_value = []
+
+        with pytest.raises(ResourceNotFoundError):
+            await uow.copy_public_varieties_to_user([uuid.uuid4()], user_id)
+
+        uow.variety_repo.create_varieties.assert_not_called()
+
 
 class TestGrowGuideUnitOfWorkInitialization:
     """Test the initialization and repository setup."""
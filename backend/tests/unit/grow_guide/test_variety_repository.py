@@ -2,11 +2,31 @@
 Test Variety Repository
 """
 
+from contextlib import contextmanager
+
 import pytest
+from sqlalchemy import event
 
+from app.api.models.grow_guide.variety_model import VarietyWaterDay
+from app.api.models.user.user_model import UserActiveVariety
 from app.api.repositories.grow_guide.variety_repository import VarietyRepository
 from tests.test_helpers import make_variety
-from tests.testing_db import TestingSessionLocal
+from tests.testing_db import TestingSessionLocal, engine
+
+
+@contextmanager
+def _recorded_statements():
+    """Collect the SQL statements executed on the test engine."""
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
 
 
 class TestVarietyRepository:
@@ -108,8 +128,163 @@ class TestVarietyRepository:
             user_id = uuid.UUID(user_in_database["user_id"])
             varieties = await repo.get_user_varieties(user_id)
 
-            assert len(varieties) >= 1
-            assert all(v.owner_user_id == user_id for v in varieties)
+            assert [v.variety_id for v in varieties] == [
+                seed_variety_data["variety_id"]
+            ]
+            assert varieties[0].family.family_name
+            assert varieties[0].lifecycle.lifecycle_name
+            assert varieties[0].is_active is False
+
+    @pytest.mark.asyncio
+    async def test_get_user_varieties_marks_active(
+        self, user_in_database, seed_variety_data
+    ):
+        """Varieties the user has activated come back with is_active set."""
+        import uuid
+
+        user_id = uuid.UUID(user_in_database["user_id"])
+        async with TestingSessionLocal() as db:
+            db.add(
+                UserActiveVariety(
+                    user_id=user_id, variety_id=seed_variety_data["variety_id"]
+                )
+            )
+            await db.commit()
+
+            varieties = await VarietyRepository(db).get_user_varieties(user_id)
+
+            assert [v.is_active for v in varieties] == [True]
+
+    @pytest.mark.asyncio
+    async def test_get_variety_by_id_is_one_statement(
+        self, user_in_database, seed_variety_data, seed_day_data
+    ):
+        """Detail, reference data, water days and is_active load in one query."""
+        import uuid
+
+        user_id = uuid.UUID(user_in_database["user_id"])
+        variety_id = seed_variety_data["variety_id"]
+        async with TestingSessionLocal() as db:
+            db.add(UserActiveVariety(user_id=user_id, variety_id=variety_id))
+            db.add_all(
+                VarietyWaterDay(variety_id=variety_id, day_id=day["id"])
+                for day in seed_day_data[:2]
+            )
+            await db.commit()
+
+        async with TestingSessionLocal() as db:
+            with _recorded_statements() as statements:
+                variety = await VarietyRepository(db).get_variety_by_id(
+                    variety_id, user_id
+                )
+
+        assert len(statements) == 1
+        assert variety.is_active is True
+        assert variety.family.family_name
+        assert variety.water_frequency.frequency_name
+        assert sorted(wd.day.day_number for wd in variety.water_days) == [
+            day["day_number"] for day in seed_day_data[:2]
+        ]
+
+    @pytest.mark.asyncio
+    async def test_update_variety_returns_last_updated_without_refresh(
+        self, user_in_database, seed_variety_data
+    ):
+        """The UPDATE brings back last_updated itself; no follow-up SELECT."""
+        import uuid
+
+        user_id = uuid.UUID(user_in_database["user_id"])
+        async with TestingSessionLocal() as db:
+            repo = VarietyRepository(db)
+            variety = await repo.get_variety_by_id(
+                seed_variety_data["variety_id"], user_id
+            )
+            variety.variety_name = "Renamed Tomato"
+
+            with _recorded_statements() as statements:
+                updated = await repo.update_variety(variety)
+                assert updated.last_updated is not None
+
+            assert len(statements) == 1
+            assert statements[0].lstrip().upper().startswith("UPDATE")
+            assert "RETURNING" in statements[0].upper()
+
+    @pytest.mark.asyncio
+    async def test_sync_water_days_writes_only_the_difference(
+        self, user_in_database, seed_variety_data, seed_day_data
+    ):
+        """Kept days are untouched; dropped and added days are one statement each."""
+        import uuid
+
+        user_id = uuid.UUID(user_in_database["user_id"])
+        variety_id = seed_variety_data["variety_id"]
+        monday, tuesday, wednesday, thursday = (d["id"] for d in seed_day_data[:4])
+        async with TestingSessionLocal() as db:
+            db.add_all(
+                VarietyWaterDay(variety_id=variety_id, day_id=day_id)
+                for day_id in (monday, tuesday, wednesday)
+            )
+            await db.commit()
+
+        async with TestingSessionLocal() as db:
+            repo = VarietyRepository(db)
+            variety = await repo.get_variety_by_id(variety_id, user_id)
+
+            with _recorded_statements() as statements:
+                await repo.sync_water_days(variety, [tuesday, wednesday, thursday])
+
+            assert [s.lstrip().split()[0].upper() for s in statements] == [
+                "DELETE",
+                "INSERT",
+            ]
+            reloaded = await repo.get_variety_by_id(variety_id, user_id)
+            assert {wd.day_id for wd in reloaded.water_days} == {
+                tuesday,
+                wednesday,
+                thursday,
+            }
+
+            with _recorded_statements() as statements:
+                await repo.sync_water_days(reloaded, [thursday, wednesday, tuesday])
+
+            assert statements == []
+
+    @pytest.mark.asyncio
+    async def test_bulk_copy_writes_are_one_insert_per_table(
+        self, user_in_database, seed_public_variety_data, seed_day_data
+    ):
+        """create_varieties and insert_water_days batch their rows."""
+        import uuid
+
+        user_id = uuid.UUID(user_in_database["user_id"])
+        async with TestingSessionLocal() as db:
+            repo = VarietyRepository(db)
+            (source,) = await repo.get_public_varieties_for_copying(
+                [seed_public_variety_data["variety_id"]]
+            )
+            copies = [
+                make_variety(
+                    user_id,
+                    variety_name=f"Copy {i}",
+                    family_id=source.family_id,
+                    lifecycle_id=source.lifecycle_id,
+                )
+                for i in range(3)
+            ]
+
+            with _recorded_statements() as statements:
+                await repo.create_varieties(copies)
+                await repo.insert_water_days(
+                    [(c.variety_id, d["id"]) for c in copies for d in seed_day_data]
+                )
+
+            assert [s.lstrip().split()[0].upper() for s in statements] == [
+                "INSERT",
+                "INSERT",
+            ]
+            assert all(c.last_updated is not None for c in copies)
+            names = await repo.get_user_variety_names(user_id)
+            assert sorted(names) == ["Copy 0", "Copy 1", "Copy 2"]
 
     @pytest.mark.asyncio
     async def test_get_public_varieties(self, seed_public_variety_data):
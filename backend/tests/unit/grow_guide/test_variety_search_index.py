@@ -0,0 +1,102 @@
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.api.services.grow_guide.variety_search_index import (
+    VarietySearchIndex,
+    VarietySearchIndexCache,
+    trigrams,
+)
+
+FAMILY_A = uuid.uuid4()
+FAMILY_B = uuid.uuid4()
+ANNUAL = uuid.uuid4()
+PERENNIAL = uuid.uuid4()
+
+
+def _rows(*specs):
+    return [
+        (uuid.uuid4(), name, family, lifecycle) for name, family, lifecycle in specs
+    ]
+
+
+@pytest.fixture
+def catalogue():
+    rows = _rows(
+        ("Cherry Tomato", FAMILY_A, ANNUAL),
+        ("Tomato", FAMILY_A, ANNUAL),
+        ("Tomatillo", FAMILY_A, PERENNIAL),
+        ("Beefsteak Tomato", FAMILY_A, ANNUAL),
+        ("Potato", FAMILY_B, ANNUAL),
+        ("Sweet Pea", FAMILY_B, ANNUAL),
+    )
+    names = {row[0]: row[1] for row in rows}
+    return VarietySearchIndex(rows), names
+
+
+def _names(index_and_names, query, **filters):
+    index, names = index_and_names
+    return [names[vid] for vid in index.search(query, **filters)]
+
+
+def test_trigrams_are_padded_like_pg_trgm():
+    assert trigrams("pea") == frozenset({"  p", " pe", "pea", "ea "})
+
+
+def test_ranks_exact_then_word_prefix_then_similar(catalogue):
+    assert _names(catalogue, "tomato") == [
+        "Tomato",
+        "Cherry Tomato",
+        "Beefsteak Tomato",
+        "Tomatillo",
+    ]
+
+
+def test_prefix_matches_rank_above_word_prefixes(catalogue):
+    results = _names(catalogue, "tomat")
+
+    assert results[:2] == ["Tomato", "Tomatillo"]
+    assert set(results[2:]) == {"Beefsteak Tomato", "Cherry Tomato"}
+
+
+def test_misspelt_query_finds_similar_names(catalogue):
+    assert _names(catalogue, "tomatoe")[0] == "Tomato"
+
+
+def test_short_query_matches_substrings(catalogue):
+    assert _names(catalogue, "pe") == ["Sweet Pea"]
+
+
+def test_filters_by_family_and_lifecycle(catalogue):
+    assert _names(catalogue, "tomat", lifecycle_id=PERENNIAL) == ["Tomatillo"]
+    assert _names(catalogue, "potato", family_id=FAMILY_A) == []
+    assert _names(catalogue, "potato", family_id=FAMILY_B) == ["Potato"]
+
+
+def test_blank_query_matches_nothing(catalogue):
+    assert _names(catalogue, "   ") == []
+
+
+@pytest.mark.asyncio
+async def test_cache_rebuilds_only_when_signature_changes():
+    cache = VarietySearchIndexCache()
+    load_rows = AsyncMock(return_value=_rows(("Tomato", FAMILY_A, ANNUAL)))
+    signature = (1, datetime(2026, 1, 1, tzinfo=timezone.utc))
+
+    first = await cache.get(signature, load_rows)
+    second = await cache.get(signature, load_rows)
+    third = await cache.get((2, signature[1]), load_rows)
+
+    assert first is second
+    assert third is not first
+    assert load_rows.await_count == 2
+
+
+def test_mid_word_substrings_match_without_shared_trigrams(catalogue):
+    assert _names(catalogue, "ee") == ["Sweet Pea", "Beefsteak Tomato"]
+
+
+def test_limit_keeps_best_matches(catalogue):
+    assert _names(catalogue, "tomato", limit=2) == ["Tomato", "Cherry Tomato"]
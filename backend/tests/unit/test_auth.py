@@ -94,10 +94,18 @@ class TestAuthUtilsCoverage:
             return_value=types.SimpleNamespace(scalar_one_or_none=lambda: user)
         )
         mocker.patch("app.api.core.auth_utils.verify_password", return_value=True)
+        mocker.patch("app.api.core.auth_utils._is_argon2_hash", return_value=True)
+        mocker.patch(
+            "app.api.core.auth_utils._needs_password_rehash", return_value=False
+        )
+        buffer = mocker.patch("app.api.core.auth_utils.get_user_activity_buffer")
         db.commit = mocker.AsyncMock()
         db.refresh = mocker.AsyncMock()
         result = await auth_utils.authenticate_user(db, "e", "pw")
         assert result == user
+        buffer.return_value.record.assert_called_once_with(user.user_id)
+        db.commit.assert_not_awaited()
+        db.refresh.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_authenticate_user_uppercase_email_success(self, mocker):
@@ -150,6 +158,7 @@ class TestAuthUtilsCoverage:
 
         assert result == user
         assert user.user_password_hash.startswith("$argon2id$")
+        db.commit.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_authenticate_user_exception(self, mocker):
@@ -239,6 +248,7 @@ class TestAuthUtilsCoverage:
             "app.api.core.auth_utils.validate_user_exists",
             return_value=mock_user,
         )
+        buffer = mocker.patch("app.api.core.auth_utils.get_user_activity_buffer")
 
         result = await auth_utils.get_current_user(
             authorization="Bearer tok",
@@ -246,6 +256,7 @@ class TestAuthUtilsCoverage:
         )
 
         assert result is mock_user
+        buffer.return_value.record.assert_called_once_with(mock_user.user_id)
         validate_user_exists.assert_called_once_with(
             db_session=db,
             user_model=auth_utils.User,
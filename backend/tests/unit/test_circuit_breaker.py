@@ -0,0 +1,135 @@
+from unittest.mock import patch
+
+import pytest
+
+from app.api.core import metrics as core_metrics
+from app.api.core.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
+
+
+@pytest.fixture
+def clock():
+    with patch("app.api.core.circuit_breaker.time.monotonic") as monotonic:
+        monotonic.return_value = 1000.0
+        yield monotonic
+
+
+def _breaker(**options) -> CircuitBreaker:
+    defaults = {
+        "failure_rate_threshold": 0.5,
+        "minimum_calls": 4,
+        "window_seconds": 10.0,
+        "open_seconds": 30.0,
+    }
+    return CircuitBreaker("test", **{**defaults, **options})
+
+
+def test_stays_closed_below_minimum_calls(clock):
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_failure()
+
+    assert breaker.state is CircuitState.CLOSED
+    breaker.before_call()
+
+
+def test_opens_when_failure_rate_reaches_threshold(clock):
+    breaker = _breaker()
+    breaker.record_success()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.before_call()
+    assert exc_info.value.retry_after == pytest.approx(30.0)
+
+
+def test_outcomes_outside_window_are_forgotten(clock):
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_failure()
+    clock.return_value += 11.0
+
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.snapshot()["calls_in_window"] == 1
+
+
+def test_half_open_admits_one_probe_and_closes_on_success(clock):
+    breaker = _breaker(minimum_calls=1)
+    breaker.record_failure()
+    clock.return_value += 30.0
+
+    assert breaker.state is CircuitState.HALF_OPEN
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.failure_rate == 0.0
+
+
+def test_failed_probe_reopens_breaker(clock):
+    breaker = _breaker(minimum_calls=1)
+    breaker.record_failure()
+    clock.return_value += 30.0
+    breaker.before_call()
+
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.retry_after == pytest.approx(30.0)
+
+
+def test_lost_probe_is_replaced_after_cool_down(clock):
+    breaker = _breaker(minimum_calls=1)
+    breaker.record_failure()
+    clock.return_value += 30.0
+    breaker.before_call()
+    clock.return_value += 30.0
+
+    breaker.before_call()
+
+
+def test_raise_if_open_does_not_take_probe(clock):
+    breaker = _breaker(minimum_calls=1)
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.raise_if_open()
+    clock.return_value += 30.0
+
+    breaker.raise_if_open()
+    breaker.before_call()
+
+
+def test_snapshot_and_transition_metrics(clock):
+    breaker = CircuitBreaker("test-snapshot", minimum_calls=1)
+    assert breaker.snapshot() == {
+        "state": "closed",
+        "failure_rate": 0.0,
+        "calls_in_window": 0,
+    }
+
+    breaker.record_failure()
+
+    assert breaker.snapshot() == {
+        "state": "open",
+        "failure_rate": 1.0,
+        "calls_in_window": 1,
+        "retry_after": 30.0,
+    }
+    text = core_metrics.render_prometheus_text()
+    assert (
+        'app_circuit_breaker_transitions_total{breaker="test-snapshot",state="open"} 1'
+        in text
+    )
@@ -4,47 +4,50 @@ import httpx
 import pytest
 from fastapi import HTTPException
 
+from app.api.core.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.api.core.config import settings
 from app.api.services.email_service import (
-    _EMAIL_SEND_TIMESTAMPS,
     _fetch_inbound_email_content,
+    _post_to_resend,
     _rate_limit_window,
     _send_email_with_retry,
+    build_password_reset_email,
+    build_verification_email,
+    build_verification_emails,
     forward_inbound_email,
-    send_password_reset_email,
-    send_verification_email,
+    get_email_circuit_breaker,
+    get_email_send_limiter,
 )
 
 
+def _open_breaker(minimum_calls: int = 1) -> CircuitBreaker:
+    breaker = CircuitBreaker("test-resend", minimum_calls=minimum_calls)
+    for _ in range(minimum_calls):
+        breaker.record_failure()
+    return breaker
+
+
 @pytest.mark.asyncio
 class TestEmailServiceInternals:
-    async def test_rate_limit_window(self):
-        # Clear existing timestamps
-        _EMAIL_SEND_TIMESTAMPS.clear()
-
-        # Mock time.monotonic to simulate rapid requests
-        with patch("time.monotonic") as mock_time:
-            # Provide enough values for multiple calls
-            # Each call to _rate_limit_window calls monotonic() at least twice (start and end of loop check)
-            # plus potentially more if it sleeps.
-            # Let's use a side_effect function to just increment time
-            mock_time.side_effect = [100.0 + i * 0.1 for i in range(20)]
-
-            # First call - should pass
-            await _rate_limit_window(max_per_sec=2)
-            assert len(_EMAIL_SEND_TIMESTAMPS) == 1
-
-            # Second call - should pass
-            await _rate_limit_window(max_per_sec=2)
-            assert len(_EMAIL_SEND_TIMESTAMPS) == 2
-
-            # Third call - should trigger sleep
-            with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-                await _rate_limit_window(max_per_sec=2)
-                mock_sleep.assert_called_once()
+    async def test_rate_limit_window_uses_shared_send_limiter(self):
+        mock_limiter = MagicMock()
+        mock_limiter.acquire = AsyncMock(return_value=0.0)
+        with patch(
+            "app.api.services.email_service.get_email_send_limiter",
+            return_value=mock_limiter,
+        ):
+            await _rate_limit_window()
+        mock_limiter.acquire.assert_awaited_once()
+
+    async def test_email_send_limiter_built_from_settings(self):
+        limiter = get_email_send_limiter()
+        assert limiter is get_email_send_limiter()
+        assert limiter.rate == settings.EMAIL_SEND_RATE_PER_SECOND
+        assert limiter.burst == settings.EMAIL_SEND_BURST
 
     async def test_send_email_with_retry_success(self):
         params = {"to": "test@example.com", "subject": "test"}
-        with patch("httpx.AsyncClient") as mock_client_cls:
+        with patch("app.api.services.email_service.get_http_client") as mock_get_client:
             mock_client = MagicMock()
             mock_client.post = AsyncMock()
 
@@ -53,16 +56,14 @@ class TestEmailServiceInternals:
             mock_response.json.return_value = {"id": "123"}
             mock_client.post.return_value = mock_response
 
-            mock_instance = mock_client_cls.return_value
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
+            mock_get_client.return_value = mock_client
 
             result = await _send_email_with_retry(params)
             assert result == {"id": "123"}
 
     async def test_send_email_with_retry_retryable_failure_then_success(self):
         params = {"to": "test@example.com", "subject": "test"}
-        with patch("httpx.AsyncClient") as mock_client_cls:
+        with patch("app.api.services.email_service.get_http_client") as mock_get_client:
             mock_client = MagicMock()
             mock_client.post = AsyncMock()
 
@@ -77,9 +78,7 @@ class TestEmailServiceInternals:
 
             mock_client.post.side_effect = [response1, response2]
 
-            mock_instance = mock_client_cls.return_value
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
+            mock_get_client.return_value = mock_client
 
             with patch("asyncio.sleep", new_callable=AsyncMock):
                 result = await _send_email_with_retry(params)
@@ -88,7 +87,7 @@ class TestEmailServiceInternals:
 
     async def test_send_email_with_retry_exhausted(self):
         params = {"to": "test@example.com", "subject": "test"}
-        with patch("httpx.AsyncClient") as mock_client_cls:
+        with patch("app.api.services.email_service.get_http_client") as mock_get_client:
             mock_client = MagicMock()
             mock_client.post = AsyncMock()
 
@@ -97,9 +96,7 @@ class TestEmailServiceInternals:
             response.text = "Server Error"
             mock_client.post.return_value = response
 
-            mock_instance = mock_client_cls.return_value
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
+            mock_get_client.return_value = mock_client
 
             with patch("asyncio.sleep", new_callable=AsyncMock):
                 with pytest.raises(RuntimeError, match="Failed to send email after"):
@@ -107,7 +104,7 @@ class TestEmailServiceInternals:
 
     async def test_send_email_with_retry_non_retryable(self):
         params = {"to": "test@example.com", "subject": "test"}
-        with patch("httpx.AsyncClient") as mock_client_cls:
+        with patch("app.api.services.email_service.get_http_client") as mock_get_client:
             mock_client = MagicMock()
             mock_client.post = AsyncMock()
 
@@ -116,57 +113,103 @@ class TestEmailServiceInternals:
             response.text = "Bad Request"
             mock_client.post.return_value = response
 
-            mock_instance = mock_client_cls.return_value
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
+            mock_get_client.return_value = mock_client
 
             with pytest.raises(RuntimeError, match="status 400"):
                 await _send_email_with_retry(params)
 
+    async def test_email_circuit_breaker_built_from_settings(self):
+        breaker = get_email_circuit_breaker()
+        assert breaker is get_email_circuit_breaker()
+        assert breaker.failure_rate_threshold == settings.EMAIL_BREAKER_FAILURE_RATE
+        assert breaker.open_seconds == settings.EMAIL_BREAKER_OPEN_SECONDS
 
-@pytest.mark.asyncio
-class TestPublicEmailFunctions:
-    async def test_send_verification_email_success(self):
+    async def test_send_email_with_retry_stops_backing_off_when_breaker_opens(self):
+        params = {"to": "test@example.com", "subject": "test"}
+        breaker = CircuitBreaker("test-resend", minimum_calls=2)
+        mock_client = MagicMock()
+        mock_client.post = AsyncMock(
+            return_value=MagicMock(status_code=503, text="Unavailable")
+        )
+        with (
+            patch(
+                "app.api.services.email_service.get_http_client",
+                return_value=mock_client,
+            ),
+            patch(
+                "app.api.services.email_service.get_email_circuit_breaker",
+                return_value=breaker,
+            ),
+            patch(
+                "app.api.services.email_service._rate_limit_window",
+                new_callable=AsyncMock,
+            ),
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            with pytest.raises(CircuitOpenError):
+                await _send_email_with_retry(params, max_attempts=5)
+
+        # Two failures open the breaker; the remaining backoff is skipped.
+        assert mock_client.post.await_count == 2
+        mock_sleep.assert_awaited_once_with(0.5)
+
+    async def test_post_to_resend_fails_fast_while_breaker_open(self):
+        mock_client = MagicMock()
+        mock_client.post = AsyncMock()
         with patch(
-            "app.api.services.email_service._send_email_with_retry",
-            new_callable=AsyncMock,
-        ) as mock_send:
-            mock_send.return_value = {"id": "123"}
-            result = await send_verification_email("test@example.com", "user123")
-            assert result == {"message": "Verification email sent successfully"}
-            mock_send.assert_called_once()
+            "app.api.services.email_service.get_email_circuit_breaker",
+            return_value=_open_breaker(),
+        ):
+            with pytest.raises(CircuitOpenError):
+                await _post_to_resend("/emails", {}, client=mock_client)
 
-    async def test_send_verification_email_failure(self):
-        with patch(
-            "app.api.services.email_service._send_email_with_retry",
-            new_callable=AsyncMock,
-        ) as mock_send:
-            mock_send.side_effect = RuntimeError("Failed")
-            with pytest.raises(HTTPException) as exc:
-                await send_verification_email("test@example.com", "user123")
-            assert exc.value.status_code == 503
+        mock_client.post.assert_not_awaited()
 
-    async def test_send_password_reset_email_success(self):
-        with patch(
-            "app.api.services.email_service._send_email_with_retry",
-            new_callable=AsyncMock,
-        ) as mock_send:
-            mock_send.return_value = {"id": "123"}
-            result = await send_password_reset_email(
-                "test@example.com", "http://reset.url"
-            )
-            assert result == {"message": "Password reset email sent successfully"}
-            mock_send.assert_called_once()
 
-    async def test_send_password_reset_email_failure(self):
-        with patch(
-            "app.api.services.email_service._send_email_with_retry",
-            new_callable=AsyncMock,
-        ) as mock_send:
-            mock_send.side_effect = Exception("Unexpected")
-            with pytest.raises(HTTPException) as exc:
-                await send_password_reset_email("test@example.com", "http://reset.url")
-            assert exc.value.status_code == 500
+@pytest.mark.asyncio
+class TestPublicEmailFunctions:
+    async def test_build_verification_email(self):
+        params = build_verification_email("test@example.com", "user123", True)
+        assert params["to"] == "test@example.com"
+        assert params["subject"] == "Email Verification Required - Allotment Service"
+        assert "/verify-email?token=" in params["text"]
+        assert "fromReset=true" in params["text"]
+
+    async def test_build_verification_emails_for_many_recipients(self):
+        messages = build_verification_emails(
+            [("a@example.com", "user-a"), ("b@example.com", "user-b")]
+        )
+
+        assert [params["to"] for params in messages] == [
+            "a@example.com",
+            "b@example.com",
+        ]
+        links = [params["text"].split("\n\n")[3] for params in messages]
+        assert all("/verify-email?token=" in link for link in links)
+        assert links[0] != links[1]
+
+    async def test_build_password_reset_email(self):
+        params = build_password_reset_email("test@example.com", "http://reset.url")
+        assert params["to"] == "test@example.com"
+        assert params["subject"] == "Password Reset - Allotment Service"
+        assert "http://reset.url" in params["text"]
+
+    async def test_post_to_resend_sends_idempotency_key(self):
+        mock_client = MagicMock()
+        mock_client.post = AsyncMock(return_value=MagicMock(status_code=200))
+
+        await _post_to_resend(
+            "/emails/batch",
+            [{"to": "a@example.com"}],
+            client=mock_client,
+            idempotency_key="email-outbox-batch/abc",
+        )
+
+        url = mock_client.post.call_args.args[0]
+        headers = mock_client.post.call_args.kwargs["headers"]
+        assert url.endswith("/emails/batch")
+        assert headers["Idempotency-Key"] == "email-outbox-batch/abc"
+        assert headers["Authorization"].startswith("Bearer ")
 
     async def test_forward_inbound_email_success(self):
         with patch(
@@ -191,14 +234,12 @@ class TestPublicEmailFunctions:
             assert exc.value.status_code == 503
 
     async def test_fetch_inbound_email_content_http_error(self):
-        with patch("httpx.AsyncClient") as mock_client_cls:
+        with patch("app.api.services.email_service.get_http_client") as mock_get_client:
             mock_client = MagicMock()
             mock_client.get = AsyncMock()
             mock_client.get.side_effect = httpx.HTTPError("Network error")
 
-            mock_instance = mock_client_cls.return_value
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
+            mock_get_client.return_value = mock_client
 
             text, html = await _fetch_inbound_email_content("email_id")
             assert text is None
@@ -212,7 +253,7 @@ class TestFetchInboundEmailContent:
         email_id = "test-email-id"
         mock_response_data = {"text": "Hello text", "html": "<p>Hello html</p>"}
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
+        with patch("app.api.services.email_service.get_http_client") as mock_get_client:
             mock_client = MagicMock()
             mock_client.get = AsyncMock()
 
@@ -221,9 +262,7 @@ class TestFetchInboundEmailContent:
             mock_response.json.return_value = mock_response_data
             mock_client.get.return_value = mock_response
 
-            mock_instance = mock_client_cls.return_value
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
+            mock_get_client.return_value = mock_client
 
             text, html = await _fetch_inbound_email_content(email_id)
 
@@ -237,7 +276,7 @@ class TestFetchInboundEmailContent:
             "data": {"text": "Hello text nested", "html": "<p>Hello html nested</p>"}
         }
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
+        with patch("app.api.services.email_service.get_http_client") as mock_get_client:
             mock_client = MagicMock()
             mock_client.get = AsyncMock()
 
@@ -246,9 +285,7 @@ class TestFetchInboundEmailContent:
             mock_response.json.return_value = mock_response_data
             mock_client.get.return_value = mock_response
 
-            mock_instance = mock_client_cls.return_value
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
+            mock_get_client.return_value = mock_client
 
             text, html = await _fetch_inbound_email_content(email_id)
 
@@ -260,7 +297,7 @@ class TestFetchInboundEmailContent:
         email_id = "test-email-id"
         mock_response_data = {"body": "Hello body fallback"}
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
+        with patch("app.api.services.email_service.get_http_client") as mock_get_client:
             mock_client = MagicMock()
             mock_client.get = AsyncMock()
 
@@ -269,9 +306,7 @@ class TestFetchInboundEmailContent:
             mock_response.json.return_value = mock_response_data
             mock_client.get.return_value = mock_response
 
-            mock_instance = mock_client_cls.return_value
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
+            mock_get_client.return_value = mock_client
 
             text, html = await _fetch_inbound_email_content(email_id)
 
@@ -283,7 +318,7 @@ class TestFetchInboundEmailContent:
         email_id = "test-email-id"
         mock_response_data = {"raw": "Hello raw fallback"}
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
+        with patch("app.api.services.email_service.get_http_client") as mock_get_client:
             mock_client = MagicMock()
             mock_client.get = AsyncMock()
 
@@ -292,9 +327,7 @@ class TestFetchInboundEmailContent:
             mock_response.json.return_value = mock_response_data
             mock_client.get.return_value = mock_response
 
-            mock_instance = mock_client_cls.return_value
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
+            mock_get_client.return_value = mock_client
 
             text, html = await _fetch_inbound_email_content(email_id)
 
@@ -309,7 +342,7 @@ class TestFetchInboundEmailContent:
             "html": {"body": "<p>Hello html dict</p>"},
         }
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
+        with patch("app.api.services.email_service.get_http_client") as mock_get_client:
             mock_client = MagicMock()
             mock_client.get = AsyncMock()
 
@@ -318,9 +351,7 @@ class TestFetchInboundEmailContent:
             mock_response.json.return_value = mock_response_data
             mock_client.get.return_value = mock_response
 
-            mock_instance = mock_client_cls.return_value
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
+            mock_get_client.return_value = mock_client
 
             text, html = await _fetch_inbound_email_content(email_id)
 
@@ -0,0 +1,86 @@
+import pytest
+
+from app.api.services.email_templates import (
+    FORWARDED_EMAIL,
+    CompiledTemplate,
+    EmailTemplate,
+)
+
+
+def test_compiled_template_fills_slots():
+    template = CompiledTemplate("Hello {name}, see {link}.")
+
+    assert template.slots == ("name", "link")
+    assert template.render({"name": "Ann", "link": "https://x"}) == (
+        "Hello Ann, see https://x."
+    )
+
+
+def test_constants_are_folded_in_at_compile_time():
+    template = CompiledTemplate("© {year} {name}", year=2026)
+
+    assert template.slots == ("name",)
+    assert template.render({"name": "Allotment"}) == "© 2026 Allotment"
+
+
+def test_escaped_braces_and_braces_in_values_are_literal():
+    template = CompiledTemplate("{{literal}} {value}")
+
+    assert template.render({"value": "{not_a_slot}"}) == "{literal} {not_a_slot}"
+
+
+def test_missing_slot_raises():
+    with pytest.raises(KeyError):
+        CompiledTemplate("Hi {name}").render({})
+
+
+@pytest.mark.parametrize("source", ["{user.name}", "{count:>5}", "{name!r}"])
+def test_unsupported_placeholders_rejected(source):
+    with pytest.raises(ValueError, match="Unsupported template placeholder"):
+        CompiledTemplate(source)
+
+
+def test_render_batch_builds_one_message_per_recipient():
+    template = EmailTemplate("digest", subject="Digest for {name}", text="{body}")
+
+    messages = template.render_batch(
+        "noreply@example.com",
+        [
+            ("a@example.com", {"name": "A", "body": "one"}),
+            ("b@example.com", {"name": "B", "body": "two"}),
+        ],
+    )
+
+    assert messages == [
+        {
+            "from": "noreply@example.com",
+            "to": "a@example.com",
+            "subject": "Digest for A",
+            "text": "one",
+        },
+        {
+            "from": "noreply@example.com",
+            "to": "b@example.com",
+            "subject": "Digest for B",
+            "text": "two",
+        },
+    ]
+
+
+def test_forwarded_template_keeps_multiline_body_unindented():
+    params = FORWARDED_EMAIL.render(
+        "contact@example.com",
+        "inbox@example.com",
+        {
+            "from_email": "sender@example.com",
+            "subject": "Hello",
+            "received": "2026-01-01T00:00:00+00:00",
+            "body": "line one\nline two",
+        },
+        reply_to="sender@example.com",
+    )
+
+    assert params["subject"] == "[Fwd] Hello"
+    assert params["reply_to"] == "sender@example.com"
+    assert params["text"].startswith("Forwarded message from: sender@example.com\n")
+    assert params["text"].endswith("--- Original Message ---\n\nline one\nline two")
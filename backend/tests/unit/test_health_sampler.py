@@ -0,0 +1,82 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from app.api.services.health_sampler import HealthSampler
+from tests.testing_db import TestingSessionLocal
+
+
+@pytest.fixture
+def resources():
+    with (
+        patch(
+            "app.api.services.health_sampler.psutil.cpu_percent", return_value=10.0
+        ) as cpu,
+        patch(
+            "app.api.services.health_sampler.psutil.virtual_memory",
+            return_value=SimpleNamespace(percent=20.0),
+        ),
+        patch(
+            "app.api.services.health_sampler.psutil.disk_usage",
+            return_value=SimpleNamespace(percent=30.0),
+        ),
+    ):
+        yield cpu
+
+
+@pytest.mark.asyncio
+async def test_sample_once_records_resources_and_database(resources):
+    sampler = HealthSampler(TestingSessionLocal)
+
+    snapshot = await sampler.sample_once()
+
+    assert snapshot.database == "healthy"
+    assert (snapshot.cpu_usage, snapshot.memory_usage, snapshot.disk_usage) == (
+        10.0,
+        20.0,
+        30.0,
+    )
+    assert sampler.snapshot is snapshot
+
+
+@pytest.mark.asyncio
+async def test_current_resamples_only_when_stale(resources):
+    sampler = HealthSampler(TestingSessionLocal, interval_seconds=10.0)
+
+    first = await sampler.current()
+    assert await sampler.current() is first
+
+    sampler._snapshot = first._replace(sampled_at=first.sampled_at - 31.0)
+    assert await sampler.current() is not first
+    assert resources.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_background_task_refreshes_snapshot(resources):
+    sampler = HealthSampler(TestingSessionLocal, interval_seconds=0.01)
+    sampler.start()
+    try:
+        for _ in range(100):
+            if resources.call_count >= 2:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await sampler.stop()
+
+    assert resources.call_count >= 2
+    assert sampler.snapshot is not None
+
+
+@pytest.mark.asyncio
+async def test_resource_transition_logged_once(resources):
+    sampler = HealthSampler(TestingSessionLocal)
+    resources.return_value = 95.0
+
+    with patch("app.api.services.health_sampler.logger") as mock_logger:
+        await sampler.sample_once()
+        await sampler.sample_once()
+
+    warnings = [call.args[0] for call in mock_logger.warning.call_args_list]
+    assert warnings == ["System resources near capacity", "CPU usage critical"]
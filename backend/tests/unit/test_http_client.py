@@ -0,0 +1,124 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.api.core import http_client
+from app.api.core import metrics as core_metrics
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def recorded(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        http_client,
+        "record_http_client_request",
+        lambda host, reused: calls.append((host, reused)),
+    )
+    return calls
+
+
+@pytest.fixture
+async def shared_client():
+    await http_client.close_http_client()
+    yield
+    await http_client.close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_client_reuses_keepalive_connections(local_server, recorded):
+    async with http_client.create_http_client() as client:
+        for _ in range(3):
+            response = await client.get(f"{local_server}/")
+            assert response.json() == {"ok": True}
+
+    assert recorded == [
+        ("127.0.0.1", False),
+        ("127.0.0.1", True),
+        ("127.0.0.1", True),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_client_applies_limits_and_timeouts():
+    async with http_client.create_http_client(
+        timeout_seconds=7.0,
+        connect_timeout_seconds=2.0,
+        max_connections=4,
+        max_keepalive_connections=2,
+        keepalive_expiry_seconds=15.0,
+    ) as client:
+        assert client.timeout.read == 7.0
+        assert client.timeout.connect == 2.0
+        pool = client._transport._pool
+        assert pool._max_connections == 4
+        assert pool._max_keepalive_connections == 2
+        assert pool._keepalive_expiry == 15.0
+
+
+@pytest.mark.asyncio
+async def test_shared_client_lifecycle(shared_client):
+    client = http_client.start_http_client(max_connections=3)
+
+    assert http_client.get_http_client() is client
+    assert http_client.start_http_client() is client
+
+    await http_client.close_http_client()
+    assert client.is_closed
+    replacement = http_client.get_http_client()
+    assert replacement is not client
+    assert not replacement.is_closed
+
+
+@pytest.mark.asyncio
+async def test_connection_trace_only_flags_new_connections():
+    trace = http_client.ConnectionTrace()
+    await trace("http11.send_request_headers.complete", {})
+    assert trace.new_connection is False
+
+    await trace("connection.connect_tcp.complete", {})
+    assert trace.new_connection is True
+
+
+def test_http2_only_when_h2_installed(monkeypatch):
+    monkeypatch.setattr(http_client.importlib.util, "find_spec", lambda name: None)
+    assert http_client.http2_available() is False
+
+
+@pytest.mark.asyncio
+async def test_reuse_is_reported_in_metrics(local_server):
+    async with http_client.create_http_client() as client:
+        await client.get(f"{local_server}/")
+        await client.get(f"{local_server}/")
+
+    text = core_metrics.render_prometheus_text()
+    assert (
+        'http_client_requests_total{server_address="127.0.0.1",'
+        'http_connection_reused="true"}' in text
+    )
@@ -0,0 +1,216 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select, update
+
+from app.api.core.circuit_breaker import CircuitBreaker
+from app.api.models import InboundEmail
+from app.api.models.email.inbound_email_model import (
+    INBOUND_STATUS_FAILED,
+    INBOUND_STATUS_PENDING,
+    INBOUND_STATUS_PROCESSED,
+)
+from app.api.schemas.inbound_email_schema import InboundEmailData, InboundEmailPayload
+from app.api.services.inbound_email_queue import (
+    InboundEmailQueue,
+    enqueue_inbound_email,
+    process_inbound_email,
+)
+from tests.testing_db import TestingSessionLocal
+
+
+def _payload(**data) -> InboundEmailPayload:
+    return InboundEmailPayload(
+        type="email.received",
+        data=InboundEmailData(
+            from_="sender@example.com",
+            to=["recipient@example.com"],
+            subject="Test Subject",
+            **data,
+        ),
+    )
+
+
+async def _enqueue(svix_id, payload: InboundEmailPayload) -> bool:
+    async with TestingSessionLocal() as session:
+        accepted = await enqueue_inbound_email(session, svix_id, payload)
+        await session.commit()
+    return accepted
+
+
+async def _stored() -> list:
+    async with TestingSessionLocal() as session:
+        rows = await session.scalars(
+            select(InboundEmail).order_by(InboundEmail.svix_id)
+        )
+        return list(rows.all())
+
+
+async def _make_due() -> None:
+    async with TestingSessionLocal() as session:
+        await session.execute(
+            update(InboundEmail).values(
+                next_attempt_at=datetime.now(timezone.utc) - timedelta(seconds=1)
+            )
+        )
+        await session.commit()
+
+
+@pytest.fixture
+def mock_forward():
+    with patch(
+        "app.api.services.inbound_email_queue.forward_inbound_email",
+        new_callable=AsyncMock,
+    ) as mock:
+        yield mock
+
+
+@pytest.fixture
+def queue():
+    return InboundEmailQueue(
+        TestingSessionLocal,
+        workers=2,
+        poll_interval_seconds=60.0,
+        max_attempts=2,
+        retry_base_seconds=1.0,
+    )
+
+
+@pytest.mark.asyncio
+class TestProcessInboundEmail:
+    async def test_forwards_webhook_body(self, mock_forward):
+        await process_inbound_email(_payload(text="Test Body"))
+
+        mock_forward.assert_awaited_once()
+        assert mock_forward.call_args.kwargs["body"] == "Test Body"
+        assert mock_forward.call_args.kwargs["subject"] == "Test Subject"
+
+    async def test_fetches_missing_body(self, mock_forward):
+        with patch(
+            "app.api.services.inbound_email_queue._fetch_inbound_email_content",
+            new_callable=AsyncMock,
+            return_value=("Fetched Body", None),
+        ) as mock_fetch:
+            await process_inbound_email(_payload(email_id="email_123"))
+
+        mock_fetch.assert_awaited_once_with("email_123")
+        assert mock_forward.call_args.kwargs["body"] == "Fetched Body"
+
+
+@pytest.mark.asyncio
+class TestInboundEmailQueue:
+    async def test_forwards_each_delivery_once(self, queue, mock_forward):
+        assert await _enqueue("msg_1", _payload(text="One")) is True
+        assert await _enqueue("msg_2", _payload(text="Two")) is True
+        assert await _enqueue("msg_1", _payload(text="One")) is False
+
+        assert await queue.drain_once() == 2
+        await _make_due()
+        assert await queue.drain_once() == 0
+
+        bodies = sorted(call.kwargs["body"] for call in mock_forward.call_args_list)
+        assert bodies == ["One", "Two"]
+        for email in await _stored():
+            # The svix-id is kept for deduplication, the content is not.
+            assert email.status == INBOUND_STATUS_PROCESSED
+            assert email.payload == {}
+        assert await _enqueue("msg_1", _payload(text="One")) is False
+
+    async def test_failure_with_breaker_closed_is_retried_not_lost(
+        self, queue, mock_forward
+    ):
+        mock_forward.side_effect = [RuntimeError("forward failed"), None]
+        await _enqueue("msg_1", _payload(text="Body"))
+
+        await queue.drain_once()
+
+        [email] = await _stored()
+        assert email.status == INBOUND_STATUS_PENDING
+        assert email.attempts == 1
+        assert email.last_error == "forward failed"
+        assert email.payload["data"]["text"] == "Body"
+
+        await _make_due()
+        await queue.drain_once()
+
+        [email] = await _stored()
+        assert email.status == INBOUND_STATUS_PROCESSED
+        assert mock_forward.await_count == 2
+
+    async def test_delivery_kept_as_failed_after_max_attempts(
+        self, queue, mock_forward
+    ):
+        mock_forward.side_effect = RuntimeError("forward failed")
+        await _enqueue("msg_1", _payload(text="Body"))
+
+        await queue.drain_once()
+        await _make_due()
+        await queue.drain_once()
+        await _make_due()
+        assert await queue.drain_once() == 0
+
+        [email] = await _stored()
+        assert email.status == INBOUND_STATUS_FAILED
+        assert email.attempts == 2
+        assert email.payload["data"]["text"] == "Body"
+
+    async def test_delivery_deferred_while_breaker_open(self, queue, mock_forward):
+        breaker = CircuitBreaker("test-resend", minimum_calls=1)
+
+        async def _fail_and_open(**_):
+            breaker.record_failure()
+            raise HTTPException(status_code=503)
+
+        mock_forward.side_effect = _fail_and_open
+        await _enqueue("msg_1", _payload(text="Body"))
+
+        with patch(
+            "app.api.services.inbound_email_queue.get_email_circuit_breaker",
+            return_value=breaker,
+        ):
+            assert await queue.drain_once() == 1
+            await _make_due()
+            # Nothing is claimed while the breaker stays open.
+            assert await queue.drain_once() == 0
+
+        [email] = await _stored()
+        assert email.status == INBOUND_STATUS_PENDING
+        assert email.attempts == 0
+        assert mock_forward.await_count == 1
+
+    async def test_notify_wakes_running_queue(self, queue, mock_forward):
+        queue.start()
+        try:
+            await _enqueue("msg_1", _payload(text="Body"))
+            queue.notify()
+            for _ in range(100):
+                if mock_forward.await_count:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await queue.stop()
+
+        mock_forward.assert_awaited_once()
+
+    async def test_purge_forgets_old_processed_deliveries(self, queue, mock_forward):
+        for svix_id in ("msg_old", "msg_new"):
+            await _enqueue(svix_id, _payload(text="Body"))
+        await queue.drain_once()
+        await _enqueue("msg_pending", _payload(text="Body"))
+        async with TestingSessionLocal() as session:
+            await session.execute(
+                update(InboundEmail)
+                .where(InboundEmail.svix_id == "msg_old")
+                .values(created_at=datetime.now(timezone.utc) - timedelta(days=2))
+            )
+            await session.commit()
+
+        assert await queue.purge_processed() == 1
+
+        assert [email.svix_id for email in await _stored()] == [
+            "msg_new",
+            "msg_pending",
+        ]
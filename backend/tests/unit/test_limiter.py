@@ -0,0 +1,173 @@
+from types import SimpleNamespace
+
+import fakeredis
+import pytest
+from limits import parse
+from limits.storage import RedisStorage, storage_from_string
+from limits.strategies import (
+    FixedWindowRateLimiter,
+    SlidingWindowCounterRateLimiter,
+)
+
+from app.api.core import rate_limit_storage
+from app.api.core.auth_utils import create_token
+from app.api.core.limiter import limiter, token_subject, user_rate_limit_key
+from app.api.core.rate_limit_storage import SQLiteStorage, sqlite_path
+
+
+def _request(headers=None, client_ip="203.0.113.7"):
+    return SimpleNamespace(
+        headers=headers or {}, client=SimpleNamespace(host=client_ip)
+    )
+
+
+@pytest.fixture
+def sqlite_uri(tmp_path):
+    return f"sqlite:///{tmp_path / 'ratelimit.db'}"
+
+
+@pytest.mark.parametrize(
+    "uri, expected",
+    [
+        ("sqlite:///ratelimit.db", "ratelimit.db"),
+        ("sqlite:////var/run/ratelimit.db", "/var/run/ratelimit.db"),
+        ("sqlite:///:memory:", ":memory:"),
+        ("sqlite://", ":memory:"),
+    ],
+)
+def test_sqlite_path(uri, expected):
+    assert sqlite_path(uri) == expected
+
+
+def test_sqlite_scheme_is_registered(sqlite_uri):
+    assert isinstance(storage_from_string(sqlite_uri), SQLiteStorage)
+
+
+def test_sqlite_storage_counts_and_clears(sqlite_uri):
+    storage = SQLiteStorage(sqlite_uri)
+
+    assert storage.incr("k", 60) == 1
+    assert storage.incr("k", 60, amount=2) == 3
+    assert storage.get("k") == 3
+    assert storage.get("missing") == 0
+    assert storage.get_expiry("k") > storage.get_expiry("missing")
+    assert storage.check() is True
+
+    storage.clear("k")
+    assert storage.get("k") == 0
+    storage.incr("a", 60)
+    storage.incr("b", 60)
+    assert storage.reset() == 2
+
+
+def test_sqlite_storage_restarts_expired_window(sqlite_uri, monkeypatch):
+    storage = SQLiteStorage(sqlite_uri)
+    now = 1_000_000.0
+    monkeypatch.setattr(rate_limit_storage.time, "time", lambda: now)
+    storage.incr("k", 60)
+    storage.incr("k", 60)
+
+    now += 61
+    assert storage.get("k") == 0
+    assert storage.incr("k", 60) == 1
+
+
+def test_sqlite_storage_purges_expired_rows(sqlite_uri, monkeypatch):
+    storage = SQLiteStorage(sqlite_uri)
+    monkeypatch.setattr(rate_limit_storage, "PURGE_EVERY_WRITES", 2)
+    now = 1_000_000.0
+    monkeypatch.setattr(rate_limit_storage.time, "time", lambda: now)
+    storage.incr("old", 1)
+
+    now += 5
+    storage.incr("new", 60)
+
+    rows = storage._connection.execute("SELECT key FROM rate_limits").fetchall()
+    assert rows == [("new",)]
+
+
+def test_sqlite_storage_is_shared_between_workers(sqlite_uri):
+    """Two storages on one file behave like two uvicorn workers on one host."""
+    item = parse("3/minute")
+    worker_a = FixedWindowRateLimiter(SQLiteStorage(sqlite_uri))
+    worker_b = FixedWindowRateLimiter(SQLiteStorage(sqlite_uri))
+
+    hits = [worker.hit(item, "user:1") for worker in (worker_a, worker_b) * 2]
+
+    assert hits == [True, True, True, False]
+
+
+def test_sqlite_storage_sliding_window(sqlite_uri):
+    storage = SQLiteStorage(sqlite_uri)
+    item = parse("2/minute")
+    strategy = SlidingWindowCounterRateLimiter(storage)
+
+    assert [strategy.hit(item, "user:1") for _ in range(3)] == [True, True, False]
+    assert strategy.get_window_stats(item, "user:1").remaining == 0
+
+    strategy.clear(item, "user:1")
+    assert strategy.hit(item, "user:1") is True
+
+
+def test_redis_storage_is_shared_between_workers():
+    """Two clients of one Redis stand-in share counters across workers."""
+    server = fakeredis.FakeServer()
+    item = parse("2/minute")
+    workers = [
+        FixedWindowRateLimiter(
+            RedisStorage(
+                "redis://localhost:6379",
+                connection_pool=fakeredis.FakeRedis(server=server).connection_pool,
+            )
+        )
+        for _ in range(2)
+    ]
+
+    hits = [worker.hit(item, "user:1") for worker in workers * 2]
+
+    assert hits == [True, True, False, False]
+
+
+def test_limiter_uses_configured_storage():
+    assert limiter._storage_uri == "memory://"
+    assert limiter._strategy == "fixed-window"
+
+
+def test_token_subject_accepts_access_tokens():
+    assert token_subject(create_token("user-1")) == "user-1"
+
+
+def test_token_subject_rejects_other_tokens():
+    tampered = create_token("user-1")[:-4] + "abcd"
+
+    assert token_subject(create_token("user-1", token_type="refresh")) is None
+    assert token_subject(tampered) is None
+    assert token_subject("not-a-jwt") is None
+
+
+def test_token_subject_rejects_expired_token_even_when_cached(monkeypatch):
+    token = create_token("user-1", expiry_seconds=60)
+    assert token_subject(token) == "user-1"
+
+    monkeypatch.setattr(
+        "app.api.core.limiter.time", SimpleNamespace(time=lambda: 10**12)
+    )
+    request = _request({"authorization": f"Bearer {token}"})
+
+    assert token_subject(token) is None
+    assert user_rate_limit_key(request) == "203.0.113.7"
+
+
+def test_user_rate_limit_key_uses_token_subject():
+    token = create_token("user-1")
+    request = _request({"authorization": f"Bearer {token}"})
+
+    assert user_rate_limit_key(request) == "user:user-1"
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [{}, {"authorization": "Bearer not-a-jwt"}, {"authorization": "Basic abc"}],
+)
+def test_user_rate_limit_key_falls_back_to_client_ip(headers):
+    assert user_rate_limit_key(_request(headers)) == "203.0.113.7"
@@ -159,34 +159,86 @@ def test_logging_middleware_does_not_redact_non_jwt_like_dotted_segment() -> Non
     assert redact_url_tokens(url) == url
 
 
+def _file_queue_handlers() -> list:
+    return [
+        h
+        for h in logging.getLogger().handlers
+        if isinstance(h, core_logging.DroppingQueueHandler)
+    ]
+
+
 def test_configure_logging_idempotent(tmp_path, monkeypatch):
     # Temporarily enable file logging and set a temporary path
     monkeypatch.setattr(settings, "LOG_TO_FILE", True)
     tmp_file = str(tmp_path / "test_app.log")
     monkeypatch.setattr(settings, "LOG_FILE", tmp_file)
 
-    # First call should add a handler
-    core_logging.configure_logging()
-    assert _has_rotating_filehandler_for(tmp_file) is True
+    try:
+        # First call should add the file log queue handler
+        core_logging.configure_logging()
+        assert len(_file_queue_handlers()) == 1
 
-    # Capture number of handlers matching that file
-    count_before = sum(
-        1
-        for h in logging.getLogger().handlers
-        if isinstance(h, RotatingFileHandler)
-        and getattr(h, "baseFilename", None) == tmp_file
-    )
+        # Second call should not add a duplicate
+        core_logging.configure_logging()
+        assert len(_file_queue_handlers()) == 1
+    finally:
+        core_logging.stop_file_logging()
 
-    # Second call should not add a duplicate
-    core_logging.configure_logging()
-    count_after = sum(
-        1
-        for h in logging.getLogger().handlers
-        if isinstance(h, RotatingFileHandler)
-        and getattr(h, "baseFilename", None) == tmp_file
-    )
+    assert _file_queue_handlers() == []
+
+
+class TestQueuedFileLogWriter:
+    """Test the background file log writer."""
 
-    assert count_after == count_before
+    @staticmethod
+    def _record(message: str) -> logging.LogRecord:
+        return logging.makeLogRecord({"msg": message, "levelno": logging.INFO})
+
+    def test_writes_batches_and_flushes_on_stop(self, tmp_path):
+        log_file = tmp_path / "queued.log"
+        writer = core_logging.QueuedFileLogWriter(
+            core_logging.BufferedRotatingFileHandler(str(log_file), delay=True),
+            batch_size=16,
+        )
+        writer.start()
+        for i in range(100):
+            writer.queue_handler.handle(self._record(f"entry {i}"))
+        writer.stop()
+
+        lines = log_file.read_text().splitlines()
+        assert lines == [f"entry {i}" for i in range(100)]
+        assert writer.written == 100
+        assert writer.dropped == 0
+
+    def test_full_queue_drops_and_reports(self, tmp_path):
+        log_file = tmp_path / "dropped.log"
+        writer = core_logging.QueuedFileLogWriter(
+            core_logging.BufferedRotatingFileHandler(str(log_file), delay=True),
+            max_queue_size=3,
+        )
+        # Writer not started yet, so the bounded queue fills up
+        for i in range(5):
+            writer.queue_handler.handle(self._record(f"entry {i}"))
+        assert writer.dropped == 2
+
+        writer.start()
+        writer.stop()
+
+        content = log_file.read_text()
+        assert "entry 2" in content
+        assert "entry 3" not in content
+        assert "Dropped 2 log records" in content
+
+    def test_buffered_handler_defers_flush(self, tmp_path):
+        log_file = tmp_path / "buffered.log"
+        handler = core_logging.BufferedRotatingFileHandler(str(log_file))
+        try:
+            handler.handle(self._record("pending"))
+            assert log_file.read_text() == ""
+            handler.flush()
+            assert log_file.read_text() == "pending\n"
+        finally:
+            handler.close()
 
 
 def test_configure_logging_reapplies_level_with_existing_handlers(monkeypatch):
@@ -3,15 +3,19 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from fastapi import HTTPException
 from httpx import AsyncClient
+from sqlalchemy import select
 from svix.webhooks import WebhookVerificationError
 
+from app.api.core.config import settings
 from app.api.middleware.exception_handler import (
     BaseApplicationError,
     BusinessLogicError,
     ResourceNotFoundError,
 )
+from app.api.models import InboundEmail
 from app.api.schemas.inbound_email_schema import InboundEmailData, InboundEmailPayload
 from app.main import app, flush_logs, handle_inbound_email, verify_resend_signature
+from tests.testing_db import TestingSessionLocal
 
 
 class TestExceptionHandlers:
@@ -78,6 +82,20 @@ class TestLifespan:
         assert mock_logger.info.call_count >= 2
         mock_flush_logs.assert_called_once()
 
+    @patch("app.main.flush_logs")
+    async def test_lifespan_manages_shared_http_client(self, mock_flush_logs):
+        """The shared HTTP client is open during the lifespan and closed after."""
+        from app.api.core import http_client
+        from app.main import lifespan
+
+        async with lifespan(app):
+            client = http_client.get_http_client()
+            assert not client.is_closed
+            assert client.timeout.read == settings.HTTP_CLIENT_TIMEOUT_SECONDS
+
+        assert client.is_closed
+        assert http_client._client is None
+
     @patch("app.main.flush_logs")
     @patch("app.main.logger")
     @patch("app.main.sanitize_error_message")
@@ -410,20 +428,43 @@ class TestWebhookVerification:
         assert "Invalid payload:" not in error_detail["msg"]
 
 
+def _inbound_payload(**data) -> InboundEmailPayload:
+    return InboundEmailPayload(
+        type="email.received",
+        data=InboundEmailData(
+            from_="sender@example.com",
+            to=["recipient@example.com"],
+            subject="Test Subject",
+            **data,
+        ),
+    )
+
+
+def _webhook_request(svix_id: str = "msg_123") -> MagicMock:
+    request = MagicMock()
+    request.headers = {"svix-id": svix_id}
+    return request
+
+
+async def _stored_inbound_emails() -> list:
+    async with TestingSessionLocal() as session:
+        return list((await session.scalars(select(InboundEmail))).all())
+
+
+@pytest.fixture
+def notify_inbound():
+    with patch("app.main.notify_inbound_email_queue") as mock:
+        yield mock
+
+
 @pytest.mark.asyncio
 class TestHandleInboundEmail:
-    async def test_handle_inbound_email_rate_limited(self, client: AsyncClient):
+    async def test_handle_inbound_email_rate_limited(
+        self, client: AsyncClient, notify_inbound
+    ):
         from app.api.core.limiter import limiter
 
-        payload = InboundEmailPayload(
-            type="email.received",
-            data=InboundEmailData(
-                from_="sender@example.com",
-                to=["recipient@example.com"],
-                subject="Test Subject",
-                text="Test Body",
-            ),
-        )
+        payload = _inbound_payload(text="Test Body")
 
         async def override_verify_resend_signature():
             return payload
@@ -436,42 +477,60 @@ class TestHandleInboundEmail:
         try:
             limiter.enabled = True
             limiter._storage.reset()
-            with patch(
-                "app.main.forward_inbound_email", new_callable=AsyncMock
-            ) as mock_forward:
-                mock_forward.return_value = {"message": "Email forwarded"}
-                responses = [
-                    await client.post("/webhooks/inbound-email") for _ in range(31)
-                ]
+            responses = [
+                await client.post(
+                    "/webhooks/inbound-email", headers={"svix-id": "msg_1"}
+                )
+                for _ in range(31)
+            ]
         finally:
             app.dependency_overrides.pop(verify_resend_signature, None)
             limiter._storage.reset()
             limiter.enabled = original_enabled
 
-        assert all(response.status_code == 200 for response in responses[:30])
+        assert all(response.status_code == 202 for response in responses[:30])
         assert responses[-1].status_code == 429
 
-    async def test_handle_inbound_email_success(self):
-        payload = InboundEmailPayload(
-            type="email.received",
-            data=InboundEmailData(
-                from_="sender@example.com",
-                to=["recipient@example.com"],
-                subject="Test Subject",
-                text="Test Body",
-            ),
-        )
+    async def test_handle_inbound_email_stores_payload(self, notify_inbound):
+        payload = _inbound_payload(text="Test Body")
+
+        async with TestingSessionLocal() as session:
+            result = await handle_inbound_email(_webhook_request(), payload, session)
+
+        assert result == {"message": "Email queued"}
+        [email] = await _stored_inbound_emails()
+        assert email.svix_id == "msg_123"
+        assert email.payload["data"]["text"] == "Test Body"
+        notify_inbound.assert_called_once()
+
+    async def test_handle_inbound_email_drops_redelivery(self, notify_inbound):
+        payload = _inbound_payload(text="Test Body")
+
+        async with TestingSessionLocal() as session:
+            await handle_inbound_email(_webhook_request("msg_1"), payload, session)
+            result = await handle_inbound_email(
+                _webhook_request("msg_1"), payload, session
+            )
+
+        assert result == {"message": "Duplicate delivery ignored"}
+        assert len(await _stored_inbound_emails()) == 1
+
+    async def test_handle_inbound_email_fails_when_not_stored(self, notify_inbound):
+        payload = _inbound_payload(text="Test Body")
 
         with patch(
-            "app.main.forward_inbound_email", new_callable=AsyncMock
-        ) as mock_forward:
-            mock_forward.return_value = {"message": "Email forwarded"}
+            "app.main.enqueue_inbound_email",
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("database down"),
+        ):
+            async with TestingSessionLocal() as session:
+                with pytest.raises(RuntimeError):
+                    await handle_inbound_email(_webhook_request(), payload, session)
 
-            result = await handle_inbound_email(MagicMock(), payload)
-            assert result == {"message": "Email forwarded"}
-            mock_forward.assert_called_once()
+        # No 2xx, so Resend delivers again.
+        notify_inbound.assert_not_called()
 
-    async def test_handle_inbound_email_ignored_event(self):
+    async def test_handle_inbound_email_ignored_event(self, notify_inbound):
         payload = InboundEmailPayload(
             type="email.delivered",  # Not email.received
             data=InboundEmailData(
@@ -479,28 +538,7 @@ class TestHandleInboundEmail:
             ),
         )
 
-        result = await handle_inbound_email(MagicMock(), payload)
+        async with TestingSessionLocal() as session:
+            result = await handle_inbound_email(_webhook_request(), payload, session)
         assert result == {"message": "Event ignored"}
-
-    async def test_handle_inbound_email_fetch_body(self):
-        payload = InboundEmailPayload(
-            type="email.received",
-            data=InboundEmailData(
-                from_="sender@example.com",
-                to=["recipient@example.com"],
-                email_id="email_123",
-            ),
-        )
-
-        with patch(
-            "app.main._fetch_inbound_email_content", new_callable=AsyncMock
-        ) as mock_fetch:
-            mock_fetch.return_value = ("Fetched Body", None)
-            with patch(
-                "app.main.forward_inbound_email", new_callable=AsyncMock
-            ) as mock_forward:
-                await handle_inbound_email(MagicMock(), payload)
-
-                mock_fetch.assert_called_with("email_123")
-                mock_forward.assert_called_once()
-                assert mock_forward.call_args[1]["body"] == "Fetched Body"
+        assert await _stored_inbound_emails() == []
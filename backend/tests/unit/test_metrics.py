@@ -0,0 +1,118 @@
+from types import SimpleNamespace
+
+import pytest
+from httpx import AsyncClient
+from pydantic import SecretStr
+
+from app.api.core import metrics as core_metrics
+from app.api.core.logging import log_timing
+
+METRICS_TOKEN = SecretStr("scrape-token")
+
+
+def test_statement_operation_extracts_leading_keyword():
+    assert core_metrics.statement_operation("\n  select 1") == "SELECT"
+    assert core_metrics.statement_operation("INSERT INTO x VALUES (1)") == "INSERT"
+    assert core_metrics.statement_operation("   ") == "UNKNOWN"
+
+
+def test_route_template_uses_matched_route_path():
+    route = SimpleNamespace(path="/api/v1/grow-guides/{variety_id}")
+    assert core_metrics.route_template({"route": route}) == route.path
+    assert core_metrics.route_template({}) == core_metrics.UNMATCHED_ROUTE
+
+
+def test_log_timing_records_operation_histogram():
+    with log_timing("test_metrics_operation"):
+        pass
+
+    text = core_metrics.render_prometheus_text()
+    assert "# TYPE app_operation_duration_seconds histogram" in text
+    assert (
+        'app_operation_duration_seconds_count{operation="test_metrics_operation"} 1'
+        in text
+    )
+    assert (
+        'app_operation_duration_seconds_bucket{operation="test_metrics_operation",le="+Inf"} 1'
+        in text
+    )
+
+
+def test_db_statement_histogram_labels_by_statement_type():
+    core_metrics.record_db_statement_duration("DELETE FROM test_metrics", 0.002)
+
+    text = core_metrics.render_prometheus_text()
+    assert 'db_client_operation_duration_seconds_count{db_operation="DELETE"}' in text
+
+
+def test_http_client_counter_rendered_as_prometheus_counter():
+    core_metrics.record_http_client_request("metrics.test", reused=True)
+    core_metrics.record_http_client_request("metrics.test", reused=True)
+
+    text = core_metrics.render_prometheus_text()
+    assert "# TYPE http_client_requests counter" in text
+    assert (
+        'http_client_requests_total{server_address="metrics.test",'
+        'http_connection_reused="true"} 2' in text
+    )
+
+
+def test_label_values_are_escaped():
+    labels = core_metrics._format_labels({"operation": 'a"b\\c'})
+    assert labels == '{operation="a\\"b\\\\c"}'
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_reports_request_duration_by_route(
+    client: AsyncClient, monkeypatch
+):
+    monkeypatch.setattr("app.main.settings.METRICS_BEARER_TOKEN", METRICS_TOKEN)
+    await client.get("/")
+
+    response = await client.get(
+        "/metrics", headers={"Authorization": "Bearer scrape-token"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# TYPE http_server_request_duration_seconds histogram" in response.text
+    assert 'http_route="/"' in response.text
+    assert 'http_response_status_code="200"' in response.text
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_disabled(client: AsyncClient, monkeypatch):
+    monkeypatch.setattr("app.main.settings.METRICS_ENABLED", False)
+
+    response = await client.get("/metrics")
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "headers",
+    [{}, {"Authorization": "Bearer wrong-token"}, {"Authorization": "scrape-token"}],
+)
+async def test_metrics_endpoint_rejects_missing_or_wrong_token(
+    client: AsyncClient, monkeypatch, headers
+):
+    monkeypatch.setattr("app.main.settings.METRICS_BEARER_TOKEN", METRICS_TOKEN)
+
+    response = await client.get("/metrics", headers=headers)
+
+    assert response.status_code == 401
+    assert "app_operation_duration_seconds" not in response.text
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_not_served_without_configured_token(
+    client: AsyncClient, monkeypatch
+):
+    monkeypatch.setattr("app.main.settings.METRICS_BEARER_TOKEN", None)
+
+    response = await client.get(
+        "/metrics", headers={"Authorization": "Bearer scrape-token"}
+    )
+
+    assert response.status_code == 404
@@ -0,0 +1,30 @@
+import uuid
+
+import pytest
+
+from app.api.core.pagination import decode_cursor, encode_cursor
+from app.api.middleware.exception_handler import BusinessLogicError
+
+
+def test_cursor_round_trips_key():
+    variety_id = uuid.uuid4()
+
+    cursor = encode_cursor(("Tomato, cherry", variety_id))
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, (str, uuid.UUID)) == ("Tomato, cherry", variety_id)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-a-cursor",
+        encode_cursor(("only one part",)),
+        encode_cursor(("Tomato", "not-a-uuid")),
+    ],
+)
+def test_malformed_cursor_rejected(cursor):
+    with pytest.raises(BusinessLogicError, match="Invalid pagination cursor") as exc:
+        decode_cursor(cursor, (str, uuid.UUID))
+
+    assert exc.value.status_code == 400
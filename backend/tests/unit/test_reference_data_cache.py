@@ -0,0 +1,56 @@
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.api.services.reference_data_cache import ReferenceDataCache
+
+UOW_PATH = "app.api.services.reference_data_cache.GrowGuideUnitOfWork"
+
+EMPTY_OPTIONS = {
+    "lifecycles": [],
+    "planting_conditions": [],
+    "frequencies": [],
+    "feed_frequencies": [],
+    "feeds": [],
+    "weeks": [],
+    "families": [],
+    "days": [],
+}
+
+
+def _mock_uow():
+    uow = MagicMock()
+    uow.get_variety_options = AsyncMock(return_value=EMPTY_OPTIONS)
+    uow.__aenter__ = AsyncMock(return_value=uow)
+    uow.__aexit__ = AsyncMock(return_value=None)
+    return uow
+
+
+@pytest.mark.asyncio
+async def test_variety_options_loaded_once_and_serialised():
+    cache = ReferenceDataCache(ttl_seconds=60)
+    uow = _mock_uow()
+
+    with patch(UOW_PATH, return_value=uow):
+        first = await cache.variety_options_json(MagicMock())
+        second = await cache.variety_options_json(MagicMock())
+
+    assert first is second
+    assert json.loads(first) == EMPTY_OPTIONS
+    uow.get_variety_options.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_variety_options_reloaded_after_expiry_or_invalidate():
+    cache = ReferenceDataCache(ttl_seconds=0)
+    uow = _mock_uow()
+
+    with patch(UOW_PATH, return_value=uow):
+        await cache.variety_options_json(MagicMock())
+        await cache.variety_options_json(MagicMock())
+        cache.ttl_seconds = 60
+        cache.invalidate()
+        await cache.variety_options_json(MagicMock())
+
+    assert uow.get_variety_options.await_count == 3
@@ -29,6 +29,7 @@ class TestCreateUserEndpointUnit:
         # Mock UserUnitOfWork to return our mock user
         mock_uow = mocker.AsyncMock()
         mock_uow.create_user_with_feed_days.return_value = mock_user
+        mock_uow.queue_email = mocker.MagicMock()
 
         mock_uow_class = mocker.patch("app.api.v1.registration.UserUnitOfWork")
         mock_uow_class.return_value.__aenter__ = mocker.AsyncMock(return_value=mock_uow)
@@ -67,10 +68,13 @@ class TestCreateUserEndpointUnit:
         assert result.is_email_verified == mock_user.is_email_verified
         assert result.user_id == str(mock_user.user_id)
 
-        # Verify email service was called
+        # Verification email is queued in the registration transaction
         mock_email_in_unit_test.assert_called_once_with(
             user_email=sample_user_data["user_email"], user_id=str(mock_user.user_id)
         )
+        mock_uow.queue_email.assert_called_once_with(
+            mock_email_in_unit_test.return_value, "email_verification"
+        )
 
     async def test_create_user_email_already_exists(
         self, sample_user_data, mock_request_and_db, mocker
@@ -265,23 +269,20 @@ class TestCreateUserEndpointUnit:
                 mock_request_and_db["request"], user, mock_request_and_db["db"]
             )
 
-    async def test_create_user_email_service_failure(
+    async def test_create_user_email_queue_failure(
         self, mock_user, sample_user_data, mock_request_and_db, mocker
     ):
-        """Test user registration when email service fails."""
-        # Mock UserUnitOfWork to succeed
+        """Registration fails as a whole when its verification email cannot be queued."""
         mock_uow = mocker.AsyncMock()
         mock_uow.create_user_with_feed_days.return_value = mock_user
+        mock_uow.queue_email = mocker.MagicMock(
+            side_effect=Exception("Outbox unavailable")
+        )
 
         mock_uow_class = mocker.patch("app.api.v1.registration.UserUnitOfWork")
         mock_uow_class.return_value.__aenter__ = mocker.AsyncMock(return_value=mock_uow)
         mock_uow_class.return_value.__aexit__ = mocker.AsyncMock(return_value=None)
-
-        # Mock email service to fail
-        mocker.patch(
-            "app.api.v1.registration.send_verification_email",
-            side_effect=Exception("Email service unavailable"),
-        )
+        mocker.patch("app.api.v1.registration.build_verification_email")
 
         # Mock context and logging
         mock_ctx = MagicMock()
@@ -303,13 +304,10 @@ class TestCreateUserEndpointUnit:
         mock_result.scalar_one_or_none.return_value = None
         mock_request_and_db["db"].execute.return_value = mock_result
 
-        # Registration should still succeed even if email fails
-        result = await registration.create_user(
-            mock_request_and_db["request"], user, mock_request_and_db["db"]
-        )
-
-        assert isinstance(result, TokenResponse)
-        assert result.user_id == str(mock_user.user_id)
+        with pytest.raises(BusinessLogicError):
+            await registration.create_user(
+                mock_request_and_db["request"], user, mock_request_and_db["db"]
+            )
 
 
 @pytest.mark.asyncio
@@ -394,10 +392,11 @@ class TestVerifyEmailTokenEndpointUnit:
         )
         mock_uow = mocker.AsyncMock()
         mock_uow.verify_email.return_value = mock_user
+        mock_uow.queue_email = mocker.MagicMock()
         mock_uow_class = mocker.patch("app.api.v1.registration.UserUnitOfWork")
         mock_uow_class.return_value.__aenter__ = mocker.AsyncMock(return_value=mock_uow)
         mock_uow_class.return_value.__aexit__ = mocker.AsyncMock(return_value=None)
-        mocker.patch("app.api.v1.registration.send_password_reset_email")
+        mock_build = mocker.patch("app.api.v1.registration.build_password_reset_email")
         mock_ctx = MagicMock()
         mock_ctx.get.return_value = "test-request-id"
         mocker.patch("app.api.v1.registration.request_id_ctx_var", mock_ctx)
@@ -411,6 +410,9 @@ class TestVerifyEmailTokenEndpointUnit:
         )
         assert isinstance(result, MessageResponse)
         assert "You can now reset your password" in result.message
+        mock_uow.queue_email.assert_called_once_with(
+            mock_build.return_value, "password_reset"
+        )
 
     async def test_verify_email_invalid_token(self, mock_request_and_db, mocker):
         invalid_token = "invalid.token.format"
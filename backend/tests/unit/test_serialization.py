@@ -0,0 +1,91 @@
+import json
+import uuid
+from datetime import date, datetime, timezone
+
+import pytest
+import structlog
+from httpx import AsyncClient
+
+from app.api.core import logging as core_logging
+from app.api.core import serialization
+from app.api.core.serialization import (
+    FastJSONResponse,
+    dumps_log_event,
+    fast_json_enabled,
+)
+
+
+def test_fast_json_enabled_by_default():
+    assert fast_json_enabled() is True
+
+
+def test_fast_json_can_be_disabled(monkeypatch):
+    monkeypatch.setattr("app.api.core.serialization.settings.FAST_JSON_ENABLED", False)
+    assert fast_json_enabled() is False
+
+
+def test_dumps_log_event_handles_uuids_and_datetimes():
+    event_id = uuid.uuid4()
+    rendered = dumps_log_event(
+        {
+            "event": "Fetched",
+            "user_id": event_id,
+            "at": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            "day": date(2026, 1, 2),
+            1: "non-string key",
+        }
+    )
+
+    assert json.loads(rendered) == {
+        "event": "Fetched",
+        "user_id": str(event_id),
+        "at": "2026-01-02T03:04:05+00:00",
+        "day": "2026-01-02",
+        "1": "non-string key",
+    }
+
+
+def test_dumps_log_event_uses_fallback_for_unknown_types():
+    class Opaque:
+        def __repr__(self) -> str:
+            return "<opaque>"
+
+    assert dumps_log_event({"value": Opaque()}, default=repr) == '{"value":"<opaque>"}'
+
+
+def test_build_processors_uses_fast_renderer():
+    renderer = core_logging._build_processors()[-1]
+    assert isinstance(renderer, structlog.processors.JSONRenderer)
+    assert renderer._dumps is dumps_log_event
+
+
+def test_build_processors_falls_back_to_stdlib_renderer(monkeypatch):
+    monkeypatch.setattr("app.api.core.serialization.settings.FAST_JSON_ENABLED", False)
+    renderer = core_logging._build_processors()[-1]
+    assert renderer._dumps is json.dumps
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_fast_json_response_matches_stdlib_output(monkeypatch, enabled):
+    monkeypatch.setattr(
+        "app.api.core.serialization.settings.FAST_JSON_ENABLED", enabled
+    )
+    content = {"detail": [{"msg": "Tomate ü", "code": 7}], "ok": True}
+
+    response = FastJSONResponse(content)
+
+    assert (
+        response.body
+        == json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+    )
+
+
+@pytest.mark.asyncio
+async def test_error_responses_render_with_fast_json(client: AsyncClient, mocker):
+    dumps = mocker.spy(serialization.orjson, "dumps")
+
+    response = await client.post("/api/v1/log-client-error", json={})
+
+    assert response.status_code == 422
+    assert response.headers["content-type"] == "application/json"
+    assert response.content in dumps.spy_return_list
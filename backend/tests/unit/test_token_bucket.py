@@ -0,0 +1,149 @@
+import asyncio
+import sqlite3
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+
+from app.api.core import metrics as core_metrics
+from app.api.core.rate_limit_storage import sqlite_path
+from app.api.core.token_bucket import (
+    MemoryTokenBucketBackend,
+    RedisTokenBucketBackend,
+    SQLiteTokenBucketBackend,
+    TokenBucketLimiter,
+    create_token_bucket_backend,
+)
+
+
+@pytest.fixture
+def sqlite_uri(tmp_path):
+    return f"sqlite:///{tmp_path / 'buckets.db'}"
+
+
+async def _reserve_many(backends, count, max_wait=None):
+    return [
+        await backends[i % len(backends)].reserve("k", 2.0, 2, max_wait)
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_allows_burst_then_queues_callers():
+    waits = await _reserve_many([MemoryTokenBucketBackend()], 4)
+
+    assert waits[:2] == [0.0, 0.0]
+    # Each caller beyond the burst is scheduled one interval after the last.
+    assert waits[2] == pytest.approx(0.5, abs=0.01)
+    assert waits[3] == pytest.approx(1.0, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_reserve_with_max_wait_takes_nothing_when_empty():
+    backend = MemoryTokenBucketBackend()
+    assert await _reserve_many([backend], 3, max_wait=0.0) == [0.0, 0.0, None]
+    # The refused call did not put the bucket further into debt.
+    assert await backend.reserve("k", 2.0, 2, None) == pytest.approx(0.5, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_is_shared_between_workers(sqlite_uri):
+    """Two workers on one host draw from one bucket through the SQLite file."""
+    workers = [SQLiteTokenBucketBackend(sqlite_uri) for _ in range(2)]
+
+    waits = await _reserve_many(workers, 4)
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(0.5, abs=0.05)
+    assert waits[3] == pytest.approx(1.0, abs=0.05)
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_is_shared_between_workers():
+    """Two clients of one Redis stand-in draw from one bucket."""
+    server = fakeredis.FakeServer()
+    workers = [
+        RedisTokenBucketBackend(
+            "redis://localhost:6379",
+            client=fakeredis.aioredis.FakeRedis(server=server),
+        )
+        for _ in range(2)
+    ]
+
+    waits = await _reserve_many(workers, 5, max_wait=0.6)
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(0.5, abs=0.05)
+    assert waits[3:] == [None, None]
+
+
+@pytest.mark.parametrize(
+    "uri, backend_type",
+    [
+        ("memory://", MemoryTokenBucketBackend),
+        ("sqlite:///:memory:", SQLiteTokenBucketBackend),
+    ],
+)
+def test_create_backend_from_uri(uri, backend_type):
+    assert isinstance(create_token_bucket_backend(uri), backend_type)
+
+
+def test_create_backend_rejects_unknown_scheme():
+    with pytest.raises(ValueError, match="Unsupported"):
+        create_token_bucket_backend("memcached://localhost")
+
+
+@pytest.mark.asyncio
+async def test_acquire_sleeps_outside_lock_and_records_wait():
+    limiter = TokenBucketLimiter("test-acquire", rate=2.0, burst=1)
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        assert await limiter.acquire() == 0.0
+        waited = await limiter.acquire()
+
+    assert waited == pytest.approx(0.5, abs=0.01)
+    mock_sleep.assert_awaited_once_with(waited)
+    text = core_metrics.render_prometheus_text()
+    assert 'app_rate_limiter_wait_seconds_count{limiter="test-acquire"} 2' in text
+
+
+@pytest.mark.asyncio
+async def test_acquire_does_not_block_event_loop_while_sqlite_is_locked(sqlite_uri):
+    limiter = TokenBucketLimiter(
+        "test-nonblocking",
+        rate=1.0,
+        burst=1,
+        backend=SQLiteTokenBucketBackend(sqlite_uri),
+    )
+    # Another process holds the database write lock.
+    blocker = sqlite3.connect(sqlite_path(sqlite_uri), isolation_level=None)
+    blocker.execute("BEGIN IMMEDIATE")
+    try:
+        acquire = asyncio.create_task(limiter.acquire())
+        # Would not return until acquire gave up if it blocked the loop.
+        await asyncio.sleep(0.2)
+        assert not acquire.done()
+    finally:
+        blocker.execute("COMMIT")
+        blocker.close()
+
+    assert await acquire == 0.0
+
+
+@pytest.mark.asyncio
+async def test_try_acquire_never_waits():
+    limiter = TokenBucketLimiter("test-try", rate=1.0, burst=1)
+
+    assert await limiter.try_acquire() is True
+    assert await limiter.try_acquire() is False
+
+
+@pytest.mark.asyncio
+async def test_backend_failure_falls_back_to_process_bucket():
+    broken = MagicMock()
+    broken.reserve = AsyncMock(side_effect=ConnectionError("redis down"))
+    limiter = TokenBucketLimiter("test-fallback", rate=1.0, burst=1, backend=broken)
+
+    assert await limiter.try_acquire() is True
+    assert await limiter.try_acquire() is False
@@ -0,0 +1,110 @@
+from types import SimpleNamespace
+
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.sdk.trace.sampling import ParentBased
+from opentelemetry.trace import SpanKind, StatusCode
+
+from app.api.core import database
+from app.api.core.logging import log_timing
+from app.api.core.tracing import http_client_span, span_attributes, tracer
+
+
+@pytest.fixture
+def span_exporter():
+    provider = trace.get_tracer_provider()
+    assert isinstance(provider, TracerProvider)
+    exporter = InMemorySpanExporter()
+    processor = SimpleSpanProcessor(exporter)
+    provider.add_span_processor(processor)
+    yield exporter
+    processor.shutdown()
+
+
+def _fake_connection():
+    return SimpleNamespace(info={}, dialect=SimpleNamespace(name="sqlite"))
+
+
+def test_tracer_provider_uses_parent_based_sampling():
+    provider = trace.get_tracer_provider()
+    assert isinstance(provider, TracerProvider)
+    assert isinstance(provider.sampler, ParentBased)
+
+
+def test_span_attributes_drops_unsupported_values():
+    assert span_attributes({"a": "x", "b": None, "c": 1, "d": {"k": "v"}}) == {
+        "a": "x",
+        "c": 1,
+    }
+
+
+def test_log_timing_creates_nested_child_spans(span_exporter):
+    with tracer.start_as_current_span("http_request"):
+        with log_timing("uow_test_operation", user_id="u1"):
+            with log_timing("db_test_operation"):
+                pass
+
+    spans = {span.name: span for span in span_exporter.get_finished_spans()}
+    root = spans["http_request"]
+    uow = spans["uow_test_operation"]
+    repo = spans["db_test_operation"]
+    assert uow.parent.span_id == root.context.span_id
+    assert repo.parent.span_id == uow.context.span_id
+    assert uow.attributes["operation"] == "uow_test_operation"
+    assert uow.attributes["user_id"] == "u1"
+
+
+def test_log_timing_span_records_errors(span_exporter):
+    with pytest.raises(ValueError):
+        with log_timing("failing_operation"):
+            raise ValueError("boom")
+
+    (span,) = span_exporter.get_finished_spans()
+    assert span.status.status_code == StatusCode.ERROR
+
+
+def test_cursor_execute_listeners_emit_db_span(span_exporter):
+    conn = _fake_connection()
+    statement = "SELECT variety.variety_id FROM variety"
+
+    database.before_cursor_execute(conn, None, statement, (), None, False)
+    database.after_cursor_execute(conn, None, statement, (), None, False)
+
+    (span,) = span_exporter.get_finished_spans()
+    assert span.name == "SELECT"
+    assert span.kind == SpanKind.CLIENT
+    assert span.attributes["db.system"] == "sqlite"
+    assert span.attributes["db.statement"] == statement
+    assert conn.info["query_span"] == []
+    assert conn.info["query_start_time"] == []
+
+
+def test_cursor_error_listener_closes_db_span(span_exporter):
+    conn = _fake_connection()
+
+    database.before_cursor_execute(conn, None, "INSERT INTO x", (), None, False)
+    database.handle_cursor_error(
+        SimpleNamespace(connection=conn, original_exception=RuntimeError("fail"))
+    )
+
+    (span,) = span_exporter.get_finished_spans()
+    assert span.status.status_code == StatusCode.ERROR
+    assert conn.info["query_span"] == []
+    assert conn.info["query_start_time"] == []
+
+
+def test_http_client_span_records_request_attributes(span_exporter):
+    with http_client_span("POST", "https://api.resend.com/emails", attempt=2) as span:
+        span.set_attribute("http.response.status_code", 200)
+
+    (finished,) = span_exporter.get_finished_spans()
+    assert finished.name == "HTTP POST"
+    assert finished.kind == SpanKind.CLIENT
+    assert finished.attributes["url.full"] == "https://api.resend.com/emails"
+    assert finished.attributes["attempt"] == 2
+    assert finished.attributes["http.response.status_code"] == 200
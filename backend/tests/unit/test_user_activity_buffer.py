@@ -0,0 +1,106 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import select
+
+from app.api.models import User
+from app.api.services import user_activity_buffer
+from app.api.services.user_activity_buffer import UserActivityBuffer
+from tests.testing_db import TestingSessionLocal
+
+
+async def _last_active(user_id: uuid.UUID) -> datetime:
+    async with TestingSessionLocal() as session:
+        value = await session.scalar(
+            select(User.last_active_date).where(User.user_id == user_id)
+        )
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_latest_timestamp_per_user(user_in_database):
+    user_id = uuid.UUID(user_in_database["user_id"])
+    buffer = UserActivityBuffer(TestingSessionLocal)
+    later = datetime.now(UTC) + timedelta(hours=1)
+
+    buffer.record(user_id, later - timedelta(minutes=5))
+    buffer.record(user_id, later)
+    buffer.record(user_id, later - timedelta(minutes=10))
+    buffer.record(uuid.uuid4(), later)
+
+    assert buffer.pending == 2
+    assert await buffer.flush() == 2
+    assert buffer.pending == 0
+    assert await _last_active(user_id) == later
+
+
+@pytest.mark.asyncio
+async def test_flush_never_moves_last_active_backwards(user_in_database):
+    user_id = uuid.UUID(user_in_database["user_id"])
+    before = await _last_active(user_id)
+    buffer = UserActivityBuffer(TestingSessionLocal)
+
+    buffer.record(user_id, before - timedelta(days=1))
+    await buffer.flush()
+
+    assert await _last_active(user_id) == before
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_timestamps_for_retry():
+    session_factory = MagicMock(side_effect=RuntimeError("database down"))
+    buffer = UserActivityBuffer(session_factory)
+    buffer.record(uuid.uuid4())
+
+    assert await buffer.flush() == 0
+    assert buffer.pending == 1
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_what_remains(user_in_database):
+    user_id = uuid.UUID(user_in_database["user_id"])
+    buffer = UserActivityBuffer(TestingSessionLocal, flush_interval_seconds=3600)
+    buffer.start()
+    later = datetime.now(UTC) + timedelta(hours=1)
+    buffer.record(user_id, later)
+
+    await buffer.stop()
+
+    assert buffer.pending == 0
+    assert await _last_active(user_id) == later
+
+
+def test_unflushed_buffer_stops_taking_new_users():
+    buffer = UserActivityBuffer(TestingSessionLocal, max_pending=2)
+    first, second = uuid.uuid4(), uuid.uuid4()
+    later = datetime.now(UTC) + timedelta(hours=1)
+
+    buffer.record(first)
+    buffer.record(second)
+    buffer.record(uuid.uuid4())
+    buffer.record(first, later)
+
+    assert buffer.pending == 2
+    # Users already buffered still move forward.
+    assert buffer._pending[first] == later
+
+
+@pytest.mark.asyncio
+async def test_start_applies_settings_to_buffer_created_earlier(monkeypatch):
+    monkeypatch.setattr(user_activity_buffer, "_buffer", None)
+    user_id = uuid.uuid4()
+    user_activity_buffer.get_user_activity_buffer().record(user_id)
+
+    buffer = user_activity_buffer.start_user_activity_buffer(
+        TestingSessionLocal, flush_interval_seconds=3600, max_pending=5
+    )
+    try:
+        assert buffer is user_activity_buffer.get_user_activity_buffer()
+        assert buffer.session_factory is TestingSessionLocal
+        assert buffer.flush_interval_seconds == 3600
+        assert buffer.max_pending == 5
+        assert user_id in buffer._pending
+    finally:
+        await user_activity_buffer.stop_user_activity_buffer()
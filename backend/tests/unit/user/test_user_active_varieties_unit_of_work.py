@@ -394,6 +394,41 @@ class TestUserActiveVarietiesUnitOfWork:
 
         assert result.activated_at == old_time
 
+    @pytest.mark.asyncio
+    async def test_update_active_varieties_checks_ownership_once(self, uow):
+        user_id = uuid.uuid4()
+        keep, add, remove = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        final = [make_user_active_variety(user_id=user_id, variety_id=keep)]
+        uow.variety_repo.get_owned_variety_ids.return_value = {keep, add}
+        uow.user_repo.get_active_varieties.return_value = final
+
+        result = await uow.update_active_varieties(
+            str(user_id), [keep, add, keep], [remove]
+        )
+
+        assert result is final
+        uow.variety_repo.get_owned_variety_ids.assert_awaited_once_with(
+            [keep, add], user_id
+        )
+        uow.user_repo.add_active_varieties.assert_awaited_once_with(
+            user_id, [keep, add]
+        )
+        uow.user_repo.delete_active_varieties.assert_awaited_once_with(
+            user_id, [remove]
+        )
+        uow.user_repo.get_active_variety.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_active_varieties_unowned_raises_not_found(self, uow):
+        owned, unowned = uuid.uuid4(), uuid.uuid4()
+        uow.variety_repo.get_owned_variety_ids.return_value = {owned}
+
+        with pytest.raises(ResourceNotFoundError):
+            await uow.update_active_varieties(str(uuid.uuid4()), [owned, unowned], [])
+
+        uow.user_repo.add_active_varieties.assert_not_called()
+        uow.user_repo.delete_active_varieties.assert_not_called()
+
 
 @pytest.mark.asyncio
 async def test_initialization_binds_repositories(mock_db, mocker):
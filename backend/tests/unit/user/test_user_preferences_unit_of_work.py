@@ -11,7 +11,7 @@ from app.api.middleware.exception_handler import (
 )
 from app.api.repositories.grow_guide.day_repository import DayRepository
 from app.api.repositories.grow_guide.variety_repository import VarietyRepository
-from app.api.repositories.user.user_repository import UserRepository
+from app.api.repositories.user.user_repository import FeedDayRow, UserRepository
 from app.api.schemas.user.user_preference_schema import (
     DayRead,
     FeedDayRead,
@@ -26,6 +26,7 @@ from tests.test_helpers import (
     build_week_days,
     make_user_feed_day,
 )
+from tests.testing_db import TestingSessionLocal
 
 
 class TestUserPreferencesUnitOfWork:
@@ -193,43 +194,35 @@ class TestUserPreferencesUnitOfWork:
         mock_get_days.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_update_user_feed_preference_success(
-        self, user_preferences_uow, sample_user_feed_day
-    ):
-        """Test successful update of user feed preference."""
+    async def test_update_user_feed_preference_success(self, user_preferences_uow):
+        """The upserted row, names included, is returned without a re-fetch."""
         user_id = str(uuid.uuid4())
         feed_id = str(uuid.uuid4())
         day_id = str(uuid.uuid4())
-
-        # Update the sample to match the test parameters
-        sample_user_feed_day.feed_id = uuid.UUID(feed_id)
-        sample_user_feed_day.day_id = uuid.UUID(day_id)
-        sample_user_feed_day.feed.feed_id = sample_user_feed_day.feed_id
-        sample_user_feed_day.day.day_id = sample_user_feed_day.day_id
-        user_feed_days = [sample_user_feed_day]
+        row = FeedDayRow(uuid.UUID(feed_id), "Tomato Feed", uuid.UUID(day_id), "Mon")
 
         with (
             patch.object(
-                user_preferences_uow.user_repo, "update_user_feed_day"
+                user_preferences_uow.user_repo,
+                "update_user_feed_day",
+                return_value=row,
             ) as mock_update,
             patch.object(
-                user_preferences_uow.user_repo,
-                "get_user_feed_days",
-                return_value=user_feed_days,
+                user_preferences_uow.user_repo, "get_user_feed_days"
             ) as mock_get_feed_days,
         ):
             result = await user_preferences_uow.update_user_feed_preference(
                 user_id, feed_id, day_id
             )
 
-        assert isinstance(result, FeedDayRead)
-        assert str(result.feed_id) == feed_id
-        assert str(result.day_id) == day_id
-        assert result.feed_name == sample_user_feed_day.feed.feed_name
-        assert result.day_name == sample_user_feed_day.day.day_name
-
+        assert result == FeedDayRead(
+            feed_id=row.feed_id,
+            feed_name="Tomato Feed",
+            day_id=row.day_id,
+            day_name="Mon",
+        )
         mock_update.assert_called_once_with(user_id, feed_id, day_id)
-        mock_get_feed_days.assert_called_once_with(user_id)
+        mock_get_feed_days.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_update_user_feed_preference_invalid_feed_id(
@@ -246,119 +239,39 @@ class TestUserPreferencesUnitOfWork:
             )
 
     @pytest.mark.asyncio
-    async def test_update_user_feed_preference_not_found_after_update(
+    async def test_update_user_feed_preference_unknown_feed_or_day(
         self, user_preferences_uow
     ):
-        """Test update when preference is not found after update."""
+        """A missing feed or day (nothing written) is a 404."""
         user_id = str(uuid.uuid4())
         feed_id = str(uuid.uuid4())
         day_id = str(uuid.uuid4())
 
-        # Return empty list after update (preference not found)
-        user_feed_days = []
-
-        with (
-            patch.object(
-                user_preferences_uow.user_repo, "update_user_feed_day"
-            ) as mock_update,
-            patch.object(
-                user_preferences_uow.user_repo,
-                "get_user_feed_days",
-                return_value=user_feed_days,
-            ) as mock_get_feed_days,
-        ):
+        with patch.object(
+            user_preferences_uow.user_repo,
+            "update_user_feed_day",
+            return_value=None,
+        ) as mock_update:
             with pytest.raises(ResourceNotFoundError, match="Feed preference"):
                 await user_preferences_uow.update_user_feed_preference(
                     user_id, feed_id, day_id
                 )
 
         mock_update.assert_called_once_with(user_id, feed_id, day_id)
-        mock_get_feed_days.assert_called_once_with(user_id)
 
     @pytest.mark.asyncio
-    async def test_update_user_feed_preference_different_ids_returned(
-        self, user_preferences_uow, sample_user_feed_day
+    async def test_update_user_feed_preference_unknown_day_in_database(
+        self, user_in_database, seed_feed_data
     ):
-        """Test update when returned preference has different IDs."""
-        user_id = str(uuid.uuid4())
-        feed_id = str(uuid.uuid4())
-        day_id = str(uuid.uuid4())
-
-        # Return a preference with different IDs
-        sample_user_feed_day.feed_id = uuid.uuid4()  # Different from feed_id
-        sample_user_feed_day.day_id = uuid.uuid4()  # Different from day_id
-        user_feed_days = [sample_user_feed_day]
-
-        with (
-            patch.object(
-                user_preferences_uow.user_repo, "update_user_feed_day"
-            ) as mock_update,
-            patch.object(
-                user_preferences_uow.user_repo,
-                "get_user_feed_days",
-                return_value=user_feed_days,
-            ) as mock_get_feed_days,
-        ):
+        """Against the database, an unknown day is a 404 rather than an FK error."""
+        async with TestingSessionLocal() as db:
             with pytest.raises(ResourceNotFoundError, match="Feed preference"):
-                await user_preferences_uow.update_user_feed_preference(
-                    user_id, feed_id, day_id
-                )
-
-        mock_update.assert_called_once_with(user_id, feed_id, day_id)
-        mock_get_feed_days.assert_called_once_with(user_id)
-
-    @pytest.mark.asyncio
-    async def test_update_user_feed_preference_multiple_matches(
-        self, user_preferences_uow
-    ):
-        """Test update when multiple preferences match the IDs."""
-        user_id = str(uuid.uuid4())
-        feed_id = str(uuid.uuid4())
-        day_id = str(uuid.uuid4())
-
-        # Create two matching preferences
-        user_feed_day1 = make_user_feed_day(
-            user_id=user_id,
-            feed_id=feed_id,
-            day_id=day_id,
-            feed_name="Feed 1",
-            day_name="Day 1",
-            day_number=1,
-        )
-        user_feed_day2 = make_user_feed_day(
-            user_id=user_id,
-            feed_id=feed_id,
-            day_id=day_id,
-            feed_name="Feed 2",
-            day_name="Day 2",
-            day_number=1,
-        )
-
-        user_feed_days = [user_feed_day1, user_feed_day2]
-
-        with (
-            patch.object(
-                user_preferences_uow.user_repo, "update_user_feed_day"
-            ) as mock_update,
-            patch.object(
-                user_preferences_uow.user_repo,
-                "get_user_feed_days",
-                return_value=user_feed_days,
-            ) as mock_get_feed_days,
-        ):
-            result = await user_preferences_uow.update_user_feed_preference(
-                user_id, feed_id, day_id
-            )
-
-        # Should return the first match
-        assert isinstance(result, FeedDayRead)
-        assert str(result.feed_id) == feed_id
-        assert str(result.day_id) == day_id
-        assert result.feed_name == "Feed 1"
-        assert result.day_name == "Day 1"
-
-        mock_update.assert_called_once_with(user_id, feed_id, day_id)
-        mock_get_feed_days.assert_called_once_with(user_id)
+                async with UserPreferencesUnitOfWork(db) as uow:
+                    await uow.update_user_feed_preference(
+                        user_in_database["user_id"],
+                        str(seed_feed_data[0]["id"]),
+                        str(uuid.uuid4()),
+                    )
 
     @pytest.mark.asyncio
     async def test_get_user_preferences_exception_handling(self, user_preferences_uow):
@@ -1,21 +1,38 @@
 import uuid
+from contextlib import contextmanager
 from unittest.mock import MagicMock, Mock
 
 import pytest
 from fastapi import HTTPException, status
+from sqlalchemy import event
 
 from app.api.middleware.exception_handler import InvalidTokenError
 from app.api.models.user.user_model import (
     User,
     UserActiveVariety,
     UserAllotment,
-    UserFeedDay,
 )
-from app.api.repositories.user.user_repository import UserRepository
+from app.api.repositories.user.user_repository import FeedDayRow, UserRepository
 from app.api.schemas.user.user_allotment_schema import (
     UserAllotmentCreate,
     UserAllotmentUpdate,
 )
+from tests.testing_db import TestingSessionLocal, engine
+
+
+@contextmanager
+def _recorded_statements():
+    """Collect the SQL statements executed on the test engine."""
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
 
 
 class TestUserRepository:
@@ -250,74 +267,92 @@ class TestUserRepository:
         mock_db.execute.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_update_user_feed_day_existing(
-        self, user_repository, mock_db, sample_user_feed_day
+    @pytest.mark.filterwarnings("error::sqlalchemy.exc.SAWarning")
+    async def test_update_user_feed_day_upserts_in_one_statement(
+        self, user_in_database, seed_feed_data, seed_day_data
     ):
-        """Test updating an existing user feed day preference."""
-        # Arrange
-        user_id = str(sample_user_feed_day.user_id)
-        feed_id = str(sample_user_feed_day.feed_id)
-        new_day_id = str(uuid.uuid4())
-
-        mock_result = Mock()
-        mock_result.scalar_one_or_none.return_value = sample_user_feed_day
-        mock_db.execute.return_value = mock_result
-
-        # Act
-        result = await user_repository.update_user_feed_day(
-            user_id, feed_id, new_day_id
+        """Create then change a preference; each write is one statement with names."""
+        user_id = user_in_database["user_id"]
+        feed = seed_feed_data[0]
+        monday, tuesday = seed_day_data[0], seed_day_data[1]
+
+        async with TestingSessionLocal() as db:
+            repo = UserRepository(db)
+            with _recorded_statements() as statements:
+                created = await repo.update_user_feed_day(
+                    user_id, str(feed["id"]), str(monday["id"])
+                )
+                updated = await repo.update_user_feed_day(
+                    user_id, str(feed["id"]), str(tuesday["id"])
+                )
+            await db.commit()
+
+        assert created == FeedDayRow(
+            feed["id"], feed["name"], monday["id"], monday["name"]
         )
-
-        # Assert
-        assert result == sample_user_feed_day
-        assert str(result.day_id) == new_day_id
-        mock_db.add.assert_called_once_with(sample_user_feed_day)
+        assert updated == FeedDayRow(
+            feed["id"], feed["name"], tuesday["id"], tuesday["name"]
+        )
+        assert len(statements) == 2
+        assert all("ON CONFLICT" in sql for sql in statements)
+        async with TestingSessionLocal() as db:
+            stored = await UserRepository(db).get_user_feed_days(user_id)
+        assert [(ufd.feed_id, ufd.day_id) for ufd in stored] == [
+            (feed["id"], tuesday["id"])
+        ]
 
     @pytest.mark.asyncio
-    async def test_update_user_feed_day_new(self, user_repository, mock_db):
-        """Test creating a new user feed day preference."""
-        # Arrange
-        user_id = str(uuid.uuid4())
-        feed_id = str(uuid.uuid4())
-        day_id = str(uuid.uuid4())
-
-        mock_result = Mock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
-
-        # Act
-        result = await user_repository.update_user_feed_day(user_id, feed_id, day_id)
+    @pytest.mark.filterwarnings("error::sqlalchemy.exc.SAWarning")
+    @pytest.mark.parametrize("unknown", ["feed", "day"])
+    async def test_update_user_feed_day_unknown_feed_or_day_writes_nothing(
+        self, user_in_database, seed_feed_data, seed_day_data, unknown
+    ):
+        """No row is written, so no foreign key error and no orphan either."""
+        user_id = user_in_database["user_id"]
+        feed_id = uuid.uuid4() if unknown == "feed" else seed_feed_data[0]["id"]
+        day_id = uuid.uuid4() if unknown == "day" else seed_day_data[0]["id"]
+
+        async with TestingSessionLocal() as db:
+            result = await UserRepository(db).update_user_feed_day(
+                user_id, str(feed_id), str(day_id)
+            )
+            await db.commit()
 
-        # Assert
-        assert isinstance(result, UserFeedDay)
-        assert str(result.user_id) == user_id
-        assert str(result.feed_id) == feed_id
-        assert str(result.day_id) == day_id
-        mock_db.add.assert_called_once_with(result)
+        assert result is None
+        async with TestingSessionLocal() as db:
+            assert await UserRepository(db).get_user_feed_days(user_id) == []
 
     @pytest.mark.asyncio
-    async def test_ensure_user_feed_days_creates_missing_preferences(
-        self, user_repository, mock_db
+    @pytest.mark.filterwarnings("error::sqlalchemy.exc.SAWarning")
+    async def test_ensure_user_feed_days_inserts_only_missing(
+        self, user_in_database, seed_feed_data, seed_day_data
     ):
-        """Ensure missing feed day preferences are created."""
-        user_id = uuid.uuid4()
-        feeds = [Mock(feed_id=uuid.uuid4()) for _ in range(3)]
-        default_day = Mock(day_id=uuid.uuid4())
-
-        mock_scalars = Mock()
-        mock_scalars.all.return_value = []
-        mock_result = Mock()
-        mock_result.scalars.return_value = mock_scalars
-        mock_db.execute.return_value = mock_result
-
-        await user_repository.ensure_user_feed_days(str(user_id), feeds, default_day)
-
-        mock_db.execute.assert_called_once()
-        assert mock_db.add.call_count == len(feeds)
-        added_records = [call.args[0] for call in mock_db.add.call_args_list]
-        assert all(record.user_id == user_id for record in added_records)
-        assert all(record.day_id == default_day.day_id for record in added_records)
-        mock_db.flush.assert_called_once()
+        """One INSERT for all feeds; existing preferences are left alone."""
+        user_id = user_in_database["user_id"]
+        feeds = [Mock(feed_id=feed["id"]) for feed in seed_feed_data]
+        monday, sunday = seed_day_data[0], seed_day_data[6]
+
+        async with TestingSessionLocal() as db:
+            repo = UserRepository(db)
+            await repo.update_user_feed_day(
+                user_id, str(seed_feed_data[0]["id"]), str(sunday["id"])
+            )
+            with _recorded_statements() as statements:
+                await repo.ensure_user_feed_days(
+                    user_id, feeds, Mock(day_id=monday["id"])
+                )
+            await db.commit()
+            stored = {
+                ufd.feed_id: ufd.day_id
+                for ufd in await repo.get_user_feed_days(user_id)
+            }
+
+        assert len(statements) == 1
+        assert statements[0].startswith("INSERT INTO user_feed_day")
+        assert stored == {
+            feed["id"]: sunday["id"] if i == 0 else monday["id"]
+            for i, feed in enumerate(seed_feed_data)
+        }
 
     @pytest.mark.asyncio
     async def test_update_user_profile_success(
@@ -393,6 +428,42 @@ class TestUserRepository:
             association, attribute_names=["variety"]
         )
 
+    @pytest.mark.asyncio
+    async def test_add_active_varieties_inserts_once_ignoring_conflicts(
+        self, user_repository, mock_db
+    ):
+        from sqlalchemy.dialects import postgresql
+
+        user_id = uuid.uuid4()
+        variety_ids = [uuid.uuid4(), uuid.uuid4()]
+        mock_db.get_bind.return_value.dialect.name = "postgresql"
+
+        await user_repository.add_active_varieties(user_id, variety_ids)
+
+        mock_db.execute.assert_awaited_once()
+        stmt, params = mock_db.execute.await_args.args
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (user_id, variety_id) DO NOTHING" in sql
+        assert [p["variety_id"] for p in params] == variety_ids
+
+    @pytest.mark.asyncio
+    async def test_delete_active_varieties_single_statement(
+        self, user_repository, mock_db
+    ):
+        mock_db.execute.return_value = Mock(rowcount=2)
+
+        deleted = await user_repository.delete_active_varieties(
+            uuid.uuid4(), [uuid.uuid4(), uuid.uuid4(), uuid.uuid4()]
+        )
+        skipped = await user_repository.delete_active_varieties(uuid.uuid4(), [])
+
+        assert deleted == 2
+        assert skipped == 0
+        mock_db.execute.assert_awaited_once()
+        assert "DELETE FROM user_active_variety" in str(
+            mock_db.execute.await_args.args[0]
+        )
+
     @pytest.mark.asyncio
     async def test_delete_active_variety_success(self, user_repository, mock_db):
         user_id = uuid.uuid4()
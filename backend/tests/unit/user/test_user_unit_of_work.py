@@ -1,5 +1,5 @@
 import uuid
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 import pytest
 from authlib.jose.errors import JoseError
@@ -53,6 +53,27 @@ class TestUserUnitOfWork:
         mock_db.commit.assert_called_once()
         mock_db.rollback.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_context_manager_notifies_outbox_after_commit(self, mock_db):
+        """Queued emails wake the outbox worker only once the transaction commits."""
+        uow = UserUnitOfWork(db=mock_db)
+        with (
+            patch("app.api.services.user.user_unit_of_work.enqueue_email"),
+            patch(
+                "app.api.services.user.user_unit_of_work.notify_email_outbox"
+            ) as mock_notify,
+        ):
+            async with uow:
+                uow.queue_email({"to": "user@example.com"}, "email_verification")
+                mock_notify.assert_not_called()
+            mock_notify.assert_called_once()
+
+            with pytest.raises(ValueError):
+                async with UserUnitOfWork(db=mock_db) as failing:
+                    failing.queue_email({"to": "user@example.com"}, "password_reset")
+                    raise ValueError("Test exception")
+            mock_notify.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_context_manager_exception(self, mock_db):
         """Test context manager with exception triggers rollback."""
@@ -65,10 +86,10 @@ class TestUserUnitOfWork:
 
     @pytest.mark.asyncio
     @patch("app.api.services.user.user_unit_of_work.UserFactory.create_user")
-    @patch("app.api.services.user.user_unit_of_work.send_verification_email")
+    @patch("app.api.services.user.user_unit_of_work.enqueue_email")
     async def test_register_user_success(
         self,
-        mock_send_email,
+        mock_enqueue,
         mock_create_user,
         user_unit_of_work,
         sample_user_create,
@@ -76,7 +97,6 @@ class TestUserUnitOfWork:
     ):
         """Test successful user registration."""
         mock_create_user.return_value = sample_user
-        mock_send_email.return_value = None
 
         with patch.object(
             user_unit_of_work.user_repo, "create_user", return_value=sample_user
@@ -86,7 +106,10 @@ class TestUserUnitOfWork:
         assert result == sample_user
         mock_create_user.assert_called_once_with(sample_user_create)
         mock_repo_create.assert_called_once_with(sample_user)
-        mock_send_email.assert_called_once()
+        mock_enqueue.assert_called_once_with(
+            user_unit_of_work.db, ANY, "email_verification"
+        )
+        assert mock_enqueue.call_args.args[1]["to"] == sample_user.user_email
 
     @pytest.mark.asyncio
     @patch("app.api.services.user.user_unit_of_work.UserFactory.create_user")
@@ -154,15 +177,14 @@ class TestUserUnitOfWork:
         mock_get.assert_called_once_with(email)
 
     @pytest.mark.asyncio
-    @patch("app.api.services.user.user_unit_of_work.send_password_reset_email")
+    @patch("app.api.services.user.user_unit_of_work.enqueue_email")
     async def test_request_password_reset_success(
-        self, mock_send_email, user_unit_of_work, sample_user
+        self, mock_enqueue, user_unit_of_work, sample_user
     ):
         """Test successful password reset request."""
         email = sample_user.user_email
         # Ensure this test exercises the 'verified user' branch; root fixture defaults to unverified
         sample_user.is_email_verified = True
-        mock_send_email.return_value = None
 
         with patch.object(
             user_unit_of_work.user_repo, "get_user_by_email", return_value=sample_user
@@ -170,12 +192,12 @@ class TestUserUnitOfWork:
             await user_unit_of_work.request_password_reset(email)
 
         mock_get.assert_called_once_with(email)
-        mock_send_email.assert_called_once()
+        mock_enqueue.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch("app.api.services.user.user_unit_of_work.send_password_reset_email")
+    @patch("app.api.services.user.user_unit_of_work.enqueue_email")
     async def test_request_password_reset_user_not_found(
-        self, mock_send_email, user_unit_of_work
+        self, mock_enqueue, user_unit_of_work
     ):
         """Test password reset request for non-existent user."""
         email = "nonexistent@example.com"
@@ -187,7 +209,7 @@ class TestUserUnitOfWork:
 
         mock_get.assert_called_once_with(email)
         # Should still not raise error for security reasons
-        mock_send_email.assert_not_called()
+        mock_enqueue.assert_not_called()
 
     @pytest.mark.asyncio
     @patch("app.api.services.user.user_unit_of_work.jwt")
@@ -407,14 +429,13 @@ class TestUserUnitOfWork:
     # (Removed separate verify email tests; covered by parametrized test_verify_user_email_param)
 
     @pytest.mark.asyncio
-    @patch("app.api.services.user.user_unit_of_work.send_verification_email")
+    @patch("app.api.services.user.user_unit_of_work.enqueue_email")
     async def test_request_password_reset_unverified_user(
-        self, mock_send_email, user_unit_of_work, sample_user
+        self, mock_enqueue, user_unit_of_work, sample_user
     ):
         """Test password reset request for unverified user."""
         sample_user.is_email_verified = False
         email = sample_user.user_email
-        mock_send_email.return_value = None
 
         with patch.object(
             user_unit_of_work.user_repo, "get_user_by_email", return_value=sample_user
@@ -424,20 +445,22 @@ class TestUserUnitOfWork:
         assert result["status"] == "unverified"
         assert "verification email" in result["message"]
         mock_get.assert_called_once_with(email)
-        mock_send_email.assert_called_once()
+        mock_enqueue.assert_called_once_with(
+            user_unit_of_work.db, ANY, "email_verification"
+        )
+        assert "fromReset=true" in mock_enqueue.call_args.args[1]["text"]
 
     @pytest.mark.asyncio
-    @patch("app.api.services.user.user_unit_of_work.send_password_reset_email")
+    @patch("app.api.services.user.user_unit_of_work.enqueue_email")
     @patch("app.api.services.user.user_unit_of_work.create_token")
     async def test_request_password_reset_verified_user(
-        self, mock_create_token, mock_send_email, user_unit_of_work, sample_user
+        self, mock_create_token, mock_enqueue, user_unit_of_work, sample_user
     ):
         """Test password reset request for verified user."""
         sample_user.is_email_verified = True
         email = sample_user.user_email
         mock_token = "test_token"
         mock_create_token.return_value = mock_token
-        mock_send_email.return_value = None
 
         with patch.object(
             user_unit_of_work.user_repo, "get_user_by_email", return_value=sample_user
@@ -450,7 +473,10 @@ class TestUserUnitOfWork:
         mock_create_token.assert_called_once_with(
             user_id=str(sample_user.user_id), token_type="reset"
         )
-        mock_send_email.assert_called_once()
+        mock_enqueue.assert_called_once_with(
+            user_unit_of_work.db, ANY, "password_reset"
+        )
+        assert "token=test_token" in mock_enqueue.call_args.args[1]["text"]
 
     @pytest.mark.asyncio
     @patch("app.api.services.user.user_unit_of_work.jwt")
@@ -504,10 +530,10 @@ class TestUserUnitOfWork:
             mock_get.assert_called_once_with(user_id)
 
     @pytest.mark.asyncio
-    @patch("app.api.services.user.user_unit_of_work.send_verification_email")
+    @patch("app.api.services.user.user_unit_of_work.enqueue_email")
     @patch("app.api.services.user.user_unit_of_work.UserFactory.create_user")
     async def test_register_user_generic_error(
-        self, mock_create_user, mock_send_email, user_unit_of_work, sample_user_create
+        self, mock_create_user, mock_enqueue, user_unit_of_work, sample_user_create
     ):
         """Test user registration with generic error."""
         mock_create_user.side_effect = Exception("Database error")
@@ -515,7 +541,7 @@ class TestUserUnitOfWork:
         with pytest.raises(Exception, match="Database error"):
             await user_unit_of_work.register_user(sample_user_create)
 
-        mock_send_email.assert_not_called()
+        mock_enqueue.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_update_user_profile_success(self, user_unit_of_work, sample_user):
@@ -550,15 +576,16 @@ class TestUserUnitOfWork:
                 return_value=sample_user,
             ) as mock_get,
             patch(
-                "app.api.services.user.user_unit_of_work.send_verification_email"
-            ) as mock_send,
+                "app.api.services.user.user_unit_of_work.enqueue_email"
+            ) as mock_enqueue,
         ):
             await user_unit_of_work.send_verification_email_service(email)
 
         mock_get.assert_called_once_with(email)
-        mock_send.assert_called_once_with(
-            user_email=email, user_id=str(sample_user.user_id)
+        mock_enqueue.assert_called_once_with(
+            user_unit_of_work.db, ANY, "email_verification"
         )
+        assert mock_enqueue.call_args.args[1]["to"] == email
 
     @pytest.mark.asyncio
     async def test_send_verification_email_service_user_not_found(